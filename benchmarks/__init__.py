@@ -0,0 +1 @@
+"""Нагрузочные замеры адаптеров инфраструктуры."""
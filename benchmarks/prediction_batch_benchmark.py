@@ -0,0 +1,172 @@
+"""Замер пропускной способности пакетных предсказаний против одиночных вызовов.
+
+Сравнивает N вызовов POST /predictions с вызовами POST /predictions:batch
+на те же N строк: сначала только обработчики с проверкой тела, затем они же
+с кэшем прогнозов (строки повторяются каждые 300), затем полный путь запроса
+через приложение FastAPI (в памяти, без сети). Аутентификация
+подменена: для одиночных вызовов она повторялась бы N раз, поэтому реальный
+выигрыш пачки ещё больше.
+
+Запуск: ``make benchmark BENCH=prediction_batch_benchmark ARGS="--rows 10000"``.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import Final, TYPE_CHECKING
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.app.domain.models.user import InternalUser
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.inference.lru_prediction_cache import LRUPredictionCache
+from src.app.infrastructure.container import AppContainer
+from src.app.presentation.api.constants import MAX_PREDICTION_BATCH_SIZE
+from src.app.presentation.api.rest.v1.routes.predictions import predict, predict_batch
+from src.app.presentation.api.rest.v1.routes.predictions import router as predictions_router
+from src.app.presentation.schemas.prediction import PredictBatchRequest, PredictRequest
+from src.app.presentation.webserver.dependencies import get_current_client, get_prediction_cache, get_predictor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from src.app.application.ports.inference.prediction_cache import PredictionCache
+    from src.app.application.services.model_registry import ModelRegistry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROWS: Final[int] = 10_000
+DEFAULT_REPEATS: Final[int] = 5
+CACHE_MAX_SIZE: Final[int] = 10_000
+CACHE_TTL_SECONDS: Final[float] = 3600.0
+
+_CLIENT: Final[InternalUser] = InternalUser(
+    username='benchmark', email='benchmark@example.com', age=30, role=Role.USER, hashed_password='hash'
+)
+
+_REGISTRY: Final['ModelRegistry'] = AppContainer.model_registry()
+
+
+def _rows(count: int) -> list[dict[str, object]]:
+    """Строит строки признаков, как они приходят в теле запроса.
+
+    Args:
+        count: Количество строк.
+
+    Returns:
+        Строки признаков.
+    """
+    return [
+        {'age': 18 + index % 60, 'income': 1000.0 * (index % 100), 'occupation': 'engineer'} for index in range(count)
+    ]
+
+
+def _single_calls(rows: 'Sequence[dict[str, object]]', cache: 'PredictionCache | None' = None) -> None:
+    """Выполняет по одному вызову обработчика на строку без объединения в пачки.
+
+    Args:
+        rows: Строки признаков.
+        cache: Кэш прогнозов или None.
+    """
+
+    async def run() -> None:
+        for row in rows:
+            await predict(PredictRequest.model_validate(row), _CLIENT, _REGISTRY, cache, None)
+
+    asyncio.run(run())
+
+
+def _batch_calls(rows: 'Sequence[dict[str, object]]', cache: 'PredictionCache | None' = None) -> None:
+    """Выполняет пакетные вызовы обработчика, не превышая максимальный размер пачки.
+
+    Args:
+        rows: Строки признаков.
+        cache: Кэш прогнозов или None.
+    """
+    for start in range(0, len(rows), MAX_PREDICTION_BATCH_SIZE):
+        batch = rows[start : start + MAX_PREDICTION_BATCH_SIZE]
+        predict_batch(PredictBatchRequest.model_validate({'rows': batch}), _CLIENT, _REGISTRY, cache)
+
+
+def _build_client() -> TestClient:
+    """Создаёт клиент приложения с маршрутами предсказаний, подменённой аутентификацией, без кэша и объединения.
+
+    Одиночные запросы отправляются последовательно, поэтому объединение в
+    пачки только добавляло бы к каждому время ожидания.
+
+    Returns:
+        Клиент, выполняющий запросы в памяти.
+    """
+    app = FastAPI()
+    app.include_router(predictions_router)
+    app.dependency_overrides[get_current_client] = lambda: _CLIENT
+    app.dependency_overrides[get_prediction_cache] = lambda: None
+    app.dependency_overrides[get_predictor] = lambda: None
+    return TestClient(app)
+
+
+def measure(
+    score: 'Callable[[Sequence[dict[str, object]]], None]', rows: 'Sequence[dict[str, object]]', repeats: int
+) -> float:
+    """Измеряет лучшую из нескольких попыток пропускную способность.
+
+    Args:
+        score: Способ вычисления предсказаний.
+        rows: Строки признаков.
+        repeats: Количество попыток.
+
+    Returns:
+        Строк в секунду.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        score(rows)
+        best = min(best, time.perf_counter() - started)
+    return len(rows) / best
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Запускает замер.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='Замер пакетных предсказаний.')
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS, help='Количество строк.')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help='Количество попыток.')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+
+    rows = _rows(args.rows)
+    cache = LRUPredictionCache(_REGISTRY, max_size=CACHE_MAX_SIZE, ttl_seconds=CACHE_TTL_SECONDS)
+
+    def single_requests(rows: 'Sequence[dict[str, object]]') -> None:
+        for row in rows:
+            client.post('/predictions', json=row).raise_for_status()
+
+    def batch_requests(rows: 'Sequence[dict[str, object]]') -> None:
+        for start in range(0, len(rows), MAX_PREDICTION_BATCH_SIZE):
+            client.post('/predictions:batch', json={'rows': rows[start : start + MAX_PREDICTION_BATCH_SIZE]})
+
+    with _build_client() as client:
+        for label, single_calls, batch_calls in (
+            ('handlers', _single_calls, _batch_calls),
+            ('cached', partial(_single_calls, cache=cache), partial(_batch_calls, cache=cache)),
+            ('requests', single_requests, batch_requests),
+        ):
+            single = measure(single_calls, rows, args.repeats)
+            batch = measure(batch_calls, rows, args.repeats)
+            logger.info(
+                f'{label:<9} single {single:>12,.0f} rows/s  batch {batch:>12,.0f} rows/s {batch / single:>6.1f}x'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Замер объединения одновременных одиночных предсказаний в пачки.
+
+Модель имитирует фиксированную стоимость вызова (подготовка входа, запуск
+вычислений) поверх текущей пороговой модели. Сравниваются прямые вызовы
+модели на каждый запрос и MicroBatchPredictor при заданном числе
+одновременных клиентов.
+
+Запуск: ``make benchmark BENCH=prediction_micro_batch_benchmark ARGS="--clients 256"``.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Final, TYPE_CHECKING
+
+from src.app.application.services.inference_service import predict_from_feature_rows
+from src.app.infrastructure.adapters.inference.micro_batch_predictor import MicroBatchPredictor
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
+
+    from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLIENTS: Final[int] = 256
+DEFAULT_REQUESTS_PER_CLIENT: Final[int] = 20
+DEFAULT_CALL_OVERHEAD_MS: Final[float] = 0.5
+DEFAULT_MAX_BATCH_SIZE: Final[int] = 64
+DEFAULT_MAX_WAIT_MS: Final[float] = 2.0
+
+
+def _busy_wait(seconds: float) -> None:
+    """Занимает процессор на заданное время, как вычисления модели.
+
+    Args:
+        seconds: Длительность в секундах.
+    """
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _run_clients(
+    predict: 'Callable[[Mapping[str, int | float | str | None]], Awaitable[PredictionOutcome]]',
+    clients: int,
+    requests_per_client: int,
+) -> float:
+    """Запускает клиентов, последовательно отправляющих свои запросы.
+
+    Args:
+        predict: Способ получить предсказание для строки.
+        clients: Количество одновременных клиентов.
+        requests_per_client: Количество запросов от каждого клиента.
+
+    Returns:
+        Запросов в секунду.
+    """
+
+    async def client(index: int) -> None:
+        for request in range(requests_per_client):
+            await predict({'age': 18 + (index + request) % 60})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(index) for index in range(clients)))
+    return clients * requests_per_client / (time.perf_counter() - started)
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Запускает замер.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='Замер объединения предсказаний в пачки.')
+    parser.add_argument('--clients', type=int, default=DEFAULT_CLIENTS, help='Одновременных клиентов.')
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS_PER_CLIENT, help='Запросов на клиента.')
+    parser.add_argument('--overhead-ms', type=float, default=DEFAULT_CALL_OVERHEAD_MS, help='Стоимость вызова модели.')
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE, help='Размер пачки.')
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT_MS, help='Ожидание пачки.')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    def model(rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list['PredictionOutcome']:
+        _busy_wait(args.overhead_ms / 1000)
+        return predict_from_feature_rows(rows)
+
+    async def direct(features: 'Mapping[str, int | float | str | None]') -> 'PredictionOutcome':
+        return model([features])[0]
+
+    batcher = MicroBatchPredictor(model, args.max_batch_size, args.max_wait_ms / 1000)
+
+    single = asyncio.run(_run_clients(direct, args.clients, args.requests))
+    batched = asyncio.run(_run_clients(batcher.predict, args.clients, args.requests))
+    stats = batcher.stats()
+
+    logger.info(f'direct calls  {single:>12,.0f} req/s')
+    logger.info(f'micro-batched {batched:>12,.0f} req/s {batched / single:>6.1f}x')
+    logger.info(
+        f'mean batch {stats.mean_batch_size:.1f} rows, '
+        f'mean queue delay {stats.mean_queue_delay_seconds * 1000:.2f} ms, '
+        f'max queue delay {stats.queue_delay_seconds_max * 1000:.2f} ms'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Замер пиковой памяти и времени выгрузки всех пользователей.
+
+Сравнивает ответ одним JSON-массивом из list() с постраничной выгрузкой
+NDJSON, которую отдаёт GET /users/export.
+
+Запуск: ``make benchmark BENCH=user_export_benchmark ARGS="--users 1000000"``.
+"""
+
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+from typing import Final, TYPE_CHECKING
+
+from src.app.domain.models.user import InternalUser, UserQuery
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.app.infrastructure.presenters.user_presenter import UserPresenter
+from src.app.presentation.api.constants import USER_EXPORT_PAGE_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USERS: Final[int] = 200_000
+
+
+def _build_repository(count: int) -> InMemoryUserRepository:
+    """Заполняет репозиторий пользователями с уникальными именами и email.
+
+    Args:
+        count: Количество пользователей.
+
+    Returns:
+        Репозиторий.
+    """
+    repository = InMemoryUserRepository()
+    for index in range(count):
+        repository.add(
+            InternalUser(
+                username=f'user_{index}',
+                email=f'user_{index}@example.com',
+                age=18 + index % 60,
+                role=Role.ADMIN if index % 100 == 0 else Role.USER,
+                hashed_password=f'$2b$12${index:053d}',
+            )
+        )
+    return repository
+
+
+def _export_json_array(repository: InMemoryUserRepository) -> int:
+    """Строит ответ одним JSON-массивом моделей UserResponse, как сделал бы обработчик, возвращающий list().
+
+    Args:
+        repository: Репозиторий пользователей.
+
+    Returns:
+        Размер ответа в байтах.
+    """
+    users = [UserPresenter.to_response(user) for user in repository.list()]
+    body = b'[' + b','.join(user.__pydantic_serializer__.to_json(user) for user in users) + b']'
+    return len(body)
+
+
+def _export_ndjson_pages(repository: InMemoryUserRepository) -> int:
+    """Проходит репозиторий страницами и кодирует каждую в NDJSON, отбрасывая отправленные части.
+
+    Args:
+        repository: Репозиторий пользователей.
+
+    Returns:
+        Размер ответа в байтах.
+    """
+    query = UserQuery()
+    cursor = None
+    size = 0
+
+    while True:
+        page = repository.list_page(query, USER_EXPORT_PAGE_SIZE, cursor)
+        size += len(UserPresenter.to_ndjson(page.items))
+        if page.next_cursor is None:
+            return size
+        cursor = page.next_cursor
+
+
+def measure(export: 'Callable[[InMemoryUserRepository], int]', repository: InMemoryUserRepository) -> tuple[int, float]:
+    """Измеряет пиковую память сверх хранилища и время выгрузки.
+
+    Args:
+        export: Способ выгрузки.
+        repository: Репозиторий пользователей.
+
+    Returns:
+        Пиковый прирост памяти в байтах и время в секундах.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        export(repository)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak, elapsed
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Запускает замер выгрузки.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='Замер выгрузки пользователей.')
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS, help='Количество пользователей.')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    repository = _build_repository(args.users)
+
+    for label, export in (('json array of list()', _export_json_array), ('paged ndjson', _export_ndjson_pages)):
+        peak, elapsed = measure(export, repository)
+        logger.info(f'{label:<22} peak {peak / 2**20:>9.1f} MiB {elapsed:>8.2f} s (under tracemalloc)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""Замер памяти, занимаемой in-memory хранилищем пользователей.
+
+Сравнивает словарь обычных dataclass-экземпляров (прежнее хранение),
+словарь экземпляров со __slots__ и столбцовый InMemoryUserRepository.
+
+Запуск: ``make benchmark BENCH=user_memory_benchmark ARGS="--users 1000000"``.
+"""
+
+import argparse
+import gc
+import logging
+import tracemalloc
+from dataclasses import dataclass
+from typing import Final, TYPE_CHECKING
+
+from src.app.domain.models.user import InternalUser
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import InMemoryUserRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USERS: Final[int] = 200_000
+
+
+@dataclass(frozen=True, kw_only=True)
+class _DictUser:
+    """Пользователь с теми же полями, что InternalUser, но со словарём атрибутов."""
+
+    username: str
+    email: str
+    age: int
+    role: Role
+    version: int
+    hashed_password: str
+
+
+def _user_fields(count: int) -> 'Iterator[dict[str, object]]':
+    """Порождает поля пользователей с уникальными строками, как у реальных учётных записей.
+
+    Args:
+        count: Количество пользователей.
+
+    Yields:
+        Словарь полей очередного пользователя.
+    """
+    for index in range(count):
+        yield {
+            'username': f'user_{index}',
+            'email': f'user_{index}@example.com',
+            'age': 18 + index % 60,
+            'role': Role.ADMIN if index % 100 == 0 else Role.USER,
+            'version': 1,
+            'hashed_password': f'$2b$12${index:053d}',
+        }
+
+
+def _build_dict_store(count: int) -> object:
+    """Строит словарь экземпляров без __slots__.
+
+    Args:
+        count: Количество пользователей.
+
+    Returns:
+        Хранилище.
+    """
+    return {str(fields['username']): _DictUser(**fields) for fields in _user_fields(count)}  # type: ignore[arg-type]
+
+
+def _build_slots_store(count: int) -> object:
+    """Строит словарь экземпляров InternalUser со __slots__.
+
+    Args:
+        count: Количество пользователей.
+
+    Returns:
+        Хранилище.
+    """
+    return {str(fields['username']): InternalUser(**fields) for fields in _user_fields(count)}  # type: ignore[arg-type]
+
+
+def _build_repository(count: int) -> object:
+    """Заполняет столбцовый in-memory репозиторий.
+
+    Args:
+        count: Количество пользователей.
+
+    Returns:
+        Хранилище.
+    """
+    repository = InMemoryUserRepository()
+    for fields in _user_fields(count):
+        repository.add(InternalUser(**fields))  # type: ignore[arg-type]
+    return repository
+
+
+def measure(build: 'Callable[[int], object]', count: int) -> int:
+    """Измеряет память, удерживаемую построенным хранилищем.
+
+    Args:
+        build: Функция построения хранилища.
+        count: Количество пользователей.
+
+    Returns:
+        Объём памяти в байтах.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        store = build(count)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del store
+    return retained
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Запускает замер памяти.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='Замер памяти хранилищ пользователей.')
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS, help='Количество пользователей.')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    baseline = None
+    for label, build in (
+        ('dict of dataclasses', _build_dict_store),
+        ('dict of slots dataclasses', _build_slots_store),
+        ('columnar repository', _build_repository),
+    ):
+        retained = measure(build, args.users)
+        baseline = baseline or retained
+        logger.info(
+            f'{label:<28} {retained / 2**20:>9.1f} MiB {retained / args.users:>7.0f} B/user '
+            f'{retained / baseline:>6.0%} of baseline'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""Сравнение in-memory, SQLite и разделяемого между процессами репозиториев пользователей.
+
+Отдельно замеряется пропускная способность in-memory репозитория при
+одновременных добавлениях и чтениях из многих потоков.
+
+Запуск: ``make benchmark BENCH=user_repository_benchmark ARGS="--users 20000"``.
+"""
+
+import argparse
+import contextlib
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Final, TYPE_CHECKING
+
+from src.app.domain.exceptions import UserAlreadyExistsError
+from src.app.domain.models.user import InternalUser
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.app.infrastructure.adapters.repositories.shared_memory_user_repository import SharedMemoryUserRepository
+from src.app.infrastructure.adapters.repositories.sqlite_user_repository import SQLiteUserRepository
+from src.app.infrastructure.config import DEFAULT_USER_REPOSITORY_SQLITE_STATEMENT_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from src.app.domain.repositories.user_repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USERS: Final[int] = 10_000
+DEFAULT_LOOKUPS: Final[int] = 50_000
+DEFAULT_THREADS: Final[int] = 8
+_SEED: Final[int] = 42
+
+
+def _make_users(count: int) -> list[InternalUser]:
+    """Создаёт набор тестовых пользователей.
+
+    Args:
+        count: Количество пользователей.
+
+    Returns:
+        Список пользователей.
+    """
+    return [
+        InternalUser(
+            username=f'User_{index}',
+            email=f'user_{index}@example.com',
+            age=18 + index % 60,
+            role=Role.USER,
+            hashed_password='$2b$12$' + 'x' * 53,
+        )
+        for index in range(count)
+    ]
+
+
+def _timed(label: str, operations: int, func: 'Callable[[], object]') -> None:
+    """Выполняет функцию и выводит пропускную способность.
+
+    Args:
+        label: Название замера.
+        operations: Количество операций, выполняемых функцией.
+        func: Замеряемая функция.
+    """
+    started_at = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started_at
+    logger.info(f'{label:<40} {elapsed * 1000:>9.1f} ms {operations / elapsed:>12,.0f} ops/s')
+
+
+def run(repository: 'UserRepository', name: str, users: list[InternalUser], lookups: int) -> None:
+    """Замеряет добавление и поиск пользователей в репозитории.
+
+    Args:
+        repository: Проверяемый репозиторий.
+        name: Название репозитория для вывода.
+        users: Пользователи для добавления.
+        lookups: Количество операций поиска.
+    """
+    rng = random.Random(_SEED)
+    hits = [rng.choice(users).username.lower() for _ in range(lookups)]
+    misses = [f'missing_{index}' for index in range(lookups)]
+
+    _timed(f'{name}: add', len(users), lambda: [repository.add(user) for user in users])
+    _timed(f'{name}: get_by_username (hit)', lookups, lambda: [repository.get_by_username(u) for u in hits])
+    _timed(f'{name}: get_by_username (miss)', lookups, lambda: [repository.get_by_username(u) for u in misses])
+    _timed(f'{name}: list', len(users), repository.list)
+
+
+def run_concurrent(users: list[InternalUser], lookups: int, threads: int) -> None:
+    """Замеряет одновременные добавления и чтения in-memory репозитория из многих потоков.
+
+    Половина потоков добавляет пользователей (каждое имя пытаются занять
+    два потока), остальные ищут уже добавленных и отсутствующих пользователей.
+
+    Args:
+        users: Пользователи для добавления.
+        lookups: Количество операций поиска на поток чтения.
+        threads: Количество потоков.
+    """
+    repository = InMemoryUserRepository()
+    for user in users[: len(users) // 2]:
+        repository.add(user)
+
+    writers = max(threads // 2, 1)
+    pairs = max(writers // 2, 1)
+    pending = users[len(users) // 2 :]
+    rng = random.Random(_SEED)
+    names = [rng.choice(users).username for _ in range(lookups)]
+    barrier = threading.Barrier(threads)
+
+    def write(thread: int) -> int:
+        barrier.wait()
+        batch = pending[thread // 2 % pairs :: pairs]
+        for user in batch:
+            with contextlib.suppress(UserAlreadyExistsError):
+                repository.add(user)
+        return len(batch)
+
+    def read(_: int) -> int:
+        barrier.wait()
+        for username in names:
+            repository.get_by_username(username)
+        return len(names)
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        futures = [executor.submit(write if thread < writers else read, thread) for thread in range(threads)]
+        operations = sum(future.result() for future in futures)
+    elapsed = time.perf_counter() - started_at
+
+    label = f'memory, {threads} threads'
+    logger.info(f'{label:<40} {elapsed * 1000:>9.1f} ms {operations / elapsed:>12,.0f} ops/s')
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Запускает сравнение репозиториев.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='Сравнение репозиториев пользователей.')
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS, help='Количество пользователей.')
+    parser.add_argument('--lookups', type=int, default=DEFAULT_LOOKUPS, help='Количество операций поиска.')
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS, help='Количество потоков.')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    users = _make_users(args.users)
+
+    run(InMemoryUserRepository(), 'memory', users, args.lookups)
+    run_concurrent(users, args.lookups, args.threads)
+
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SQLiteUserRepository(
+            path=Path(directory) / 'users.sqlite3',
+            busy_timeout_seconds=5.0,
+            statement_cache_size=DEFAULT_USER_REPOSITORY_SQLITE_STATEMENT_CACHE_SIZE,
+        )
+        try:
+            run(repository, 'sqlite', users, args.lookups)
+        finally:
+            repository.close()
+
+    shared_repository = SharedMemoryUserRepository(name=f'insight-api-benchmark-{os.getpid()}', capacity=len(users))
+    try:
+        run(shared_repository, 'shared_memory', users, args.lookups)
+    finally:
+        shared_repository.unlink()
+        shared_repository.close()
+
+
+if __name__ == '__main__':
+    main()
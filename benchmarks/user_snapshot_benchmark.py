@@ -0,0 +1,82 @@
+"""Замер записи и восстановления снимка in-memory хранилища пользователей.
+
+Запуск: ``make benchmark BENCH=user_snapshot_benchmark ARGS="--users 1000000"``.
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Final, TYPE_CHECKING
+
+from src.app.domain.models.user import InternalUser
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import InMemoryUserRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USERS: Final[int] = 200_000
+
+
+def _build_repository(count: int) -> InMemoryUserRepository:
+    """Заполняет репозиторий пользователями с уникальными именами, email и хешами bcrypt.
+
+    Args:
+        count: Количество пользователей.
+
+    Returns:
+        Репозиторий.
+    """
+    repository = InMemoryUserRepository()
+    for index in range(count):
+        repository.add(
+            InternalUser(
+                username=f'user_{index}',
+                email=f'user_{index}@example.com',
+                age=18 + index % 60,
+                role=Role.ADMIN if index % 100 == 0 else Role.USER,
+                hashed_password=f'$2b$12${index:053d}',
+            )
+        )
+    return repository
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Запускает замер снимка.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='Замер снимка хранилища пользователей.')
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS, help='Количество пользователей.')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    repository = _build_repository(args.users)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'users.snapshot'
+
+        started = time.perf_counter()
+        sections = repository.snapshot()
+        copied = time.perf_counter()
+        repository.save_snapshot(path)
+        written = time.perf_counter()
+        InMemoryUserRepository.from_snapshot(path)
+        restored = time.perf_counter()
+
+        logger.info(f'snapshot size    {path.stat().st_size / 2**20:>9.1f} MiB')
+        logger.info(f'copy sections    {(copied - started) * 1000:>9.1f} ms')
+        logger.info(f'write to disk    {(written - copied) * 1000:>9.1f} ms')
+        logger.info(f'restore          {(restored - written) * 1000:>9.1f} ms')
+
+    del sections
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""Контракт для модели предсказаний."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+
+
+class PredictionModel(ABC):
+    """Интерфейс загруженной версии модели.
+
+    Экземпляр неизменяем после загрузки, поэтому его можно вызывать из
+    нескольких потоков одновременно.
+    """
+
+    @property
+    @abstractmethod
+    def version(self) -> str:
+        """Возвращает версию модели."""
+        pass
+
+    @abstractmethod
+    def predict_many(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list['PredictionOutcome']:
+        """Возвращает прогнозы для строк признаков в порядке строк."""
+        pass
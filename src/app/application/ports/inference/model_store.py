@@ -0,0 +1,40 @@
+"""Контракт для хранилища версионированных артефактов модели."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.app.application.ports.inference.model import PredictionModel
+
+
+class ModelStore(ABC):
+    """Интерфейс хранилища версий модели и указателя на активную версию.
+
+    Указатель общий для всех процессов, читающих хранилище: по нему воркеры
+    узнают о переключении версии, выполненном в другом процессе.
+    """
+
+    @abstractmethod
+    def list_versions(self) -> list[str]:
+        """Возвращает доступные версии от старой к новой."""
+        pass
+
+    @abstractmethod
+    def load(self, version: str) -> 'PredictionModel':
+        """Загружает версию модели.
+
+        Raises:
+            ModelVersionNotFoundError: Если версии нет в хранилище.
+            InvalidModelArtifactError: Если артефакт повреждён или имеет неизвестный формат.
+        """
+        pass
+
+    @abstractmethod
+    def read_active(self) -> str | None:
+        """Возвращает опубликованную активную версию или None, если она не задана."""
+        pass
+
+    @abstractmethod
+    def write_active(self, version: str) -> None:
+        """Публикует активную версию для всех процессов."""
+        pass
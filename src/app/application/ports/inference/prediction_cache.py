@@ -0,0 +1,32 @@
+"""Контракт для кэша результатов предсказаний."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+
+
+class PredictionCache(ABC):
+    """Интерфейс кэша прогнозов активной версии модели.
+
+    Позволяет не вызывать модель для повторяющихся строк признаков.
+    Прогнозы одной версии модели не возвращаются после переключения на другую.
+    """
+
+    @abstractmethod
+    def get(self, features: 'Mapping[str, int | float | str | None]') -> 'PredictionOutcome | None':
+        """Возвращает закэшированный прогноз активной модели или None."""
+        pass
+
+    @abstractmethod
+    def predict_many(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list['PredictionOutcome']:
+        """Возвращает прогнозы в порядке строк, вычисляя активной моделью только отсутствующие в кэше."""
+        pass
+
+    @abstractmethod
+    def compute_many(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list['PredictionOutcome']:
+        """Вычисляет прогнозы активной моделью без поиска в кэше и сохраняет их."""
+        pass
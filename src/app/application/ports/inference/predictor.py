@@ -0,0 +1,18 @@
+"""Контракт для вычисления предсказаний модели."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+
+
+class AsyncPredictor(ABC):
+    """Асинхронный интерфейс вычисления предсказания по признакам одной строки."""
+
+    @abstractmethod
+    async def predict(self, features: 'Mapping[str, int | float | str | None]') -> 'PredictionOutcome':
+        """Возвращает предсказание модели для входных признаков."""
+        pass
@@ -0,0 +1,36 @@
+"""Контракт для кэша успешно проверенных учетных данных."""
+
+from abc import ABC, abstractmethod
+
+
+class CredentialCache(ABC):
+    """Интерфейс кэша успешных проверок пароля.
+
+    Позволяет не выполнять повторную проверку bcrypt для одних и тех же
+    учетных данных в течение короткого времени.
+    """
+
+    @abstractmethod
+    def is_verified(self, username: str, password: str, hashed_password: str) -> bool:
+        """Проверяет, были ли учетные данные недавно успешно проверены для данного хеша.
+
+        Args:
+            username: Имя пользователя.
+            password: Открытый пароль.
+            hashed_password: Текущий хеш пароля пользователя.
+
+        Returns:
+            True, если пара имя/пароль была проверена для этого же хеша и запись не истекла.
+        """
+        pass
+
+    @abstractmethod
+    def remember(self, username: str, password: str, hashed_password: str) -> None:
+        """Запоминает успешную проверку учетных данных.
+
+        Args:
+            username: Имя пользователя.
+            password: Открытый пароль.
+            hashed_password: Хеш пароля, с которым прошла проверка.
+        """
+        pass
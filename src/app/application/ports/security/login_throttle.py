@@ -0,0 +1,34 @@
+"""Контракт для ограничения частоты попыток входа."""
+
+from abc import ABC, abstractmethod
+
+
+class LoginThrottle(ABC):
+    """Интерфейс ограничителя попыток входа по имени пользователя и адресу клиента.
+
+    Проверка выполняется до поиска пользователя и проверки пароля, поэтому
+    перебор паролей отклоняется, не расходуя процессорное время на bcrypt.
+    """
+
+    @abstractmethod
+    def check(self, username: str, client_ip: str | None) -> None:
+        """Отклоняет попытку входа, если лимит неудачных попыток исчерпан; попытку не учитывает.
+
+        Args:
+            username: Имя пользователя из запроса.
+            client_ip: IP-адрес клиента, если известен.
+
+        Raises:
+            TooManyLoginAttemptsError: Если лимит попыток для имени или адреса исчерпан.
+        """
+        pass
+
+    @abstractmethod
+    def record_failure(self, username: str, client_ip: str | None) -> None:
+        """Учитывает неудачную попытку входа.
+
+        Args:
+            username: Имя пользователя из запроса.
+            client_ip: IP-адрес клиента, если известен.
+        """
+        pass
@@ -1,6 +1,10 @@
 """Контракт для сервиса хеширования паролей."""
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 
 class PasswordHasher(ABC):
@@ -15,3 +19,44 @@ class PasswordHasher(ABC):
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         """Проверяет соответствие пароля и его хеша."""
         pass
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Проверяет, нужно ли пересчитать хеш с текущими параметрами."""
+        pass
+
+
+class AsyncPasswordHasher(ABC):
+    """Асинхронный интерфейс сервиса хеширования паролей.
+
+    Используется в обработчиках запросов, чтобы ресурсоёмкое хеширование
+    не блокировало цикл событий и пул потоков веб-сервера.
+    """
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """Возвращает хеш от пароля."""
+        pass
+
+    @abstractmethod
+    async def hash_many(self, passwords: 'Sequence[str]') -> list[str]:
+        """Возвращает хеши паролей в том же порядке, вычисляя их параллельно."""
+        pass
+
+    @abstractmethod
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Проверяет соответствие пароля и его хеша."""
+        pass
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Проверяет, нужно ли пересчитать хеш с текущими параметрами.
+
+        Проверка только разбирает хеш и не требует вычислений bcrypt.
+        """
+        pass
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Освобождает ресурсы, занятые хешером."""
+        pass
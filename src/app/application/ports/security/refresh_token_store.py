@@ -0,0 +1,62 @@
+"""Контракт для хранилища refresh токенов с ротацией."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.app.domain.models.token import RefreshTokenGrant
+
+
+class RefreshTokenStore(ABC):
+    """Интерфейс хранилища refresh токенов.
+
+    Каждый refresh токен может быть использован ровно один раз: при ротации он
+    помечается использованным, а клиент получает новый токен того же семейства.
+    """
+
+    @abstractmethod
+    def issue(self, username: str) -> 'RefreshTokenGrant':
+        """Регистрирует первый refresh токен нового семейства.
+
+        Args:
+            username: Имя пользователя, которому выдаётся токен.
+
+        Returns:
+            Зарегистрированный токен.
+        """
+        pass
+
+    @abstractmethod
+    def rotate(self, token_id: str, family_id: str) -> 'RefreshTokenGrant':
+        """Погашает refresh токен и выдаёт следующий токен того же семейства.
+
+        Args:
+            token_id: Идентификатор предъявленного токена.
+            family_id: Идентификатор семейства предъявленного токена.
+
+        Returns:
+            Новый зарегистрированный токен.
+
+        Raises:
+            InvalidTokenError: Если токен неизвестен, истёк или уже был использован.
+                Повторное использование отзывает всё семейство.
+        """
+        pass
+
+    @abstractmethod
+    def revoke_family(self, family_id: str) -> None:
+        """Отзывает все токены семейства.
+
+        Args:
+            family_id: Идентификатор семейства.
+        """
+        pass
+
+    @abstractmethod
+    def sweep(self) -> int:
+        """Удаляет истёкшие токены.
+
+        Returns:
+            Количество удалённых записей.
+        """
+        pass
@@ -0,0 +1,46 @@
+"""Контракт для списка отозванных access токенов."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+class TokenRevocationStore(ABC):
+    """Интерфейс списка отозванных токенов.
+
+    Запись об отзыве нужна только до истечения срока действия токена:
+    после этого токен отклоняется проверкой 'exp'.
+    """
+
+    @abstractmethod
+    def revoke(self, token_id: str, expires_at: 'datetime') -> None:
+        """Отзывает токен до момента истечения его срока действия.
+
+        Args:
+            token_id: Идентификатор токена (поле 'jti').
+            expires_at: Момент истечения срока действия токена.
+        """
+        pass
+
+    @abstractmethod
+    def is_revoked(self, token_id: str) -> bool:
+        """Проверяет, отозван ли токен.
+
+        Args:
+            token_id: Идентификатор токена (поле 'jti').
+
+        Returns:
+            True, если токен отозван.
+        """
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Удаляет записи о токенах с истёкшим сроком действия.
+
+        Returns:
+            Количество удалённых записей.
+        """
+        pass
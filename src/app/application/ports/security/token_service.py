@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import Any
 
+    from src.app.domain.models.token import RefreshTokenGrant
+
 
 class TokenService(ABC):
     """Интерфейс для генерации и валидации JWT."""
@@ -19,3 +21,13 @@ class TokenService(ABC):
     def decode_access_token(self, token: str) -> dict[str, 'Any']:
         """Декодирует access токен."""
         pass
+
+    @abstractmethod
+    def create_refresh_token(self, grant: 'RefreshTokenGrant') -> str:
+        """Создаёт подписанный refresh токен для зарегистрированной записи."""
+        pass
+
+    @abstractmethod
+    def decode_refresh_token(self, token: str) -> dict[str, 'Any']:
+        """Декодирует refresh токен."""
+        pass
@@ -0,0 +1,31 @@
+"""Контракт для получения актуальной версии учётной записи пользователя."""
+
+from abc import ABC, abstractmethod
+
+
+class UserVersionProvider(ABC):
+    """Интерфейс источника версий учётных записей.
+
+    Используется для дешёвой проверки отзыва токенов, выданных до изменения учётной записи.
+    """
+
+    @abstractmethod
+    async def get_version(self, username: str) -> int | None:
+        """Возвращает текущую версию учётной записи.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Версия учётной записи или None, если пользователь не существует.
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, username: str) -> None:
+        """Сбрасывает закэшированную версию учётной записи.
+
+        Args:
+            username: Имя пользователя.
+        """
+        pass
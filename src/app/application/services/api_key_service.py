@@ -0,0 +1,117 @@
+"""Сервис для выдачи, проверки и отзыва API-ключей."""
+
+import hashlib
+import secrets
+from datetime import datetime, UTC
+from typing import Final, TYPE_CHECKING
+
+from src.app.domain.exceptions import ApiKeyNotFoundError, InvalidApiKeyError, UserNotFoundError
+from src.app.domain.models.api_key import ApiKey
+
+if TYPE_CHECKING:
+    from src.app.domain.models.user import InternalUser
+    from src.app.domain.repositories.api_key_repository import ApiKeyRepository
+    from src.app.domain.repositories.user_repository import AsyncUserRepository
+
+API_KEY_PREFIX: Final[str] = 'ik'
+_KEY_ID_BYTES: Final[int] = 8
+_KEY_SECRET_BYTES: Final[int] = 32
+
+
+def hash_api_key(api_key: str) -> str:
+    """Вычисляет SHA-256 дайджест API-ключа.
+
+    Ключи генерируются с высокой энтропией, поэтому быстрого хеша достаточно:
+    подбор по дайджесту невозможен, а проверка не требует bcrypt.
+
+    Args:
+        api_key: Значение ключа.
+
+    Returns:
+        Шестнадцатеричный дайджест.
+    """
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+async def mint_api_key(
+    username: str,
+    name: str,
+    api_key_repository: 'ApiKeyRepository',
+    user_repository: 'AsyncUserRepository',
+) -> tuple[ApiKey, str]:
+    """Выпускает новый API-ключ для пользователя.
+
+    Args:
+        username: Имя пользователя, от имени которого будет действовать ключ.
+        name: Человекочитаемое название ключа.
+        api_key_repository: Репозиторий API-ключей.
+        user_repository: Репозиторий пользователей.
+
+    Returns:
+        Сохранённая запись о ключе и само значение ключа, которое больше нигде не хранится.
+
+    Raises:
+        UserNotFoundError: Если пользователь не найден.
+    """
+    user = await user_repository.get_by_username(username.strip().lower())
+
+    if user is None:
+        raise UserNotFoundError()
+
+    key_id = secrets.token_hex(_KEY_ID_BYTES)
+    plain_key = f'{API_KEY_PREFIX}_{key_id}_{secrets.token_urlsafe(_KEY_SECRET_BYTES)}'
+    api_key = ApiKey(
+        key_id=key_id,
+        digest=hash_api_key(plain_key),
+        username=user.username,
+        name=name,
+        created_at=datetime.now(UTC),
+    )
+    api_key_repository.add(api_key)
+
+    return api_key, plain_key
+
+
+async def authenticate_api_key(
+    plain_key: str,
+    api_key_repository: 'ApiKeyRepository',
+    user_repository: 'AsyncUserRepository',
+) -> 'InternalUser':
+    """Возвращает пользователя, которому принадлежит API-ключ.
+
+    Args:
+        plain_key: Значение ключа из запроса.
+        api_key_repository: Репозиторий API-ключей.
+        user_repository: Репозиторий пользователей.
+
+    Returns:
+        Владелец ключа.
+
+    Raises:
+        InvalidApiKeyError: Если ключ неизвестен, отозван или его владелец удалён.
+    """
+    api_key = api_key_repository.get_by_digest(hash_api_key(plain_key))
+
+    if api_key is None:
+        raise InvalidApiKeyError()
+
+    user = await user_repository.get_by_username(api_key.username.lower())
+
+    if user is None:
+        raise InvalidApiKeyError()
+
+    return user
+
+
+def revoke_api_key(key_id: str, api_key_repository: 'ApiKeyRepository') -> None:
+    """Отзывает API-ключ.
+
+    Args:
+        key_id: Идентификатор ключа.
+        api_key_repository: Репозиторий API-ключей.
+
+    Raises:
+        ApiKeyNotFoundError: Если ключ не найден.
+    """
+    if api_key_repository.delete(key_id) is None:
+        raise ApiKeyNotFoundError()
@@ -1,16 +1,30 @@
 """Сервис для аутентификации пользователей."""
 
+from dataclasses import replace
+from datetime import datetime, UTC
 from typing import TYPE_CHECKING
 
-from src.app.domain.exceptions import InvalidCredentialsError
+from src.app.application.services.authorization_service import SCOPES_CLAIM
+from src.app.domain.exceptions import InvalidCredentialsError, InvalidTokenError, UserNotFoundError
+from src.app.domain.models.token import TokenPair
+from src.app.domain.value_objects.scope import scopes_for_role
 
 if TYPE_CHECKING:
-    from src.app.application.ports.security.password_hasher import PasswordHasher
-    from src.app.domain.models.user import InternalUser
-    from src.app.domain.repositories.user_repository import UserRepository
+    from typing import Any
 
+    from src.app.application.ports.security.credential_cache import CredentialCache
+    from src.app.application.ports.security.login_throttle import LoginThrottle
+    from src.app.application.ports.security.password_hasher import AsyncPasswordHasher
+    from src.app.application.ports.security.refresh_token_store import RefreshTokenStore
+    from src.app.application.ports.security.token_revocation_store import TokenRevocationStore
+    from src.app.application.ports.security.token_service import TokenService
+    from src.app.application.ports.security.user_version_provider import UserVersionProvider
+    from src.app.domain.models.user import InternalUser, Principal
+    from src.app.domain.repositories.user_repository import AsyncUserRepository
+    from src.app.domain.value_objects.role import Role
 
-def verify_password(password: str, hashed_password: str, password_hasher: 'PasswordHasher') -> None:
+
+async def verify_password(password: str, hashed_password: str, password_hasher: 'AsyncPasswordHasher') -> None:
     """Проверяет корректность пароля по хешу.
 
     Args:
@@ -21,13 +35,13 @@ def verify_password(password: str, hashed_password: str, password_hasher: 'Passw
     Raises:
         InvalidCredentialsError: Если пароль не совпадает.
     """
-    if not password_hasher.verify(password, hashed_password):
+    if not await password_hasher.verify(password, hashed_password):
         raise InvalidCredentialsError()
 
 
-def resolve_current_user(
+async def resolve_current_user(
     username: str,
-    user_repository: 'UserRepository',
+    user_repository: 'AsyncUserRepository',
 ) -> 'InternalUser':
     """Возвращает пользователя по имени.
 
@@ -41,7 +55,7 @@ def resolve_current_user(
     Raises:
         InvalidCredentialsError: Если пользователь не найден.
     """
-    user: InternalUser | None = user_repository.get_by_username(username.strip().lower())
+    user: InternalUser | None = await user_repository.get_by_username(username.strip().lower())
 
     if not user:
         raise InvalidCredentialsError()
@@ -49,26 +63,317 @@ def resolve_current_user(
     return user
 
 
-def authenticate_user(
+async def authenticate_user(  # noqa: PLR0913
     username: str,
     password: str,
-    password_hasher: 'PasswordHasher',
-    user_repository: 'UserRepository',
+    password_hasher: 'AsyncPasswordHasher',
+    user_repository: 'AsyncUserRepository',
+    credential_cache: 'CredentialCache | None' = None,
+    login_throttle: 'LoginThrottle | None' = None,
+    client_ip: str | None = None,
+    version_provider: 'UserVersionProvider | None' = None,
 ) -> 'InternalUser':
     """Аутентифицирует пользователя по имени и паролю.
 
+    Если передан ограничитель попыток, лимит проверяется до поиска
+    пользователя и проверки пароля, поэтому при исчерпанном лимите попытка
+    отклоняется без вычисления bcrypt. В лимит учитываются только неверные
+    имя или пароль: успешные входы и прочие ошибки его не расходуют.
+
+    Если передан кэш учетных данных, недавно проверенная пара имя/пароль
+    для неизменившегося хеша принимается без повторной проверки bcrypt.
+    Хеш, вычисленный с устаревшей стоимостью, после успешной проверки
+    пересчитывается и сохраняется, поэтому смена стоимости не требует сброса паролей.
+    Пересчёт хеша меняет учётные данные, поэтому отзывает ранее выданные токены.
+
     Args:
         username: Имя пользователя.
         password: Пароль.
         password_hasher: Сервис по работе с паролями.
         user_repository: Репозиторий пользователей.
+        credential_cache: Кэш успешных проверок пароля.
+        login_throttle: Ограничитель частоты попыток входа.
+        client_ip: IP-адрес клиента для ограничителя.
+        version_provider: Источник версий учётных записей (None, если авторизация по токену без версий).
 
     Returns:
         Пользователь, если аутентификация прошла успешно.
 
     Raises:
+        TooManyLoginAttemptsError: Если лимит попыток входа исчерпан.
         InvalidCredentialsError: Если пользователь не найден или пароль неверен.
     """
-    user: InternalUser = resolve_current_user(username, user_repository)
-    verify_password(password, user.hashed_password, password_hasher)
+    if login_throttle is not None:
+        login_throttle.check(username, client_ip)
+
+    try:
+        return await _verify_credentials(
+            username, password, password_hasher, user_repository, credential_cache, version_provider
+        )
+    except InvalidCredentialsError:
+        if login_throttle is not None:
+            login_throttle.record_failure(username, client_ip)
+        raise
+
+
+async def _verify_credentials(
+    username: str,
+    password: str,
+    password_hasher: 'AsyncPasswordHasher',
+    user_repository: 'AsyncUserRepository',
+    credential_cache: 'CredentialCache | None',
+    version_provider: 'UserVersionProvider | None',
+) -> 'InternalUser':
+    """Проверяет имя и пароль, при необходимости пересчитывая устаревший хеш.
+
+    Args:
+        username: Имя пользователя.
+        password: Пароль.
+        password_hasher: Сервис по работе с паролями.
+        user_repository: Репозиторий пользователей.
+        credential_cache: Кэш успешных проверок пароля.
+        version_provider: Источник версий учётных записей.
+
+    Returns:
+        Пользователь, если пароль верен.
+
+    Raises:
+        InvalidCredentialsError: Если пользователь не найден или пароль неверен.
+    """
+    user: InternalUser = await resolve_current_user(username, user_repository)
+
+    if credential_cache is not None and credential_cache.is_verified(username, password, user.hashed_password):
+        return user
+
+    await verify_password(password, user.hashed_password, password_hasher)
+
+    if password_hasher.needs_rehash(user.hashed_password):
+        user = await save_account_change(
+            replace(user, hashed_password=await password_hasher.hash(password)), user_repository, version_provider
+        )
+
+    if credential_cache is not None:
+        credential_cache.remember(username, password, user.hashed_password)
+
+    return user
+
+
+async def save_account_change(
+    user: 'InternalUser',
+    user_repository: 'AsyncUserRepository',
+    version_provider: 'UserVersionProvider | None',
+) -> 'InternalUser':
+    """Сохраняет изменение учётной записи, после которого ранее выданные токены не должны приниматься.
+
+    Версия учётной записи увеличивается, а её закэшированное значение
+    сбрасывается: в текущем процессе старые токены отклоняются сразу, в
+    остальных — не позже истечения TTL кэша версий.
+
+    Args:
+        user: Пользователь с изменёнными данными и прежней версией.
+        user_repository: Репозиторий пользователей.
+        version_provider: Источник версий учётных записей (None, если режим отключён).
+
+    Returns:
+        Сохранённый пользователь с новой версией.
+    """
+    user = replace(user, version=user.version + 1)
+    await user_repository.update(user)
+
+    if version_provider is not None:
+        version_provider.invalidate(user.username)
+
     return user
+
+
+async def change_user_role(
+    username: str,
+    role: 'Role',
+    user_repository: 'AsyncUserRepository',
+    version_provider: 'UserVersionProvider | None',
+) -> 'InternalUser':
+    """Меняет роль пользователя и отзывает токены, выданные с прежними правами.
+
+    Args:
+        username: Имя пользователя.
+        role: Новая роль.
+        user_repository: Репозиторий пользователей.
+        version_provider: Источник версий учётных записей (None, если режим отключён).
+
+    Returns:
+        Пользователь с новой ролью.
+
+    Raises:
+        UserNotFoundError: Если пользователь не найден.
+    """
+    user = await user_repository.get_by_username(username.strip().lower())
+
+    if user is None:
+        raise UserNotFoundError()
+
+    if user.role == role:
+        return user
+
+    return await save_account_change(replace(user, role=role), user_repository, version_provider)
+
+
+def build_access_token_claims(user: 'Principal', include_profile: bool) -> dict[str, 'Any']:
+    """Формирует утверждения access токена для пользователя.
+
+    Права доступа роли всегда передаются битовой маской в поле 'scp',
+    поэтому проверка прав на маршрутах не требует загрузки пользователя.
+
+    Args:
+        user: Аутентифицированный пользователь.
+        include_profile: Включать ли в токен профиль и версию учётной записи,
+            достаточные для авторизации без обращения к репозиторию.
+
+    Returns:
+        Словарь утверждений токена.
+    """
+    claims: dict[str, Any] = {
+        'sub': user.username,
+        'role': user.role.value,
+        SCOPES_CLAIM: int(scopes_for_role(user.role)),
+    }
+
+    if include_profile:
+        claims.update(email=user.email, age=user.age, ver=user.version)
+
+    return claims
+
+
+async def verify_principal_version(principal: 'Principal', version_provider: 'UserVersionProvider') -> 'Principal':
+    """Проверяет, что токен выдан для актуальной версии учётной записи.
+
+    Args:
+        principal: Пользователь, восстановленный из утверждений токена.
+        version_provider: Источник текущих версий учётных записей.
+
+    Returns:
+        Тот же пользователь, если версия актуальна.
+
+    Raises:
+        InvalidTokenError: Если пользователь удалён или его учётная запись изменилась после выдачи токена.
+    """
+    if await version_provider.get_version(principal.username) != principal.version:
+        raise InvalidTokenError()
+
+    return principal
+
+
+def issue_token_pair(
+    user: 'Principal',
+    token_service: 'TokenService',
+    refresh_token_store: 'RefreshTokenStore',
+    include_profile: bool,
+) -> TokenPair:
+    """Выдаёт access токен и первый refresh токен нового семейства.
+
+    Args:
+        user: Аутентифицированный пользователь.
+        token_service: Сервис токенов.
+        refresh_token_store: Хранилище refresh токенов.
+        include_profile: Включать ли в access токен профиль и версию учётной записи.
+
+    Returns:
+        Пара токенов.
+    """
+    grant = refresh_token_store.issue(user.username)
+
+    return TokenPair(
+        access_token=token_service.create_access_token(build_access_token_claims(user, include_profile)),
+        refresh_token=token_service.create_refresh_token(grant),
+    )
+
+
+async def refresh_token_pair(
+    refresh_token: str,
+    token_service: 'TokenService',
+    refresh_token_store: 'RefreshTokenStore',
+    user_repository: 'AsyncUserRepository',
+    include_profile: bool,
+) -> TokenPair:
+    """Обменивает refresh токен на новую пару токенов без проверки пароля.
+
+    Предъявленный refresh токен погашается; повторное его использование
+    отзывает всё семейство токенов.
+
+    Args:
+        refresh_token: Refresh токен, полученный от клиента.
+        token_service: Сервис токенов.
+        refresh_token_store: Хранилище refresh токенов.
+        user_repository: Репозиторий пользователей.
+        include_profile: Включать ли в access токен профиль и версию учётной записи.
+
+    Returns:
+        Новая пара токенов.
+
+    Raises:
+        InvalidTokenError: Если refresh токен недействителен, истёк или уже использован.
+        InvalidCredentialsError: Если пользователь больше не существует.
+    """
+    claims = token_service.decode_refresh_token(refresh_token)
+    grant = refresh_token_store.rotate(claims['jti'], claims['fam'])
+
+    try:
+        user = await resolve_current_user(grant.username, user_repository)
+    except InvalidCredentialsError:
+        refresh_token_store.revoke_family(grant.family_id)
+        raise
+
+    return TokenPair(
+        access_token=token_service.create_access_token(build_access_token_claims(user, include_profile)),
+        refresh_token=token_service.create_refresh_token(grant),
+    )
+
+
+def ensure_token_not_revoked(claims: dict[str, 'Any'], revocation_store: 'TokenRevocationStore') -> None:
+    """Проверяет, что access токен не был отозван.
+
+    Токены без идентификатора 'jti' отозвать невозможно, поэтому они пропускаются.
+
+    Args:
+        claims: Утверждения проверенного access токена.
+        revocation_store: Список отозванных токенов.
+
+    Raises:
+        InvalidTokenError: Если токен отозван.
+    """
+    token_id = claims.get('jti')
+
+    if isinstance(token_id, str) and revocation_store.is_revoked(token_id):
+        raise InvalidTokenError()
+
+
+def logout(
+    access_claims: dict[str, 'Any'],
+    refresh_token: str | None,
+    token_service: 'TokenService',
+    revocation_store: 'TokenRevocationStore',
+    refresh_token_store: 'RefreshTokenStore',
+) -> None:
+    """Отзывает access токен и, если передан, всё семейство refresh токена.
+
+    Args:
+        access_claims: Утверждения проверенного access токена.
+        refresh_token: Refresh токен клиента.
+        token_service: Сервис токенов.
+        revocation_store: Список отозванных access токенов.
+        refresh_token_store: Хранилище refresh токенов.
+
+    Raises:
+        InvalidTokenError: Если refresh токен недействителен или выдан другому пользователю.
+    """
+    token_id, expires_at = access_claims.get('jti'), access_claims.get('exp')
+
+    if isinstance(token_id, str) and isinstance(expires_at, int | float):
+        revocation_store.revoke(token_id, datetime.fromtimestamp(expires_at, UTC))
+
+    if refresh_token is not None:
+        refresh_claims = token_service.decode_refresh_token(refresh_token)
+
+        if refresh_claims['sub'] != access_claims.get('sub'):
+            raise InvalidTokenError()
+
+        refresh_token_store.revoke_family(refresh_claims['fam'])
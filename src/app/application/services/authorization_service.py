@@ -0,0 +1,89 @@
+"""Сервис авторизации по правам доступа из access токена."""
+
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+from typing import Final, TYPE_CHECKING
+
+from src.app.domain.exceptions import InsufficientScopeError, InvalidTokenError
+from src.app.domain.models.token import TokenSubject
+from src.app.domain.value_objects.scope import Scope
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from src.app.application.ports.security.user_version_provider import UserVersionProvider
+
+SCOPES_CLAIM: Final[str] = 'scp'
+
+
+@dataclass(frozen=True, slots=True)
+class ScopePolicy:
+    """Политика доступа, заранее скомпилированная в битовую маску.
+
+    Проверка сводится к одной операции AND над маской из токена,
+    без обращения к репозиторию и без перебора списков ролей.
+    """
+
+    required: int
+
+    @classmethod
+    def all_of(cls, *scopes: Scope) -> 'ScopePolicy':
+        """Компилирует политику, требующую все перечисленные права.
+
+        Args:
+            *scopes: Требуемые права.
+
+        Returns:
+            Политика с объединённой маской.
+        """
+        return cls(required=int(reduce(or_, scopes, Scope.NONE)))
+
+    def is_satisfied_by(self, granted: int) -> bool:
+        """Проверяет, покрывает ли выданная маска требуемые права.
+
+        Args:
+            granted: Маска прав из токена.
+
+        Returns:
+            True, если все требуемые права выданы.
+        """
+        return granted & self.required == self.required
+
+
+async def authorize_claims(
+    claims: dict[str, 'Any'],
+    policy: ScopePolicy,
+    version_provider: 'UserVersionProvider | None' = None,
+) -> TokenSubject:
+    """Авторизует запрос по утверждениям проверенного access токена.
+
+    Если передан источник версий и токен содержит версию учётной записи,
+    дополнительно проверяется, что учётная запись не менялась после выдачи токена.
+
+    Args:
+        claims: Утверждения проверенного access токена.
+        policy: Скомпилированная политика маршрута.
+        version_provider: Источник текущих версий учётных записей.
+
+    Returns:
+        Субъект токена с выданными правами.
+
+    Raises:
+        InvalidTokenError: Если утверждения токена некорректны или версия учётной записи устарела.
+        InsufficientScopeError: Если прав недостаточно.
+    """
+    username, granted = claims.get('sub'), claims.get(SCOPES_CLAIM, 0)
+
+    if not isinstance(username, str) or not isinstance(granted, int):
+        raise InvalidTokenError()
+
+    if not policy.is_satisfied_by(granted):
+        raise InsufficientScopeError()
+
+    version = claims.get('ver')
+
+    if version_provider is not None and version is not None and await version_provider.get_version(username) != version:
+        raise InvalidTokenError()
+
+    return TokenSubject(username=username, scopes=Scope(granted))
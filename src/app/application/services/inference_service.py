@@ -1,11 +1,14 @@
 """Сервис для выполнения предсказаний модели на основе входных признаков."""
 
-from typing import TYPE_CHECKING
+from typing import Final, TYPE_CHECKING
+
+from src.app.application.ports.inference.model import PredictionModel
+from src.app.domain.value_objects.prediction_outcome import PREDICTION_AGE_THRESHOLD, PredictionOutcome
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
 
-from src.app.domain.value_objects.prediction_outcome import PREDICTION_AGE_THRESHOLD, PredictionOutcome
+BUILTIN_MODEL_VERSION: Final[str] = 'builtin'
 
 
 def predict_from_features(features: 'Mapping[str, int | float | str | None]') -> PredictionOutcome:
@@ -23,3 +26,65 @@ def predict_from_features(features: 'Mapping[str, int | float | str | None]') ->
         return PredictionOutcome.POSITIVE if age_raw > PREDICTION_AGE_THRESHOLD else PredictionOutcome.NEGATIVE
 
     return PredictionOutcome.NEGATIVE
+
+
+def predict_from_age_column(ages: 'Sequence[int | float]') -> list[PredictionOutcome]:
+    """Вычисляет прогнозы для столбца возрастов за один проход.
+
+    Векторная форма predict_from_features: признаки строк заранее собраны в
+    столбец, поэтому на строку приходится одно сравнение без разбора словаря.
+
+    Args:
+        ages: Возрасты в порядке строк.
+
+    Returns:
+        Значения прогноза в порядке строк.
+    """
+    positive, negative = PredictionOutcome.POSITIVE, PredictionOutcome.NEGATIVE
+    return [positive if age > PREDICTION_AGE_THRESHOLD else negative for age in ages]
+
+
+def predict_from_feature_rows(rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list[PredictionOutcome]:
+    """Вычисляет прогнозы для пачки строк признаков одним вызовом модели.
+
+    Пакетная форма predict_from_features: возрасты строк собираются в
+    столбец, а строки без числового возраста, как и в одиночном вызове,
+    получают отрицательный прогноз.
+
+    Args:
+        rows: Словари входных признаков.
+
+    Returns:
+        Значения прогноза в порядке строк.
+    """
+    ages = [age if isinstance(age := row.get('age', 0), (int | float)) else None for row in rows]
+    outcomes = iter(predict_from_age_column([age for age in ages if age is not None]))
+    return [PredictionOutcome.NEGATIVE if age is None else next(outcomes) for age in ages]
+
+
+class ThresholdModel(PredictionModel):
+    """Встроенная модель: положительный прогноз для возраста выше порога.
+
+    Используется, пока в реестре не активирована загруженная версия, и
+    остаётся доступной для отката.
+    """
+
+    @property
+    def version(self) -> str:
+        """Возвращает версию встроенной модели.
+
+        Returns:
+            Версия модели.
+        """
+        return BUILTIN_MODEL_VERSION
+
+    def predict_many(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list[PredictionOutcome]:
+        """Возвращает прогнозы для строк признаков.
+
+        Args:
+            rows: Словари входных признаков.
+
+        Returns:
+            Значения прогноза в порядке строк.
+        """
+        return predict_from_feature_rows(rows)
@@ -0,0 +1,270 @@
+"""Реестр версий модели с атомарным переключением активной версии."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Final, TYPE_CHECKING
+
+from src.app.domain.exceptions import (
+    BaseAppError,
+    InvalidModelArtifactError,
+    ModelVersionNotFoundError,
+    NoPreviousModelError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from src.app.application.ports.inference.model import PredictionModel
+    from src.app.application.ports.inference.model_store import ModelStore
+    from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+
+_WARMUP_ROWS: Final[tuple['Mapping[str, int | float | str | None]', ...]] = (
+    {'age': 0},
+    {'age': 100, 'income': 1_000_000.0, 'occupation': 'engineer'},
+    {'age': 42, 'income': None, 'occupation': None},
+)
+
+
+def _describe(error: Exception) -> str:
+    """Возвращает текст ошибки сверки для статуса реестра.
+
+    Args:
+        error: Ошибка.
+
+    Returns:
+        Сообщение ошибки.
+    """
+    return error.message if isinstance(error, BaseAppError) else str(error)
+
+
+@dataclass(frozen=True)
+class ModelRegistryStatus:
+    """Снимок состояния реестра."""
+
+    active_version: str
+    resident_versions: list[str]
+    rollback_versions: list[str]
+    available_versions: list[str]
+    sync_error: str | None
+
+
+class ModelRegistry:
+    """Реестр версий модели.
+
+    Версии загружаются из хранилища и прогреваются до переключения: версия,
+    которая не загрузилась или не прошла прогрев, не становится активной.
+    Переключение — замена одной ссылки, поэтому запросы, уже получившие
+    модель, дорабатывают со старой версией, а новые сразу получают новую;
+    чтение активной модели не берёт блокировок.
+
+    В памяти держится до max_resident загруженных версий: откат на любую
+    из них не требует повторной загрузки. Встроенная модель остаётся в
+    памяти всегда.
+
+    Активная версия публикуется в хранилище, а каждый процесс периодически
+    вызывает sync() в фоновой задаче и переключается сам, поэтому смена
+    версии не требует перезапуска воркеров. activate() и rollback()
+    публикуют версию до переключения: если публикация не удалась, процесс
+    продолжает работать с прежней версией, как и остальные. Чтение и прогрев версии
+    выполняются только в sync(), activate() и rollback(); обработчики
+    запросов лишь читают ссылку на активную модель.
+    """
+
+    def __init__(
+        self,
+        fallback: 'PredictionModel',
+        store: 'ModelStore | None',
+        max_resident: int,
+    ) -> None:
+        """Инициализирует реестр со встроенной моделью в качестве активной.
+
+        Args:
+            fallback: Встроенная модель, активная до загрузки первой версии.
+            store: Хранилище версий или None, если доступна только встроенная модель.
+            max_resident: Количество загруженных версий, удерживаемых в памяти для отката.
+        """
+        self._fallback = fallback
+        self._store = store
+        self._max_resident = max_resident
+        self._active = fallback
+        self._resident: OrderedDict[str, PredictionModel] = OrderedDict()
+        self._history: list[str] = []
+        self._lock = threading.Lock()
+        self._sync_error: str | None = None
+
+    @property
+    def active(self) -> 'PredictionModel':
+        """Возвращает активную модель без блокировок и обращений к хранилищу.
+
+        Returns:
+            Активная модель.
+        """
+        return self._active
+
+    def predict_many(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list['PredictionOutcome']:
+        """Вычисляет прогнозы активной моделью.
+
+        Args:
+            rows: Словари входных признаков.
+
+        Returns:
+            Значения прогноза в порядке строк.
+        """
+        return self.active.predict_many(rows)
+
+    def sync(self) -> None:
+        """Переключается на опубликованную версию, а если она не задана — на последнюю доступную.
+
+        Ошибка не меняет активную модель и попадает в status() до следующей
+        успешной сверки.
+
+        Raises:
+            ModelVersionNotFoundError: Если опубликованной версии нет в хранилище.
+            InvalidModelArtifactError: Если версия не загрузилась или не прошла прогрев.
+            OSError: Если хранилище недоступно.
+        """
+        with self._lock:
+            try:
+                self._sync()
+            except Exception as error:
+                self._sync_error = _describe(error)
+                raise
+
+    def activate(self, version: str) -> None:
+        """Загружает и прогревает указанную версию, публикует её и делает активной.
+
+        Args:
+            version: Версия модели.
+
+        Raises:
+            ModelVersionNotFoundError: Если версии нет в хранилище.
+            InvalidModelArtifactError: Если версия не загрузилась или не прошла прогрев.
+            OSError: Если версию не удалось опубликовать; активная версия не меняется.
+        """
+        with self._lock:
+            self._resolve(version)
+            self._publish(version)
+            self._switch(version, remember=True)
+
+    def rollback(self) -> str:
+        """Возвращает активной версию, которая была активна перед текущей, и публикует её.
+
+        Returns:
+            Версия, ставшая активной.
+
+        Raises:
+            NoPreviousModelError: Если переключений ещё не было.
+            InvalidModelArtifactError: Если вытесненную из памяти версию не удалось загрузить снова.
+            OSError: Если версию не удалось опубликовать; активная версия и история не меняются.
+        """
+        with self._lock:
+            if not self._history:
+                raise NoPreviousModelError
+
+            version = self._history[-1]
+            self._resolve(version)
+            self._publish(version)
+            self._history.pop()
+            self._switch(version, remember=False)
+
+        return version
+
+    def status(self) -> ModelRegistryStatus:
+        """Возвращает снимок состояния реестра.
+
+        Returns:
+            Активная версия, версии в памяти, история для отката, версии в хранилище и ошибка последней сверки.
+        """
+        with self._lock:
+            return ModelRegistryStatus(
+                active_version=self._active.version,
+                resident_versions=[self._fallback.version, *self._resident],
+                rollback_versions=list(reversed(self._history)),
+                available_versions=[] if self._store is None else self._store.list_versions(),
+                sync_error=self._sync_error,
+            )
+
+    def _sync(self) -> None:
+        """Переключается на опубликованную или последнюю доступную версию. Вызывается под блокировкой."""
+        if self._store is None:
+            return
+
+        version = self._store.read_active()
+        if version is None:
+            versions = self._store.list_versions()
+            version = versions[-1] if versions else self._fallback.version
+
+        if version != self._active.version:
+            self._switch(version, remember=True)
+        self._sync_error = None
+
+    def _switch(self, version: str, remember: bool) -> None:
+        """Делает версию активной, загрузив и прогрев её при необходимости. Вызывается под блокировкой.
+
+        Args:
+            version: Версия модели.
+            remember: Запомнить текущую версию для отката.
+        """
+        model = self._resolve(version)
+        if model is self._active:
+            return
+
+        if remember:
+            self._history.append(self._active.version)
+            del self._history[: -self._max_resident]
+
+        self._active = model
+        self._evict()
+
+    def _resolve(self, version: str) -> 'PredictionModel':
+        """Возвращает версию из памяти или загружает и прогревает её.
+
+        Args:
+            version: Версия модели.
+
+        Returns:
+            Модель, готовая к вызову.
+
+        Raises:
+            ModelVersionNotFoundError: Если версии нет в хранилище.
+            InvalidModelArtifactError: Если версия не загрузилась или не прошла прогрев.
+        """
+        if version == self._fallback.version:
+            return self._fallback
+
+        if (model := self._resident.get(version)) is not None:
+            self._resident.move_to_end(version)
+            return model
+
+        if self._store is None:
+            raise ModelVersionNotFoundError(version)
+
+        model = self._store.load(version)
+        try:
+            outcomes = model.predict_many(_WARMUP_ROWS)
+        except Exception as error:
+            raise InvalidModelArtifactError(version, f'warm-up failed: {error}') from error
+        if len(outcomes) != len(_WARMUP_ROWS):
+            raise InvalidModelArtifactError(version, 'warm-up returned a wrong number of predictions')
+
+        self._resident[version] = model
+        return model
+
+    def _evict(self) -> None:
+        """Вытесняет давно использованные версии сверх max_resident, кроме активной. Вызывается под блокировкой."""
+        for version in list(self._resident):
+            if len(self._resident) <= self._max_resident:
+                return
+            if self._resident[version] is not self._active:
+                del self._resident[version]
+
+    def _publish(self, version: str) -> None:
+        """Публикует активную версию для остальных процессов. Вызывается под блокировкой.
+
+        Args:
+            version: Версия модели.
+        """
+        if self._store is not None:
+            self._store.write_active(version)
+        self._sync_error = None
@@ -0,0 +1,79 @@
+"""Сервис массового создания пользователей."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.app.domain.exceptions import ServiceOverloadedError, UserAlreadyExistsError
+from src.app.domain.models.user import InternalUser
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from src.app.application.ports.security.password_hasher import AsyncPasswordHasher
+    from src.app.domain.exceptions import BaseAppError
+    from src.app.domain.repositories.user_repository import AsyncUserRepository
+    from src.app.domain.value_objects.role import Role
+
+
+@dataclass(frozen=True, slots=True)
+class NewUser:
+    """Данные создаваемого пользователя с паролем в открытом виде."""
+
+    username: str
+    email: str
+    age: int
+    role: 'Role'
+    password: str = field(repr=False)
+
+
+async def create_users(
+    users: 'Sequence[NewUser]',
+    password_hasher: 'AsyncPasswordHasher',
+    user_repository: 'AsyncUserRepository',
+) -> list['BaseAppError | None']:
+    """Создаёт пачку пользователей, хешируя их пароли параллельно.
+
+    Пользователи с уже занятыми именами отклоняются до хеширования, поэтому
+    повторная загрузка того же файла не тратит время на bcrypt. Пароли
+    остальных хешируются одной пачкой в пуле хешера, а пользователи
+    добавляются одним вызовом add_many.
+
+    Args:
+        users: Создаваемые пользователи.
+        password_hasher: Сервис хеширования паролей.
+        user_repository: Репозиторий пользователей.
+
+    Returns:
+        Для каждого пользователя — None, если он создан, или ошибка, по которой он отклонён.
+    """
+    errors: list[BaseAppError | None] = [
+        UserAlreadyExistsError(username=user.username)
+        if await user_repository.get_by_username(user.username) is not None
+        else None
+        for user in users
+    ]
+    pending = [position for position, error in enumerate(errors) if error is None]
+
+    try:
+        hashes = await password_hasher.hash_many([users[position].password for position in pending])
+    except ServiceOverloadedError as error:
+        for position in pending:
+            errors[position] = error
+        return errors
+
+    added = await user_repository.add_many(
+        [
+            InternalUser(
+                username=users[position].username,
+                email=users[position].email,
+                age=users[position].age,
+                role=users[position].role,
+                hashed_password=hashed_password,
+            )
+            for position, hashed_password in zip(pending, hashes, strict=True)
+        ]
+    )
+    for position, rejection in zip(pending, added, strict=True):
+        errors[position] = rejection
+
+    return errors
@@ -16,6 +16,14 @@ class AppEnv(str, Enum):
     PROD = 'production'
 
 
+class RepositoryBackend(str, Enum):
+    """Перечисление хранилищ данных репозиториев."""
+
+    MEMORY = 'memory'
+    SQLITE = 'sqlite'
+    SHARED_MEMORY = 'shared_memory'
+
+
 class LogLevel(str, Enum):
     """Уровни журналирования в приложении."""
 
@@ -6,15 +6,22 @@ from http import HTTPStatus
 class BaseAppError(Exception):
     """Базовая ошибка приложения."""
 
-    def __init__(self, message: str, status_code: HTTPStatus = HTTPStatus.BAD_REQUEST) -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         """Инициализирует ошибку приложения с сообщением и HTTP-статусом.
 
         Args:
             message: Текстовое описание ошибки.
             status_code: HTTP-код, возвращаемый клиенту.
+            headers: Дополнительные HTTP-заголовки ответа.
         """
         self.message = message
         self.status_code = int(status_code)
+        self.headers = headers or {}
 
 
 class UserAlreadyExistsError(BaseAppError):
@@ -29,6 +36,49 @@ class UserAlreadyExistsError(BaseAppError):
         super().__init__(f'User "{username}" already exists', status_code=HTTPStatus.CONFLICT)
 
 
+class EmailAlreadyExistsError(BaseAppError):
+    """Ошибка: email уже занят другим пользователем."""
+
+    def __init__(self, email: str) -> None:
+        """Инициализирует ошибку занятого email.
+
+        Args:
+            email: Email, который уже используется.
+        """
+        super().__init__(f'Email "{email}" is already in use', status_code=HTTPStatus.CONFLICT)
+
+
+class InvalidCursorError(BaseAppError):
+    """Ошибка: курсор пагинации повреждён."""
+
+    def __init__(self) -> None:
+        """Инициализирует ошибку некорректного курсора."""
+        super().__init__('Invalid pagination cursor', status_code=HTTPStatus.BAD_REQUEST)
+
+
+class UserFieldTooLongError(BaseAppError):
+    """Ошибка: значение поля пользователя не помещается в хранилище."""
+
+    def __init__(self, field: str, max_bytes: int) -> None:
+        """Ошибка слишком длинного значения (HTTP 422).
+
+        Args:
+            field: Название поля.
+            max_bytes: Максимальная длина значения в байтах UTF-8.
+        """
+        super().__init__(
+            f'Field "{field}" must not exceed {max_bytes} bytes', status_code=HTTPStatus.UNPROCESSABLE_ENTITY
+        )
+
+
+class UserStorageFullError(BaseAppError):
+    """Ошибка: в хранилище пользователей закончилось место."""
+
+    def __init__(self) -> None:
+        """Ошибка переполнения хранилища (HTTP 507)."""
+        super().__init__('User storage is full', status_code=HTTPStatus.INSUFFICIENT_STORAGE)
+
+
 class UserNotFoundError(BaseAppError):
     """Ошибка: пользователь не найден."""
 
@@ -51,3 +101,88 @@ class InvalidTokenError(BaseAppError):
     def __init__(self) -> None:
         """Ошибка аутентификации (HTTP 401)."""
         super().__init__('Invalid or expired token', status_code=HTTPStatus.UNAUTHORIZED)
+
+
+class ServiceOverloadedError(BaseAppError):
+    """Ошибка: сервис перегружен и временно не принимает новые задачи."""
+
+    def __init__(self, resource: str) -> None:
+        """Ошибка перегрузки ресурса (HTTP 503).
+
+        Args:
+            resource: Название перегруженного ресурса.
+        """
+        super().__init__(f'{resource} is overloaded, try again later', status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+
+
+class TooManyLoginAttemptsError(BaseAppError):
+    """Ошибка: превышен лимит попыток входа."""
+
+    def __init__(self, retry_after_seconds: int) -> None:
+        """Ошибка ограничения частоты попыток входа (HTTP 429).
+
+        Args:
+            retry_after_seconds: Через сколько секунд можно повторить попытку.
+        """
+        super().__init__(
+            'Too many login attempts, try again later',
+            status_code=HTTPStatus.TOO_MANY_REQUESTS,
+            headers={'Retry-After': str(retry_after_seconds)},
+        )
+
+
+class InvalidApiKeyError(BaseAppError):
+    """Ошибка: API-ключ неизвестен или отозван."""
+
+    def __init__(self) -> None:
+        """Ошибка аутентификации по API-ключу (HTTP 401)."""
+        super().__init__('Invalid API key', status_code=HTTPStatus.UNAUTHORIZED)
+
+
+class ApiKeyNotFoundError(BaseAppError):
+    """Ошибка: API-ключ не найден."""
+
+    def __init__(self) -> None:
+        """Ошибка при попытке отозвать несуществующий ключ (HTTP 404)."""
+        super().__init__('API key not found', status_code=HTTPStatus.NOT_FOUND)
+
+
+class InsufficientScopeError(BaseAppError):
+    """Ошибка: в токене нет прав, необходимых для операции."""
+
+    def __init__(self) -> None:
+        """Ошибка авторизации (HTTP 403)."""
+        super().__init__('Insufficient scope', status_code=HTTPStatus.FORBIDDEN)
+
+
+class ModelVersionNotFoundError(BaseAppError):
+    """Ошибка: версия модели не найдена в реестре."""
+
+    def __init__(self, version: str) -> None:
+        """Ошибка при обращении к несуществующей версии модели (HTTP 404).
+
+        Args:
+            version: Запрошенная версия модели.
+        """
+        super().__init__(f'Model version "{version}" not found', status_code=HTTPStatus.NOT_FOUND)
+
+
+class InvalidModelArtifactError(BaseAppError):
+    """Ошибка: артефакт модели не удалось загрузить или прогреть."""
+
+    def __init__(self, version: str, reason: str) -> None:
+        """Ошибка загрузки версии модели (HTTP 422).
+
+        Args:
+            version: Версия модели.
+            reason: Причина, по которой артефакт отклонён.
+        """
+        super().__init__(f'Model version "{version}" is invalid: {reason}', status_code=HTTPStatus.UNPROCESSABLE_ENTITY)
+
+
+class NoPreviousModelError(BaseAppError):
+    """Ошибка: нет предыдущей версии модели для отката."""
+
+    def __init__(self) -> None:
+        """Ошибка отката без истории переключений (HTTP 409)."""
+        super().__init__('No previous model version to roll back to', status_code=HTTPStatus.CONFLICT)
@@ -0,0 +1,22 @@
+"""Доменная модель API-ключа для машинных клиентов."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ApiKey:
+    """Выданный API-ключ.
+
+    Сам ключ не хранится: сохраняется только его SHA-256 дайджест,
+    по которому выполняется поиск при аутентификации.
+    """
+
+    key_id: str
+    digest: str
+    username: str
+    name: str
+    created_at: 'datetime'
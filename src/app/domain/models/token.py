@@ -0,0 +1,42 @@
+"""Доменные модели, описывающие выданные токены."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from src.app.domain.value_objects.scope import Scope
+
+
+@dataclass(frozen=True)
+class RefreshTokenGrant:
+    """Зарегистрированный refresh токен.
+
+    Токены одного семейства порождаются последовательной ротацией от одного входа
+    по паролю. Повторное предъявление уже использованного токена отзывает всё семейство.
+    """
+
+    token_id: str
+    family_id: str
+    username: str
+    expires_at: 'datetime'
+
+
+@dataclass(frozen=True)
+class TokenPair:
+    """Пара access и refresh токенов, выдаваемая клиенту."""
+
+    access_token: str
+    refresh_token: str
+
+
+@dataclass(frozen=True)
+class TokenSubject:
+    """Субъект access токена с выданными ему правами.
+
+    Достаточен для авторизации по правам без загрузки пользователя из репозитория.
+    """
+
+    username: str
+    scopes: 'Scope'
@@ -1,17 +1,22 @@
 """Доменная модель пользователя."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Final, TYPE_CHECKING  # noqa: TC003
 
 if TYPE_CHECKING:
     from src.app.domain.value_objects.role import Role
 
 DEFAULT_ADULT_AGE: Final[int] = 18
+INITIAL_USER_VERSION: Final[int] = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User:
-    """Пользователь, используемый в бизнес-логике."""
+    """Пользователь, используемый в бизнес-логике.
+
+    Модели пользователя объявлены со __slots__: без словаря атрибутов каждый
+    экземпляр заметно меньше, что важно для репозиториев на миллионы записей.
+    """
 
     username: str
     email: str
@@ -26,12 +31,61 @@ class User:
         return self.age >= DEFAULT_ADULT_AGE
 
 
-@dataclass(frozen=True)
-class InternalUser(User):
+@dataclass(frozen=True, slots=True)
+class Principal(User):
+    """Аутентифицированный пользователь с ролью и версией учётной записи.
+
+    Версия увеличивается при изменениях, которые должны сделать недействительными
+    ранее выданные токены (смена пароля, роли, блокировка).
+    """
+
+    role: 'Role'
+    version: int = INITIAL_USER_VERSION
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class InternalUser(Principal):
     """Внутренняя модель пользователя, содержащая хеш пароля.
 
     Используется при аутентификации и работе с репозиторием.
     """
 
     hashed_password: str
-    role: 'Role'
+
+
+@dataclass(frozen=True, slots=True)
+class UserQuery:
+    """Условия отбора пользователей. Незаданные условия не ограничивают выборку."""
+
+    email: str | None = None
+    role: 'Role | None' = None
+    min_age: int | None = None
+    max_age: int | None = None
+
+    def matches(self, user: 'InternalUser') -> bool:
+        """Проверяет, удовлетворяет ли пользователь всем условиям.
+
+        Args:
+            user: Проверяемый пользователь.
+
+        Returns:
+            True, если пользователь подходит под условия.
+        """
+        return (
+            (self.email is None or user.email.lower() == self.email.lower())
+            and (self.role is None or user.role == self.role)
+            and (self.min_age is None or user.age >= self.min_age)
+            and (self.max_age is None or user.age <= self.max_age)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class UserPage:
+    """Страница пользователей для курсорной пагинации.
+
+    Курсор — позиция последнего пользователя страницы в порядке добавления;
+    передаётся в запрос следующей страницы и равен None на последней странице.
+    """
+
+    items: list[InternalUser] = field(default_factory=list)
+    next_cursor: int | None = None
@@ -0,0 +1,53 @@
+"""Абстрактный репозиторий для управления API-ключами."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.app.domain.models.api_key import ApiKey
+
+
+class ApiKeyRepository(ABC):
+    """Абстрактный репозиторий API-ключей."""
+
+    @abstractmethod
+    def add(self, api_key: 'ApiKey') -> None:
+        """Сохраняет выданный ключ.
+
+        Args:
+            api_key: Ключ для сохранения.
+        """
+        pass
+
+    @abstractmethod
+    def get_by_digest(self, digest: str) -> 'ApiKey | None':
+        """Возвращает ключ по SHA-256 дайджесту его значения.
+
+        Args:
+            digest: Шестнадцатеричный SHA-256 дайджест ключа.
+
+        Returns:
+            Найденный ключ или None.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key_id: str) -> 'ApiKey | None':
+        """Удаляет ключ по идентификатору.
+
+        Args:
+            key_id: Идентификатор ключа.
+
+        Returns:
+            Удалённый ключ или None, если ключ не найден.
+        """
+        pass
+
+    @abstractmethod
+    def list(self) -> list['ApiKey']:
+        """Возвращает список всех ключей.
+
+        Returns:
+            Список ключей.
+        """
+        pass
@@ -4,7 +4,10 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from src.app.schemas.user import InternalUser
+    from collections.abc import Sequence
+
+    from src.app.domain.exceptions import BaseAppError
+    from src.app.domain.models.user import InternalUser, UserPage, UserQuery
 
 
 class UserRepository(ABC):
@@ -16,6 +19,35 @@ class UserRepository(ABC):
 
         Args:
             user: Пользователь для добавления.
+
+        Raises:
+            UserAlreadyExistsError: Если имя пользователя уже занято.
+            EmailAlreadyExistsError: Если email уже занят.
+        """
+        pass
+
+    @abstractmethod
+    def add_many(self, users: 'Sequence[InternalUser]') -> list['BaseAppError | None']:
+        """Добавляет пользователей по порядку; отклонённый пользователь не мешает остальным.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        pass
+
+    @abstractmethod
+    def update(self, user: 'InternalUser') -> None:
+        """Заменяет сохранённые данные существующего пользователя.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+            EmailAlreadyExistsError: Если новый email занят другим пользователем.
         """
         pass
 
@@ -39,3 +71,122 @@ class UserRepository(ABC):
             Список пользователей.
         """
         pass
+
+    @abstractmethod
+    def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email (без учета регистра).
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Найденный пользователь или None.
+        """
+        pass
+
+    @abstractmethod
+    def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей, подходящих под условия, в порядке добавления.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: Курсор предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        pass
+
+
+class AsyncUserRepository(ABC):
+    """Асинхронный репозиторий пользователей.
+
+    Используется обработчиками запросов, чтобы ожидание хранилища не занимало
+    потоки пула, в котором FastAPI выполняет синхронные функции.
+    """
+
+    @abstractmethod
+    async def add(self, user: 'InternalUser') -> None:
+        """Добавляет пользователя в репозиторий.
+
+        Args:
+            user: Пользователь для добавления.
+
+        Raises:
+            UserAlreadyExistsError: Если имя пользователя уже занято.
+            EmailAlreadyExistsError: Если email уже занят.
+        """
+        pass
+
+    @abstractmethod
+    async def add_many(self, users: 'Sequence[InternalUser]') -> list['BaseAppError | None']:
+        """Добавляет пользователей по порядку; отклонённый пользователь не мешает остальным.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, user: 'InternalUser') -> None:
+        """Заменяет сохранённые данные существующего пользователя.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+            EmailAlreadyExistsError: Если новый email занят другим пользователем.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> 'InternalUser | None':
+        """Возвращает пользователя по имени (без учета регистра).
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Найденный пользователь или None.
+        """
+        pass
+
+    @abstractmethod
+    async def list(self) -> list['InternalUser']:
+        """Возвращает список всех пользователей.
+
+        Returns:
+            Список пользователей.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email (без учета регистра).
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Найденный пользователь или None.
+        """
+        pass
+
+    @abstractmethod
+    async def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей, подходящих под условия, в порядке добавления.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: Курсор предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        pass
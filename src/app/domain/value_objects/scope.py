@@ -0,0 +1,37 @@
+"""Права доступа (scopes), передаваемые в access токене в виде битовой маски."""
+
+from enum import IntFlag
+from typing import Final, TYPE_CHECKING  # noqa: TC003
+
+from src.app.domain.value_objects.role import Role
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class Scope(IntFlag):
+    """Право доступа. Набор прав кодируется одним целым числом."""
+
+    NONE = 0
+    USERS_READ = 1 << 0
+    PREDICTIONS = 1 << 1
+    ADMIN = 1 << 2
+    API_KEYS_MANAGE = 1 << 3
+
+
+ROLE_SCOPES: Final['Mapping[Role, Scope]'] = {
+    Role.USER: Scope.USERS_READ | Scope.PREDICTIONS,
+    Role.ADMIN: Scope.USERS_READ | Scope.PREDICTIONS | Scope.ADMIN | Scope.API_KEYS_MANAGE,
+}
+
+
+def scopes_for_role(role: Role) -> Scope:
+    """Возвращает набор прав, выдаваемых роли.
+
+    Args:
+        role: Роль пользователя.
+
+    Returns:
+        Битовая маска прав.
+    """
+    return ROLE_SCOPES.get(role, Scope.NONE)
@@ -0,0 +1,74 @@
+"""Фильтр Блума для быстрой проверки отсутствия строкового ключа во множестве."""
+
+import hashlib
+import math
+from typing import Final  # noqa: TC003
+
+_MIN_BITS: Final[int] = 64
+_HASH_HALF_SIZE: Final[int] = 8
+
+
+class BloomFilter:
+    """Вероятностное множество строк без ложноотрицательных ответов.
+
+    Ответ «ключа нет» всегда точен, ответ «ключ, возможно, есть» ошибочен
+    с вероятностью не выше заданной, пока число ключей не превышает ёмкость.
+    Удаление ключей не поддерживается — фильтр пересоздаётся.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Создаёт пустой фильтр, рассчитывая размер и число хеш-функций.
+
+        Args:
+            capacity: Ожидаемое максимальное количество ключей.
+            error_rate: Допустимая вероятность ложноположительного ответа (от 0 до 1).
+        """
+        bits = max(_MIN_BITS, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._size = bits
+        self._hash_count = max(1, round(bits / capacity * math.log(2)))
+        self._bits = bytearray((bits + 7) // 8)
+        self._count = 0
+
+    def add(self, key: str) -> None:
+        """Добавляет ключ в фильтр.
+
+        Args:
+            key: Ключ.
+        """
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, key: object) -> bool:
+        """Проверяет, может ли ключ находиться в фильтре.
+
+        Args:
+            key: Ключ.
+
+        Returns:
+            False, если ключа точно нет; True, если он, возможно, есть.
+        """
+        if not isinstance(key, str):
+            return False
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def __len__(self) -> int:
+        """Возвращает количество добавленных ключей."""
+        return self._count
+
+    def _positions(self, key: str) -> list[int]:
+        """Вычисляет позиции битов ключа методом двойного хеширования.
+
+        Args:
+            key: Ключ.
+
+        Returns:
+            Список позиций битов.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=_HASH_HALF_SIZE * 2).digest()
+        first = int.from_bytes(digest[:_HASH_HALF_SIZE], 'little')
+        second = int.from_bytes(digest[_HASH_HALF_SIZE:], 'little') | 1
+        return [(first + index * second) % self._size for index in range(self._hash_count)]
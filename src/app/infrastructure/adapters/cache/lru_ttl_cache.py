@@ -0,0 +1,134 @@
+"""Потокобезопасный LRU-кэш с ограничением по размеру и времени жизни записей."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Снимок счётчиков кэша."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля попаданий среди всех обращений к кэшу.
+
+        Returns:
+            Значение от 0 до 1; 0, если обращений ещё не было.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUTTLCache[K: 'Hashable', V]:
+    """LRU-кэш с ограничением размера и TTL для каждой записи.
+
+    Просроченные записи удаляются лениво — при обращении к ним или при вытеснении.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Инициализирует пустой кэш.
+
+        Args:
+            max_size: Максимальное количество записей.
+            ttl_seconds: Время жизни записи по умолчанию в секундах.
+            clock: Источник монотонного времени в секундах.
+        """
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> V | None:
+        """Возвращает значение по ключу и помечает запись как недавно использованную.
+
+        Args:
+            key: Ключ записи.
+
+        Returns:
+            Значение или None, если запись отсутствует или просрочена.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """Сохраняет значение, вытесняя самую давно использованную запись при переполнении.
+
+        Args:
+            key: Ключ записи.
+            value: Значение.
+            ttl_seconds: Время жизни записи; по умолчанию используется TTL кэша.
+        """
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """Удаляет запись по ключу, если она существует.
+
+        Args:
+            key: Ключ записи.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Удаляет все записи, сохраняя счётчики обращений."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Возвращает текущие счётчики кэша.
+
+        Returns:
+            Снимок статистики кэша.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+    def __len__(self) -> int:
+        """Возвращает количество записей, включая ещё не удалённые просроченные."""
+        return len(self._entries)
@@ -0,0 +1,140 @@
+"""Хранилище версий модели в локальном каталоге."""
+
+import os
+import re
+from pathlib import Path  # noqa: TC003
+from typing import Final, TYPE_CHECKING
+
+import orjson
+from pydantic import ValidationError
+
+from src.app.application.ports.inference.model_store import ModelStore
+from src.app.domain.exceptions import InvalidModelArtifactError, ModelVersionNotFoundError
+from src.app.infrastructure.adapters.inference.linear_model import LINEAR_MODEL_KIND, LinearModel
+from src.app.infrastructure.adapters.inference.npy_array import InvalidNpyError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.app.application.ports.inference.model import PredictionModel
+
+ARTIFACT_SUFFIX: Final[str] = '.json'
+ACTIVE_POINTER_NAME: Final[str] = 'ACTIVE'
+
+_VERSION_PATTERN: Final[re.Pattern[str]] = re.compile(r'[A-Za-z0-9][A-Za-z0-9._-]*')
+_VERSION_NUMBER_PATTERN: Final[re.Pattern[str]] = re.compile(r'(\d+)')
+_MODEL_LOADERS: Final[dict[str, 'Callable[[str, object, Path], PredictionModel]']] = {
+    LINEAR_MODEL_KIND: LinearModel.from_artifact,
+}
+
+
+def _version_key(version: str) -> tuple[tuple[int, str], ...]:
+    """Возвращает ключ сортировки версии, в котором числа сравниваются как числа.
+
+    Args:
+        version: Версия модели.
+
+    Returns:
+        Части имени: числа с их значением, остальной текст как есть.
+    """
+    return tuple(
+        (int(part), '') if part.isdigit() else (-1, part) for part in _VERSION_NUMBER_PATTERN.split(version) if part
+    )
+
+
+class DirectoryModelStore(ModelStore):
+    """Хранилище, в котором каждая версия модели — файл ``<версия>.json`` в одном каталоге.
+
+    Формат модели задаётся полем kind артефакта; файлы весов, на которые
+    ссылается артефакт, лежат в том же каталоге. Версии упорядочиваются по
+    имени, а числа в имени сравниваются как числа: v10 новее v9, а 1.10 — 1.9.
+    Активная версия записывается в файл ACTIVE атомарной заменой, чтобы
+    процессы никогда не прочитали его частично записанным.
+    """
+
+    def __init__(self, path: 'Path') -> None:
+        """Инициализирует хранилище.
+
+        Args:
+            path: Каталог с артефактами.
+        """
+        self._path = path
+
+    def list_versions(self) -> list[str]:
+        """Возвращает версии, для которых в каталоге есть артефакт.
+
+        Returns:
+            Версии от старой к новой.
+        """
+        return sorted(
+            (path.stem for path in self._path.glob(f'*{ARTIFACT_SUFFIX}') if _VERSION_PATTERN.fullmatch(path.stem)),
+            key=_version_key,
+        )
+
+    def load(self, version: str) -> 'PredictionModel':
+        """Читает и проверяет артефакт версии.
+
+        Args:
+            version: Версия модели.
+
+        Returns:
+            Модель.
+
+        Raises:
+            ModelVersionNotFoundError: Если артефакта нет или имя версии недопустимо.
+            InvalidModelArtifactError: Если артефакт не читается или не соответствует схеме.
+        """
+        if not _VERSION_PATTERN.fullmatch(version):
+            raise ModelVersionNotFoundError(version)
+
+        try:
+            data = orjson.loads((self._path / f'{version}{ARTIFACT_SUFFIX}').read_bytes())
+        except FileNotFoundError as error:
+            raise ModelVersionNotFoundError(version) from error
+        except (OSError, orjson.JSONDecodeError) as error:
+            raise InvalidModelArtifactError(version, str(error)) from error
+
+        kind = data.get('kind') if isinstance(data, dict) else None
+        loader = _MODEL_LOADERS.get(kind) if isinstance(kind, str) else None
+        if loader is None:
+            raise InvalidModelArtifactError(version, f'unknown model kind {kind!r}')
+
+        try:
+            return loader(version, data, self._path)
+        except ValidationError as error:
+            reason = '; '.join(
+                f'{".".join(map(str, detail["loc"]))}: {detail["msg"]}' for detail in error.errors(include_url=False)
+            )
+            raise InvalidModelArtifactError(version, reason) from error
+        except (InvalidNpyError, OSError) as error:
+            raise InvalidModelArtifactError(version, str(error)) from error
+
+    def read_active(self) -> str | None:
+        """Читает опубликованную активную версию.
+
+        Returns:
+            Версия или None, если файла ACTIVE нет.
+        """
+        try:
+            return (self._path / ACTIVE_POINTER_NAME).read_text(encoding='utf-8').strip() or None
+        except FileNotFoundError:
+            return None
+
+    def write_active(self, version: str) -> None:
+        """Публикует активную версию, атомарно заменяя файл ACTIVE.
+
+        Args:
+            version: Версия модели.
+        """
+        path = self._path / ACTIVE_POINTER_NAME
+        temporary_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+
+        try:
+            with open(temporary_path, 'w', encoding='utf-8') as file:
+                file.write(f'{version}\n')
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(temporary_path, path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
@@ -0,0 +1,154 @@
+"""Линейная модель, загружаемая из JSON-артефакта."""
+
+from typing import Literal, Self, TYPE_CHECKING  # noqa: TC003
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.app.application.ports.inference.model import PredictionModel
+from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+from src.app.infrastructure.adapters.inference.npy_array import InvalidNpyError, map_npy
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+LINEAR_MODEL_KIND = 'linear'
+
+
+class LinearModelArtifact(BaseModel):
+    """Схема артефакта линейной модели.
+
+    Веса числовых признаков задаются либо прямо в weights, либо списком
+    features и файлом .npy рядом с артефактом, в котором i-й элемент — вес
+    i-го признака. Пример: ``{"kind": "linear", "bias": -30, "weights":
+    {"age": 1.0}, "categories": {"occupation": {"engineer": 2.5}}}``.
+    """
+
+    kind: Literal['linear']
+    bias: float = 0.0
+    threshold: float = 0.0
+    weights: dict[str, float] = Field(default_factory=dict, description='Веса числовых признаков.')
+    features: list[str] = Field(default_factory=list, description='Числовые признаки в порядке весов в weights_file.')
+    weights_file: str | None = Field(
+        default=None,
+        pattern=r'^[A-Za-z0-9][A-Za-z0-9._-]*\.npy$',
+        description='Файл .npy с весами признаков из features в каталоге артефакта.',
+    )
+    categories: dict[str, dict[str, float]] = Field(
+        default_factory=dict, description='Веса значений категориальных признаков.'
+    )
+
+    model_config = ConfigDict(extra='forbid')
+
+    @model_validator(mode='after')
+    def check_weights_source(self) -> Self:
+        """Проверяет, что веса числовых признаков заданы одним способом.
+
+        Returns:
+            Проверенный артефакт.
+
+        Raises:
+            ValueError: Если заданы и weights, и weights_file, или features без weights_file.
+        """
+        if self.weights_file is not None and self.weights:
+            raise ValueError('weights and weights_file are mutually exclusive')
+        if self.features and self.weights_file is None:
+            raise ValueError('features require weights_file')
+        return self
+
+
+class LinearModel(PredictionModel):
+    """Линейный классификатор над взвешенной суммой признаков.
+
+    Прогноз положительный, если bias + сумма весов числовых признаков,
+    умноженных на их значения, + веса значений категориальных признаков
+    больше threshold. Отсутствующие и нечисловые значения числовых признаков
+    и неизвестные категории дают нулевой вклад.
+
+    Веса из файла .npy не копируются: модель читает их прямо из отображения
+    файла в память, поэтому все воркеры хоста делят одни страницы
+    страничного кэша, а загрузка не зависит от размера весов.
+    """
+
+    def __init__(
+        self, version: str, artifact: LinearModelArtifact, feature_weights: 'Sequence[float] | None' = None
+    ) -> None:
+        """Инициализирует модель из проверенного артефакта.
+
+        Args:
+            version: Версия модели.
+            artifact: Параметры модели.
+            feature_weights: Веса признаков из artifact.features, если они хранятся в weights_file.
+        """
+        self._version = version
+        self._bias = artifact.bias
+        self._threshold = artifact.threshold
+        self._weights: Sequence[float]
+        if feature_weights is None:
+            self._features, self._weights = tuple(artifact.weights), tuple(artifact.weights.values())
+        else:
+            self._features, self._weights = tuple(artifact.features), feature_weights
+        self._categories = tuple(artifact.categories.items())
+
+    @classmethod
+    def from_artifact(cls, version: str, data: object, directory: 'Path') -> 'LinearModel':
+        """Проверяет разобранный JSON-артефакт и создаёт модель, отображая файл весов в память.
+
+        Args:
+            version: Версия модели.
+            data: Содержимое артефакта.
+            directory: Каталог артефакта, в котором ищется weights_file.
+
+        Returns:
+            Модель.
+
+        Raises:
+            pydantic.ValidationError: Если артефакт не соответствует схеме.
+            InvalidNpyError: Если файл весов повреждён или не совпадает по длине с features.
+            OSError: Если файл весов не удалось открыть.
+        """
+        artifact = LinearModelArtifact.model_validate(data)
+        if artifact.weights_file is None:
+            return cls(version, artifact)
+
+        feature_weights = map_npy(directory / artifact.weights_file)
+        if len(feature_weights) != len(artifact.features):
+            raise InvalidNpyError(f'{len(feature_weights)} weights for {len(artifact.features)} features')
+        return cls(version, artifact, feature_weights)
+
+    @property
+    def version(self) -> str:
+        """Возвращает версию модели.
+
+        Returns:
+            Версия модели.
+        """
+        return self._version
+
+    def predict_many(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list[PredictionOutcome]:
+        """Возвращает прогнозы для строк признаков.
+
+        Args:
+            rows: Словари входных признаков.
+
+        Returns:
+            Значения прогноза в порядке строк.
+        """
+        positive, negative = PredictionOutcome.POSITIVE, PredictionOutcome.NEGATIVE
+        bias, threshold, categories = self._bias, self._threshold, self._categories
+        features, weights = self._features, self._weights
+        outcomes: list[PredictionOutcome] = []
+
+        for row in rows:
+            score = bias
+            for name, weight in zip(features, weights, strict=True):
+                value = row.get(name)
+                if isinstance(value, int | float):
+                    score += weight * value
+            for name, category_weights in categories:
+                value = row.get(name)
+                if isinstance(value, str):
+                    score += category_weights.get(value, 0.0)
+            outcomes.append(positive if score > threshold else negative)
+
+        return outcomes
@@ -0,0 +1,141 @@
+"""Кэш результатов предсказаний по каноническому вектору признаков и версии модели."""
+
+import time
+from typing import cast, TYPE_CHECKING
+
+from src.app.application.ports.inference.prediction_cache import PredictionCache
+from src.app.infrastructure.adapters.cache.lru_ttl_cache import LRUTTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from src.app.application.ports.inference.model import PredictionModel
+    from src.app.application.services.model_registry import ModelRegistry
+    from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+    from src.app.infrastructure.adapters.cache.lru_ttl_cache import CacheStats
+
+type FeatureKey = tuple[tuple[str, int | float | str], ...]
+
+
+def canonical_features(features: 'Mapping[str, int | float | str | None]') -> FeatureKey:
+    """Приводит словарь признаков к канонической форме ключа кэша.
+
+    Признаки упорядочиваются по имени, а признаки со значением None
+    отбрасываются: модели не отличают их от отсутствующих. Числа сравниваются
+    по значению, поэтому 70000 и 70000.0 дают один ключ.
+
+    Args:
+        features: Словарь входных признаков.
+
+    Returns:
+        Кортеж пар «признак — значение».
+    """
+    return tuple(sorted((name, value) for name, value in features.items() if value is not None))
+
+
+class LRUPredictionCache(PredictionCache):
+    """Ограниченный LRU-кэш прогнозов с TTL перед активной моделью реестра.
+
+    Ключ — версия модели и канонический вектор признаков; словарь кэша
+    сравнивает ключи целиком, поэтому коллизии хешей не дают чужой прогноз.
+    Строки одного вызова вычисляются одной и той же версией модели, а при
+    смене активной версии кэш очищается. Запросы, начатые до переключения,
+    могут дописать прогнозы старой версии, но под её ключом, поэтому новая
+    версия их не увидит. TTL ограничивает жизнь прогноза, если версия
+    с тем же именем была загружена заново.
+    """
+
+    def __init__(
+        self,
+        registry: 'ModelRegistry',
+        max_size: int,
+        ttl_seconds: float,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Инициализирует пустой кэш.
+
+        Args:
+            registry: Реестр, активная модель которого вычисляет промахи.
+            max_size: Максимальное количество закэшированных прогнозов.
+            ttl_seconds: Время жизни прогноза в секундах.
+            clock: Источник монотонного времени в секундах.
+        """
+        self._registry = registry
+        self._cache: LRUTTLCache[tuple[str, FeatureKey], PredictionOutcome] = LRUTTLCache(
+            max_size=max_size, ttl_seconds=ttl_seconds, clock=clock
+        )
+        self._version: str | None = None
+
+    def get(self, features: 'Mapping[str, int | float | str | None]') -> 'PredictionOutcome | None':
+        """Возвращает закэшированный прогноз активной модели для строки признаков.
+
+        Args:
+            features: Словарь входных признаков.
+
+        Returns:
+            Значение прогноза или None, если его нет в кэше.
+        """
+        return self._cache.get((self._current().version, canonical_features(features)))
+
+    def predict_many(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list['PredictionOutcome']:
+        """Возвращает прогнозы из кэша, вычисляя промахи активной моделью за один вызов.
+
+        Args:
+            rows: Словари входных признаков.
+
+        Returns:
+            Значения прогноза в порядке строк.
+        """
+        model = self._current()
+        keys = [(model.version, canonical_features(row)) for row in rows]
+        outcomes = [self._cache.get(key) for key in keys]
+        misses = [index for index, outcome in enumerate(outcomes) if outcome is None]
+
+        if misses:
+            for index, outcome in zip(misses, model.predict_many([rows[index] for index in misses]), strict=True):
+                self._cache.set(keys[index], outcome)
+                outcomes[index] = outcome
+
+        return cast('list[PredictionOutcome]', outcomes)
+
+    def compute_many(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list['PredictionOutcome']:
+        """Вычисляет прогнозы активной моделью без поиска в кэше и сохраняет их.
+
+        Предназначен для строк, уже не найденных через get(), чтобы промах
+        не учитывался в статистике дважды.
+
+        Args:
+            rows: Словари входных признаков.
+
+        Returns:
+            Значения прогноза в порядке строк.
+        """
+        model = self._current()
+        outcomes = model.predict_many(rows)
+
+        for row, outcome in zip(rows, outcomes, strict=True):
+            self._cache.set((model.version, canonical_features(row)), outcome)
+
+        return outcomes
+
+    def stats(self) -> 'CacheStats':
+        """Возвращает счётчики попаданий и промахов кэша прогнозов.
+
+        Returns:
+            Снимок статистики кэша.
+        """
+        return self._cache.stats()
+
+    def _current(self) -> 'PredictionModel':
+        """Возвращает активную модель, очищая кэш, если её версия сменилась.
+
+        Returns:
+            Активная модель.
+        """
+        model = self._registry.active
+
+        if model.version != self._version:
+            self._version = model.version
+            self._cache.clear()
+
+        return model
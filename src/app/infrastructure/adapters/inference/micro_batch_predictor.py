@@ -0,0 +1,161 @@
+"""Реализация AsyncPredictor, собирающая одновременные запросы в пачки для одного вызова модели."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.app.application.ports.inference.predictor import AsyncPredictor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+
+
+@dataclass(frozen=True)
+class BatcherStats:
+    """Снимок счётчиков пакетной обработки."""
+
+    batches: int
+    items: int
+    full_batches: int
+    max_batch_size: int
+    queue_delay_seconds_total: float
+    queue_delay_seconds_max: float
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Средний размер пачки.
+
+        Returns:
+            Среднее число строк в вызове модели; 0, если вызовов ещё не было.
+        """
+        return self.items / self.batches if self.batches else 0.0
+
+    @property
+    def mean_queue_delay_seconds(self) -> float:
+        """Среднее время ожидания строки в очереди до вызова модели.
+
+        Returns:
+            Время в секундах; 0, если вызовов ещё не было.
+        """
+        return self.queue_delay_seconds_total / self.items if self.items else 0.0
+
+
+class MicroBatchPredictor(AsyncPredictor):
+    """Асинхронный предиктор с динамическим объединением запросов в пачки.
+
+    Первая строка открывает пачку и запускает таймер ожидания. Пачка
+    отправляется в модель, когда набирает max_batch_size строк или когда
+    истекает max_wait_seconds, после чего каждый ожидающий получает свой
+    результат. Так накладные расходы вызова модели делятся между
+    одновременными запросами, а задержка одиночного запроса ограничена
+    max_wait_seconds.
+
+    Экземпляр используется из одного цикла событий: пачка вычисляется в нём
+    же, без блокировок.
+    """
+
+    def __init__(
+        self,
+        predict_many: 'Callable[[Sequence[Mapping[str, int | float | str | None]]], Sequence[PredictionOutcome]]',
+        max_batch_size: int,
+        max_wait_seconds: float,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Инициализирует предиктор с пустой очередью.
+
+        Args:
+            predict_many: Пакетный вызов модели, возвращающий прогнозы в порядке строк.
+            max_batch_size: Размер пачки, при котором она отправляется без ожидания.
+            max_wait_seconds: Максимальное время ожидания первой строки пачки в секундах.
+            clock: Источник монотонного времени в секундах.
+        """
+        self._predict_many = predict_many
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._rows: list[Mapping[str, int | float | str | None]] = []
+        self._waiters: list[asyncio.Future[PredictionOutcome]] = []
+        self._enqueued_at: list[float] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches = 0
+        self._items = 0
+        self._full_batches = 0
+        self._queue_delay_total = 0.0
+        self._queue_delay_max = 0.0
+
+    async def predict(self, features: 'Mapping[str, int | float | str | None]') -> 'PredictionOutcome':
+        """Ставит строку в текущую пачку и ожидает её прогноз.
+
+        Args:
+            features: Словарь входных признаков.
+
+        Returns:
+            Значение прогноза для строки.
+        """
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[PredictionOutcome] = loop.create_future()
+
+        self._rows.append(features)
+        self._waiters.append(waiter)
+        self._enqueued_at.append(self._clock())
+
+        if len(self._rows) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait_seconds, self._flush)
+
+        return await waiter
+
+    def stats(self) -> BatcherStats:
+        """Возвращает снимок счётчиков пакетной обработки.
+
+        Returns:
+            Количество пачек и строк, число полных пачек и время ожидания строк в очереди.
+        """
+        return BatcherStats(
+            batches=self._batches,
+            items=self._items,
+            full_batches=self._full_batches,
+            max_batch_size=self._max_batch_size,
+            queue_delay_seconds_total=self._queue_delay_total,
+            queue_delay_seconds_max=self._queue_delay_max,
+        )
+
+    def _flush(self) -> None:
+        """Отправляет накопленную пачку в модель и передаёт результаты ожидающим.
+
+        Ошибка модели, как и ответ модели с числом прогнозов, не совпадающим
+        с числом строк, передаётся всем строкам пачки. Результаты для
+        отменённых запросов отбрасываются.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        rows, waiters, enqueued_at = self._rows, self._waiters, self._enqueued_at
+        self._rows, self._waiters, self._enqueued_at = [], [], []
+
+        if not rows:
+            return
+
+        started = self._clock()
+        self._batches += 1
+        self._items += len(rows)
+        self._full_batches += len(rows) >= self._max_batch_size
+        self._queue_delay_total += sum(started - moment for moment in enqueued_at)
+        self._queue_delay_max = max(self._queue_delay_max, started - enqueued_at[0])
+
+        try:
+            results = list(zip(waiters, self._predict_many(rows), strict=True))
+        except Exception as error:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(error)
+            return
+
+        for waiter, outcome in results:
+            if not waiter.done():
+                waiter.set_result(outcome)
@@ -0,0 +1,106 @@
+"""Отображение одномерных массивов чисел с плавающей точкой формата .npy в память без NumPy."""
+
+import ast
+import mmap
+import struct
+import sys
+from typing import Final, Literal, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NPY_MAGIC: Final[bytes] = b'\x93NUMPY'
+
+_VERSION_HEADER_LENGTHS: Final[dict[int, struct.Struct]] = {
+    1: struct.Struct('<H'),
+    2: struct.Struct('<I'),
+    3: struct.Struct('<I'),
+}
+_NATIVE_ORDER: Final[str] = '<' if sys.byteorder == 'little' else '>'
+_FORMATS: Final[dict[str, Literal['d', 'f']]] = {
+    f'{_NATIVE_ORDER}f8': 'd',
+    f'{_NATIVE_ORDER}f4': 'f',
+}
+
+
+class InvalidNpyError(ValueError):
+    """Ошибка: файл не является одномерным массивом .npy типа float32 или float64."""
+
+
+def map_npy(path: 'Path') -> 'memoryview[float]':
+    """Отображает одномерный массив float32 или float64 из файла .npy в память только для чтения.
+
+    Данные не копируются в память процесса: страницы файла читаются из
+    страничного кэша ядра по мере обращения и общие для всех процессов,
+    открывших тот же файл. Отображение живёт, пока жив возвращённый буфер.
+
+    Args:
+        path: Путь к файлу, записанному numpy.save.
+
+    Returns:
+        Буфер элементов массива с форматом struct (например, 'd' для float64).
+
+    Raises:
+        InvalidNpyError: Если формат файла, тип или форма массива не поддерживаются.
+        OSError: Если файл не удалось открыть.
+    """
+    with open(path, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as error:
+            raise InvalidNpyError('Empty .npy file') from error
+
+    buffer = memoryview(mapped)
+    try:
+        return _array_view(buffer)
+    except InvalidNpyError:
+        buffer.release()
+        mapped.close()
+        raise
+
+
+def _array_view(buffer: memoryview) -> 'memoryview[float]':
+    """Разбирает заголовок .npy и возвращает буфер данных массива.
+
+    Args:
+        buffer: Содержимое файла.
+
+    Returns:
+        Буфер элементов массива.
+
+    Raises:
+        InvalidNpyError: Если формат файла, тип или форма массива не поддерживаются.
+    """
+    prefix_length = len(NPY_MAGIC) + 2
+    if bytes(buffer[: len(NPY_MAGIC)]) != NPY_MAGIC or len(buffer) < prefix_length:
+        raise InvalidNpyError('Not an .npy file')
+
+    header_length_format = _VERSION_HEADER_LENGTHS.get(buffer[len(NPY_MAGIC)])
+    if header_length_format is None:
+        raise InvalidNpyError(f'Unsupported .npy version {buffer[len(NPY_MAGIC)]}')
+
+    header_start = prefix_length + header_length_format.size
+    if len(buffer) < header_start:
+        raise InvalidNpyError('Truncated .npy header')
+    (header_length,) = header_length_format.unpack(buffer[prefix_length:header_start])
+    data_start = header_start + header_length
+
+    try:
+        header = ast.literal_eval(bytes(buffer[header_start:data_start]).decode('latin-1'))
+        descr, fortran_order, shape = header['descr'], header['fortran_order'], header['shape']
+    except (ValueError, SyntaxError, TypeError, KeyError, MemoryError, RecursionError) as error:
+        raise InvalidNpyError('Invalid .npy header') from error
+
+    element_format = _FORMATS.get(descr) if isinstance(descr, str) else None
+    if element_format is None:
+        raise InvalidNpyError(f'Unsupported .npy dtype {descr!r}')
+    if not isinstance(shape, tuple) or len(shape) != 1 or fortran_order:
+        raise InvalidNpyError(f'Only one-dimensional arrays are supported, got shape {shape!r}')
+    if type(shape[0]) is not int or shape[0] < 0:
+        raise InvalidNpyError(f'Invalid .npy array length {shape[0]!r}')
+
+    data_end = data_start + shape[0] * struct.calcsize(element_format)
+    if data_end > len(buffer):
+        raise InvalidNpyError('Truncated .npy file')
+
+    return buffer[data_start:data_end].cast(element_format)
@@ -0,0 +1,356 @@
+"""Кэширующие декораторы репозитория пользователей."""
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from src.app.domain.repositories.user_repository import AsyncUserRepository, UserRepository
+from src.app.infrastructure.adapters.cache.lru_ttl_cache import LRUTTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from src.app.domain.exceptions import BaseAppError
+    from src.app.domain.models.user import InternalUser, UserPage, UserQuery
+    from src.app.infrastructure.adapters.cache.lru_ttl_cache import CacheStats
+
+
+class UserLookupCache:
+    """Кэш результатов поиска пользователей по имени.
+
+    Найденные пользователи и отсутствующие имена хранятся в разных LRU-кэшах:
+    имена, перебираемые сканерами, вытесняют друг друга, не трогая реальных
+    пользователей, и живут меньше, чтобы созданный пользователь быстро стал
+    виден другим процессам. Один экземпляр разделяется синхронным и
+    асинхронным декораторами, поэтому запись через любой из них сбрасывает
+    кэш для обоих.
+
+    Каждая запись в репозиторий увеличивает поколение кэша. Результат чтения
+    сохраняется, только если поколение не изменилось с начала чтения, —
+    иначе чтение, начатое до записи, могло бы вернуть в кэш устаревшие данные.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        negative_max_size: int,
+        negative_ttl_seconds: float,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Инициализирует пустой кэш.
+
+        Args:
+            max_size: Максимальное количество закэшированных пользователей.
+            ttl_seconds: Время жизни найденного пользователя в секундах.
+            negative_max_size: Максимальное количество закэшированных отсутствующих имён.
+            negative_ttl_seconds: Время жизни отсутствующего имени в секундах.
+            clock: Источник монотонного времени в секундах.
+        """
+        self._users: LRUTTLCache[str, InternalUser] = LRUTTLCache(
+            max_size=max_size, ttl_seconds=ttl_seconds, clock=clock
+        )
+        self._missing: LRUTTLCache[str, bool] = LRUTTLCache(
+            max_size=negative_max_size, ttl_seconds=negative_ttl_seconds, clock=clock
+        )
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, username: str) -> 'tuple[bool, InternalUser | None]':
+        """Ищет результат поиска пользователя в кэше.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Пара «найден ли результат в кэше — пользователь или None для отсутствующего имени».
+        """
+        key = username.lower()
+        user = self._users.get(key)
+
+        if user is not None:
+            return True, user
+
+        return self._missing.get(key) is not None, None
+
+    def generation(self) -> int:
+        """Возвращает текущее поколение кэша, которое нужно передать в store после чтения.
+
+        Returns:
+            Номер поколения.
+        """
+        with self._lock:
+            return self._generation
+
+    def store(self, username: str, user: 'InternalUser | None', generation: int) -> None:
+        """Сохраняет результат чтения, если с его начала не было записей.
+
+        Args:
+            username: Имя пользователя из запроса.
+            user: Найденный пользователь или None.
+            generation: Поколение, полученное до чтения.
+        """
+        key = username.lower()
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            if user is None:
+                self._missing.set(key, True)
+            else:
+                self._users.set(key, user)
+
+    def invalidate(self, username: str) -> None:
+        """Сбрасывает закэшированный результат для имени после записи.
+
+        Args:
+            username: Имя изменённого пользователя.
+        """
+        key = username.lower()
+
+        with self._lock:
+            self._generation += 1
+            self._users.delete(key)
+            self._missing.delete(key)
+
+    def stats(self) -> 'tuple[CacheStats, CacheStats]':
+        """Возвращает счётчики кэшей найденных пользователей и отсутствующих имён.
+
+        Промах кэша найденных пользователей, попавший в кэш отсутствующих имён,
+        учитывается в обоих снимках.
+
+        Returns:
+            Пара снимков статистики: найденные пользователи, отсутствующие имена.
+        """
+        return self._users.stats(), self._missing.stats()
+
+
+class CachingUserRepository(UserRepository):
+    """Декоратор, кэширующий поиск пользователей по имени для любого UserRepository.
+
+    Поиск по email и выборки страниц не кэшируются и передаются в обёрнутый
+    репозиторий. Записи, сделанные в обход декоратора (например, другим
+    процессом), становятся видны после истечения TTL.
+    """
+
+    def __init__(self, repository: UserRepository, cache: UserLookupCache) -> None:
+        """Инициализирует декоратор.
+
+        Args:
+            repository: Обёртываемый репозиторий.
+            cache: Кэш результатов поиска.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    def add(self, user: 'InternalUser') -> None:
+        """Добавляет пользователя и сбрасывает закэшированное отсутствие его имени.
+
+        Args:
+            user: Пользователь для добавления.
+
+        Raises:
+            UserAlreadyExistsError: Если имя пользователя уже занято.
+            EmailAlreadyExistsError: Если email уже занят.
+        """
+        try:
+            self._repository.add(user)
+        finally:
+            self._cache.invalidate(user.username)
+
+    def add_many(self, users: 'Sequence[InternalUser]') -> list['BaseAppError | None']:
+        """Добавляет пользователей и сбрасывает закэшированное отсутствие их имён.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        try:
+            return self._repository.add_many(users)
+        finally:
+            for user in users:
+                self._cache.invalidate(user.username)
+
+    def update(self, user: 'InternalUser') -> None:
+        """Обновляет пользователя и сбрасывает его закэшированные данные.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+            EmailAlreadyExistsError: Если новый email занят другим пользователем.
+        """
+        try:
+            self._repository.update(user)
+        finally:
+            self._cache.invalidate(user.username)
+
+    def get_by_username(self, username: str) -> 'InternalUser | None':
+        """Возвращает пользователя по имени, обращаясь к репозиторию только при промахе кэша.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Найденный пользователь или None.
+        """
+        cached, user = self._cache.lookup(username)
+
+        if cached:
+            return user
+
+        generation = self._cache.generation()
+        user = self._repository.get_by_username(username)
+        self._cache.store(username, user, generation)
+
+        return user
+
+    def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email без кэширования.
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Найденный пользователь или None.
+        """
+        return self._repository.get_by_email(email)
+
+    def list(self) -> list['InternalUser']:
+        """Возвращает всех пользователей без кэширования.
+
+        Returns:
+            Список пользователей.
+        """
+        return self._repository.list()
+
+    def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей без кэширования.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: Курсор предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        return self._repository.list_page(query, limit, cursor)
+
+
+class AsyncCachingUserRepository(AsyncUserRepository):
+    """Асинхронный декоратор, кэширующий поиск пользователей по имени для любого AsyncUserRepository.
+
+    Попадание в кэш обслуживается без ожидания хранилища.
+    """
+
+    def __init__(self, repository: AsyncUserRepository, cache: UserLookupCache) -> None:
+        """Инициализирует декоратор.
+
+        Args:
+            repository: Обёртываемый репозиторий.
+            cache: Кэш результатов поиска.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def add(self, user: 'InternalUser') -> None:
+        """Добавляет пользователя и сбрасывает закэшированное отсутствие его имени.
+
+        Args:
+            user: Пользователь для добавления.
+
+        Raises:
+            UserAlreadyExistsError: Если имя пользователя уже занято.
+            EmailAlreadyExistsError: Если email уже занят.
+        """
+        try:
+            await self._repository.add(user)
+        finally:
+            self._cache.invalidate(user.username)
+
+    async def add_many(self, users: 'Sequence[InternalUser]') -> list['BaseAppError | None']:
+        """Добавляет пользователей и сбрасывает закэшированное отсутствие их имён.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        try:
+            return await self._repository.add_many(users)
+        finally:
+            for user in users:
+                self._cache.invalidate(user.username)
+
+    async def update(self, user: 'InternalUser') -> None:
+        """Обновляет пользователя и сбрасывает его закэшированные данные.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+            EmailAlreadyExistsError: Если новый email занят другим пользователем.
+        """
+        try:
+            await self._repository.update(user)
+        finally:
+            self._cache.invalidate(user.username)
+
+    async def get_by_username(self, username: str) -> 'InternalUser | None':
+        """Возвращает пользователя по имени, обращаясь к репозиторию только при промахе кэша.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Найденный пользователь или None.
+        """
+        cached, user = self._cache.lookup(username)
+
+        if cached:
+            return user
+
+        generation = self._cache.generation()
+        user = await self._repository.get_by_username(username)
+        self._cache.store(username, user, generation)
+
+        return user
+
+    async def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email без кэширования.
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Найденный пользователь или None.
+        """
+        return await self._repository.get_by_email(email)
+
+    async def list(self) -> list['InternalUser']:
+        """Возвращает всех пользователей без кэширования.
+
+        Returns:
+            Список пользователей.
+        """
+        return await self._repository.list()
+
+    async def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей без кэширования.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: Курсор предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        return await self._repository.list_page(query, limit, cursor)
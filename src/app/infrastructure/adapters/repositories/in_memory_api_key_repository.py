@@ -0,0 +1,66 @@
+"""Реализация in-memory репозитория API-ключей."""
+
+import threading
+from typing import TYPE_CHECKING
+
+from src.app.domain.repositories.api_key_repository import ApiKeyRepository
+
+if TYPE_CHECKING:
+    from src.app.domain.models.api_key import ApiKey
+
+
+class InMemoryApiKeyRepository(ApiKeyRepository):
+    """Ин-мемори реализация репозитория API-ключей.
+
+    Основной индекс — словарь «дайджест — ключ», поэтому аутентификация
+    выполняется за O(1) без перебора ключей. Вспомогательный индекс
+    «идентификатор — дайджест» используется при отзыве.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустые индексы."""
+        self._by_digest: dict[str, ApiKey] = {}
+        self._digest_by_id: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def add(self, api_key: 'ApiKey') -> None:
+        """Сохраняет выданный ключ.
+
+        Args:
+            api_key: Ключ для сохранения.
+        """
+        with self._lock:
+            self._by_digest[api_key.digest] = api_key
+            self._digest_by_id[api_key.key_id] = api_key.digest
+
+    def get_by_digest(self, digest: str) -> 'ApiKey | None':
+        """Возвращает ключ по SHA-256 дайджесту его значения.
+
+        Args:
+            digest: Шестнадцатеричный SHA-256 дайджест ключа.
+
+        Returns:
+            Найденный ключ или None.
+        """
+        return self._by_digest.get(digest)
+
+    def delete(self, key_id: str) -> 'ApiKey | None':
+        """Удаляет ключ по идентификатору.
+
+        Args:
+            key_id: Идентификатор ключа.
+
+        Returns:
+            Удалённый ключ или None, если ключ не найден.
+        """
+        with self._lock:
+            digest = self._digest_by_id.pop(key_id, None)
+            return self._by_digest.pop(digest, None) if digest is not None else None
+
+    def list(self) -> list['ApiKey']:
+        """Возвращает список всех ключей.
+
+        Returns:
+            Список ключей.
+        """
+        return list(self._by_digest.values())
@@ -1,20 +1,87 @@
 """Реализация in-memory репозитория пользователей."""
 
-from typing import TYPE_CHECKING
+import bisect
+import heapq
+import threading
+from array import array
+from typing import Final, TYPE_CHECKING
 
-from src.app.domain.exceptions import UserAlreadyExistsError
-from src.app.domain.repositories.user_repository import UserRepository
+from src.app.domain.exceptions import BaseAppError, EmailAlreadyExistsError, UserAlreadyExistsError, UserNotFoundError
+from src.app.domain.models.user import InternalUser, UserPage
+from src.app.domain.repositories.user_repository import AsyncUserRepository, UserRepository
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.packed_columns import CaseInsensitiveIndex, PackedStringColumn
+from src.app.infrastructure.adapters.repositories.snapshot import (
+    CorruptedSnapshotError,
+    open_snapshot,
+    write_snapshot,
+)
+from src.app.infrastructure.adapters.security.bcrypt_hash_codec import (
+    pack_bcrypt_hash,
+    PACKED_BCRYPT_HASH_SIZE,
+    unpack_bcrypt_hash,
+)
 
 if TYPE_CHECKING:
-    from src.app.domain.models.user import InternalUser
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from pathlib import Path
+
+    from src.app.domain.models.user import UserQuery
+    from src.app.infrastructure.adapters.repositories.snapshot import Section, SnapshotReader
+
+AGE_BUCKET_WIDTH: Final[int] = 10
+
+_ROLES: Final[tuple[Role, ...]] = tuple(Role)
+_ROLE_CODES: Final['Mapping[Role, int]'] = {role: code for code, role in enumerate(_ROLES)}
+_UNPACKED_HASH: Final[bytes] = bytes(PACKED_BCRYPT_HASH_SIZE)
+_ROLE_NAMES: Final[bytes] = '\n'.join(_ROLES).encode()
 
 
 class InMemoryUserRepository(UserRepository):
-    """Ин-мемори реализация репозитория пользователей."""
+    """Ин-мемори реализация репозитория пользователей.
+
+    Пользователи хранятся по столбцам: каждому при добавлении выделяется
+    строка — порядковый номер в столбцах имён, email, возрастов, кодов ролей,
+    версий и хешей паролей. Имена и email лежат в буферах UTF-8, числа — в
+    массивах array, хеши bcrypt упакованы в двоичный вид подряд в одном
+    bytearray (хеши другого формата хранятся отдельным словарём), а объекты
+    InternalUser создаются только при чтении. Поиск по имени и email идёт
+    через хеш-индексы на массивах, не создающие объектов на пользователя.
+    В итоге пользователь занимает в 2–3 раза меньше памяти, чем экземпляр
+    модели в словаре.
+
+    Номер строки служит ключом курсорной пагинации. Вторичные индексы по
+    роли и корзинам возраста хранят номера строк по возрастанию, поэтому
+    начало страницы находится бинарным поиском, а обход ограничивается строками
+    из самого узкого подходящего индекса.
+
+    Столбцы и индексы сохраняются в двоичный снимок как есть и при запуске
+    восстанавливаются копированием секций отображённого в память файла, без
+    разбора записей и повторного построения индексов.
+
+    Репозиторий безопасен для вызова из многих потоков: все операции
+    выполняются под одной блокировкой, поэтому проверки уникальности имени
+    и email атомарны с добавлением, а чтение не видит строку наполовину
+    изменённой. Блокировка не делится на полосы по имени: любая запись
+    выделяет строку в общих столбцах и проверяет email по общему индексу,
+    так что записи разных имён всё равно упорядочиваются. Операции короткие
+    и не освобождают GIL, поэтому одна блокировка не уступает полосам.
+    """
 
     def __init__(self) -> None:
-        """Инициализирует пустой словарь пользователей."""
-        self._users: dict[str, InternalUser] = {}
+        """Инициализирует пустые столбцы и индексы."""
+        self._lock = threading.Lock()
+        self._usernames = PackedStringColumn()
+        self._emails = PackedStringColumn()
+        self._ages = array('i')
+        self._roles = array('B')
+        self._versions = array('I')
+        self._hashes = bytearray()
+        self._unpacked_hashes: dict[int, str] = {}
+        self._username_index = CaseInsensitiveIndex(self._usernames)
+        self._email_index = CaseInsensitiveIndex(self._emails)
+        self._role_index: dict[int, array[int]] = {}
+        self._age_index: dict[int, array[int]] = {}
 
     def add(self, user: 'InternalUser') -> None:
         """Добавляет пользователя в репозиторий.
@@ -23,12 +90,84 @@ class InMemoryUserRepository(UserRepository):
             user: Пользователь для добавления.
 
         Raises:
-            ValueError: Если пользователь с таким же именем уже существует.
+            UserAlreadyExistsError: Если пользователь с таким же именем уже существует.
+            EmailAlreadyExistsError: Если email уже занят.
+        """
+        with self._lock:
+            if self._username_index.find(user.username) is not None:
+                raise UserAlreadyExistsError(username=user.username)
+            if self._email_index.find(user.email) is not None:
+                raise EmailAlreadyExistsError(email=user.email)
+
+            row = len(self._usernames)
+            role_code = _ROLE_CODES[user.role]
+
+            self._usernames.append(user.username)
+            self._emails.append(user.email)
+            self._ages.append(user.age)
+            self._roles.append(role_code)
+            self._versions.append(user.version)
+            self._hashes += _UNPACKED_HASH
+            self._store_hash(row, user.hashed_password)
+            self._email_index.insert(row)
+            self._role_index.setdefault(role_code, array('I')).append(row)
+            self._age_index.setdefault(_age_bucket(user.age), array('I')).append(row)
+            self._username_index.insert(row)
+
+    def add_many(self, users: 'Sequence[InternalUser]') -> list[BaseAppError | None]:
+        """Добавляет пользователей по порядку; отклонённый пользователь не мешает остальным.
+
+        Каждый пользователь добавляется под отдельным захватом блокировки,
+        чтобы чтения не ждали всю пачку.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        errors: list[BaseAppError | None] = []
+
+        for user in users:
+            try:
+                self.add(user)
+            except BaseAppError as error:
+                errors.append(error)
+            else:
+                errors.append(None)
+
+        return errors
+
+    def update(self, user: 'InternalUser') -> None:
+        """Заменяет сохранённые данные существующего пользователя.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+            EmailAlreadyExistsError: Если новый email занят другим пользователем.
         """
-        key = user.username.lower()
-        if key in self._users:
-            raise UserAlreadyExistsError(username=user.username)
-        self._users[key] = user
+        with self._lock:
+            row = self._username_index.find(user.username)
+            if row is None:
+                raise UserNotFoundError()
+
+            if self._email_index.find(user.email) not in (None, row):
+                raise EmailAlreadyExistsError(email=user.email)
+
+            role_code = _ROLE_CODES[user.role]
+            if self._emails.get(row) != user.email:
+                self._email_index.remove(row)
+                self._emails.set(row, user.email)
+                self._email_index.insert(row)
+            _move_row(self._role_index, self._roles[row], role_code, row)
+            _move_row(self._age_index, _age_bucket(self._ages[row]), _age_bucket(user.age), row)
+
+            self._ages[row] = user.age
+            self._roles[row] = role_code
+            self._versions[row] = user.version
+            self._store_hash(row, user.hashed_password)
 
     def get_by_username(self, username: str) -> 'InternalUser | None':
         """Возвращает пользователя по имени без учета регистра.
@@ -39,12 +178,459 @@ class InMemoryUserRepository(UserRepository):
         Returns:
             Пользователь или None, если не найден.
         """
-        return self._users.get(username.lower())
+        with self._lock:
+            row = self._username_index.find(username)
+            return self._materialize(row) if row is not None else None
+
+    def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email без учета регистра.
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        with self._lock:
+            row = self._email_index.find(email)
+            return self._materialize(row) if row is not None else None
 
     def list(self) -> list['InternalUser']:
         """Возвращает всех пользователей из репозитория.
 
+        Returns:
+            Список пользователей в порядке добавления.
+        """
+        with self._lock:
+            return [self._materialize(row) for row in range(len(self._usernames))]
+
+    def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей, подходящих под условия, в порядке добавления.
+
+        Условия проверяются по столбцам, поэтому объекты создаются только
+        для пользователей, попавших на страницу.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: Номер строки последнего пользователя предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        start = 0 if cursor is None else cursor + 1
+        rows: list[int] = []
+
+        with self._lock:
+            for row in self._candidate_rows(query, start):
+                if not self._row_matches(row, query):
+                    continue
+                if len(rows) == limit:
+                    return UserPage(items=[self._materialize(row) for row in rows], next_cursor=rows[-1])
+                rows.append(row)
+
+            return UserPage(items=[self._materialize(row) for row in rows])
+
+    def snapshot(self) -> 'Sequence[Section]':
+        """Копирует столбцы и индексы в секции снимка.
+
+        Копирование занимает время, пропорциональное объёму данных, но не
+        требует обхода пользователей. Снимок согласован: записи ждут окончания
+        копирования. Запись на диск может выполняться позже и в другом потоке:
+        секции не зависят от последующих изменений.
+
+        Returns:
+            Секции снимка для write_snapshot.
+        """
+        with self._lock:
+            return self._dump()
+
+    def save_snapshot(self, path: 'Path') -> None:
+        """Атомарно записывает снимок репозитория в файл.
+
+        Args:
+            path: Путь к файлу снимка.
+        """
+        write_snapshot(path, self.snapshot())
+
+    @classmethod
+    def from_snapshot(cls, path: 'Path') -> 'InMemoryUserRepository':
+        """Восстанавливает репозиторий из файла, записанного save_snapshot.
+
+        Args:
+            path: Путь к файлу снимка.
+
+        Returns:
+            Репозиторий с сохранёнными пользователями.
+
+        Raises:
+            OSError: Если файл не удалось открыть.
+            CorruptedSnapshotError: Если файл повреждён или записан для другого набора ролей.
+        """
+        repository = cls()
+
+        with open_snapshot(path) as reader:
+            if bytes(reader.read_bytes()) != _ROLE_NAMES:
+                raise CorruptedSnapshotError('Snapshot roles differ from the current ones')
+
+            repository._usernames = PackedStringColumn.load(reader)
+            repository._emails = PackedStringColumn.load(reader)
+            repository._ages = reader.read_array('i')
+            repository._roles = reader.read_array('B')
+            repository._versions = reader.read_array('I')
+            repository._hashes = bytearray(reader.read_bytes())
+            unpacked_rows = reader.read_array('I')
+            unpacked_hashes = PackedStringColumn.load(reader)
+            repository._username_index = CaseInsensitiveIndex.load(reader, repository._usernames)
+            repository._email_index = CaseInsensitiveIndex.load(reader, repository._emails)
+            repository._role_index = _load_row_index(reader)
+            repository._age_index = _load_row_index(reader)
+            reader.expect_end()
+
+        size = len(repository._usernames)
+        if (
+            len(repository._emails) != size
+            or len(repository._ages) != size
+            or len(repository._roles) != size
+            or len(repository._versions) != size
+            or len(repository._hashes) != size * PACKED_BCRYPT_HASH_SIZE
+            or len(unpacked_rows) != len(unpacked_hashes)
+        ):
+            raise CorruptedSnapshotError('Snapshot column sizes differ')
+
+        repository._unpacked_hashes = {row: unpacked_hashes.get(index) for index, row in enumerate(unpacked_rows)}
+        return repository
+
+    def _dump(self) -> 'Sequence[Section]':
+        """Копирует столбцы и индексы в секции снимка. Вызывается под блокировкой.
+
+        Returns:
+            Секции снимка.
+        """
+        unpacked_rows = array('I', self._unpacked_hashes)
+        unpacked_hashes = PackedStringColumn()
+        for row in unpacked_rows:
+            unpacked_hashes.append(self._unpacked_hashes[row])
+
+        return [
+            _ROLE_NAMES,
+            *self._usernames.dump(),
+            *self._emails.dump(),
+            self._ages.tobytes(),
+            self._roles.tobytes(),
+            self._versions.tobytes(),
+            bytes(self._hashes),
+            unpacked_rows.tobytes(),
+            *unpacked_hashes.dump(),
+            *self._username_index.dump(),
+            *self._email_index.dump(),
+            *_dump_row_index(self._role_index),
+            *_dump_row_index(self._age_index),
+        ]
+
+    def _materialize(self, row: int) -> InternalUser:
+        """Собирает модель пользователя из значений строки.
+
+        Args:
+            row: Номер строки.
+
+        Returns:
+            Пользователь.
+        """
+        return InternalUser(
+            username=self._usernames.get(row),
+            email=self._emails.get(row),
+            age=self._ages[row],
+            role=_ROLES[self._roles[row]],
+            version=self._versions[row],
+            hashed_password=self._load_hash(row),
+        )
+
+    def _store_hash(self, row: int, hashed_password: str) -> None:
+        """Записывает хеш пароля строки на её место в буфере хешей.
+
+        Args:
+            row: Номер строки.
+            hashed_password: Хеш пароля.
+        """
+        packed = pack_bcrypt_hash(hashed_password)
+        offset = row * PACKED_BCRYPT_HASH_SIZE
+
+        if packed is None:
+            self._unpacked_hashes[row] = hashed_password
+            packed = _UNPACKED_HASH
+        else:
+            self._unpacked_hashes.pop(row, None)
+
+        self._hashes[offset : offset + PACKED_BCRYPT_HASH_SIZE] = packed
+
+    def _load_hash(self, row: int) -> str:
+        """Возвращает хеш пароля строки в текстовом виде.
+
+        Args:
+            row: Номер строки.
+
+        Returns:
+            Хеш пароля.
+        """
+        offset = row * PACKED_BCRYPT_HASH_SIZE
+
+        if self._hashes[offset] == 0:
+            return self._unpacked_hashes[row]
+
+        return unpack_bcrypt_hash(self._hashes[offset : offset + PACKED_BCRYPT_HASH_SIZE])
+
+    def _row_matches(self, row: int, query: 'UserQuery') -> bool:
+        """Проверяет условия отбора по столбцам строки.
+
+        Args:
+            row: Номер строки.
+            query: Условия отбора.
+
+        Returns:
+            True, если пользователь строки подходит под условия.
+        """
+        age = self._ages[row]
+        return (
+            (query.email is None or self._emails.get(row).lower() == query.email.lower())
+            and (query.role is None or self._roles[row] == _ROLE_CODES[query.role])
+            and (query.min_age is None or age >= query.min_age)
+            and (query.max_age is None or age <= query.max_age)
+        )
+
+    def _candidate_rows(self, query: 'UserQuery', start: int) -> 'Iterator[int]':
+        """Возвращает номера строк не меньше start, среди которых находятся все подходящие пользователи.
+
+        Из индексов, применимых к условиям, выбирается содержащий меньше всего
+        строк; остальные условия проверяются уже по столбцам.
+
+        Args:
+            query: Условия отбора.
+            start: Первая допустимая строка.
+
+        Returns:
+            Итератор номеров строк по возрастанию.
+        """
+        if query.email is not None:
+            row = self._email_index.find(query.email)
+            return iter([row] if row is not None and row >= start else [])
+
+        candidates: list[list[array[int]]] = []
+        if query.role is not None:
+            candidates.append([self._role_index.get(_ROLE_CODES[query.role], array('I'))])
+        if query.min_age is not None or query.max_age is not None:
+            candidates.append(_age_buckets(self._age_index, query.min_age, query.max_age))
+
+        if not candidates:
+            return iter(range(start, len(self._usernames)))
+
+        indexes = min(candidates, key=lambda rows: sum(map(len, rows)))
+        return heapq.merge(*(_tail(rows, start) for rows in indexes))
+
+
+def _age_bucket(age: int) -> int:
+    """Возвращает номер корзины индекса для возраста.
+
+    Args:
+        age: Возраст.
+
+    Returns:
+        Номер корзины.
+    """
+    return age // AGE_BUCKET_WIDTH
+
+
+def _age_buckets(age_index: dict[int, array[int]], min_age: int | None, max_age: int | None) -> list[array[int]]:
+    """Возвращает корзины индекса возраста, пересекающиеся с диапазоном.
+
+    Args:
+        age_index: Индекс «корзина возраста — строки по возрастанию».
+        min_age: Нижняя граница возраста включительно.
+        max_age: Верхняя граница возраста включительно.
+
+    Returns:
+        Массивы строк подходящих корзин.
+    """
+    low = None if min_age is None else _age_bucket(min_age)
+    high = None if max_age is None else _age_bucket(max_age)
+
+    return [
+        rows
+        for bucket, rows in age_index.items()
+        if (low is None or bucket >= low) and (high is None or bucket <= high)
+    ]
+
+
+def _tail(rows: array[int], start: int) -> 'Iterable[int]':
+    """Возвращает строки отсортированного массива, не меньшие start, без копирования массива.
+
+    Args:
+        rows: Номера строк по возрастанию.
+        start: Первая допустимая строка.
+
+    Returns:
+        Итератор номеров строк.
+    """
+    return (rows[index] for index in range(bisect.bisect_left(rows, start), len(rows)))
+
+
+def _move_row(index: dict[int, array[int]], old_key: int, new_key: int, row: int) -> None:
+    """Переносит строку между массивами индекса, сохраняя их упорядоченность.
+
+    Args:
+        index: Индекс «значение — строки по возрастанию».
+        old_key: Прежнее значение.
+        new_key: Новое значение.
+        row: Номер строки.
+    """
+    if old_key == new_key:
+        return
+
+    old_rows = index[old_key]
+    del old_rows[bisect.bisect_left(old_rows, row)]
+    if not old_rows:
+        del index[old_key]
+    bisect.insort(index.setdefault(new_key, array('I')), row)
+
+
+def _dump_row_index(index: dict[int, array[int]]) -> list['Section']:
+    """Кодирует индекс «значение — строки» в секции снимка: ключи, размеры массивов и сами массивы подряд.
+
+    Args:
+        index: Индекс «значение — строки по возрастанию».
+
+    Returns:
+        Секции снимка.
+    """
+    rows = array('I')
+    for values in index.values():
+        rows.extend(values)
+
+    return [
+        array('i', index).tobytes(),
+        array('Q', map(len, index.values())).tobytes(),
+        rows.tobytes(),
+    ]
+
+
+def _load_row_index(reader: 'SnapshotReader') -> dict[int, array[int]]:
+    """Восстанавливает индекс «значение — строки» из секций, записанных _dump_row_index.
+
+    Args:
+        reader: Читатель снимка.
+
+    Returns:
+        Индекс «значение — строки по возрастанию».
+
+    Raises:
+        CorruptedSnapshotError: Если размеры массивов не совпадают с количеством строк.
+    """
+    keys = reader.read_array('i')
+    sizes = reader.read_array('Q')
+    rows = reader.read_array('I')
+
+    if len(keys) != len(sizes) or sum(sizes) != len(rows):
+        raise CorruptedSnapshotError('Snapshot index sizes differ')
+
+    index: dict[int, array[int]] = {}
+    start = 0
+    for key, size in zip(keys, sizes, strict=True):
+        index[key] = rows[start : start + size]
+        start += size
+
+    return index
+
+
+class AsyncInMemoryUserRepository(AsyncUserRepository):
+    """Асинхронный доступ к in-memory репозиторию пользователей.
+
+    Операции занимают микросекунды и ждут блокировок только на время таких же
+    коротких операций других потоков, поэтому выполняются прямо в цикле событий.
+    Хранилище общее с синхронным репозиторием, переданным в конструктор.
+    """
+
+    def __init__(self, repository: InMemoryUserRepository) -> None:
+        """Инициализирует адаптер поверх синхронного репозитория.
+
+        Args:
+            repository: Синхронный in-memory репозиторий.
+        """
+        self._repository = repository
+
+    async def add(self, user: 'InternalUser') -> None:
+        """Добавляет пользователя в репозиторий.
+
+        Args:
+            user: Пользователь для добавления.
+
+        Raises:
+            UserAlreadyExistsError: Если пользователь с таким же именем уже существует.
+            EmailAlreadyExistsError: Если email уже занят.
+        """
+        self._repository.add(user)
+
+    async def add_many(self, users: 'Sequence[InternalUser]') -> list[BaseAppError | None]:
+        """Добавляет пользователей по порядку; отклонённый пользователь не мешает остальным.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        return self._repository.add_many(users)
+
+    async def update(self, user: 'InternalUser') -> None:
+        """Заменяет сохранённые данные существующего пользователя.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+            EmailAlreadyExistsError: Если новый email занят другим пользователем.
+        """
+        self._repository.update(user)
+
+    async def get_by_username(self, username: str) -> 'InternalUser | None':
+        """Возвращает пользователя по имени без учета регистра.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        return self._repository.get_by_username(username)
+
+    async def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email без учета регистра.
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        return self._repository.get_by_email(email)
+
+    async def list(self) -> list['InternalUser']:
+        """Возвращает всех пользователей из репозитория.
+
         Returns:
             Список пользователей.
         """
-        return list(self._users.values())
+        return self._repository.list()
+
+    async def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей, подходящих под условия, в порядке добавления.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: Курсор предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        return self._repository.list_page(query, limit, cursor)
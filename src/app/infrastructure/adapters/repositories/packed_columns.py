@@ -0,0 +1,280 @@
+"""Компактные столбцы строк и хеш-индексы для in-memory хранилищ."""
+
+import zlib
+from array import array
+from typing import Final, TYPE_CHECKING
+
+from src.app.infrastructure.adapters.repositories.snapshot import CorruptedSnapshotError, int_section
+
+if TYPE_CHECKING:
+    from src.app.infrastructure.adapters.repositories.snapshot import Section, SnapshotReader
+
+_ENCODING: Final[str] = 'utf-8'
+_EMPTY_SLOT: Final[int] = -1
+_DELETED_SLOT: Final[int] = -2
+_MIN_CAPACITY: Final[int] = 8
+
+
+class PackedStringColumn:
+    """Столбец строк, хранящий их подряд в одном буфере UTF-8.
+
+    Строка занимает свою длину в байтах плюс 12 байт на смещение и длину
+    вместо объекта str (около 50 байт служебных данных на строку). Значение,
+    не помещающееся на прежнее место при замене, дописывается в конец буфера;
+    старое место не переиспользуется.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустой столбец."""
+        self._data = bytearray()
+        self._starts = array('Q')
+        self._lengths = array('I')
+
+    def append(self, value: str) -> None:
+        """Добавляет строку в конец столбца.
+
+        Args:
+            value: Строка.
+        """
+        encoded = value.encode(_ENCODING)
+        self._starts.append(len(self._data))
+        self._lengths.append(len(encoded))
+        self._data += encoded
+
+    def get(self, row: int) -> str:
+        """Возвращает строку по номеру.
+
+        Args:
+            row: Номер строки.
+
+        Returns:
+            Строка.
+        """
+        start = self._starts[row]
+        return self._data[start : start + self._lengths[row]].decode(_ENCODING)
+
+    def set(self, row: int, value: str) -> None:
+        """Заменяет строку по номеру.
+
+        Args:
+            row: Номер строки.
+            value: Новое значение.
+        """
+        encoded = value.encode(_ENCODING)
+
+        if len(encoded) > self._lengths[row]:
+            self._starts[row] = len(self._data)
+            self._data += encoded
+        else:
+            start = self._starts[row]
+            self._data[start : start + len(encoded)] = encoded
+
+        self._lengths[row] = len(encoded)
+
+    def __len__(self) -> int:
+        """Возвращает количество строк в столбце."""
+        return len(self._starts)
+
+    def dump(self) -> list['Section']:
+        """Возвращает копию содержимого столбца в виде секций снимка.
+
+        Returns:
+            Секции снимка.
+        """
+        return [bytes(self._data), self._starts.tobytes(), self._lengths.tobytes()]
+
+    @classmethod
+    def load(cls, reader: 'SnapshotReader') -> 'PackedStringColumn':
+        """Восстанавливает столбец из секций снимка, записанных dump.
+
+        Args:
+            reader: Читатель снимка.
+
+        Returns:
+            Столбец.
+
+        Raises:
+            CorruptedSnapshotError: Если секции не согласованы между собой.
+        """
+        column = cls()
+        column._data = bytearray(reader.read_bytes())
+        column._starts = reader.read_array('Q')
+        column._lengths = reader.read_array('I')
+
+        if len(column._starts) != len(column._lengths):
+            raise CorruptedSnapshotError('Snapshot column sizes differ')
+
+        return column
+
+
+class CaseInsensitiveIndex:
+    """Хеш-индекс «значение без учета регистра — номер строки» поверх PackedStringColumn.
+
+    Открытая адресация с линейным пробированием: каждая ячейка хранит номер
+    строки и отпечаток значения (CRC-32) в двух массивах array, поэтому индекс
+    не создаёт объектов на запись. Отпечаток отсекает почти все несовпадения
+    без чтения столбца и позволяет перестраивать таблицу без повторного
+    хеширования, а в отличие от встроенного hash() не зависит от процесса,
+    поэтому таблица переносится в снимок как есть. Таблица перестраивается
+    при заполнении на две трети.
+
+    Изменения индекса нужно выполнять под внешней блокировкой, а find можно
+    вызывать одновременно с ними из других потоков: массивы таблицы
+    заменяются при перестроении одной парой, а ячейка заполняется отпечатком
+    раньше номера строки, поэтому поиск видит либо прежнее, либо новое
+    состояние ячейки и не пропускает значения, не менявшиеся во время поиска.
+    """
+
+    def __init__(self, column: PackedStringColumn) -> None:
+        """Инициализирует пустой индекс.
+
+        Args:
+            column: Столбец, значения которого индексируются.
+        """
+        self._column = column
+        self._table = (array('i', [_EMPTY_SLOT]) * _MIN_CAPACITY, array('I', [0]) * _MIN_CAPACITY)
+        self._size = 0
+        self._used = 0
+
+    def find(self, value: str) -> int | None:
+        """Ищет строку столбца со значением, равным value без учета регистра.
+
+        Args:
+            value: Искомое значение.
+
+        Returns:
+            Номер строки или None, если значение не проиндексировано.
+        """
+        key = value.lower()
+        fingerprint = _fingerprint(key)
+        rows, fingerprints = self._table
+        mask = len(rows) - 1
+        slot = fingerprint & mask
+
+        while (row := rows[slot]) != _EMPTY_SLOT:
+            if row != _DELETED_SLOT and fingerprints[slot] == fingerprint and self._column.get(row).lower() == key:
+                return row
+            slot = (slot + 1) & mask
+
+        return None
+
+    def insert(self, row: int) -> None:
+        """Индексирует текущее значение строки столбца. Значение не должно быть уже проиндексировано.
+
+        Args:
+            row: Номер строки.
+        """
+        if (self._used + 1) * 3 > len(self._table[0]) * 2:
+            self._rebuild()
+
+        fingerprint = _fingerprint(self._column.get(row).lower())
+        rows, fingerprints = self._table
+        mask = len(rows) - 1
+        slot = fingerprint & mask
+
+        while rows[slot] >= 0:
+            slot = (slot + 1) & mask
+
+        if rows[slot] == _EMPTY_SLOT:
+            self._used += 1
+
+        fingerprints[slot] = fingerprint
+        rows[slot] = row
+        self._size += 1
+
+    def remove(self, row: int) -> None:
+        """Убирает из индекса текущее значение строки столбца.
+
+        Вызывается до изменения значения в столбце.
+
+        Args:
+            row: Номер строки.
+        """
+        fingerprint = _fingerprint(self._column.get(row).lower())
+        rows = self._table[0]
+        mask = len(rows) - 1
+        slot = fingerprint & mask
+
+        while (stored := rows[slot]) != _EMPTY_SLOT:
+            if stored == row:
+                rows[slot] = _DELETED_SLOT
+                self._size -= 1
+                return
+            slot = (slot + 1) & mask
+
+    def __len__(self) -> int:
+        """Возвращает количество проиндексированных значений."""
+        return self._size
+
+    def dump(self) -> list['Section']:
+        """Возвращает копию таблицы индекса в виде секций снимка.
+
+        Returns:
+            Секции снимка.
+        """
+        rows, fingerprints = self._table
+        return [rows.tobytes(), fingerprints.tobytes(), int_section(self._size), int_section(self._used)]
+
+    @classmethod
+    def load(cls, reader: 'SnapshotReader', column: PackedStringColumn) -> 'CaseInsensitiveIndex':
+        """Восстанавливает индекс из секций снимка, записанных dump, без перестроения таблицы.
+
+        Args:
+            reader: Читатель снимка.
+            column: Восстановленный столбец, значения которого индексируются.
+
+        Returns:
+            Индекс.
+
+        Raises:
+            CorruptedSnapshotError: Если таблица индекса повреждена.
+        """
+        index = cls(column)
+        rows = reader.read_array('i')
+        fingerprints = reader.read_array('I')
+        index._size = reader.read_int()
+        index._used = reader.read_int()
+        capacity = len(rows)
+
+        if capacity < _MIN_CAPACITY or capacity & (capacity - 1) or len(fingerprints) != capacity:
+            raise CorruptedSnapshotError('Snapshot index table is invalid')
+
+        index._table = (rows, fingerprints)
+        return index
+
+    def _rebuild(self) -> None:
+        """Перестраивает таблицу по сохранённым отпечаткам, удаляя пометки удалённых ячеек.
+
+        Новая ёмкость — степень двойки, при которой таблица заполнена не более чем наполовину.
+        """
+        capacity = _MIN_CAPACITY
+        while capacity < (self._size + 1) * 2:
+            capacity *= 2
+
+        rows = array('i', [_EMPTY_SLOT]) * capacity
+        fingerprints = array('I', [0]) * capacity
+        mask = capacity - 1
+
+        for row, fingerprint in zip(*self._table, strict=True):
+            if row < 0:
+                continue
+            slot = fingerprint & mask
+            while rows[slot] != _EMPTY_SLOT:
+                slot = (slot + 1) & mask
+            rows[slot] = row
+            fingerprints[slot] = fingerprint
+
+        self._table = (rows, fingerprints)
+        self._used = self._size
+
+
+def _fingerprint(key: str) -> int:
+    """Вычисляет отпечаток значения индекса, одинаковый во всех процессах.
+
+    Args:
+        key: Значение в нижнем регистре.
+
+    Returns:
+        32-битный отпечаток.
+    """
+    return zlib.crc32(key.encode(_ENCODING))
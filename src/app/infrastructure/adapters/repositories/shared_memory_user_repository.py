@@ -0,0 +1,783 @@
+"""Реализация репозитория пользователей в разделяемой памяти, общего для воркеров одного хоста."""
+
+import asyncio
+import dataclasses
+import fcntl
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import cast, Final, Literal, TYPE_CHECKING
+
+from src.app.domain.exceptions import (
+    BaseAppError,
+    EmailAlreadyExistsError,
+    UserAlreadyExistsError,
+    UserFieldTooLongError,
+    UserNotFoundError,
+    UserStorageFullError,
+)
+from src.app.domain.models.user import InternalUser, UserPage
+from src.app.domain.repositories.user_repository import AsyncUserRepository, UserRepository
+from src.app.domain.value_objects.role import Role
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+
+    from src.app.domain.models.user import UserQuery
+
+USERNAME_MAX_BYTES: Final[int] = 64
+EMAIL_MAX_BYTES: Final[int] = 254
+HASHED_PASSWORD_MAX_BYTES: Final[int] = 128
+
+_ENCODING: Final[str] = 'utf-8'
+_MAGIC: Final[bytes] = b'IAUSRS01'
+_HEADER: Final[struct.Struct] = struct.Struct('<8sIIIIQ')
+_COUNT_OFFSET: Final[int] = 16
+_SEQUENCE_OFFSET: Final[int] = 24
+_SLOT_SIZE: Final[int] = 4
+_MIN_TABLE_SIZE: Final[int] = 8
+_EMPTY_SLOT: Final[int] = 0
+_DELETED_SLOT: Final[int] = -1
+_OPTIMISTIC_READ_ATTEMPTS: Final[int] = 100
+_SCAN_CHUNK_ROWS: Final[int] = 256
+
+_RECORD_HEADER: Final[struct.Struct] = struct.Struct('<IiBBHB')
+_USERNAME_OFFSET: Final[int] = _RECORD_HEADER.size
+_EMAIL_OFFSET: Final[int] = _USERNAME_OFFSET + USERNAME_MAX_BYTES
+_HASH_OFFSET: Final[int] = _EMAIL_OFFSET + EMAIL_MAX_BYTES
+_RECORD_SIZE: Final[int] = _HASH_OFFSET + HASHED_PASSWORD_MAX_BYTES
+
+_ROLES: Final[tuple[Role, ...]] = tuple(Role)
+_ROLE_CODES: Final['Mapping[Role, int]'] = {role: code for code, role in enumerate(_ROLES)}
+
+
+class _SharedIndex:
+    """Хеш-индекс «значение без учета регистра — номер записи» в разделяемой памяти.
+
+    Открытая адресация с линейным пробированием по двум массивам фиксированного
+    размера: номер записи плюс один (ноль — пустая ячейка, как в только что
+    созданной памяти) и CRC-32 значения. Таблица не перестраивается: её размер
+    рассчитан так, чтобы она была заполнена не более чем наполовину.
+    """
+
+    def __init__(self, rows: memoryview, fingerprints: memoryview, value_of: 'Callable[[int], str]') -> None:
+        """Инициализирует индекс поверх массивов разделяемой памяти.
+
+        Args:
+            rows: Массив номеров записей плюс один.
+            fingerprints: Массив отпечатков значений.
+            value_of: Функция, возвращающая значение записи по её номеру.
+        """
+        self._rows = rows
+        self._fingerprints = fingerprints
+        self._value_of = value_of
+        self._mask = len(rows) - 1
+
+    def find(self, value: str) -> int | None:
+        """Ищет запись со значением, равным value без учета регистра.
+
+        Args:
+            value: Искомое значение.
+
+        Returns:
+            Номер записи или None, если значение не проиндексировано.
+        """
+        key = value.lower()
+        fingerprint = _fingerprint(key)
+        slot = fingerprint & self._mask
+
+        for _ in range(len(self._rows)):
+            stored = self._rows[slot]
+            if stored == _EMPTY_SLOT:
+                break
+            if (
+                stored != _DELETED_SLOT
+                and self._fingerprints[slot] == fingerprint
+                and self._value_of(stored - 1).lower() == key
+            ):
+                return stored - 1
+            slot = (slot + 1) & self._mask
+
+        return None
+
+    def insert(self, row: int, value: str) -> None:
+        """Индексирует значение записи. Значение не должно быть уже проиндексировано.
+
+        Args:
+            row: Номер записи.
+            value: Значение.
+        """
+        fingerprint = _fingerprint(value.lower())
+        slot = fingerprint & self._mask
+
+        while self._rows[slot] > _EMPTY_SLOT:
+            slot = (slot + 1) & self._mask
+
+        self._fingerprints[slot] = fingerprint
+        self._rows[slot] = row + 1
+
+    def remove(self, row: int, value: str) -> None:
+        """Убирает из индекса значение записи.
+
+        Args:
+            row: Номер записи.
+            value: Проиндексированное значение.
+        """
+        slot = _fingerprint(value.lower()) & self._mask
+
+        for _ in range(len(self._rows)):
+            stored = self._rows[slot]
+            if stored == _EMPTY_SLOT:
+                return
+            if stored == row + 1:
+                self._rows[slot] = _DELETED_SLOT
+                return
+            slot = (slot + 1) & self._mask
+
+
+class SharedMemoryUserRepository(UserRepository):
+    """Репозиторий пользователей в разделяемой памяти, общий для всех воркеров хоста.
+
+    Первый воркер создаёт сегмент multiprocessing.shared_memory с указанным
+    именем, остальные подключаются к нему, поэтому пользователь, созданный
+    через один воркер, сразу виден другим, а данные хранятся в одном
+    экземпляре. Сегмент имеет фиксированную раскладку: заголовок, хеш-таблицы
+    имён и email и записи фиксированного размера, в которых строки ограничены
+    USERNAME_MAX_BYTES, EMAIL_MAX_BYTES и HASHED_PASSWORD_MAX_BYTES байтами.
+    Количество пользователей ограничено ёмкостью, заданной при создании.
+
+    Записи выполняются под блокировкой файла (fcntl.flock), общей для всех
+    процессов, и под seqlock: счётчик в заголовке нечётен, пока идёт
+    изменение; пакетное добавление отмечает каждую запись отдельно, поэтому
+    чтения не ждут конца пакета. Поиск по имени сначала не берёт блокировок —
+    он читает индекс и запись и повторяет чтение, если счётчик изменился;
+    после нескольких неудачных попыток он выполняется под блокировкой. Если процесс завершился посреди
+    записи, следующая блокировка возвращает счётчику чётность. Поиск по email
+    выполняется под блокировкой. Выборки копируют записи под блокировкой
+    порциями по _SCAN_CHUNK_ROWS и разбирают их уже после её освобождения,
+    поэтому длинный обход не останавливает записи всех воркеров хоста.
+
+    Сегмент не удаляется при остановке воркеров и переживает их перезапуск;
+    удалить его можно методом unlink.
+    """
+
+    def __init__(self, name: str, capacity: int) -> None:
+        """Создаёт сегмент разделяемой памяти или подключается к существующему.
+
+        Args:
+            name: Имя сегмента, общее для всех воркеров.
+            capacity: Максимальное количество пользователей; используется при создании сегмента.
+
+        Raises:
+            ValueError: Если существующий сегмент имеет другую раскладку или ёмкость.
+        """
+        table_size = _MIN_TABLE_SIZE
+        while table_size < capacity * 2:
+            table_size *= 2
+
+        self._capacity = capacity
+        self._table_size = table_size
+        self._thread_lock = threading.Lock()
+        self._lock_file = open(Path(tempfile.gettempdir()) / f'{name}.lock', 'a+b')  # noqa: SIM115
+
+        try:
+            with self._locked():
+                self._memory = self._attach_or_create(name)
+        except ValueError:
+            self._lock_file.close()
+            raise
+
+        self._views: list[memoryview] = []
+        self._count = self._view(_COUNT_OFFSET, 4, 'I')
+        self._sequence = self._view(_SEQUENCE_OFFSET, 8, 'Q')
+        table_bytes = table_size * _SLOT_SIZE
+        self._username_index = _SharedIndex(
+            self._view(_HEADER.size, table_bytes, 'i'),
+            self._view(_HEADER.size + table_bytes, table_bytes, 'I'),
+            lambda row: self._field(row, _USERNAME_OFFSET, 3),
+        )
+        self._email_index = _SharedIndex(
+            self._view(_HEADER.size + 2 * table_bytes, table_bytes, 'i'),
+            self._view(_HEADER.size + 3 * table_bytes, table_bytes, 'I'),
+            lambda row: self._field(row, _EMAIL_OFFSET, 4),
+        )
+        self._records = self._view(_HEADER.size + 4 * table_bytes, capacity * _RECORD_SIZE, 'B')
+
+    def add(self, user: 'InternalUser') -> None:
+        """Добавляет пользователя в репозиторий.
+
+        Args:
+            user: Пользователь для добавления.
+
+        Raises:
+            UserAlreadyExistsError: Если пользователь с таким же именем уже существует.
+            EmailAlreadyExistsError: Если email уже занят.
+            UserFieldTooLongError: Если имя, email или хеш пароля длиннее допустимого.
+            UserStorageFullError: Если ёмкость хранилища исчерпана.
+        """
+        record = _encode_record(user)
+
+        with self._writing():
+            self._insert(user, record)
+
+    def add_many(self, users: 'Sequence[InternalUser]') -> list[BaseAppError | None]:
+        """Добавляет пользователей по порядку за один захват блокировки записи.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        errors: list[BaseAppError | None] = []
+        records: list[bytes | None] = []
+
+        for user in users:
+            try:
+                records.append(_encode_record(user))
+            except UserFieldTooLongError as error:
+                records.append(None)
+                errors.append(error)
+            else:
+                errors.append(None)
+
+        with self._exclusive():
+            for position, (user, record) in enumerate(zip(users, records, strict=True)):
+                if record is None:
+                    continue
+                try:
+                    with self._changing():
+                        self._insert(user, record)
+                except BaseAppError as error:
+                    errors[position] = error
+
+        return errors
+
+    def update(self, user: 'InternalUser') -> None:
+        """Заменяет сохранённые данные существующего пользователя.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+            EmailAlreadyExistsError: Если новый email занят другим пользователем.
+            UserFieldTooLongError: Если email или хеш пароля длиннее допустимого.
+        """
+        with self._writing():
+            row = self._username_index.find(user.username)
+            if row is None:
+                raise UserNotFoundError()
+
+            if self._email_index.find(user.email) not in (None, row):
+                raise EmailAlreadyExistsError(email=user.email)
+
+            stored = _decode_record(self._read_record(row))
+            record = _encode_record(dataclasses.replace(user, username=stored.username))
+
+            if stored.email != user.email:
+                self._email_index.remove(row, stored.email)
+                self._email_index.insert(row, user.email)
+            self._write_record(row, record)
+
+    def get_by_username(self, username: str) -> 'InternalUser | None':
+        """Возвращает пользователя по имени без учета регистра.
+
+        Сначала читает без блокировок, а если запись всё время меняется,
+        ждёт блокировку записи, которую может удерживать другой процесс.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        consistent, user = self.try_get_by_username(username)
+        return user if consistent else self.get_by_username_locked(username)
+
+    def try_get_by_username(self, username: str) -> tuple[bool, 'InternalUser | None']:
+        """Ищет пользователя по имени без блокировок, повторяя чтение, если запись менялась.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Признак согласованного чтения и пользователь или None, если он не найден.
+            Если согласованно прочитать не удалось, возвращается (False, None).
+        """
+        for _ in range(_OPTIMISTIC_READ_ATTEMPTS):
+            sequence = self._sequence[0]
+            if sequence & 1:
+                time.sleep(0)
+                continue
+
+            row = self._username_index.find(username)
+            record = self._read_record(row) if row is not None else None
+
+            if self._sequence[0] == sequence:
+                return True, _decode_record(record) if record is not None else None
+
+        return False, None
+
+    def get_by_username_locked(self, username: str) -> 'InternalUser | None':
+        """Возвращает пользователя по имени под блокировкой записи.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        with self._exclusive():
+            row = self._username_index.find(username)
+            return _decode_record(self._read_record(row)) if row is not None else None
+
+    def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email без учета регистра.
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        with self._exclusive():
+            row = self._email_index.find(email)
+            return _decode_record(self._read_record(row)) if row is not None else None
+
+    def list(self) -> list['InternalUser']:
+        """Возвращает всех пользователей из репозитория.
+
+        Returns:
+            Список пользователей в порядке добавления.
+        """
+        users: list[InternalUser] = []
+
+        for _, records in self._scan(0):
+            users.extend(map(_decode_record, records))
+
+        return users
+
+    def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей, подходящих под условия, в порядке добавления.
+
+        Записи перебираются подряд начиная с курсора; индексов по роли и
+        возрасту нет. Блокировка берётся только на копирование очередной
+        порции записей.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: Номер записи последнего пользователя предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        start = 0 if cursor is None else cursor + 1
+        rows: list[int] = []
+        items: list[InternalUser] = []
+
+        for first_row, records in self._scan(start):
+            for row, record in enumerate(records, first_row):
+                user = _decode_record(record)
+                if not query.matches(user):
+                    continue
+                if len(items) == limit:
+                    return UserPage(items=items, next_cursor=rows[-1])
+                rows.append(row)
+                items.append(user)
+
+        return UserPage(items=items)
+
+    def close(self) -> None:
+        """Отключается от сегмента, оставляя его другим воркерам."""
+        for view in self._views:
+            view.release()
+        self._memory.close()
+        self._lock_file.close()
+
+    def unlink(self) -> None:
+        """Удаляет сегмент и файл блокировки; подключённые воркеры продолжают работать с ними до отключения."""
+        self._memory.unlink()
+        Path(self._lock_file.name).unlink(missing_ok=True)
+
+    def _layout_size(self) -> int:
+        """Возвращает размер сегмента в байтах.
+
+        Returns:
+            Размер сегмента.
+        """
+        return _HEADER.size + 4 * self._table_size * _SLOT_SIZE + self._capacity * _RECORD_SIZE
+
+    def _attach_or_create(self, name: str) -> SharedMemory:
+        """Подключается к сегменту или создаёт его. Вызывается под блокировкой записи.
+
+        Args:
+            name: Имя сегмента.
+
+        Returns:
+            Сегмент разделяемой памяти.
+
+        Raises:
+            ValueError: Если существующий сегмент имеет другую раскладку или ёмкость.
+        """
+        try:
+            memory = SharedMemory(name=name, create=True, size=self._layout_size(), track=False)
+        except FileExistsError:
+            memory = SharedMemory(name=name, track=False)
+        else:
+            _HEADER.pack_into(_buffer(memory), 0, _MAGIC, self._capacity, self._table_size, 0, 0, 0)
+            return memory
+
+        magic, capacity, table_size, *_ = _HEADER.unpack_from(_buffer(memory), 0)
+
+        if magic != _MAGIC or capacity != self._capacity or table_size != self._table_size:
+            memory.close()
+            raise ValueError(
+                f'Shared memory "{name}" has an incompatible layout (capacity {capacity}, expected '
+                f'{self._capacity}); stop all workers and remove the segment'
+            )
+
+        return memory
+
+    def _view(self, offset: int, size: int, typecode: Literal['B', 'I', 'Q', 'i']) -> memoryview:
+        """Возвращает типизированное представление участка сегмента.
+
+        Args:
+            offset: Смещение участка.
+            size: Размер участка в байтах.
+            typecode: Код типа элементов.
+
+        Returns:
+            Представление участка.
+        """
+        view = _buffer(self._memory)[offset : offset + size].cast(typecode)
+        self._views.append(view)
+        return view
+
+    def _field(self, row: int, offset: int, length_index: int) -> str:
+        """Читает строковое поле записи без проверки целостности.
+
+        Используется при поиске по индексу, в том числе без блокировки, поэтому
+        не бросает исключений на частично изменённых данных: результат такого
+        чтения отбрасывается по seqlock.
+
+        Args:
+            row: Номер записи.
+            offset: Смещение поля в записи.
+            length_index: Номер длины поля в заголовке записи.
+
+        Returns:
+            Значение поля.
+        """
+        base = row * _RECORD_SIZE
+        length = _RECORD_HEADER.unpack_from(self._records, base)[length_index]
+        start = base + offset
+        return bytes(self._records[start : start + length]).decode(_ENCODING, errors='replace')
+
+    def _read_record(self, row: int) -> bytes:
+        """Копирует запись из сегмента.
+
+        Args:
+            row: Номер записи.
+
+        Returns:
+            Байты записи.
+        """
+        start = row * _RECORD_SIZE
+        return bytes(self._records[start : start + _RECORD_SIZE])
+
+    def _scan(self, start: int) -> 'Iterator[tuple[int, Sequence[bytes]]]':
+        """Копирует записи начиная с заданной порциями, удерживая блокировку записи только на время копирования.
+
+        Записи только добавляются, поэтому между порциями номера не сдвигаются;
+        каждая запись копируется целиком под блокировкой и согласована.
+
+        Args:
+            start: Номер первой записи.
+
+        Yields:
+            Номер первой записи порции и байты записей порции.
+        """
+        row = start
+
+        while True:
+            with self._exclusive():
+                end = min(row + _SCAN_CHUNK_ROWS, self._count[0])
+                chunk = bytes(self._records[row * _RECORD_SIZE : end * _RECORD_SIZE])
+
+            if row >= end:
+                return
+
+            yield row, [chunk[offset : offset + _RECORD_SIZE] for offset in range(0, len(chunk), _RECORD_SIZE)]
+            row = end
+
+    def _write_record(self, row: int, record: bytes) -> None:
+        """Записывает запись в сегмент.
+
+        Args:
+            row: Номер записи.
+            record: Байты записи.
+        """
+        start = row * _RECORD_SIZE
+        self._records[start : start + _RECORD_SIZE] = record
+
+    def _insert(self, user: 'InternalUser', record: bytes) -> None:
+        """Записывает нового пользователя; вызывается под блокировкой записи.
+
+        Args:
+            user: Пользователь для добавления.
+            record: Закодированная запись пользователя.
+
+        Raises:
+            UserAlreadyExistsError: Если пользователь с таким же именем уже существует.
+            EmailAlreadyExistsError: Если email уже занят.
+            UserStorageFullError: Если ёмкость хранилища исчерпана.
+        """
+        if self._username_index.find(user.username) is not None:
+            raise UserAlreadyExistsError(username=user.username)
+        if self._email_index.find(user.email) is not None:
+            raise EmailAlreadyExistsError(email=user.email)
+
+        row = self._count[0]
+        if row >= self._capacity:
+            raise UserStorageFullError()
+
+        self._write_record(row, record)
+        self._email_index.insert(row, user.email)
+        self._username_index.insert(row, user.username)
+        self._count[0] = row + 1
+
+    @contextmanager
+    def _locked(self) -> 'Iterator[None]':
+        """Захватывает блокировку записи, общую для потоков и процессов."""
+        with self._thread_lock:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _exclusive(self) -> 'Iterator[None]':
+        """Захватывает блокировку записи и завершает изменение, прерванное упавшим процессом."""
+        with self._locked():
+            if self._sequence[0] & 1:
+                self._sequence[0] += 1
+            yield
+
+    @contextmanager
+    def _writing(self) -> 'Iterator[None]':
+        """Захватывает блокировку записи и отмечает изменение в seqlock на время блока."""
+        with self._exclusive(), self._changing():
+            yield
+
+    @contextmanager
+    def _changing(self) -> 'Iterator[None]':
+        """Отмечает изменение в seqlock на время блока. Вызывается под блокировкой записи."""
+        self._sequence[0] += 1
+        try:
+            yield
+        finally:
+            self._sequence[0] += 1
+
+
+def _buffer(memory: SharedMemory) -> memoryview:
+    """Возвращает буфер открытого сегмента.
+
+    Args:
+        memory: Сегмент разделяемой памяти.
+
+    Returns:
+        Буфер сегмента.
+    """
+    return cast('memoryview', memory.buf)
+
+
+def _fingerprint(key: str) -> int:
+    """Вычисляет отпечаток значения индекса, одинаковый во всех процессах.
+
+    Args:
+        key: Значение в нижнем регистре.
+
+    Returns:
+        32-битный отпечаток.
+    """
+    return zlib.crc32(key.encode(_ENCODING))
+
+
+def _encode_field(field: str, value: str, max_bytes: int) -> bytes:
+    """Кодирует строковое поле записи.
+
+    Args:
+        field: Название поля для сообщения об ошибке.
+        value: Значение.
+        max_bytes: Максимальная длина в байтах UTF-8.
+
+    Returns:
+        Значение в UTF-8.
+
+    Raises:
+        UserFieldTooLongError: Если значение длиннее max_bytes.
+    """
+    encoded = value.encode(_ENCODING)
+
+    if len(encoded) > max_bytes:
+        raise UserFieldTooLongError(field=field, max_bytes=max_bytes)
+
+    return encoded
+
+
+def _encode_record(user: 'InternalUser') -> bytes:
+    """Кодирует пользователя в запись фиксированного размера.
+
+    Args:
+        user: Пользователь.
+
+    Returns:
+        Байты записи.
+
+    Raises:
+        UserFieldTooLongError: Если имя, email или хеш пароля длиннее допустимого.
+    """
+    username = _encode_field('username', user.username, USERNAME_MAX_BYTES)
+    email = _encode_field('email', user.email, EMAIL_MAX_BYTES)
+    hashed_password = _encode_field('hashed_password', user.hashed_password, HASHED_PASSWORD_MAX_BYTES)
+
+    record = bytearray(_RECORD_SIZE)
+    _RECORD_HEADER.pack_into(
+        record, 0, user.version, user.age, _ROLE_CODES[user.role], len(username), len(email), len(hashed_password)
+    )
+    record[_USERNAME_OFFSET : _USERNAME_OFFSET + len(username)] = username
+    record[_EMAIL_OFFSET : _EMAIL_OFFSET + len(email)] = email
+    record[_HASH_OFFSET : _HASH_OFFSET + len(hashed_password)] = hashed_password
+
+    return bytes(record)
+
+
+def _decode_record(record: bytes) -> InternalUser:
+    """Восстанавливает пользователя из записи.
+
+    Args:
+        record: Байты записи.
+
+    Returns:
+        Пользователь.
+    """
+    version, age, role_code, username_length, email_length, hash_length = _RECORD_HEADER.unpack_from(record)
+
+    return InternalUser(
+        username=record[_USERNAME_OFFSET : _USERNAME_OFFSET + username_length].decode(_ENCODING),
+        email=record[_EMAIL_OFFSET : _EMAIL_OFFSET + email_length].decode(_ENCODING),
+        age=age,
+        role=_ROLES[role_code],
+        version=version,
+        hashed_password=record[_HASH_OFFSET : _HASH_OFFSET + hash_length].decode(_ENCODING),
+    )
+
+
+class AsyncSharedMemoryUserRepository(AsyncUserRepository):
+    """Асинхронный доступ к репозиторию пользователей в разделяемой памяти.
+
+    Поиск по имени сначала читает без блокировок прямо в цикле событий.
+    Если согласованно прочитать не удалось, он, как и остальные операции,
+    ждёт блокировку, которую может удерживать другой процесс, в потоке пула
+    по умолчанию через asyncio.to_thread, не останавливая цикл событий.
+    """
+
+    def __init__(self, repository: SharedMemoryUserRepository) -> None:
+        """Инициализирует адаптер поверх синхронного репозитория.
+
+        Args:
+            repository: Синхронный репозиторий в разделяемой памяти.
+        """
+        self._repository = repository
+
+    async def add(self, user: 'InternalUser') -> None:
+        """Добавляет пользователя в репозиторий.
+
+        Args:
+            user: Пользователь для добавления.
+
+        Raises:
+            UserAlreadyExistsError: Если пользователь с таким же именем уже существует.
+            EmailAlreadyExistsError: Если email уже занят.
+            UserFieldTooLongError: Если имя, email или хеш пароля длиннее допустимого.
+            UserStorageFullError: Если ёмкость хранилища исчерпана.
+        """
+        await asyncio.to_thread(self._repository.add, user)
+
+    async def add_many(self, users: 'Sequence[InternalUser]') -> list[BaseAppError | None]:
+        """Добавляет пользователей по порядку за один захват блокировки записи.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        return await asyncio.to_thread(self._repository.add_many, users)
+
+    async def update(self, user: 'InternalUser') -> None:
+        """Заменяет сохранённые данные существующего пользователя.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+            EmailAlreadyExistsError: Если новый email занят другим пользователем.
+            UserFieldTooLongError: Если email или хеш пароля длиннее допустимого.
+        """
+        await asyncio.to_thread(self._repository.update, user)
+
+    async def get_by_username(self, username: str) -> 'InternalUser | None':
+        """Возвращает пользователя по имени без учета регистра.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        consistent, user = self._repository.try_get_by_username(username)
+        if consistent:
+            return user
+        return await asyncio.to_thread(self._repository.get_by_username_locked, username)
+
+    async def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email без учета регистра.
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        return await asyncio.to_thread(self._repository.get_by_email, email)
+
+    async def list(self) -> list['InternalUser']:
+        """Возвращает всех пользователей из репозитория.
+
+        Returns:
+            Список пользователей.
+        """
+        return await asyncio.to_thread(self._repository.list)
+
+    async def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей, подходящих под условия, в порядке добавления.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: Курсор предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        return await asyncio.to_thread(self._repository.list_page, query, limit, cursor)
@@ -0,0 +1,202 @@
+"""Двоичные снимки in-memory хранилищ: последовательность секций с префиксом длины и контрольной суммой."""
+
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from contextlib import contextmanager
+from typing import Final, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+SNAPSHOT_MAGIC: Final[bytes] = b'IASNAP02'
+
+_LENGTH: Final[struct.Struct] = struct.Struct('<Q')
+_CHECKSUM: Final[struct.Struct] = struct.Struct('<I')
+_INT: Final[struct.Struct] = struct.Struct('<q')
+
+Section = bytes | bytearray | memoryview | array[int]
+
+
+class CorruptedSnapshotError(ValueError):
+    """Ошибка: файл снимка повреждён или записан в другом формате."""
+
+
+class SnapshotReader:
+    """Последовательно читает секции снимка из буфера без копирования.
+
+    Секции следуют за SNAPSHOT_MAGIC, а файл завершается CRC-32 всех секций.
+    Сумма проверяется до чтения первой секции, поэтому повреждённый файл
+    отклоняется целиком: восстановленные из секций таблицы и индексы можно
+    использовать без поэлементной проверки.
+    """
+
+    def __init__(self, buffer: memoryview) -> None:
+        """Инициализирует чтение с начала первой секции.
+
+        Args:
+            buffer: Содержимое файла снимка.
+
+        Raises:
+            CorruptedSnapshotError: Если файл не начинается с SNAPSHOT_MAGIC или контрольная сумма не совпадает.
+        """
+        if bytes(buffer[: len(SNAPSHOT_MAGIC)]) != SNAPSHOT_MAGIC:
+            raise CorruptedSnapshotError('Unknown snapshot format')
+
+        end = len(buffer) - _CHECKSUM.size
+        if end < len(SNAPSHOT_MAGIC):
+            raise CorruptedSnapshotError('Snapshot is truncated')
+
+        with buffer[len(SNAPSHOT_MAGIC) : end] as sections:
+            checksum = zlib.crc32(sections)
+        if _CHECKSUM.unpack_from(buffer, end) != (checksum,):
+            raise CorruptedSnapshotError('Snapshot checksum mismatch')
+
+        self._buffer = buffer
+        self._position = len(SNAPSHOT_MAGIC)
+        self._end = end
+
+    def read_bytes(self) -> memoryview:
+        """Возвращает очередную секцию как срез буфера.
+
+        Срез удерживает отображение файла, поэтому вызывающий копирует его
+        или освобождает до выхода из open_snapshot, в том числе при ошибке.
+
+        Returns:
+            Содержимое секции.
+
+        Raises:
+            CorruptedSnapshotError: Если секция выходит за пределы файла.
+        """
+        header_end = self._position + _LENGTH.size
+
+        if header_end > self._end:
+            raise CorruptedSnapshotError('Snapshot is truncated')
+
+        (length,) = _LENGTH.unpack_from(self._buffer, self._position)
+        end = header_end + length
+
+        if end > self._end:
+            raise CorruptedSnapshotError('Snapshot is truncated')
+
+        self._position = end
+        return self._buffer[header_end:end]
+
+    def read_array(self, typecode: str) -> 'array[int]':
+        """Восстанавливает массив из очередной секции.
+
+        Args:
+            typecode: Код типа элементов массива.
+
+        Returns:
+            Новый массив с копией данных секции.
+
+        Raises:
+            CorruptedSnapshotError: Если длина секции не кратна размеру элемента.
+        """
+        values = array(typecode)
+
+        with self.read_bytes() as section:
+            if len(section) % values.itemsize:
+                raise CorruptedSnapshotError('Snapshot section has invalid length')
+
+            values.frombytes(section)
+
+        return values
+
+    def read_int(self) -> int:
+        """Возвращает целое число из очередной секции.
+
+        Returns:
+            Число.
+
+        Raises:
+            CorruptedSnapshotError: Если секция не содержит ровно одно число.
+        """
+        with self.read_bytes() as section:
+            if len(section) != _INT.size:
+                raise CorruptedSnapshotError('Snapshot section has invalid length')
+
+            (value,) = _INT.unpack(section)
+
+        return int(value)
+
+    def expect_end(self) -> None:
+        """Проверяет, что все секции прочитаны.
+
+        Raises:
+            CorruptedSnapshotError: Если после последней ожидаемой секции остались данные.
+        """
+        if self._position != self._end:
+            raise CorruptedSnapshotError('Snapshot has trailing data')
+
+
+def int_section(value: int) -> bytes:
+    """Кодирует целое число в секцию снимка.
+
+    Args:
+        value: Число.
+
+    Returns:
+        Содержимое секции.
+    """
+    return _INT.pack(value)
+
+
+def write_snapshot(path: 'Path', sections: 'Sequence[Section]') -> None:
+    """Атомарно записывает снимок: во временный файл, который затем заменяет прежний.
+
+    Читатели, открывшие прежний файл, продолжают работать с ним, а при сбое
+    во время записи на диске остаётся предыдущий целый снимок. Контрольная
+    сумма секций вычисляется по ходу записи и дописывается в конец файла.
+
+    Args:
+        path: Путь к файлу снимка.
+        sections: Секции в порядке чтения.
+    """
+    temporary_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+
+    try:
+        with open(temporary_path, 'wb') as file:
+            file.write(SNAPSHOT_MAGIC)
+            checksum = 0
+            for section in sections:
+                data = memoryview(section).cast('B')
+                header = _LENGTH.pack(len(data))
+                checksum = zlib.crc32(data, zlib.crc32(header, checksum))
+                file.write(header)
+                file.write(data)
+            file.write(_CHECKSUM.pack(checksum))
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
+@contextmanager
+def open_snapshot(path: 'Path') -> 'Iterator[SnapshotReader]':
+    """Отображает файл снимка в память и возвращает читатель секций.
+
+    Страницы файла подгружаются ядром по мере чтения секций, без
+    промежуточного чтения всего файла в память процесса.
+
+    Args:
+        path: Путь к файлу снимка.
+
+    Yields:
+        Читатель секций.
+
+    Raises:
+        CorruptedSnapshotError: Если файл не является снимком или повреждён.
+    """
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        buffer = memoryview(mapped)
+        try:
+            yield SnapshotReader(buffer)
+        finally:
+            buffer.release()
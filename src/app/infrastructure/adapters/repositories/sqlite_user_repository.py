@@ -0,0 +1,389 @@
+"""Реализация репозитория пользователей на SQLite."""
+
+import asyncio
+import sqlite3
+import threading
+from typing import Final, TYPE_CHECKING
+
+from src.app.domain.exceptions import BaseAppError, EmailAlreadyExistsError, UserAlreadyExistsError, UserNotFoundError
+from src.app.domain.models.user import InternalUser, UserPage
+from src.app.domain.repositories.user_repository import AsyncUserRepository, UserRepository
+from src.app.domain.value_objects.role import Role
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from src.app.domain.models.user import UserQuery
+
+_SCHEMA: Final[tuple[str, ...]] = (
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY,
+        username TEXT NOT NULL,
+        email TEXT NOT NULL,
+        age INTEGER NOT NULL,
+        role TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        hashed_password TEXT NOT NULL
+    )
+    """,
+    'CREATE UNIQUE INDEX IF NOT EXISTS ux_users_username ON users (username COLLATE NOCASE)',
+    'CREATE UNIQUE INDEX IF NOT EXISTS ux_users_email ON users (email COLLATE NOCASE)',
+    'CREATE INDEX IF NOT EXISTS ix_users_role ON users (role, id)',
+    'CREATE INDEX IF NOT EXISTS ix_users_age ON users (age, id)',
+)
+
+_COLUMNS: Final[str] = 'username, email, age, role, version, hashed_password'
+_INSERT_USER: Final[str] = f'INSERT INTO users ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)'
+_UPDATE_USER: Final[str] = (
+    'UPDATE users SET email = ?, age = ?, role = ?, version = ?, hashed_password = ? WHERE username = ? COLLATE NOCASE'
+)
+_SELECT_BY_USERNAME: Final[str] = f'SELECT {_COLUMNS} FROM users WHERE username = ? COLLATE NOCASE'
+_SELECT_BY_EMAIL: Final[str] = f'SELECT {_COLUMNS} FROM users WHERE email = ? COLLATE NOCASE'
+_SELECT_ALL: Final[str] = f'SELECT {_COLUMNS} FROM users ORDER BY id'
+_SELECT_PAGE: Final[str] = f'SELECT id, {_COLUMNS} FROM users WHERE {{conditions}} ORDER BY id LIMIT ?'
+
+_UserRow = tuple[str, str, int, str, int, str]
+
+
+class SQLiteUserRepository(UserRepository):
+    """Репозиторий пользователей в файле SQLite, общий для нескольких процессов.
+
+    База работает в режиме WAL: чтения не блокируются записью, а несколько
+    воркеров uvicorn могут пользоваться одним файлом. Каждый поток получает
+    собственное соединение, которое живёт до закрытия репозитория; SQL-тексты
+    постоянны, поэтому подготовленные выражения переиспользуются из кэша
+    соединения. Уникальность имени и email обеспечивается индексами с COLLATE
+    NOCASE, которые также используются для поиска без учёта регистра. Страницы
+    выбираются по ключу id > курсора, поэтому стоимость запроса не растёт с
+    номером страницы; индексы (role, id) и (age, id) позволяют SQLite читать
+    только подходящие строки.
+    """
+
+    def __init__(self, path: 'Path | str', busy_timeout_seconds: float, statement_cache_size: int) -> None:
+        """Открывает базу данных и создаёт схему, если её ещё нет.
+
+        Args:
+            path: Путь к файлу базы данных.
+            busy_timeout_seconds: Время ожидания снятия блокировки записи в секундах.
+            statement_cache_size: Количество подготовленных выражений, кэшируемых соединением.
+        """
+        self._path = str(path)
+        self._busy_timeout_seconds = busy_timeout_seconds
+        self._statement_cache_size = statement_cache_size
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        connection = self._connection()
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    def add(self, user: 'InternalUser') -> None:
+        """Добавляет пользователя в репозиторий.
+
+        Args:
+            user: Пользователь для добавления.
+
+        Raises:
+            UserAlreadyExistsError: Если пользователь с таким же именем уже существует.
+            EmailAlreadyExistsError: Если email уже занят.
+        """
+        try:
+            with self._connection() as connection:
+                connection.execute(_INSERT_USER, _to_row(user))
+        except sqlite3.IntegrityError as error:
+            raise self._conflict(user) from error
+
+    def add_many(self, users: 'Sequence[InternalUser]') -> list[BaseAppError | None]:
+        """Добавляет пользователей по порядку в одной транзакции.
+
+        Нарушение уникальности откатывает только вставку своей строки, поэтому
+        отклонённый пользователь не мешает остальным, а вся пачка фиксируется
+        одной записью в журнал.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        errors: list[BaseAppError | None] = []
+
+        with self._connection() as connection:
+            for user in users:
+                try:
+                    connection.execute(_INSERT_USER, _to_row(user))
+                except sqlite3.IntegrityError:
+                    errors.append(self._conflict(user))
+                else:
+                    errors.append(None)
+
+        return errors
+
+    def update(self, user: 'InternalUser') -> None:
+        """Заменяет сохранённые данные существующего пользователя.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+            EmailAlreadyExistsError: Если новый email занят другим пользователем.
+        """
+        try:
+            with self._connection() as connection:
+                cursor = connection.execute(
+                    _UPDATE_USER,
+                    (user.email, user.age, user.role.value, user.version, user.hashed_password, user.username),
+                )
+        except sqlite3.IntegrityError as error:
+            raise EmailAlreadyExistsError(email=user.email) from error
+
+        if cursor.rowcount == 0:
+            raise UserNotFoundError()
+
+    def get_by_username(self, username: str) -> 'InternalUser | None':
+        """Возвращает пользователя по имени без учета регистра.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        row = self._connection().execute(_SELECT_BY_USERNAME, (username,)).fetchone()
+        return _to_user(row) if row is not None else None
+
+    def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email без учета регистра.
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        row = self._connection().execute(_SELECT_BY_EMAIL, (email,)).fetchone()
+        return _to_user(row) if row is not None else None
+
+    def list(self) -> list['InternalUser']:
+        """Возвращает всех пользователей из репозитория.
+
+        Returns:
+            Список пользователей в порядке добавления.
+        """
+        return [_to_user(row) for row in self._connection().execute(_SELECT_ALL)]
+
+    def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей, подходящих под условия, в порядке добавления.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: id последнего пользователя предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        conditions = ['id > ?']
+        parameters: list[object] = [cursor if cursor is not None else 0]
+
+        if query.email is not None:
+            conditions.append('email = ? COLLATE NOCASE')
+            parameters.append(query.email)
+        if query.role is not None:
+            conditions.append('role = ?')
+            parameters.append(query.role.value)
+        if query.min_age is not None:
+            conditions.append('age >= ?')
+            parameters.append(query.min_age)
+        if query.max_age is not None:
+            conditions.append('age <= ?')
+            parameters.append(query.max_age)
+
+        statement = _SELECT_PAGE.format(conditions=' AND '.join(conditions))
+        rows = self._connection().execute(statement, (*parameters, limit + 1)).fetchall()
+
+        if len(rows) <= limit:
+            return UserPage(items=[_to_user(row[1:]) for row in rows])
+
+        rows = rows[:limit]
+        return UserPage(items=[_to_user(row[1:]) for row in rows], next_cursor=rows[-1][0])
+
+    def close(self) -> None:
+        """Закрывает соединения всех потоков."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+
+        for connection in connections:
+            connection.close()
+
+        self._local = threading.local()
+
+    def _conflict(self, user: 'InternalUser') -> BaseAppError:
+        """Определяет, какое из уникальных полей пользователя уже занято.
+
+        Args:
+            user: Пользователь, вставка которого нарушила уникальность.
+
+        Returns:
+            Ошибка занятого имени или email.
+        """
+        if self.get_by_username(user.username) is not None:
+            return UserAlreadyExistsError(username=user.username)
+        return EmailAlreadyExistsError(email=user.email)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Возвращает соединение текущего потока, открывая его при первом обращении.
+
+        Соединение используется только своим потоком; проверка потока отключена
+        лишь для того, чтобы close() мог закрыть соединения всех потоков.
+
+        Returns:
+            Соединение SQLite.
+        """
+        connection: sqlite3.Connection | None = getattr(self._local, 'connection', None)
+
+        if connection is None:
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout_seconds,
+                cached_statements=self._statement_cache_size,
+                check_same_thread=False,
+            )
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+            self._local.connection = connection
+
+            with self._lock:
+                self._connections.append(connection)
+
+        return connection
+
+
+def _to_row(user: 'InternalUser') -> _UserRow:
+    """Преобразует пользователя в значения столбцов таблицы users.
+
+    Args:
+        user: Пользователь.
+
+    Returns:
+        Кортеж значений в порядке _COLUMNS.
+    """
+    return user.username, user.email, user.age, user.role.value, user.version, user.hashed_password
+
+
+def _to_user(row: _UserRow) -> InternalUser:
+    """Преобразует строку таблицы users в доменную модель.
+
+    Args:
+        row: Кортеж значений в порядке _COLUMNS.
+
+    Returns:
+        Пользователь.
+    """
+    username, email, age, role, version, hashed_password = row
+    return InternalUser(
+        username=username,
+        email=email,
+        age=age,
+        role=Role(role),
+        version=version,
+        hashed_password=hashed_password,
+    )
+
+
+class AsyncSQLiteUserRepository(AsyncUserRepository):
+    """Асинхронный доступ к SQLite репозиторию пользователей.
+
+    Каждый вызов выполняется в потоке пула по умолчанию через asyncio.to_thread,
+    поэтому цикл событий не блокируется дисковым вводом-выводом, а поток пула
+    переиспользует своё соединение SQLite.
+    """
+
+    def __init__(self, repository: SQLiteUserRepository) -> None:
+        """Инициализирует адаптер поверх синхронного репозитория.
+
+        Args:
+            repository: Синхронный SQLite репозиторий.
+        """
+        self._repository = repository
+
+    async def add(self, user: 'InternalUser') -> None:
+        """Добавляет пользователя в репозиторий.
+
+        Args:
+            user: Пользователь для добавления.
+
+        Raises:
+            UserAlreadyExistsError: Если пользователь с таким же именем уже существует.
+        """
+        await asyncio.to_thread(self._repository.add, user)
+
+    async def add_many(self, users: 'Sequence[InternalUser]') -> list[BaseAppError | None]:
+        """Добавляет пользователей по порядку в одной транзакции.
+
+        Args:
+            users: Пользователи для добавления.
+
+        Returns:
+            Для каждого пользователя — None, если он добавлен, или ошибка, по которой он отклонён.
+        """
+        return await asyncio.to_thread(self._repository.add_many, users)
+
+    async def update(self, user: 'InternalUser') -> None:
+        """Заменяет сохранённые данные существующего пользователя.
+
+        Args:
+            user: Пользователь с обновлёнными данными.
+
+        Raises:
+            UserNotFoundError: Если пользователь не найден.
+        """
+        await asyncio.to_thread(self._repository.update, user)
+
+    async def get_by_username(self, username: str) -> 'InternalUser | None':
+        """Возвращает пользователя по имени без учета регистра.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        return await asyncio.to_thread(self._repository.get_by_username, username)
+
+    async def get_by_email(self, email: str) -> 'InternalUser | None':
+        """Возвращает пользователя по email без учета регистра.
+
+        Args:
+            email: Email пользователя.
+
+        Returns:
+            Пользователь или None, если не найден.
+        """
+        return await asyncio.to_thread(self._repository.get_by_email, email)
+
+    async def list(self) -> list['InternalUser']:
+        """Возвращает всех пользователей из репозитория.
+
+        Returns:
+            Список пользователей в порядке добавления.
+        """
+        return await asyncio.to_thread(self._repository.list)
+
+    async def list_page(self, query: 'UserQuery', limit: int, cursor: int | None = None) -> 'UserPage':
+        """Возвращает страницу пользователей, подходящих под условия, в порядке добавления.
+
+        Args:
+            query: Условия отбора.
+            limit: Максимальное количество пользователей на странице.
+            cursor: Курсор предыдущей страницы; None для первой страницы.
+
+        Returns:
+            Страница пользователей с курсором следующей страницы.
+        """
+        return await asyncio.to_thread(self._repository.list_page, query, limit, cursor)
@@ -0,0 +1,138 @@
+"""Подбор стоимости bcrypt под железо хоста.
+
+Запуск: ``make calibrate-password-hasher`` или
+``python -m src.app.infrastructure.adapters.security.bcrypt_calibration --target-ms 250``.
+Найденная стоимость записывается в env-файл в переменную APP_PASSWORD_HASHER_BCRYPT_ROUNDS.
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from pathlib import Path
+from typing import Final, TYPE_CHECKING
+
+from src.app.infrastructure.adapters.security.bcrypt_password_hasher import build_crypt_context, prehash_password
+from src.app.infrastructure.config import (
+    DEFAULT_APP_ENV_FILE,
+    MAX_BCRYPT_ROUNDS,
+    PasswordHasherSettings,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TARGET_MS: Final[float] = 250.0
+DEFAULT_MIN_ROUNDS: Final[int] = 10
+DEFAULT_SAMPLES: Final[int] = 3
+
+_SAMPLE_PASSWORD: Final[str] = 'calibration-password'
+_SAMPLE_SECRET: Final[str] = 'calibration-secret'
+_ROUNDS_ENV_VAR: Final[str] = f'{PasswordHasherSettings.model_config.get("env_prefix", "")}BCRYPT_ROUNDS'.upper()
+
+
+def measure_hash_seconds(rounds: int, samples: int = DEFAULT_SAMPLES) -> float:
+    """Измеряет медианное время вычисления одного хеша с заданной стоимостью.
+
+    Args:
+        rounds: Стоимость bcrypt.
+        samples: Количество замеров.
+
+    Returns:
+        Медианное время в секундах.
+    """
+    context = build_crypt_context(rounds)
+    prehashed = prehash_password(_SAMPLE_PASSWORD, _SAMPLE_SECRET)
+    timings = []
+
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        context.hash(prehashed)
+        timings.append(time.perf_counter() - started_at)
+
+    return statistics.median(timings)
+
+
+def calibrate_rounds(
+    target_seconds: float,
+    min_rounds: int = DEFAULT_MIN_ROUNDS,
+    measure: 'Callable[[int], float]' = measure_hash_seconds,
+) -> int:
+    """Подбирает наибольшую стоимость, при которой хеширование укладывается в целевое время.
+
+    Время bcrypt удваивается с каждой единицей стоимости, поэтому по замеру
+    минимальной стоимости сразу оценивается кандидат, который затем
+    проверяется реальным замером и при необходимости уменьшается.
+
+    Args:
+        target_seconds: Целевое время вычисления одного хеша.
+        min_rounds: Минимально допустимая стоимость, возвращаемая даже при превышении целевого времени.
+        measure: Функция замера времени для заданной стоимости.
+
+    Returns:
+        Подобранная стоимость bcrypt.
+    """
+    baseline = measure(min_rounds)
+    rounds = min_rounds
+
+    while rounds < MAX_BCRYPT_ROUNDS and baseline * 2 ** (rounds + 1 - min_rounds) <= target_seconds:
+        rounds += 1
+
+    while rounds > min_rounds and measure(rounds) > target_seconds:
+        rounds -= 1
+
+    return rounds
+
+
+def write_env_value(env_file: Path, name: str, value: str) -> None:
+    """Записывает переменную в env-файл, заменяя существующее значение.
+
+    Args:
+        env_file: Путь к env-файлу; создаётся, если не существует.
+        name: Имя переменной.
+        value: Значение переменной.
+    """
+    lines = env_file.read_text().splitlines() if env_file.exists() else []
+    assignment = f'{name}={value}'
+    prefix = f'{name}='
+
+    for index, line in enumerate(lines):
+        if line.startswith(prefix):
+            lines[index] = assignment
+            break
+    else:
+        lines.append(assignment)
+
+    env_file.write_text('\n'.join(lines) + '\n')
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Подбирает стоимость bcrypt и сохраняет её в env-файл.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='Подбор стоимости bcrypt под железо хоста.')
+    parser.add_argument('--target-ms', type=float, default=DEFAULT_TARGET_MS, help='Целевое время хеширования, мс.')
+    parser.add_argument('--min-rounds', type=int, default=DEFAULT_MIN_ROUNDS, help='Минимальная стоимость bcrypt.')
+    parser.add_argument('--env-file', type=Path, default=Path(DEFAULT_APP_ENV_FILE), help='Файл для записи.')
+    parser.add_argument('--dry-run', action='store_true', help='Только вывести результат, не изменяя файл.')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    rounds = calibrate_rounds(args.target_ms / 1000, args.min_rounds)
+    elapsed_ms = measure_hash_seconds(rounds) * 1000
+    logger.info(f'bcrypt rounds={rounds}: {elapsed_ms:.0f} ms per hash (target {args.target_ms:.0f} ms)')
+
+    if args.dry_run:
+        return
+
+    write_env_value(args.env_file, _ROUNDS_ENV_VAR, str(rounds))
+    logger.info(f'{_ROUNDS_ENV_VAR}={rounds} written to {args.env_file}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Компактное двоичное представление хешей bcrypt."""
+
+import binascii
+import re
+from typing import Final  # noqa: TC003
+
+PACKED_BCRYPT_HASH_SIZE: Final[int] = 44
+
+_BCRYPT_VARIANTS: Final[tuple[str, ...]] = ('2a', '2b', '2x', '2y')
+_BCRYPT_HASH_PATTERN: Final[re.Pattern[str]] = re.compile(r'\$(2[abxy])\$(\d{2})\$([./A-Za-z0-9]{53})')
+_BCRYPT_ALPHABET: Final[str] = './ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+_BASE64_ALPHABET: Final[str] = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+_TO_BASE64: Final[bytes] = bytes.maketrans(_BCRYPT_ALPHABET.encode(), _BASE64_ALPHABET.encode())
+_FROM_BASE64: Final[bytes] = bytes.maketrans(_BASE64_ALPHABET.encode(), _BCRYPT_ALPHABET.encode())
+_BODY_LENGTH: Final[int] = 53
+_BODY_PADDING: Final[bytes] = _BASE64_ALPHABET[0].encode() * 3
+
+
+def pack_bcrypt_hash(hashed_password: str) -> bytes | None:
+    """Упаковывает хеш bcrypt в PACKED_BCRYPT_HASH_SIZE байт.
+
+    Строка вида ``$2b$12$<53 символа>`` занимает 60 байт текста; соль и
+    контрольная сумма в ней записаны в собственной base64-кодировке bcrypt,
+    поэтому без потерь переводятся в двоичный вид. Первый байт результата —
+    номер варианта алгоритма, второй — стоимость, остальные — тело хеша.
+
+    Args:
+        hashed_password: Хеш пароля.
+
+    Returns:
+        Упакованный хеш или None, если строка не является хешем bcrypt.
+    """
+    match = _BCRYPT_HASH_PATTERN.fullmatch(hashed_password)
+
+    if match is None:
+        return None
+
+    variant, cost, body = match.groups()
+    header = bytes((_BCRYPT_VARIANTS.index(variant) + 1, int(cost)))
+
+    return header + binascii.a2b_base64(body.encode().translate(_TO_BASE64) + _BODY_PADDING)
+
+
+def unpack_bcrypt_hash(packed: bytes | bytearray | memoryview) -> str:
+    """Восстанавливает строку хеша bcrypt, упакованную pack_bcrypt_hash.
+
+    Args:
+        packed: Упакованный хеш.
+
+    Returns:
+        Хеш в исходном текстовом виде.
+    """
+    variant = _BCRYPT_VARIANTS[packed[0] - 1]
+    encoded = binascii.b2a_base64(packed[2:PACKED_BCRYPT_HASH_SIZE], newline=False)
+    body = encoded[:_BODY_LENGTH].translate(_FROM_BASE64).decode()
+
+    return f'${variant}${packed[1]:02d}${body}'
@@ -8,33 +8,71 @@ from passlib.context import CryptContext
 from src.app.application.ports.security.password_hasher import PasswordHasher
 from src.app.infrastructure.config import get_settings
 
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+
+def build_crypt_context(rounds: int) -> CryptContext:
+    """Создаёт контекст passlib для bcrypt с фиксированной стоимостью.
+
+    Стоимость задаётся одновременно как значение по умолчанию и как границы
+    допустимого диапазона, поэтому needs_update помечает любой хеш с другой
+    стоимостью — как более слабый, так и избыточно дорогой.
+
+    Args:
+        rounds: Стоимость bcrypt (логарифм числа итераций по основанию 2).
+
+    Returns:
+        Контекст для хеширования и проверки паролей.
+    """
+    return CryptContext(
+        schemes=['bcrypt'],
+        deprecated='auto',
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+def prehash_password(password: str, secret: str) -> str:
+    """Прехеширует пароль с использованием SHA-512 и секретного ключа.
+
+    Эта функция объединяет пароль пользователя с секретным ключом приложения и
+    хеширует полученную строку с использованием SHA-512.
+
+    Args:
+        password: Исходный пароль пользователя.
+        secret: Секретный ключ приложения.
+
+    Returns:
+        SHA-512 хеш от пароля с солью.
+    """
+    salted = f'{password}{secret}'
+    return hashlib.sha512(salted.encode()).hexdigest()
 
 
 class BcryptPasswordHasher(PasswordHasher):
     """Хешер паролей с SHA-512 + bcrypt."""
 
-    def __init__(self) -> None:
-        """Инициализирует хешер, извлекая секретный ключ из конфигурации приложения.
+    def __init__(self, rounds: int | None = None) -> None:
+        """Инициализирует хешер, извлекая секретный ключ и стоимость bcrypt из конфигурации приложения.
 
         Секретный ключ используется при прехешировании пароля перед применением bcrypt.
+
+        Args:
+            rounds: Стоимость bcrypt; по умолчанию берётся из настроек.
         """
-        self._secret = get_settings().app.secret_key.get_secret_value()
+        settings = get_settings()
+        self._secret = settings.app.secret_key.get_secret_value()
+        self._context = build_crypt_context(rounds if rounds is not None else settings.password_hasher.bcrypt_rounds)
 
     def _prehash(self, password: str) -> str:
         """Прехеширует пароль с использованием SHA-512 и секретного ключа.
 
-        Эта функция объединяет пароль пользователя с секретным ключом приложения и
-        хеширует полученную строку с использованием SHA-512.
-
         Args:
             password: Исходный пароль пользователя.
 
         Returns:
             SHA-512 хеш от пароля с солью.
         """
-        salted = f'{password}{self._secret}'
-        return hashlib.sha512(salted.encode()).hexdigest()
+        return prehash_password(password, self._secret)
 
     def hash(self, password: str) -> str:
         """Возвращает хеш от переданного пароля.
@@ -48,7 +86,7 @@ class BcryptPasswordHasher(PasswordHasher):
             Хешированная строка, пригодная для хранения в БД.
         """
         prehashed = self._prehash(password)
-        return cast('str', pwd_context.hash(prehashed))
+        return cast('str', self._context.hash(prehashed))
 
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         """Проверяет соответствие пароля его хешу.
@@ -63,4 +101,15 @@ class BcryptPasswordHasher(PasswordHasher):
             True, если хеш соответствует паролю. Иначе — False.
         """
         prehashed = self._prehash(plain_password)
-        return cast('bool', pwd_context.verify(prehashed, hashed_password))
+        return cast('bool', self._context.verify(prehashed, hashed_password))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Проверяет, вычислен ли хеш с отличной от текущей стоимостью bcrypt.
+
+        Args:
+            hashed_password: Хеш, сохранённый в базе данных.
+
+        Returns:
+            True, если хеш следует пересчитать. Иначе — False.
+        """
+        return cast('bool', self._context.needs_update(hashed_password))
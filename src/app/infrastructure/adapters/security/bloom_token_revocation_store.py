@@ -0,0 +1,153 @@
+"""Список отозванных токенов: фильтр Блума перед точным множеством."""
+
+import heapq
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from src.app.application.ports.security.token_revocation_store import TokenRevocationStore
+from src.app.infrastructure.adapters.cache.bloom_filter import BloomFilter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+
+class BloomTokenRevocationStore(TokenRevocationStore):
+    """Потокобезопасный in-memory список отозванных токенов.
+
+    Типичный ответ «токен не отозван» даётся фильтром Блума за несколько
+    проверок битов без обращения к словарю. Положительный ответ фильтра
+    уточняется по точному словарю «jti — срок действия». Записи истёкших
+    токенов удаляются не чаще одного раза за интервал очистки, после чего
+    фильтр перестраивается, поэтому память не растёт при постоянном отзыве токенов.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        purge_interval_seconds: float,
+        clock: 'Callable[[], float]' = time.time,
+    ) -> None:
+        """Инициализирует пустой список.
+
+        Args:
+            capacity: Начальная ёмкость фильтра Блума; при переполнении фильтр удваивается.
+            error_rate: Допустимая доля ложноположительных ответов фильтра.
+            purge_interval_seconds: Минимальный интервал между очистками истёкших записей.
+            clock: Источник времени в секундах Unix-эпохи.
+        """
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._purge_interval_seconds = purge_interval_seconds
+        self._clock = clock
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._revoked: dict[str, float] = {}
+        self._expirations: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._last_purge_at = clock()
+
+    def revoke(self, token_id: str, expires_at: 'datetime') -> None:
+        """Отзывает токен до момента истечения его срока действия.
+
+        Args:
+            token_id: Идентификатор токена (поле 'jti').
+            expires_at: Момент истечения срока действия токена.
+        """
+        expires_at_ts = expires_at.timestamp()
+        now = self._clock()
+
+        if expires_at_ts <= now:
+            return
+
+        with self._lock:
+            if token_id not in self._revoked and len(self._bloom) >= self._bloom.capacity:
+                self._rebuild_bloom(self._bloom.capacity * 2)
+
+            self._revoked[token_id] = expires_at_ts
+            heapq.heappush(self._expirations, (expires_at_ts, token_id))
+            self._bloom.add(token_id)
+
+        self._purge_if_due(now)
+
+    def is_revoked(self, token_id: str) -> bool:
+        """Проверяет, отозван ли токен.
+
+        Args:
+            token_id: Идентификатор токена (поле 'jti').
+
+        Returns:
+            True, если токен отозван и срок его действия ещё не истёк.
+        """
+        now = self._clock()
+        self._purge_if_due(now)
+
+        if token_id not in self._bloom:
+            return False
+
+        expires_at = self._revoked.get(token_id)
+        return expires_at is not None and expires_at > now
+
+    def purge_expired(self) -> int:
+        """Удаляет записи о токенах с истёкшим сроком действия и перестраивает фильтр.
+
+        Returns:
+            Количество удалённых записей.
+        """
+        with self._lock:
+            return self._purge(self._clock())
+
+    def __len__(self) -> int:
+        """Возвращает количество хранимых записей об отзыве."""
+        return len(self._revoked)
+
+    def _purge_if_due(self, now: float) -> None:
+        """Запускает очистку, если с предыдущей прошло достаточно времени.
+
+        Args:
+            now: Текущее время.
+        """
+        if now - self._last_purge_at < self._purge_interval_seconds:
+            return
+
+        with self._lock:
+            if now - self._last_purge_at >= self._purge_interval_seconds:
+                self._purge(now)
+
+    def _purge(self, now: float) -> int:
+        """Удаляет истёкшие записи. Вызывается под блокировкой.
+
+        Args:
+            now: Текущее время.
+
+        Returns:
+            Количество удалённых записей.
+        """
+        removed = 0
+
+        while self._expirations and self._expirations[0][0] <= now:
+            expires_at, token_id = heapq.heappop(self._expirations)
+
+            if self._revoked.get(token_id) == expires_at:
+                del self._revoked[token_id]
+                removed += 1
+
+        if removed:
+            self._rebuild_bloom(max(self._capacity, len(self._revoked) * 2))
+
+        self._last_purge_at = now
+        return removed
+
+    def _rebuild_bloom(self, capacity: int) -> None:
+        """Пересоздаёт фильтр Блума по актуальному набору записей. Вызывается под блокировкой.
+
+        Args:
+            capacity: Ёмкость нового фильтра.
+        """
+        bloom = BloomFilter(capacity, self._error_rate)
+
+        for token_id in self._revoked:
+            bloom.add(token_id)
+
+        self._bloom = bloom
@@ -0,0 +1,79 @@
+"""Источник версий учётных записей с кэшированием в памяти процесса."""
+
+import time
+from typing import Final, TYPE_CHECKING
+
+from src.app.application.ports.security.user_version_provider import UserVersionProvider
+from src.app.infrastructure.adapters.cache.lru_ttl_cache import LRUTTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.app.domain.repositories.user_repository import AsyncUserRepository
+    from src.app.infrastructure.adapters.cache.lru_ttl_cache import CacheStats
+
+_MISSING_USER_VERSION: Final[int] = 0
+
+
+class CachedUserVersionProvider(UserVersionProvider):
+    """Возвращает версии учётных записей из репозитория, кэшируя их на короткое время.
+
+    TTL ограничивает время, в течение которого процесс может не заметить изменение
+    учётной записи, сделанное другим процессом.
+    """
+
+    def __init__(
+        self,
+        user_repository: 'AsyncUserRepository',
+        ttl_seconds: float,
+        max_size: int,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Инициализирует источник версий.
+
+        Args:
+            user_repository: Репозиторий пользователей.
+            ttl_seconds: Время жизни закэшированной версии в секундах.
+            max_size: Максимальное количество закэшированных версий.
+            clock: Источник монотонного времени в секундах.
+        """
+        self._user_repository = user_repository
+        self._cache: LRUTTLCache[str, int] = LRUTTLCache(max_size=max_size, ttl_seconds=ttl_seconds, clock=clock)
+
+    async def get_version(self, username: str) -> int | None:
+        """Возвращает текущую версию учётной записи.
+
+        Отсутствие пользователя тоже кэшируется, чтобы токены удалённых
+        пользователей не приводили к обращению в репозиторий на каждый запрос.
+
+        Args:
+            username: Имя пользователя.
+
+        Returns:
+            Версия учётной записи или None, если пользователь не существует.
+        """
+        key = username.strip().lower()
+        version = self._cache.get(key)
+
+        if version is None:
+            user = await self._user_repository.get_by_username(key)
+            version = user.version if user is not None else _MISSING_USER_VERSION
+            self._cache.set(key, version)
+
+        return None if version == _MISSING_USER_VERSION else version
+
+    def invalidate(self, username: str) -> None:
+        """Сбрасывает закэшированную версию учётной записи.
+
+        Args:
+            username: Имя пользователя.
+        """
+        self._cache.delete(username.strip().lower())
+
+    def stats(self) -> 'CacheStats':
+        """Возвращает счётчики попаданий и промахов кэша версий.
+
+        Returns:
+            Снимок статистики кэша.
+        """
+        return self._cache.stats()
@@ -0,0 +1,98 @@
+"""Кэш проверенных учетных данных HTTP Basic, ключи которого — HMAC от имени и пароля."""
+
+import hashlib
+import hmac
+import time
+from typing import TYPE_CHECKING
+
+from src.app.application.ports.security.credential_cache import CredentialCache
+from src.app.infrastructure.adapters.cache.lru_ttl_cache import LRUTTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.app.infrastructure.adapters.cache.lru_ttl_cache import CacheStats
+
+
+class HMACCredentialCache(CredentialCache):
+    """Кэш успешных проверок пароля с TTL и ограничением размера.
+
+    Открытый пароль нигде не сохраняется: ключом служит HMAC-SHA256 от имени
+    пользователя и пароля на секретном ключе приложения. Значением является хеш
+    пароля, с которым прошла проверка, поэтому смена пароля автоматически
+    делает запись недействительной.
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        ttl_seconds: float,
+        max_size: int,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Инициализирует кэш.
+
+        Args:
+            secret_key: Секретный ключ приложения для HMAC.
+            ttl_seconds: Время жизни записи в секундах.
+            max_size: Максимальное количество записей.
+            clock: Источник монотонного времени в секундах.
+        """
+        self._secret = secret_key.encode()
+        self._cache: LRUTTLCache[bytes, str] = LRUTTLCache(max_size=max_size, ttl_seconds=ttl_seconds, clock=clock)
+
+    def is_verified(self, username: str, password: str, hashed_password: str) -> bool:
+        """Проверяет, были ли учетные данные недавно успешно проверены для данного хеша.
+
+        Запись, сохранённая для другого хеша пароля, удаляется.
+
+        Args:
+            username: Имя пользователя.
+            password: Открытый пароль.
+            hashed_password: Текущий хеш пароля пользователя.
+
+        Returns:
+            True, если проверку bcrypt можно пропустить.
+        """
+        key = self._make_key(username, password)
+        cached_hash = self._cache.get(key)
+
+        if cached_hash is None:
+            return False
+
+        if not hmac.compare_digest(cached_hash, hashed_password):
+            self._cache.delete(key)
+            return False
+
+        return True
+
+    def remember(self, username: str, password: str, hashed_password: str) -> None:
+        """Запоминает успешную проверку учетных данных.
+
+        Args:
+            username: Имя пользователя.
+            password: Открытый пароль.
+            hashed_password: Хеш пароля, с которым прошла проверка.
+        """
+        self._cache.set(self._make_key(username, password), hashed_password)
+
+    def stats(self) -> 'CacheStats':
+        """Возвращает счётчики попаданий и промахов кэша.
+
+        Returns:
+            Снимок статистики кэша.
+        """
+        return self._cache.stats()
+
+    def _make_key(self, username: str, password: str) -> bytes:
+        """Вычисляет ключ кэша для пары имя/пароль.
+
+        Args:
+            username: Имя пользователя.
+            password: Открытый пароль.
+
+        Returns:
+            HMAC-SHA256 дайджест.
+        """
+        message = b'\x00'.join((username.strip().lower().encode(), password.encode()))
+        return hmac.new(self._secret, message, hashlib.sha256).digest()
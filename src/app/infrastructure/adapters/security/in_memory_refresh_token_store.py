@@ -0,0 +1,185 @@
+"""In-memory хранилище refresh токенов с ротацией и обнаружением повторного использования."""
+
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import TYPE_CHECKING
+
+from src.app.application.ports.security.refresh_token_store import RefreshTokenStore
+from src.app.domain.exceptions import InvalidTokenError
+from src.app.domain.models.token import RefreshTokenGrant
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import timedelta
+
+
+@dataclass
+class _RefreshTokenRecord:
+    """Состояние зарегистрированного refresh токена."""
+
+    family_id: str
+    username: str
+    expires_at: float
+    used: bool = False
+
+
+class InMemoryRefreshTokenStore(RefreshTokenStore):
+    """Потокобезопасное in-memory хранилище refresh токенов.
+
+    Использованные токены хранятся до истечения срока действия, чтобы распознать
+    повторное предъявление украденного токена. Истёкшие записи удаляются при
+    обращении к хранилищу не чаще одного раза за интервал очистки.
+    """
+
+    def __init__(
+        self,
+        expiration: 'timedelta',
+        sweep_interval_seconds: float,
+        clock: 'Callable[[], float]' = time.time,
+    ) -> None:
+        """Инициализирует пустое хранилище.
+
+        Args:
+            expiration: Срок действия refresh токена.
+            sweep_interval_seconds: Минимальный интервал между автоматическими очистками.
+            clock: Источник времени в секундах Unix-эпохи.
+        """
+        self._ttl_seconds = expiration.total_seconds()
+        self._sweep_interval_seconds = sweep_interval_seconds
+        self._clock = clock
+        self._tokens: dict[str, _RefreshTokenRecord] = {}
+        self._families: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self._last_sweep_at = clock()
+
+    def issue(self, username: str) -> RefreshTokenGrant:
+        """Регистрирует первый refresh токен нового семейства.
+
+        Args:
+            username: Имя пользователя, которому выдаётся токен.
+
+        Returns:
+            Зарегистрированный токен.
+        """
+        with self._lock:
+            now = self._clock()
+            self._sweep_if_due(now)
+            return self._register(username, secrets.token_urlsafe(16), now)
+
+    def rotate(self, token_id: str, family_id: str) -> RefreshTokenGrant:
+        """Погашает refresh токен и выдаёт следующий токен того же семейства.
+
+        Args:
+            token_id: Идентификатор предъявленного токена.
+            family_id: Идентификатор семейства предъявленного токена.
+
+        Returns:
+            Новый зарегистрированный токен.
+
+        Raises:
+            InvalidTokenError: Если токен неизвестен, истёк или уже был использован.
+        """
+        with self._lock:
+            now = self._clock()
+            self._sweep_if_due(now)
+            record = self._tokens.get(token_id)
+
+            if record is None or record.family_id != family_id or record.expires_at <= now:
+                raise InvalidTokenError()
+
+            if record.used:
+                self._revoke_family(family_id)
+                raise InvalidTokenError()
+
+            record.used = True
+            return self._register(record.username, family_id, now)
+
+    def revoke_family(self, family_id: str) -> None:
+        """Отзывает все токены семейства.
+
+        Args:
+            family_id: Идентификатор семейства.
+        """
+        with self._lock:
+            self._revoke_family(family_id)
+
+    def sweep(self) -> int:
+        """Удаляет истёкшие токены.
+
+        Returns:
+            Количество удалённых записей.
+        """
+        with self._lock:
+            return self._sweep(self._clock())
+
+    def __len__(self) -> int:
+        """Возвращает количество хранимых записей, включая использованные."""
+        return len(self._tokens)
+
+    def _register(self, username: str, family_id: str, now: float) -> RefreshTokenGrant:
+        """Создаёт запись нового токена. Вызывается под блокировкой.
+
+        Args:
+            username: Имя пользователя.
+            family_id: Идентификатор семейства.
+            now: Текущее время.
+
+        Returns:
+            Зарегистрированный токен.
+        """
+        token_id = secrets.token_urlsafe(16)
+        expires_at = now + self._ttl_seconds
+
+        self._tokens[token_id] = _RefreshTokenRecord(family_id=family_id, username=username, expires_at=expires_at)
+        self._families.setdefault(family_id, set()).add(token_id)
+
+        return RefreshTokenGrant(
+            token_id=token_id,
+            family_id=family_id,
+            username=username,
+            expires_at=datetime.fromtimestamp(expires_at, UTC),
+        )
+
+    def _revoke_family(self, family_id: str) -> None:
+        """Удаляет все токены семейства. Вызывается под блокировкой.
+
+        Args:
+            family_id: Идентификатор семейства.
+        """
+        for token_id in self._families.pop(family_id, set()):
+            self._tokens.pop(token_id, None)
+
+    def _sweep_if_due(self, now: float) -> None:
+        """Запускает очистку, если с предыдущей прошло достаточно времени. Вызывается под блокировкой.
+
+        Args:
+            now: Текущее время.
+        """
+        if now - self._last_sweep_at >= self._sweep_interval_seconds:
+            self._sweep(now)
+
+    def _sweep(self, now: float) -> int:
+        """Удаляет истёкшие записи. Вызывается под блокировкой.
+
+        Args:
+            now: Текущее время.
+
+        Returns:
+            Количество удалённых записей.
+        """
+        expired = [token_id for token_id, record in self._tokens.items() if record.expires_at <= now]
+
+        for token_id in expired:
+            record = self._tokens.pop(token_id)
+            family = self._families.get(record.family_id)
+
+            if family is not None:
+                family.discard(token_id)
+                if not family:
+                    del self._families[record.family_id]
+
+        self._last_sweep_at = now
+        return len(expired)
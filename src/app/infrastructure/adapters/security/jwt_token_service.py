@@ -1,39 +1,70 @@
 """Адаптер сервиса для работы с JWT токенами."""
 
+import secrets
+import time
 from datetime import datetime, timedelta, UTC
-from typing import cast, TYPE_CHECKING
+from typing import cast, Final, TYPE_CHECKING
 
 import jwt
 
 from src.app.application.ports.security.token_service import TokenService
 from src.app.domain.exceptions import InvalidTokenError
+from src.app.infrastructure.adapters.cache.lru_ttl_cache import LRUTTLCache
 from src.app.infrastructure.config import get_settings
 
 if TYPE_CHECKING:
     from typing import Any
 
+    from src.app.domain.models.token import RefreshTokenGrant
+    from src.app.infrastructure.adapters.cache.lru_ttl_cache import CacheStats
+
 
 settings = get_settings()
 
+DEFAULT_DECODE_CACHE_SIZE: Final[int] = 0
 
-class PyJWTTokenService(TokenService):
-    """Реализация TokenService с использованием библиотеки PyJWT."""
+TOKEN_TYPE_CLAIM: Final[str] = 'typ'
+REFRESH_TOKEN_TYPE: Final[str] = 'refresh'
+_REFRESH_TOKEN_REQUIRED_CLAIMS: Final[list[str]] = ['exp', 'sub', 'jti', 'fam']
 
-    def __init__(self, secret_key: str, algorithm: str, expiration: timedelta) -> None:
+
+class PyJWTTokenService(TokenService):
+    """Реализация TokenService с использованием библиотеки PyJWT.
+
+    Может кэшировать результаты проверки подписи: повторное предъявление того же
+    токена возвращает ранее проверенные данные без разбора и вычисления HMAC.
+    Запись кэша живёт не дольше срока действия токена (поле 'exp').
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str,
+        expiration: timedelta,
+        decode_cache_size: int = DEFAULT_DECODE_CACHE_SIZE,
+    ) -> None:
         """Инициализирует JWT сервис.
 
         Args:
             secret_key: Секретный ключ для подписи JWT-токенов.
             algorithm: Алгоритм кодирования и декодирования JWT.
             expiration: Срок действия access токена.
+            decode_cache_size: Максимальное число проверенных токенов в кэше; 0 отключает кэш.
         """
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.expiration = expiration
+        self._decode_cache: LRUTTLCache[str, dict[str, Any]] | None = (
+            LRUTTLCache(max_size=decode_cache_size, ttl_seconds=expiration.total_seconds())
+            if decode_cache_size > 0
+            else None
+        )
 
     def create_access_token(self, data: dict[str, 'Any']) -> str:
         """Создаёт access токен с подписью и сроком действия.
 
+        Каждому токену присваивается уникальный идентификатор 'jti', по которому его можно отозвать.
+
         Args:
             data: Пользовательские данные, включаемые в токен. Ожидаются поля 'sub' и 'role'.
 
@@ -42,6 +73,7 @@ class PyJWTTokenService(TokenService):
         """
         payload = data.copy()
         payload['exp'] = datetime.now(UTC) + self.expiration
+        payload['jti'] = secrets.token_urlsafe(16)
 
         return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
 
@@ -54,10 +86,111 @@ class PyJWTTokenService(TokenService):
         Returns:
             Раскодированные данные токена в виде словаря.
 
+        Raises:
+            InvalidTokenError: Если токен недействителен или истёк.
+        """
+        if self._decode_cache is None:
+            return self._decode_access(token)
+
+        cached = self._decode_cache.get(token)
+
+        if cached is not None:
+            return cached.copy()
+
+        payload = self._decode_access(token)
+        expires_at = payload.get('exp')
+
+        if isinstance(expires_at, int | float) and (ttl := expires_at - time.time()) > 0:
+            self._decode_cache.set(token, payload.copy(), ttl_seconds=ttl)
+
+        return payload
+
+    def create_refresh_token(self, grant: 'RefreshTokenGrant') -> str:
+        """Создаёт refresh токен для зарегистрированной записи.
+
+        Args:
+            grant: Запись хранилища refresh токенов.
+
+        Returns:
+            Закодированный JWT refresh токен.
+        """
+        payload = {
+            'sub': grant.username,
+            'jti': grant.token_id,
+            'fam': grant.family_id,
+            'exp': grant.expires_at,
+            TOKEN_TYPE_CLAIM: REFRESH_TOKEN_TYPE,
+        }
+        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+
+    def decode_refresh_token(self, token: str) -> dict[str, 'Any']:
+        """Проверяет подпись, срок действия и тип refresh токена.
+
+        Args:
+            token: JWT refresh токен, полученный от клиента.
+
+        Returns:
+            Раскодированные данные токена с полями 'sub', 'jti' и 'fam'.
+
+        Raises:
+            InvalidTokenError: Если токен недействителен, истёк или не является refresh токеном.
+        """
+        payload = self._decode(token, required_claims=_REFRESH_TOKEN_REQUIRED_CLAIMS)
+
+        if payload.get(TOKEN_TYPE_CLAIM) != REFRESH_TOKEN_TYPE:
+            raise InvalidTokenError()
+
+        return payload
+
+    def cache_stats(self) -> 'CacheStats | None':
+        """Возвращает счётчики попаданий и промахов кэша проверенных токенов.
+
+        Returns:
+            Снимок статистики или None, если кэш отключён.
+        """
+        return self._decode_cache.stats() if self._decode_cache is not None else None
+
+    def _decode_access(self, token: str) -> dict[str, 'Any']:
+        """Проверяет access токен, отклоняя refresh токены.
+
+        Args:
+            token: JWT access токен.
+
+        Returns:
+            Раскодированные данные токена.
+
+        Raises:
+            InvalidTokenError: Если токен недействителен, истёк или является refresh токеном.
+        """
+        payload = self._decode(token)
+
+        if payload.get(TOKEN_TYPE_CLAIM) == REFRESH_TOKEN_TYPE:
+            raise InvalidTokenError()
+
+        return payload
+
+    def _decode(self, token: str, required_claims: list[str] | None = None) -> dict[str, 'Any']:
+        """Проверяет подпись и срок действия токена.
+
+        Args:
+            token: JWT токен.
+            required_claims: Обязательные поля токена.
+
+        Returns:
+            Раскодированные данные токена.
+
         Raises:
             InvalidTokenError: Если токен недействителен или истёк.
         """
         try:
-            return cast('dict[str, Any]', jwt.decode(token, self.secret_key, algorithms=[self.algorithm]))
+            return cast(
+                'dict[str, Any]',
+                jwt.decode(
+                    token,
+                    self.secret_key,
+                    algorithms=[self.algorithm],
+                    options={'require': required_claims or []},
+                ),
+            )
         except jwt.PyJWTError as error:
             raise InvalidTokenError() from error
@@ -0,0 +1,251 @@
+"""Асинхронная реализация PasswordHasher, выполняющая SHA-512 + bcrypt в пуле процессов."""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, cast, Final, TYPE_CHECKING
+
+from src.app.application.ports.security.password_hasher import AsyncPasswordHasher
+from src.app.domain.exceptions import ServiceOverloadedError
+from src.app.infrastructure.adapters.security.bcrypt_password_hasher import build_crypt_context, prehash_password
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+_POOL_START_METHOD: Final[str] = 'spawn'
+_OVERLOADED_RESOURCE_NAME: Final[str] = 'Password hasher'
+
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(secret: str, rounds: int) -> None:
+    """Сохраняет секретный ключ и контекст bcrypt в памяти процесса-воркера.
+
+    Параметры передаются один раз при старте процесса, а не с каждой задачей.
+
+    Args:
+        secret: Секретный ключ приложения.
+        rounds: Стоимость bcrypt.
+    """
+    _worker_state['secret'] = secret
+    _worker_state['context'] = build_crypt_context(rounds)
+
+
+def _hash_in_worker(password: str) -> str:
+    """Хеширует пароль внутри процесса-воркера.
+
+    Args:
+        password: Исходный пароль пользователя.
+
+    Returns:
+        bcrypt-хеш прехешированного пароля.
+    """
+    return cast('str', _worker_state['context'].hash(prehash_password(password, _worker_state['secret'])))
+
+
+def _verify_in_worker(plain_password: str, hashed_password: str) -> bool:
+    """Проверяет пароль внутри процесса-воркера.
+
+    Args:
+        plain_password: Исходный (введённый) пароль пользователя.
+        hashed_password: Хеш, сохранённый в базе данных.
+
+    Returns:
+        True, если хеш соответствует паролю. Иначе — False.
+    """
+    prehashed = prehash_password(plain_password, _worker_state['secret'])
+    return cast('bool', _worker_state['context'].verify(prehashed, hashed_password))
+
+
+class ProcessPoolPasswordHasher(AsyncPasswordHasher):
+    """Асинхронный хешер паролей с SHA-512 + bcrypt в ограниченном пуле процессов.
+
+    bcrypt выполняется с удержанием GIL, поэтому в пуле потоков он блокирует
+    остальные обработчики. Пул процессов переносит эту работу на отдельные ядра,
+    а ограничение числа ожидающих задач защищает от бесконечного роста очереди.
+    Место в очереди освобождается, когда задача действительно завершилась в
+    пуле, поэтому отмена запроса не позволяет занять пул сверх max_pending.
+    """
+
+    def __init__(self, secret_key: str, pool_size: int, max_pending: int, bcrypt_rounds: int) -> None:
+        """Инициализирует хешер. Процессы создаются лениво при первом обращении.
+
+        Args:
+            secret_key: Секретный ключ для прехеширования пароля.
+            pool_size: Количество процессов в пуле.
+            max_pending: Максимальное число одновременно выполняемых и ожидающих задач.
+            bcrypt_rounds: Стоимость bcrypt для новых хешей.
+        """
+        self._secret = secret_key
+        self._bcrypt_rounds = bcrypt_rounds
+        self._context = build_crypt_context(bcrypt_rounds)
+        self._pool_size = pool_size
+        self._max_pending = max_pending
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def pending(self) -> int:
+        """Возвращает количество задач, находящихся в пуле."""
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        """Возвращает хеш от переданного пароля, вычисленный в пуле процессов.
+
+        Args:
+            password: Исходный пароль пользователя.
+
+        Returns:
+            Хешированная строка, пригодная для хранения в БД.
+
+        Raises:
+            ServiceOverloadedError: Если очередь пула заполнена.
+        """
+        return cast('str', await self._submit(_hash_in_worker, password))
+
+    async def hash_many(self, passwords: 'Sequence[str]') -> list[str]:
+        """Возвращает хеши паролей, вычисленные параллельно на всех процессах пула.
+
+        Места в очереди занимаются сразу под всю пачку: она либо целиком
+        принимается в пул, либо отклоняется, не занимая очередь частично.
+
+        Args:
+            passwords: Исходные пароли пользователей.
+
+        Returns:
+            Хеши в порядке паролей.
+
+        Raises:
+            ServiceOverloadedError: Если в очереди пула не хватает мест для всей пачки.
+        """
+        return cast('list[str]', await self._submit_many(_hash_in_worker, [(password,) for password in passwords]))
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Проверяет соответствие пароля его хешу в пуле процессов.
+
+        Args:
+            plain_password: Исходный (введённый) пароль пользователя.
+            hashed_password: Хеш, сохранённый в базе данных.
+
+        Returns:
+            True, если хеш соответствует паролю. Иначе — False.
+
+        Raises:
+            ServiceOverloadedError: Если очередь пула заполнена.
+        """
+        return cast('bool', await self._submit(_verify_in_worker, plain_password, hashed_password))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Проверяет, вычислен ли хеш с отличной от текущей стоимостью bcrypt.
+
+        Проверка выполняется в текущем процессе: она только разбирает хеш.
+
+        Args:
+            hashed_password: Хеш, сохранённый в базе данных.
+
+        Returns:
+            True, если хеш следует пересчитать. Иначе — False.
+        """
+        return cast('bool', self._context.needs_update(hashed_password))
+
+    def shutdown(self) -> None:
+        """Останавливает пул процессов, не дожидаясь завершения задач."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, func: 'Callable[..., object]', *args: str) -> object:
+        """Отправляет задачу в пул, соблюдая ограничение на глубину очереди.
+
+        Args:
+            func: Функция, выполняемая в процессе-воркере.
+            *args: Аргументы функции.
+
+        Returns:
+            Результат выполнения функции.
+
+        Raises:
+            ServiceOverloadedError: Если очередь пула заполнена.
+        """
+        (result,) = await self._submit_many(func, [args])
+        return result
+
+    async def _submit_many(self, func: 'Callable[..., object]', arguments: 'Sequence[tuple[str, ...]]') -> list[object]:
+        """Отправляет в пул задачи для каждого набора аргументов, занимая места в очереди под все сразу.
+
+        Args:
+            func: Функция, выполняемая в процессе-воркере.
+            arguments: Наборы аргументов функции.
+
+        Returns:
+            Результаты выполнения в порядке наборов аргументов.
+
+        Raises:
+            ServiceOverloadedError: Если в очереди пула не хватает мест для всех задач.
+        """
+        executor = self._get_executor()
+        count = len(arguments)
+
+        with self._lock:
+            if self._pending + count > self._max_pending:
+                raise ServiceOverloadedError(_OVERLOADED_RESOURCE_NAME)
+            self._pending += count
+
+        futures: list[Future[object]] = []
+        try:
+            for args in arguments:
+                future = executor.submit(func, *args)
+                future.add_done_callback(self._release)
+                futures.append(future)
+            return await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            raise
+        finally:
+            if len(futures) < count:
+                with self._lock:
+                    self._pending -= count - len(futures)
+
+    def _release(self, _: 'Future[object]') -> None:
+        """Освобождает место в очереди, когда задача завершилась, упала или была отменена до запуска.
+
+        Вызывается потоком пула, поэтому счётчик меняется под блокировкой.
+
+        Args:
+            _: Завершившаяся задача.
+        """
+        with self._lock:
+            self._pending -= 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Возвращает пул процессов, создавая его при первом обращении.
+
+        Returns:
+            Экземпляр ProcessPoolExecutor.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._pool_size,
+                    mp_context=multiprocessing.get_context(_POOL_START_METHOD),
+                    initializer=_init_worker,
+                    initargs=(self._secret, self._bcrypt_rounds),
+                )
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Сбрасывает сломанный пул, чтобы следующая задача создала новый.
+
+        Args:
+            executor: Пул, в котором произошёл сбой.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+
+        executor.shutdown(wait=False, cancel_futures=True)
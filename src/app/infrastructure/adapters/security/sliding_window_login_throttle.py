@@ -0,0 +1,191 @@
+"""Ограничитель попыток входа на основе скользящего окна со взвешенными счётчиками."""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Final, TYPE_CHECKING
+
+from src.app.application.ports.security.login_throttle import LoginThrottle
+from src.app.domain.exceptions import TooManyLoginAttemptsError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_USERNAME_KEY_PREFIX: Final[str] = 'user:'
+_CLIENT_IP_KEY_PREFIX: Final[str] = 'ip:'
+
+
+@dataclass(slots=True)
+class _WindowCounter:
+    """Счётчики текущего и предыдущего окна для одного ключа."""
+
+    window_start: float
+    previous: int = 0
+    current: int = 0
+
+
+class SlidingWindowLoginThrottle(LoginThrottle):
+    """Потокобезопасный in-memory ограничитель попыток входа.
+
+    Для каждого ключа хранятся только начало текущего окна и два счётчика —
+    за текущее и предыдущее окно. Число попыток за последние window_seconds
+    оценивается как счётчик текущего окна плюс доля предыдущего,
+    пропорциональная ещё не вышедшей из скользящего окна части. Память на ключ
+    постоянна, а число ключей ограничено: давно не использованные вытесняются.
+
+    Учитываются только неудачные попытки, поэтому сколько угодно
+    одновременных запросов с верными учётными данными не упираются в лимит.
+    Неудачи параллельного залпа учитываются по мере завершения проверок
+    пароля, так что залп может превысить лимит не больше чем на число
+    одновременно проверяемых паролей.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        max_attempts_per_username: int,
+        max_attempts_per_ip: int,
+        max_keys: int,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Инициализирует ограничитель без учтённых попыток.
+
+        Args:
+            window_seconds: Длина скользящего окна в секундах.
+            max_attempts_per_username: Лимит попыток на одно имя пользователя за окно.
+            max_attempts_per_ip: Лимит попыток с одного IP-адреса за окно.
+            max_keys: Максимальное количество отслеживаемых ключей.
+            clock: Источник монотонного времени в секундах.
+        """
+        self._window_seconds = window_seconds
+        self._max_attempts_per_username = max_attempts_per_username
+        self._max_attempts_per_ip = max_attempts_per_ip
+        self._max_keys = max_keys
+        self._clock = clock
+        self._counters: OrderedDict[str, _WindowCounter] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, username: str, client_ip: str | None) -> None:
+        """Отклоняет попытку входа, если лимит неудачных попыток исчерпан; попытку не учитывает.
+
+        Args:
+            username: Имя пользователя из запроса.
+            client_ip: IP-адрес клиента, если известен.
+
+        Raises:
+            TooManyLoginAttemptsError: Если лимит попыток для имени или адреса исчерпан.
+        """
+        now = self._clock()
+        retry_after = 0.0
+
+        with self._lock:
+            for key, limit in self._limits(username, client_ip):
+                counter = self._counters.get(key)
+
+                if counter is not None:
+                    self._advance(counter, now)
+                    retry_after = max(retry_after, self._retry_after(counter, limit, now))
+
+        if retry_after > 0:
+            raise TooManyLoginAttemptsError(retry_after_seconds=max(1, math.ceil(retry_after)))
+
+    def record_failure(self, username: str, client_ip: str | None) -> None:
+        """Учитывает неудачную попытку входа.
+
+        Args:
+            username: Имя пользователя из запроса.
+            client_ip: IP-адрес клиента, если известен.
+        """
+        now = self._clock()
+
+        with self._lock:
+            for key, _ in self._limits(username, client_ip):
+                self._get_counter(key, now).current += 1
+
+    def __len__(self) -> int:
+        """Возвращает количество отслеживаемых ключей."""
+        return len(self._counters)
+
+    def _limits(self, username: str, client_ip: str | None) -> list[tuple[str, int]]:
+        """Возвращает ключи попытки и лимиты для них.
+
+        Args:
+            username: Имя пользователя из запроса.
+            client_ip: IP-адрес клиента, если известен.
+
+        Returns:
+            Список пар «ключ — лимит попыток за окно».
+        """
+        limits = [(f'{_USERNAME_KEY_PREFIX}{username.strip().lower()}', self._max_attempts_per_username)]
+
+        if client_ip:
+            limits.append((f'{_CLIENT_IP_KEY_PREFIX}{client_ip}', self._max_attempts_per_ip))
+
+        return limits
+
+    def _get_counter(self, key: str, now: float) -> _WindowCounter:
+        """Возвращает счётчик ключа, создавая его и вытесняя самый старый при переполнении.
+
+        Вызывается под блокировкой.
+
+        Args:
+            key: Ключ счётчика.
+            now: Текущее время.
+
+        Returns:
+            Счётчик, приведённый к окну, содержащему момент now.
+        """
+        counter = self._counters.get(key)
+
+        if counter is None:
+            counter = _WindowCounter(window_start=now)
+            self._counters[key] = counter
+
+            if len(self._counters) > self._max_keys:
+                self._counters.popitem(last=False)
+        else:
+            self._counters.move_to_end(key)
+            self._advance(counter, now)
+
+        return counter
+
+    def _advance(self, counter: _WindowCounter, now: float) -> None:
+        """Сдвигает окно счётчика так, чтобы оно содержало момент now.
+
+        Args:
+            counter: Счётчик ключа.
+            now: Текущее время.
+        """
+        elapsed_windows = int((now - counter.window_start) // self._window_seconds)
+
+        if elapsed_windows < 1:
+            return
+
+        counter.previous = counter.current if elapsed_windows == 1 else 0
+        counter.current = 0
+        counter.window_start += elapsed_windows * self._window_seconds
+
+    def _retry_after(self, counter: _WindowCounter, limit: int, now: float) -> float:
+        """Вычисляет, через сколько секунд ещё одна попытка уложится в лимит.
+
+        Args:
+            counter: Счётчик ключа, приведённый к текущему окну.
+            limit: Лимит попыток за окно.
+            now: Текущее время.
+
+        Returns:
+            Время ожидания в секундах; 0, если попытка разрешена сейчас.
+        """
+        window = self._window_seconds
+        elapsed = now - counter.window_start
+        allowed = limit - 1
+
+        if counter.previous * (1 - elapsed / window) + counter.current <= allowed:
+            return 0.0
+
+        if counter.current <= allowed:
+            return window * (1 - (allowed - counter.current) / counter.previous) - elapsed
+
+        return window - elapsed + window * (1 - allowed / counter.current)
@@ -16,7 +16,7 @@ from jwt.algorithms import get_default_algorithms
 from pydantic import Field, field_validator, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from src.app.domain.constants import AppEnv, LogLevel
+from src.app.domain.constants import AppEnv, LogLevel, RepositoryBackend
 
 logger = logging.getLogger(__name__)
 
@@ -47,14 +47,78 @@ _ENV_SETTINGS: Final[SettingsConfigDict] = SettingsConfigDict(
 )
 
 
+def _build_env_settings(group_prefix: str) -> SettingsConfigDict:
+    """Возвращает конфигурацию окружения для группы настроек с собственным префиксом.
+
+    Args:
+        group_prefix: Префикс группы, добавляемый к базовому префиксу (например, 'PASSWORD_HASHER_').
+
+    Returns:
+        Конфигурация pydantic-settings.
+    """
+    config = SettingsConfigDict(**_ENV_SETTINGS)
+    config['env_prefix'] = f'{_BASE_ENV_PREFIX}{group_prefix}'
+    return config
+
+
 DEFAULT_JWT_ACCESS_TOKEN_EXPIRES_MINUTES: Final[int] = 15
 DEFAULT_JWT_REFRESH_TOKEN_EXPIRES_MINUTES: Final[int] = 60 * 24 * 7
 
 DEFAULT_JWT_ALGORITHM: Final[str] = 'HS256'
+DEFAULT_JWT_DECODE_CACHE_SIZE: Final[int] = 10_000
+DEFAULT_JWT_STATELESS_PRINCIPAL: Final[bool] = False
+DEFAULT_JWT_REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS: Final[float] = 60.0
+DEFAULT_JWT_USER_VERSION_CACHE_TTL_SECONDS: Final[float] = 5.0
+DEFAULT_JWT_USER_VERSION_CACHE_SIZE: Final[int] = 100_000
 
 MIN_TOKEN_EXPIRES_MINUTES = 1
 MAX_TOKEN_EXPIRES_MINUTES = 525600
 
+DEFAULT_PASSWORD_HASHER_POOL_SIZE: Final[int] = min(os.cpu_count() or 1, 4)
+DEFAULT_PASSWORD_HASHER_MAX_PENDING: Final[int] = 64
+DEFAULT_PASSWORD_HASHER_BCRYPT_ROUNDS: Final[int] = 12
+
+MIN_BCRYPT_ROUNDS = 4
+MAX_BCRYPT_ROUNDS = 31
+
+DEFAULT_TOKEN_REVOCATION_BLOOM_CAPACITY: Final[int] = 100_000
+DEFAULT_TOKEN_REVOCATION_BLOOM_ERROR_RATE: Final[float] = 0.001
+DEFAULT_TOKEN_REVOCATION_PURGE_INTERVAL_SECONDS: Final[float] = 60.0
+
+DEFAULT_USER_REPOSITORY_BACKEND: Final[RepositoryBackend] = RepositoryBackend.MEMORY
+DEFAULT_USER_REPOSITORY_SQLITE_PATH: Final[str] = 'insight-api.sqlite3'
+DEFAULT_USER_REPOSITORY_SQLITE_BUSY_TIMEOUT_SECONDS: Final[float] = 5.0
+DEFAULT_USER_REPOSITORY_SQLITE_STATEMENT_CACHE_SIZE: Final[int] = 128
+DEFAULT_USER_REPOSITORY_CACHE_ENABLED: Final[bool] = False
+DEFAULT_USER_REPOSITORY_CACHE_MAX_SIZE: Final[int] = 10_000
+DEFAULT_USER_REPOSITORY_CACHE_TTL_SECONDS: Final[float] = 30.0
+DEFAULT_USER_REPOSITORY_CACHE_NEGATIVE_MAX_SIZE: Final[int] = 10_000
+DEFAULT_USER_REPOSITORY_CACHE_NEGATIVE_TTL_SECONDS: Final[float] = 5.0
+DEFAULT_USER_REPOSITORY_SNAPSHOT_INTERVAL_SECONDS: Final[float] = 300.0
+DEFAULT_USER_REPOSITORY_SHARED_MEMORY_NAME: Final[str] = 'insight-api-users'
+DEFAULT_USER_REPOSITORY_SHARED_MEMORY_CAPACITY: Final[int] = 100_000
+
+DEFAULT_LOGIN_THROTTLE_ENABLED: Final[bool] = True
+DEFAULT_LOGIN_THROTTLE_WINDOW_SECONDS: Final[float] = 300.0
+DEFAULT_LOGIN_THROTTLE_MAX_ATTEMPTS_PER_USERNAME: Final[int] = 10
+DEFAULT_LOGIN_THROTTLE_MAX_ATTEMPTS_PER_IP: Final[int] = 100
+DEFAULT_LOGIN_THROTTLE_MAX_KEYS: Final[int] = 100_000
+
+DEFAULT_CREDENTIAL_CACHE_ENABLED: Final[bool] = False
+DEFAULT_CREDENTIAL_CACHE_TTL_SECONDS: Final[float] = 60.0
+DEFAULT_CREDENTIAL_CACHE_MAX_SIZE: Final[int] = 10_000
+
+DEFAULT_MODEL_REGISTRY_MAX_RESIDENT: Final[int] = 3
+DEFAULT_MODEL_REGISTRY_SYNC_INTERVAL_SECONDS: Final[float] = 5.0
+
+DEFAULT_PREDICTION_BATCHER_ENABLED: Final[bool] = True
+DEFAULT_PREDICTION_BATCHER_MAX_BATCH_SIZE: Final[int] = 64
+DEFAULT_PREDICTION_BATCHER_MAX_WAIT_MS: Final[float] = 2.0
+
+DEFAULT_PREDICTION_CACHE_ENABLED: Final[bool] = False
+DEFAULT_PREDICTION_CACHE_MAX_SIZE: Final[int] = 100_000
+DEFAULT_PREDICTION_CACHE_TTL_SECONDS: Final[float] = 300.0
+
 
 class JWTSettings(BaseSettings):
     """Настройки для работы с JWT."""
@@ -68,6 +132,30 @@ class JWTSettings(BaseSettings):
         default=DEFAULT_JWT_REFRESH_TOKEN_EXPIRES_MINUTES,
         description='Время истечения срока действия refresh токена в минутах.',
     )
+    refresh_token_sweep_interval_seconds: float = Field(
+        default=DEFAULT_JWT_REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS,
+        gt=0,
+        description='Минимальный интервал между очистками истёкших refresh токенов в секундах.',
+    )
+    decode_cache_size: int = Field(
+        default=DEFAULT_JWT_DECODE_CACHE_SIZE,
+        ge=0,
+        description='Количество проверенных access токенов в кэше; 0 отключает кэширование.',
+    )
+    stateless_principal: bool = Field(
+        default=DEFAULT_JWT_STATELESS_PRINCIPAL,
+        description='Авторизовать запросы по утверждениям токена без загрузки пользователя из репозитория.',
+    )
+    user_version_cache_ttl_seconds: float = Field(
+        default=DEFAULT_JWT_USER_VERSION_CACHE_TTL_SECONDS,
+        gt=0,
+        description='Время жизни закэшированной версии учётной записи в секундах.',
+    )
+    user_version_cache_size: int = Field(
+        default=DEFAULT_JWT_USER_VERSION_CACHE_SIZE,
+        ge=1,
+        description='Максимальное количество закэшированных версий учётных записей.',
+    )
 
     model_config = SettingsConfigDict(**_ENV_SETTINGS)
 
@@ -191,12 +279,264 @@ class LoggingSettings(BaseSettings):
         return value
 
 
+class UserRepositorySettings(BaseSettings):
+    """Настройки хранилища пользователей."""
+
+    backend: RepositoryBackend = Field(
+        default=DEFAULT_USER_REPOSITORY_BACKEND,
+        description=(
+            'Хранилище пользователей: memory (только в памяти процесса), sqlite или shared_memory '
+            '(разделяемая память, общая для воркеров хоста).'
+        ),
+    )
+    sqlite_path: Path = Field(
+        default=Path(DEFAULT_USER_REPOSITORY_SQLITE_PATH),
+        description='Путь к файлу базы данных SQLite.',
+    )
+    sqlite_busy_timeout_seconds: float = Field(
+        default=DEFAULT_USER_REPOSITORY_SQLITE_BUSY_TIMEOUT_SECONDS,
+        ge=0,
+        description='Время ожидания снятия блокировки записи другим процессом в секундах.',
+    )
+    sqlite_statement_cache_size: int = Field(
+        default=DEFAULT_USER_REPOSITORY_SQLITE_STATEMENT_CACHE_SIZE,
+        ge=1,
+        description='Количество подготовленных выражений, кэшируемых каждым соединением.',
+    )
+    cache_enabled: bool = Field(
+        default=DEFAULT_USER_REPOSITORY_CACHE_ENABLED,
+        description='Кэшировать поиск пользователей по имени в памяти процесса.',
+    )
+    cache_max_size: int = Field(
+        default=DEFAULT_USER_REPOSITORY_CACHE_MAX_SIZE,
+        ge=1,
+        description='Максимальное количество закэшированных пользователей.',
+    )
+    cache_ttl_seconds: float = Field(
+        default=DEFAULT_USER_REPOSITORY_CACHE_TTL_SECONDS,
+        gt=0,
+        description='Время жизни закэшированного пользователя; ограничивает задержку изменений из других процессов.',
+    )
+    cache_negative_max_size: int = Field(
+        default=DEFAULT_USER_REPOSITORY_CACHE_NEGATIVE_MAX_SIZE,
+        ge=1,
+        description='Максимальное количество закэшированных несуществующих имён.',
+    )
+    cache_negative_ttl_seconds: float = Field(
+        default=DEFAULT_USER_REPOSITORY_CACHE_NEGATIVE_TTL_SECONDS,
+        gt=0,
+        description='Время жизни записи о несуществующем имени в секундах.',
+    )
+    snapshot_path: Path | None = Field(
+        default=None,
+        description=(
+            'Файл снимка хранилища memory: загружается при запуске, записывается периодически и при остановке. '
+            'Не задан — снимки отключены.'
+        ),
+    )
+    snapshot_interval_seconds: float = Field(
+        default=DEFAULT_USER_REPOSITORY_SNAPSHOT_INTERVAL_SECONDS,
+        gt=0,
+        description='Интервал периодической записи снимка в секундах.',
+    )
+    shared_memory_name: str = Field(
+        default=DEFAULT_USER_REPOSITORY_SHARED_MEMORY_NAME,
+        min_length=1,
+        description='Имя сегмента разделяемой памяти хранилища shared_memory.',
+    )
+    shared_memory_capacity: int = Field(
+        default=DEFAULT_USER_REPOSITORY_SHARED_MEMORY_CAPACITY,
+        ge=1,
+        description='Максимальное количество пользователей в хранилище shared_memory; задаёт размер сегмента.',
+    )
+
+    model_config = _build_env_settings('USER_REPOSITORY_')
+
+
+class PasswordHasherSettings(BaseSettings):
+    """Настройки хеширования паролей."""
+
+    pool_size: int = Field(
+        default=DEFAULT_PASSWORD_HASHER_POOL_SIZE,
+        ge=1,
+        description='Количество процессов, выполняющих bcrypt.',
+    )
+    max_pending: int = Field(
+        default=DEFAULT_PASSWORD_HASHER_MAX_PENDING,
+        ge=1,
+        description='Максимальное число задач хеширования в пуле, сверх которого запросы отклоняются с 503.',
+    )
+    bcrypt_rounds: int = Field(
+        default=DEFAULT_PASSWORD_HASHER_BCRYPT_ROUNDS,
+        ge=MIN_BCRYPT_ROUNDS,
+        le=MAX_BCRYPT_ROUNDS,
+        description='Стоимость bcrypt; подбирается под железо командой make calibrate-password-hasher.',
+    )
+
+    model_config = _build_env_settings('PASSWORD_HASHER_')
+
+
+class LoginThrottleSettings(BaseSettings):
+    """Настройки ограничения частоты попыток входа."""
+
+    enabled: bool = Field(
+        default=DEFAULT_LOGIN_THROTTLE_ENABLED,
+        description='Включает ограничение попыток входа по имени пользователя и IP-адресу.',
+    )
+    window_seconds: float = Field(
+        default=DEFAULT_LOGIN_THROTTLE_WINDOW_SECONDS,
+        gt=0,
+        description='Длина скользящего окна в секундах.',
+    )
+    max_attempts_per_username: int = Field(
+        default=DEFAULT_LOGIN_THROTTLE_MAX_ATTEMPTS_PER_USERNAME,
+        ge=1,
+        description='Лимит неудачных и незавершённых попыток входа на одно имя пользователя за окно.',
+    )
+    max_attempts_per_ip: int = Field(
+        default=DEFAULT_LOGIN_THROTTLE_MAX_ATTEMPTS_PER_IP,
+        ge=1,
+        description='Лимит неудачных и незавершённых попыток входа с одного IP-адреса за окно.',
+    )
+    max_keys: int = Field(
+        default=DEFAULT_LOGIN_THROTTLE_MAX_KEYS,
+        ge=1,
+        description='Максимальное количество отслеживаемых имён и адресов; старые вытесняются.',
+    )
+
+    model_config = _build_env_settings('LOGIN_THROTTLE_')
+
+
+class CredentialCacheSettings(BaseSettings):
+    """Настройки кэша успешных проверок HTTP Basic."""
+
+    enabled: bool = Field(
+        default=DEFAULT_CREDENTIAL_CACHE_ENABLED,
+        description='Включает кэширование успешных проверок пароля для HTTP Basic.',
+    )
+    ttl_seconds: float = Field(
+        default=DEFAULT_CREDENTIAL_CACHE_TTL_SECONDS,
+        gt=0,
+        description='Время жизни записи кэша в секундах.',
+    )
+    max_size: int = Field(
+        default=DEFAULT_CREDENTIAL_CACHE_MAX_SIZE,
+        ge=1,
+        description='Максимальное количество записей в кэше.',
+    )
+
+    model_config = _build_env_settings('CREDENTIAL_CACHE_')
+
+
+class TokenRevocationSettings(BaseSettings):
+    """Настройки списка отозванных access токенов."""
+
+    bloom_capacity: int = Field(
+        default=DEFAULT_TOKEN_REVOCATION_BLOOM_CAPACITY,
+        ge=1,
+        description='Начальная ёмкость фильтра Блума (число одновременно отозванных токенов).',
+    )
+    bloom_error_rate: float = Field(
+        default=DEFAULT_TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+        gt=0,
+        lt=1,
+        description='Допустимая доля ложноположительных ответов фильтра Блума.',
+    )
+    purge_interval_seconds: float = Field(
+        default=DEFAULT_TOKEN_REVOCATION_PURGE_INTERVAL_SECONDS,
+        gt=0,
+        description='Минимальный интервал между очистками записей об истёкших токенах в секундах.',
+    )
+
+    model_config = _build_env_settings('TOKEN_REVOCATION_')
+
+
+class ModelRegistrySettings(BaseSettings):
+    """Настройки реестра версий модели."""
+
+    path: Path | None = Field(
+        default=None,
+        description='Каталог с артефактами версий модели. Не задан — используется встроенная модель.',
+    )
+    max_resident: int = Field(
+        default=DEFAULT_MODEL_REGISTRY_MAX_RESIDENT,
+        ge=1,
+        description='Количество загруженных версий, удерживаемых в памяти для мгновенного отката.',
+    )
+    sync_interval_seconds: float = Field(
+        default=DEFAULT_MODEL_REGISTRY_SYNC_INTERVAL_SECONDS,
+        gt=0,
+        description='Интервал между фоновыми проверками активной версии, опубликованной другим воркером.',
+    )
+
+    model_config = _build_env_settings('MODEL_REGISTRY_')
+
+
+class PredictionBatcherSettings(BaseSettings):
+    """Настройки объединения одиночных запросов предсказаний в пачки."""
+
+    enabled: bool = Field(
+        default=DEFAULT_PREDICTION_BATCHER_ENABLED,
+        description='Объединяет одновременные запросы POST /predictions в один вызов модели.',
+    )
+    max_batch_size: int = Field(
+        default=DEFAULT_PREDICTION_BATCHER_MAX_BATCH_SIZE,
+        ge=1,
+        description='Размер пачки, при котором она отправляется в модель без ожидания.',
+    )
+    max_wait_ms: float = Field(
+        default=DEFAULT_PREDICTION_BATCHER_MAX_WAIT_MS,
+        gt=0,
+        description='Максимальная задержка запроса в ожидании пачки в миллисекундах.',
+    )
+
+    model_config = _build_env_settings('PREDICTION_BATCHER_')
+
+    @property
+    def max_wait_seconds(self) -> float:
+        """Возвращает максимальную задержку запроса в ожидании пачки в секундах.
+
+        Returns:
+            Задержка в секундах.
+        """
+        return self.max_wait_ms / 1000
+
+
+class PredictionCacheSettings(BaseSettings):
+    """Настройки кэша результатов предсказаний."""
+
+    enabled: bool = Field(
+        default=DEFAULT_PREDICTION_CACHE_ENABLED,
+        description='Возвращает повторные предсказания активной версии модели из кэша без вызова модели.',
+    )
+    max_size: int = Field(
+        default=DEFAULT_PREDICTION_CACHE_MAX_SIZE,
+        ge=1,
+        description='Максимальное количество закэшированных прогнозов.',
+    )
+    ttl_seconds: float = Field(
+        default=DEFAULT_PREDICTION_CACHE_TTL_SECONDS,
+        gt=0,
+        description='Время жизни прогноза в кэше в секундах.',
+    )
+
+    model_config = _build_env_settings('PREDICTION_CACHE_')
+
+
 class Settings(BaseSettings):
     """Основная точка доступа к настройкам всего приложения."""
 
     app: AppSettings = Field(default_factory=AppSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     jwt: JWTSettings = Field(default_factory=JWTSettings)
+    user_repository: UserRepositorySettings = Field(default_factory=UserRepositorySettings)
+    password_hasher: PasswordHasherSettings = Field(default_factory=PasswordHasherSettings)
+    login_throttle: LoginThrottleSettings = Field(default_factory=LoginThrottleSettings)
+    credential_cache: CredentialCacheSettings = Field(default_factory=CredentialCacheSettings)
+    token_revocation: TokenRevocationSettings = Field(default_factory=TokenRevocationSettings)
+    models: ModelRegistrySettings = Field(default_factory=ModelRegistrySettings)
+    prediction_batcher: PredictionBatcherSettings = Field(default_factory=PredictionBatcherSettings)
+    prediction_cache: PredictionCacheSettings = Field(default_factory=PredictionCacheSettings)
 
     model_config = SettingsConfigDict(**_ENV_SETTINGS)
 
@@ -1,19 +1,57 @@
 """Контейнер зависимостей для управления синглтонами приложения."""
 
-from typing import TYPE_CHECKING
+from typing import cast, TYPE_CHECKING
 
-from src.app.domain.constants import LOGGER_NAME
+from src.app.application.services.inference_service import ThresholdModel
+from src.app.application.services.model_registry import ModelRegistry
+from src.app.domain.constants import LOGGER_NAME, RepositoryBackend
+from src.app.infrastructure.adapters.inference.directory_model_store import DirectoryModelStore
+from src.app.infrastructure.adapters.inference.lru_prediction_cache import LRUPredictionCache
+from src.app.infrastructure.adapters.inference.micro_batch_predictor import MicroBatchPredictor
 from src.app.infrastructure.adapters.logger.structlog_logger import StructlogLogger
-from src.app.infrastructure.adapters.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.app.infrastructure.adapters.repositories.caching_user_repository import (
+    AsyncCachingUserRepository,
+    CachingUserRepository,
+    UserLookupCache,
+)
+from src.app.infrastructure.adapters.repositories.in_memory_api_key_repository import InMemoryApiKeyRepository
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import (
+    AsyncInMemoryUserRepository,
+    InMemoryUserRepository,
+)
+from src.app.infrastructure.adapters.repositories.shared_memory_user_repository import (
+    AsyncSharedMemoryUserRepository,
+    SharedMemoryUserRepository,
+)
+from src.app.infrastructure.adapters.repositories.sqlite_user_repository import (
+    AsyncSQLiteUserRepository,
+    SQLiteUserRepository,
+)
 from src.app.infrastructure.adapters.security.bcrypt_password_hasher import BcryptPasswordHasher
+from src.app.infrastructure.adapters.security.bloom_token_revocation_store import BloomTokenRevocationStore
+from src.app.infrastructure.adapters.security.cached_user_version_provider import CachedUserVersionProvider
+from src.app.infrastructure.adapters.security.hmac_credential_cache import HMACCredentialCache
+from src.app.infrastructure.adapters.security.in_memory_refresh_token_store import InMemoryRefreshTokenStore
 from src.app.infrastructure.adapters.security.jwt_token_service import PyJWTTokenService
+from src.app.infrastructure.adapters.security.process_pool_password_hasher import ProcessPoolPasswordHasher
+from src.app.infrastructure.adapters.security.sliding_window_login_throttle import SlidingWindowLoginThrottle
 from src.app.infrastructure.config import get_settings
 
 if TYPE_CHECKING:
+    from src.app.application.ports.inference.prediction_cache import PredictionCache
+    from src.app.application.ports.inference.predictor import AsyncPredictor
     from src.app.application.ports.logger import Logger
-    from src.app.application.ports.security.password_hasher import PasswordHasher
+    from src.app.application.ports.security.credential_cache import CredentialCache
+    from src.app.application.ports.security.login_throttle import LoginThrottle
+    from src.app.application.ports.security.password_hasher import AsyncPasswordHasher, PasswordHasher
+    from src.app.application.ports.security.refresh_token_store import RefreshTokenStore
+    from src.app.application.ports.security.token_revocation_store import TokenRevocationStore
     from src.app.application.ports.security.token_service import TokenService
-    from src.app.domain.repositories.user_repository import UserRepository
+    from src.app.application.ports.security.user_version_provider import UserVersionProvider
+    from src.app.domain.repositories.api_key_repository import ApiKeyRepository
+    from src.app.domain.repositories.user_repository import AsyncUserRepository, UserRepository
+    from src.app.infrastructure.adapters.cache.lru_ttl_cache import CacheStats
+    from src.app.infrastructure.adapters.inference.micro_batch_predictor import BatcherStats
 
 
 settings = get_settings()
@@ -25,12 +63,84 @@ class AppContainer:
     Служит для централизованного хранения и предоставления зависимостей.
     """
 
+    _user_storage: 'UserRepository | None' = None
     _user_repository: 'UserRepository | None' = None
-    _password_hasher: 'PasswordHasher' = BcryptPasswordHasher()
-    _token_service: 'TokenService' = PyJWTTokenService(
+    _async_user_repository: 'AsyncUserRepository | None' = None
+    _user_lookup_cache: 'UserLookupCache | None' = (
+        UserLookupCache(
+            max_size=settings.user_repository.cache_max_size,
+            ttl_seconds=settings.user_repository.cache_ttl_seconds,
+            negative_max_size=settings.user_repository.cache_negative_max_size,
+            negative_ttl_seconds=settings.user_repository.cache_negative_ttl_seconds,
+        )
+        if settings.user_repository.cache_enabled
+        else None
+    )
+    _api_key_repository: 'ApiKeyRepository | None' = None
+    _user_version_provider: 'CachedUserVersionProvider | None' = None
+    _password_hasher: 'PasswordHasher' = BcryptPasswordHasher(rounds=settings.password_hasher.bcrypt_rounds)
+    _async_password_hasher: 'AsyncPasswordHasher' = ProcessPoolPasswordHasher(
+        secret_key=settings.app.secret_key.get_secret_value(),
+        pool_size=settings.password_hasher.pool_size,
+        max_pending=settings.password_hasher.max_pending,
+        bcrypt_rounds=settings.password_hasher.bcrypt_rounds,
+    )
+    _login_throttle: 'LoginThrottle | None' = (
+        SlidingWindowLoginThrottle(
+            window_seconds=settings.login_throttle.window_seconds,
+            max_attempts_per_username=settings.login_throttle.max_attempts_per_username,
+            max_attempts_per_ip=settings.login_throttle.max_attempts_per_ip,
+            max_keys=settings.login_throttle.max_keys,
+        )
+        if settings.login_throttle.enabled
+        else None
+    )
+    _credential_cache: 'HMACCredentialCache | None' = (
+        HMACCredentialCache(
+            secret_key=settings.app.secret_key.get_secret_value(),
+            ttl_seconds=settings.credential_cache.ttl_seconds,
+            max_size=settings.credential_cache.max_size,
+        )
+        if settings.credential_cache.enabled
+        else None
+    )
+    _token_service: 'PyJWTTokenService' = PyJWTTokenService(
         secret_key=settings.app.secret_key.get_secret_value(),
         algorithm=settings.jwt.algorithm,
         expiration=settings.jwt.access_token_expiration,
+        decode_cache_size=settings.jwt.decode_cache_size,
+    )
+    _refresh_token_store: 'RefreshTokenStore' = InMemoryRefreshTokenStore(
+        expiration=settings.jwt.refresh_token_expiration,
+        sweep_interval_seconds=settings.jwt.refresh_token_sweep_interval_seconds,
+    )
+    _token_revocation_store: 'TokenRevocationStore' = BloomTokenRevocationStore(
+        capacity=settings.token_revocation.bloom_capacity,
+        error_rate=settings.token_revocation.bloom_error_rate,
+        purge_interval_seconds=settings.token_revocation.purge_interval_seconds,
+    )
+    _model_registry: 'ModelRegistry' = ModelRegistry(
+        fallback=ThresholdModel(),
+        store=DirectoryModelStore(settings.models.path) if settings.models.path is not None else None,
+        max_resident=settings.models.max_resident,
+    )
+    _prediction_cache: 'LRUPredictionCache | None' = (
+        LRUPredictionCache(
+            registry=_model_registry,
+            max_size=settings.prediction_cache.max_size,
+            ttl_seconds=settings.prediction_cache.ttl_seconds,
+        )
+        if settings.prediction_cache.enabled
+        else None
+    )
+    _prediction_batcher: 'MicroBatchPredictor | None' = (
+        MicroBatchPredictor(
+            predict_many=_model_registry.predict_many if _prediction_cache is None else _prediction_cache.compute_many,
+            max_batch_size=settings.prediction_batcher.max_batch_size,
+            max_wait_seconds=settings.prediction_batcher.max_wait_seconds,
+        )
+        if settings.prediction_batcher.enabled
+        else None
     )
 
     @classmethod
@@ -41,8 +151,118 @@ class AppContainer:
             Экземпляр UserRepository.
         """
         if cls._user_repository is None:
-            cls._user_repository = InMemoryUserRepository()
-        return cls._user_repository
+            cls._build_user_repositories()
+        return cast('UserRepository', cls._user_repository)
+
+    @classmethod
+    def async_user_repository(cls) -> 'AsyncUserRepository':
+        """Возвращает синглтон асинхронного доступа к репозиторию пользователей.
+
+        Работает с тем же хранилищем и кэшем, что и user_repository().
+
+        Returns:
+            Экземпляр AsyncUserRepository.
+        """
+        if cls._async_user_repository is None:
+            cls._build_user_repositories()
+        return cast('AsyncUserRepository', cls._async_user_repository)
+
+    @classmethod
+    def _build_user_repositories(cls) -> None:
+        """Создаёт хранилище пользователей выбранного типа и синхронный и асинхронный доступ к нему.
+
+        Если кэш включён в настройках, оба доступа оборачиваются кэширующими
+        декораторами с общим кэшем.
+        """
+        storage: UserRepository
+        async_storage: AsyncUserRepository
+
+        if settings.user_repository.backend == RepositoryBackend.SQLITE:
+            sqlite_storage = SQLiteUserRepository(
+                path=settings.user_repository.sqlite_path,
+                busy_timeout_seconds=settings.user_repository.sqlite_busy_timeout_seconds,
+                statement_cache_size=settings.user_repository.sqlite_statement_cache_size,
+            )
+            storage, async_storage = sqlite_storage, AsyncSQLiteUserRepository(sqlite_storage)
+        elif settings.user_repository.backend == RepositoryBackend.SHARED_MEMORY:
+            shared_storage = SharedMemoryUserRepository(
+                name=settings.user_repository.shared_memory_name,
+                capacity=settings.user_repository.shared_memory_capacity,
+            )
+            storage, async_storage = shared_storage, AsyncSharedMemoryUserRepository(shared_storage)
+        else:
+            memory_storage = cls._load_memory_storage()
+            storage, async_storage = memory_storage, AsyncInMemoryUserRepository(memory_storage)
+
+        cls._user_storage = storage
+
+        if cls._user_lookup_cache is not None:
+            cls._user_repository = CachingUserRepository(storage, cls._user_lookup_cache)
+            cls._async_user_repository = AsyncCachingUserRepository(async_storage, cls._user_lookup_cache)
+        else:
+            cls._user_repository = storage
+            cls._async_user_repository = async_storage
+
+    @classmethod
+    def _load_memory_storage(cls) -> InMemoryUserRepository:
+        """Восстанавливает in-memory хранилище из снимка, если он задан в настройках и существует.
+
+        Повреждённый или нечитаемый снимок не мешает запуску: хранилище
+        создаётся пустым, а снимок будет перезаписан при следующем сохранении.
+
+        Returns:
+            Экземпляр InMemoryUserRepository.
+        """
+        path = settings.user_repository.snapshot_path
+
+        if path is None or not path.exists():
+            return InMemoryUserRepository()
+
+        try:
+            return InMemoryUserRepository.from_snapshot(path)
+        except (OSError, ValueError) as exc:
+            cls.logger().warning('user_snapshot_load_failed', path=str(path), error=str(exc))
+            return InMemoryUserRepository()
+
+    @classmethod
+    def save_user_snapshot(cls) -> None:
+        """Записывает снимок in-memory хранилища пользователей в файл из настроек.
+
+        Ничего не делает, если снимки отключены или выбрано другое хранилище.
+        """
+        path = settings.user_repository.snapshot_path
+
+        if path is not None and isinstance(cls._user_storage, InMemoryUserRepository):
+            cls._user_storage.save_snapshot(path)
+
+    @classmethod
+    def api_key_repository(cls) -> 'ApiKeyRepository':
+        """Возвращает синглтон репозитория API-ключей.
+
+        Returns:
+            Экземпляр ApiKeyRepository.
+        """
+        if cls._api_key_repository is None:
+            cls._api_key_repository = InMemoryApiKeyRepository()
+        return cls._api_key_repository
+
+    @classmethod
+    def user_version_provider(cls) -> 'UserVersionProvider | None':
+        """Возвращает синглтон источника версий учётных записей.
+
+        Returns:
+            Экземпляр UserVersionProvider или None, если авторизация по утверждениям токена отключена.
+        """
+        if not settings.jwt.stateless_principal:
+            return None
+
+        if cls._user_version_provider is None:
+            cls._user_version_provider = CachedUserVersionProvider(
+                user_repository=cls.async_user_repository(),
+                ttl_seconds=settings.jwt.user_version_cache_ttl_seconds,
+                max_size=settings.jwt.user_version_cache_size,
+            )
+        return cls._user_version_provider
 
     @classmethod
     def password_hasher(cls) -> 'PasswordHasher':
@@ -53,6 +273,33 @@ class AppContainer:
         """
         return cls._password_hasher
 
+    @classmethod
+    def async_password_hasher(cls) -> 'AsyncPasswordHasher':
+        """Возвращает синглтон асинхронного хешера паролей.
+
+        Returns:
+            Экземпляр AsyncPasswordHasher.
+        """
+        return cls._async_password_hasher
+
+    @classmethod
+    def login_throttle(cls) -> 'LoginThrottle | None':
+        """Возвращает синглтон ограничителя попыток входа.
+
+        Returns:
+            Экземпляр LoginThrottle или None, если ограничение отключено в настройках.
+        """
+        return cls._login_throttle
+
+    @classmethod
+    def credential_cache(cls) -> 'CredentialCache | None':
+        """Возвращает синглтон кэша проверенных учетных данных.
+
+        Returns:
+            Экземпляр CredentialCache или None, если кэш отключён в настройках.
+        """
+        return cls._credential_cache
+
     @classmethod
     def token_service(cls) -> 'TokenService':
         """Возвращает синглтон службы токенов.
@@ -62,6 +309,51 @@ class AppContainer:
         """
         return cls._token_service
 
+    @classmethod
+    def refresh_token_store(cls) -> 'RefreshTokenStore':
+        """Возвращает синглтон хранилища refresh токенов.
+
+        Returns:
+            Экземпляр RefreshTokenStore.
+        """
+        return cls._refresh_token_store
+
+    @classmethod
+    def token_revocation_store(cls) -> 'TokenRevocationStore':
+        """Возвращает синглтон списка отозванных access токенов.
+
+        Returns:
+            Экземпляр TokenRevocationStore.
+        """
+        return cls._token_revocation_store
+
+    @classmethod
+    def model_registry(cls) -> 'ModelRegistry':
+        """Возвращает синглтон реестра версий модели.
+
+        Returns:
+            Экземпляр ModelRegistry.
+        """
+        return cls._model_registry
+
+    @classmethod
+    def prediction_cache(cls) -> 'PredictionCache | None':
+        """Возвращает синглтон кэша результатов предсказаний.
+
+        Returns:
+            Экземпляр PredictionCache или None, если кэш отключён в настройках.
+        """
+        return cls._prediction_cache
+
+    @classmethod
+    def predictor(cls) -> 'AsyncPredictor | None':
+        """Возвращает синглтон предиктора, объединяющего запросы в пачки.
+
+        Returns:
+            Экземпляр AsyncPredictor или None, если объединение отключено в настройках.
+        """
+        return cls._prediction_batcher
+
     @classmethod
     def logger(cls) -> 'Logger':
         """Возвращает синглтон логгера приложения.
@@ -70,3 +362,56 @@ class AppContainer:
             Экземпляр Logger.
         """
         return StructlogLogger(name=LOGGER_NAME)
+
+    @classmethod
+    def cache_stats(cls) -> dict[str, 'CacheStats']:
+        """Собирает счётчики всех включённых кэшей приложения.
+
+        Returns:
+            Словарь «название кэша — снимок статистики».
+        """
+        stats: dict[str, CacheStats] = {}
+
+        if (token_stats := cls._token_service.cache_stats()) is not None:
+            stats['access_token_decode'] = token_stats
+
+        if cls._credential_cache is not None:
+            stats['http_basic_credentials'] = cls._credential_cache.stats()
+
+        if cls._user_version_provider is not None:
+            stats['user_versions'] = cls._user_version_provider.stats()
+
+        if cls._user_lookup_cache is not None:
+            stats['users'], stats['users_not_found'] = cls._user_lookup_cache.stats()
+
+        if cls._prediction_cache is not None:
+            stats['predictions'] = cls._prediction_cache.stats()
+
+        return stats
+
+    @classmethod
+    def batcher_stats(cls) -> dict[str, 'BatcherStats']:
+        """Собирает счётчики всех включённых пакетных обработчиков приложения.
+
+        Returns:
+            Словарь «название обработчика — снимок статистики».
+        """
+        stats: dict[str, BatcherStats] = {}
+
+        if cls._prediction_batcher is not None:
+            stats['predictions'] = cls._prediction_batcher.stats()
+
+        return stats
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Освобождает ресурсы синглтонов при остановке приложения."""
+        cls._async_password_hasher.shutdown()
+
+        try:
+            cls.save_user_snapshot()
+        except OSError as exc:
+            cls.logger().error('user_snapshot_save_failed', error=str(exc))
+
+        if isinstance(cls._user_storage, SQLiteUserRepository | SharedMemoryUserRepository):
+            cls._user_storage.close()
@@ -0,0 +1,20 @@
+"""Загружает и прогревает активную версию модели при запуске."""
+
+from src.app.domain.exceptions import BaseAppError
+from src.app.infrastructure.container import AppContainer
+
+
+def load_active_model() -> None:
+    """Загружает опубликованную или последнюю версию модели до приёма запросов.
+
+    Если версию загрузить не удалось, приложение запускается со встроенной
+    моделью, а реестр повторит попытку при следующей сверке.
+    """
+    registry = AppContainer.model_registry()
+
+    try:
+        registry.sync()
+    except (BaseAppError, OSError):
+        AppContainer.logger().warning('model_load_failed', error=registry.status().sync_error)
+    else:
+        AppContainer.logger().info('model_loaded', version=registry.active.version)
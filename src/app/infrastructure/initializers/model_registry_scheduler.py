@@ -0,0 +1,28 @@
+"""Периодическая сверка реестра моделей с опубликованной версией."""
+
+import asyncio
+
+from src.app.domain.exceptions import BaseAppError
+from src.app.infrastructure.container import AppContainer
+
+
+async def sync_model_registry_periodically(interval_seconds: float) -> None:
+    """Сверяет реестр с опубликованной версией через равные интервалы до отмены задачи.
+
+    Чтение указателя, загрузка и прогрев новой версии выполняются в потоке,
+    поэтому не задерживают обработку запросов, а запросы продолжают
+    работать с текущей моделью до переключения ссылки.
+
+    Args:
+        interval_seconds: Интервал между сверками в секундах.
+    """
+    registry = AppContainer.model_registry()
+    logger = AppContainer.logger()
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+
+        try:
+            await asyncio.to_thread(registry.sync)
+        except (BaseAppError, OSError):
+            logger.warning('model_sync_failed', error=registry.status().sync_error)
@@ -1,5 +1,8 @@
 """Инициализирует репозиторий пользователей с тестовыми данными."""
 
+import contextlib
+
+from src.app.domain.exceptions import UserAlreadyExistsError
 from src.app.domain.models.user import InternalUser
 from src.app.domain.value_objects.role import Role
 from src.app.infrastructure.container import AppContainer
@@ -9,6 +12,8 @@ def init_fake_users() -> None:
     """Создаёт пользователей для разработки и тестов.
 
     Добавляет в репозиторий фиктивного пользователя с захардкоженными данными.
+    Воркеры с общим хранилищем могут выполнять инициализацию одновременно,
+    поэтому пользователь, добавленный другим воркером, не считается ошибкой.
     """
     user_repository = AppContainer.user_repository()
     password_hasher = AppContainer.password_hasher()
@@ -23,4 +28,5 @@ def init_fake_users() -> None:
             role=Role.USER,
             hashed_password=password_hasher.hash('qwerty123'),
         )
-        user_repository.add(user)
+        with contextlib.suppress(UserAlreadyExistsError):
+            user_repository.add(user)
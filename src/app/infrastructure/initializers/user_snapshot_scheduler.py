@@ -0,0 +1,25 @@
+"""Периодическая запись снимка in-memory репозитория пользователей."""
+
+import asyncio
+
+from src.app.infrastructure.container import AppContainer
+
+
+async def save_user_snapshots_periodically(interval_seconds: float) -> None:
+    """Записывает снимок хранилища пользователей через равные интервалы до отмены задачи.
+
+    Снимок снимается и записывается в потоке, не задерживая обработку
+    запросов; согласованность копии обеспечивают блокировки хранилища.
+
+    Args:
+        interval_seconds: Интервал между снимками в секундах.
+    """
+    logger = AppContainer.logger()
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+
+        try:
+            await asyncio.to_thread(AppContainer.save_user_snapshot)
+        except OSError as exc:
+            logger.error('user_snapshot_save_failed', error=str(exc))
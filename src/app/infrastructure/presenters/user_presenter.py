@@ -1,18 +1,25 @@
 """Presenter для преобразования моделей пользователя домена в модели ответа API."""
 
-from typing import TYPE_CHECKING
+from typing import Final, TYPE_CHECKING
 
-from src.app.presentation.schemas.user import UserResponse
+import orjson
+
+from src.app.presentation.api.pagination import encode_cursor
+from src.app.presentation.schemas.user import UserPageResponse, UserResponse
 
 if TYPE_CHECKING:
-    from src.app.domain.models.user import InternalUser
+    from collections.abc import Iterable
+
+    from src.app.domain.models.user import InternalUser, Principal, UserPage
+
+_RESPONSE_FIELDS: Final[tuple[str, ...]] = tuple(UserResponse.model_fields)
 
 
 class UserPresenter:
     """Presenter для преобразования доменной модели пользователя в ответ API."""
 
     @staticmethod
-    def to_response(user: 'InternalUser') -> 'UserResponse':
+    def to_response(user: 'Principal') -> 'UserResponse':
         """Преобразует доменную модель пользователя в схему ответа API.
 
         Args:
@@ -22,3 +29,36 @@ class UserPresenter:
             Модель ответа пользователя для API.
         """
         return UserResponse.model_validate(user, from_attributes=True)
+
+    @staticmethod
+    def to_page_response(page: 'UserPage') -> 'UserPageResponse':
+        """Преобразует страницу пользователей в схему ответа API.
+
+        Args:
+            page: Страница пользователей из репозитория.
+
+        Returns:
+            Модель страницы с закодированным курсором.
+        """
+        return UserPageResponse(
+            items=[UserPresenter.to_response(user) for user in page.items],
+            next_cursor=encode_cursor(page.next_cursor) if page.next_cursor is not None else None,
+        )
+
+    @staticmethod
+    def to_ndjson(users: 'Iterable[InternalUser]') -> bytes:
+        """Сериализует пользователей в строки NDJSON с полями UserResponse.
+
+        Поля берутся прямо из доменной модели и кодируются orjson, без
+        создания и проверки модели ответа для каждого пользователя.
+
+        Args:
+            users: Доменные модели пользователей.
+
+        Returns:
+            По одной строке JSON на пользователя, каждая с переводом строки.
+        """
+        return b''.join(
+            orjson.dumps({field: getattr(user, field) for field in _RESPONSE_FIELDS}, option=orjson.OPT_APPEND_NEWLINE)
+            for user in users
+        )
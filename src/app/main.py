@@ -1,7 +1,11 @@
 """Точка входа в приложение. Настраивает и запускает сервер."""
 
+import asyncio
+import contextlib
 import os
 import pathlib
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
 import uvicorn
 from fastapi import FastAPI
@@ -11,15 +15,51 @@ from src.app.domain.exceptions import BaseAppError
 from src.app.infrastructure.adapters.logger.logging import configure_logging
 from src.app.infrastructure.adapters.logger.structlog_logger import StructlogLogger
 from src.app.infrastructure.config import get_settings
+from src.app.infrastructure.container import AppContainer
+from src.app.infrastructure.initializers.model_registry_initializer import load_active_model
+from src.app.infrastructure.initializers.model_registry_scheduler import sync_model_registry_periodically
 from src.app.infrastructure.initializers.user_repository_initializer import init_fake_users
+from src.app.infrastructure.initializers.user_snapshot_scheduler import save_user_snapshots_periodically
 from src.app.presentation.api.rest.v1.router import api_v1_router
 from src.app.presentation.webserver.exceptions import base_app_error_handler, validation_error_handler
 from src.app.presentation.webserver.middlewares.request_id import request_id_middleware
 from src.app.presentation.webserver.middlewares.request_logging import request_logging_middleware
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 settings = get_settings()
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> 'AsyncIterator[None]':
+    """Управляет жизненным циклом приложения и освобождает ресурсы при остановке.
+
+    Если задан файл снимка, пока приложение работает, периодически записывает
+    снимок хранилища пользователей. Если задан каталог моделей, периодически
+    сверяет реестр с опубликованной версией модели.
+
+    Args:
+        _: Экземпляр приложения FastAPI (не используется).
+    """
+    tasks: list[asyncio.Task[None]] = []
+    if settings.user_repository.snapshot_path is not None:
+        tasks.append(
+            asyncio.create_task(save_user_snapshots_periodically(settings.user_repository.snapshot_interval_seconds))
+        )
+    if settings.models.path is not None:
+        tasks.append(asyncio.create_task(sync_model_registry_periodically(settings.models.sync_interval_seconds)))
+
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        AppContainer.shutdown()
+
+
 def create_app() -> FastAPI:
     """Создает и настраивает экземпляр FastAPI-приложения.
 
@@ -35,6 +75,7 @@ def create_app() -> FastAPI:
     )
 
     init_fake_users()
+    load_active_model()
 
     app = FastAPI(
         docs_url=None,
@@ -43,6 +84,7 @@ def create_app() -> FastAPI:
         version=settings.app.version,
         description=settings.app.description,
         debug=settings.app.debug,
+        lifespan=lifespan,
     )
 
     app.include_router(api_v1_router)
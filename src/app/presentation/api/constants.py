@@ -2,3 +2,12 @@
 
 API_V1_PREFIX = '/api/v1'
 OAUTH2_TOKEN_URL = f'{API_V1_PREFIX}/auth/token'
+API_KEY_HEADER_NAME = 'X-API-Key'
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+NDJSON_MAX_LINE_BYTES = 4096
+USER_IMPORT_CHUNK_SIZE = 32
+USER_IMPORT_MAX_BUFFERED_LINES = 1000
+USER_EXPORT_PAGE_SIZE = 1000
+MAX_PREDICTION_BATCH_SIZE = 10_000
@@ -0,0 +1,90 @@
+"""Потоковые запросы и ответы в формате NDJSON."""
+
+from typing import TYPE_CHECKING
+
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
+
+from src.app.presentation.api.constants import NDJSON_MEDIA_TYPE
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    from starlette.types import Receive, Scope, Send
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """Потоковый ответ NDJSON, тело которого может читать тело запроса по ходу отправки.
+
+    StreamingResponse на серверах с ASGI ниже 2.4 параллельно ждёт отключения
+    клиента и при этом забирает из receive части тела запроса, так что
+    генератор, читающий запрос, никогда их не получит. Этот ответ не слушает
+    receive: отключение клиента обнаруживается чтением тела запроса или
+    ошибкой отправки.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    async def __call__(self, _scope: 'Scope', _receive: 'Receive', send: 'Send') -> None:
+        """Отправляет ответ, не читая сообщения клиента.
+
+        Args:
+            _scope: Область ASGI (не используется).
+            _receive: Канал сообщений клиента (не используется).
+            send: Канал отправки ответа.
+
+        Raises:
+            ClientDisconnect: Если клиент отключился во время отправки.
+        """
+        try:
+            await self.stream_response(send)
+        except OSError as error:
+            raise ClientDisconnect() from error
+
+        if self.background is not None:
+            await self.background()
+
+
+async def iter_ndjson_lines(
+    chunks: 'AsyncIterable[bytes]', max_line_bytes: int
+) -> 'AsyncIterator[tuple[int, bytes | None]]':
+    """Разбивает поток байтов на строки, не накапливая в памяти больше одной строки.
+
+    Пустые строки пропускаются, но учитываются в нумерации. Содержимое строки
+    длиннее max_line_bytes отбрасывается по мере чтения.
+
+    Args:
+        chunks: Части тела запроса.
+        max_line_bytes: Максимальная длина строки в байтах без перевода строки.
+
+    Yields:
+        Номер строки, начиная с единицы, и её содержимое или None, если строка длиннее допустимого.
+    """
+    buffer = bytearray()
+    oversized = False
+    number = 0
+
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b'\n', start)) != -1:
+            number += 1
+            if not oversized and len(buffer) + end - start <= max_line_bytes:
+                buffer += chunk[start:end]
+                if buffer.strip():
+                    yield number, bytes(buffer)
+            else:
+                yield number, None
+            buffer.clear()
+            oversized = False
+            start = end + 1
+
+        if not oversized:
+            buffer += chunk[start:]
+            if len(buffer) > max_line_bytes:
+                oversized = True
+                buffer.clear()
+
+    if oversized:
+        yield number + 1, None
+    elif buffer.strip():
+        yield number + 1, bytes(buffer)
@@ -0,0 +1,41 @@
+"""Кодирование курсоров пагинации для API."""
+
+import base64
+import binascii
+
+from src.app.domain.exceptions import InvalidCursorError
+
+
+def encode_cursor(position: int) -> str:
+    """Кодирует курсор репозитория в непрозрачную строку для клиента.
+
+    Args:
+        position: Курсор, возвращённый репозиторием.
+
+    Returns:
+        Строка, безопасная для передачи в query-параметре.
+    """
+    return base64.urlsafe_b64encode(str(position).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> int:
+    """Восстанавливает курсор репозитория из строки, полученной от клиента.
+
+    Args:
+        cursor: Строка, ранее выданная encode_cursor.
+
+    Returns:
+        Курсор репозитория.
+
+    Raises:
+        InvalidCursorError: Если строка не является курсором.
+    """
+    try:
+        position = int(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError) as error:
+        raise InvalidCursorError() from error
+
+    if position < 0:
+        raise InvalidCursorError()
+
+    return position
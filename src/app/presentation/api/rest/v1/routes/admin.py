@@ -1,25 +1,192 @@
 """Маршрут администратора."""
 
+from dataclasses import asdict
 from http import HTTPStatus
+from typing import TYPE_CHECKING
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from fastapi.responses import JSONResponse
 
-from src.app.presentation.webserver.dependencies import AdminUserDep  # noqa: TC001
+from src.app.application.services.api_key_service import mint_api_key, revoke_api_key
+from src.app.application.services.auth_service import change_user_role
+from src.app.infrastructure.presenters.user_presenter import UserPresenter
+from src.app.presentation.schemas.api_key import ApiKeyCreate, ApiKeyCreated, ApiKeyResponse
+from src.app.presentation.schemas.model_registry import ModelRegistryResponse
+from src.app.presentation.schemas.user import UserResponse, UserRoleUpdate  # noqa: TC001
+from src.app.presentation.webserver.dependencies import (  # noqa: TC001
+    AdminUserDep,
+    ApiKeyAdminDep,
+    ApiKeyRepoDep,
+    ModelRegistryDep,
+    UserRepoDep,
+    UserVersionProviderDep,
+)
+
+if TYPE_CHECKING:
+    from src.app.application.services.model_registry import ModelRegistry
 
 router = APIRouter(
     tags=['admin'],
 )
 
 
-@router.get('admin', status_code=HTTPStatus.OK, summary='Admin Check')
-def admin(current_user: AdminUserDep) -> JSONResponse:
-    """Проверяет, что текущий пользователь имеет роль администратора.
+@router.get('/admin', status_code=HTTPStatus.OK, summary='Admin Check')
+async def admin(current_user: AdminUserDep) -> JSONResponse:
+    """Проверяет, что токен текущего пользователя содержит право администратора.
 
     Args:
-        current_user: Аутентифицированный пользователь с ролью ADMIN.
+        current_user: Субъект токена с правом ADMIN.
 
     Returns:
         Ответ с приветствием, если доступ разрешён.
     """
     return JSONResponse(content={'message': f'Hello admin {current_user.username}'})
+
+
+@router.put('/admin/users/{username}/role', status_code=HTTPStatus.OK, summary='Сменить роль пользователя')
+async def update_user_role(
+    username: str,
+    request: UserRoleUpdate,
+    _: AdminUserDep,
+    user_repository: UserRepoDep,
+    version_provider: UserVersionProviderDep,
+) -> UserResponse:
+    """Меняет роль пользователя.
+
+    В режиме авторизации по утверждениям токена токены, выданные с прежней
+    ролью, перестают приниматься.
+
+    Args:
+        username: Имя пользователя.
+        request: Новая роль.
+        _: Субъект токена с правом ADMIN.
+        user_repository: Репозиторий пользователей.
+        version_provider: Источник версий учётных записей (None, если режим отключён).
+
+    Returns:
+        Пользователь с новой ролью.
+    """
+    user = await change_user_role(username, request.role, user_repository, version_provider)
+
+    return UserPresenter.to_response(user)
+
+
+@router.post('/admin/api-keys', status_code=HTTPStatus.CREATED, summary='Выпустить API-ключ')
+async def create_api_key(
+    request: ApiKeyCreate,
+    _: ApiKeyAdminDep,
+    api_key_repository: ApiKeyRepoDep,
+    user_repository: UserRepoDep,
+) -> ApiKeyCreated:
+    """Выпускает API-ключ, действующий от имени указанного пользователя.
+
+    Args:
+        request: Владелец и название ключа.
+        _: Субъект токена с правом управления API-ключами.
+        api_key_repository: Репозиторий API-ключей.
+        user_repository: Репозиторий пользователей.
+
+    Returns:
+        Данные ключа вместе с его значением, которое больше не будет показано.
+    """
+    api_key, plain_key = await mint_api_key(request.username, request.name, api_key_repository, user_repository)
+
+    return ApiKeyCreated(
+        key_id=api_key.key_id,
+        username=api_key.username,
+        name=api_key.name,
+        created_at=api_key.created_at,
+        api_key=plain_key,
+    )
+
+
+@router.get('/admin/api-keys', status_code=HTTPStatus.OK, summary='Список API-ключей')
+async def list_api_keys(_: ApiKeyAdminDep, api_key_repository: ApiKeyRepoDep) -> list[ApiKeyResponse]:
+    """Возвращает выданные API-ключи без их значений.
+
+    Args:
+        _: Субъект токена с правом управления API-ключами.
+        api_key_repository: Репозиторий API-ключей.
+
+    Returns:
+        Список ключей.
+    """
+    return [ApiKeyResponse.model_validate(api_key, from_attributes=True) for api_key in api_key_repository.list()]
+
+
+@router.delete('/admin/api-keys/{key_id}', status_code=HTTPStatus.NO_CONTENT, summary='Отозвать API-ключ')
+async def delete_api_key(key_id: str, _: ApiKeyAdminDep, api_key_repository: ApiKeyRepoDep) -> Response:
+    """Отзывает API-ключ.
+
+    Args:
+        key_id: Идентификатор ключа.
+        _: Субъект токена с правом управления API-ключами.
+        api_key_repository: Репозиторий API-ключей.
+
+    Returns:
+        Пустой ответ 204.
+    """
+    revoke_api_key(key_id, api_key_repository)
+
+    return Response(status_code=HTTPStatus.NO_CONTENT)
+
+
+@router.get('/admin/models', status_code=HTTPStatus.OK, summary='Состояние реестра моделей')
+def get_models(_: AdminUserDep, registry: ModelRegistryDep) -> ModelRegistryResponse:
+    """Возвращает активную версию модели, версии в памяти и доступные для загрузки.
+
+    Args:
+        _: Субъект токена с правом ADMIN.
+        registry: Реестр версий модели.
+
+    Returns:
+        Состояние реестра.
+    """
+    return _registry_response(registry)
+
+
+@router.post('/admin/models/{version}:activate', status_code=HTTPStatus.OK, summary='Активировать версию модели')
+def activate_model(version: str, _: AdminUserDep, registry: ModelRegistryDep) -> ModelRegistryResponse:
+    """Загружает, прогревает и делает активной версию модели во всех воркерах.
+
+    Этот воркер переключается сразу, остальные — при следующей сверке с
+    опубликованной версией. Запросы, уже начатые на прежней версии,
+    дорабатывают с ней.
+
+    Args:
+        version: Версия модели.
+        _: Субъект токена с правом ADMIN.
+        registry: Реестр версий модели.
+
+    Returns:
+        Состояние реестра после переключения.
+    """
+    registry.activate(version)
+    return _registry_response(registry)
+
+
+@router.post('/admin/models:rollback', status_code=HTTPStatus.OK, summary='Откатить версию модели')
+def rollback_model(_: AdminUserDep, registry: ModelRegistryDep) -> ModelRegistryResponse:
+    """Возвращает активной версию модели, которая была активна перед текущей.
+
+    Args:
+        _: Субъект токена с правом ADMIN.
+        registry: Реестр версий модели.
+
+    Returns:
+        Состояние реестра после отката.
+    """
+    registry.rollback()
+    return _registry_response(registry)
+
+
+def _registry_response(registry: 'ModelRegistry') -> ModelRegistryResponse:
+    """Преобразует состояние реестра в ответ API.
+
+    Args:
+        registry: Реестр версий модели.
+
+    Returns:
+        Состояние реестра.
+    """
+    return ModelRegistryResponse(**asdict(registry.status()))
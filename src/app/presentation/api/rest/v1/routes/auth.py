@@ -3,16 +3,31 @@
 from http import HTTPStatus
 from typing import Annotated, TYPE_CHECKING
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from fastapi.security import OAuth2PasswordRequestForm
 
-from src.app.application.services.auth_service import authenticate_user
+from src.app.application.services.auth_service import (
+    authenticate_user,
+    issue_token_pair,
+    logout,
+    refresh_token_pair,
+)
+from src.app.infrastructure.config import get_settings
 from src.app.infrastructure.container import AppContainer
-from src.app.presentation.schemas.auth import Token
+from src.app.infrastructure.presenters.user_presenter import UserPresenter
+from src.app.presentation.schemas.auth import LogoutRequest, RefreshTokenRequest, Token
+from src.app.presentation.schemas.user import UserResponse  # noqa: TC001
+from src.app.presentation.webserver.dependencies import (  # noqa: TC001
+    AccessTokenClaimsDep,
+    ClientIpDep,
+    CurrentUserOauth2Dep,
+)
 
 if TYPE_CHECKING:
     from src.app.domain.models.user import InternalUser
 
+settings = get_settings()
+
 router = APIRouter(
     prefix='/auth',
     tags=['auth'],
@@ -21,25 +36,92 @@ router = APIRouter(
 OAuth2FormDep = Annotated[OAuth2PasswordRequestForm, Depends()]
 
 
-@router.post('token', status_code=HTTPStatus.OK, summary='Получить access токен')
-def login_access_token(form_data: OAuth2FormDep) -> Token:
-    """Аутентификация пользователя и выдача access токена.
+@router.post('/token', status_code=HTTPStatus.OK, summary='Получить access токен')
+async def login_access_token(form_data: OAuth2FormDep, client_ip: ClientIpDep) -> Token:
+    """Аутентификация пользователя и выдача access и refresh токенов.
 
     Args:
         form_data: Учетные данные (username и password) в форме OAuth2.
+        client_ip: IP-адрес клиента для ограничения попыток входа.
 
     Returns:
-        JWT access токен, если аутентификация прошла успешно.
+        JWT access и refresh токены, если аутентификация прошла успешно.
     """
-    user: InternalUser = authenticate_user(
+    user: InternalUser = await authenticate_user(
         form_data.username,
         form_data.password,
-        AppContainer.password_hasher(),
-        AppContainer.user_repository(),
+        AppContainer.async_password_hasher(),
+        AppContainer.async_user_repository(),
+        login_throttle=AppContainer.login_throttle(),
+        client_ip=client_ip,
+        version_provider=AppContainer.user_version_provider(),
     )
 
-    access_token = AppContainer.token_service().create_access_token(
-        {'sub': user.username, 'role': user.role.value},
+    tokens = issue_token_pair(
+        user,
+        AppContainer.token_service(),
+        AppContainer.refresh_token_store(),
+        include_profile=settings.jwt.stateless_principal,
     )
 
-    return Token(access_token=access_token, token_type='bearer')
+    return Token(access_token=tokens.access_token, refresh_token=tokens.refresh_token, token_type='bearer')
+
+
+@router.post('/refresh', status_code=HTTPStatus.OK, summary='Обновить пару токенов')
+async def refresh_access_token(request: RefreshTokenRequest) -> Token:
+    """Обменивает одноразовый refresh токен на новую пару токенов без проверки пароля.
+
+    Args:
+        request: Refresh токен, полученный ранее.
+
+    Returns:
+        Новые JWT access и refresh токены.
+    """
+    tokens = await refresh_token_pair(
+        request.refresh_token,
+        AppContainer.token_service(),
+        AppContainer.refresh_token_store(),
+        AppContainer.async_user_repository(),
+        include_profile=settings.jwt.stateless_principal,
+    )
+
+    return Token(access_token=tokens.access_token, refresh_token=tokens.refresh_token, token_type='bearer')
+
+
+@router.post('/logout', status_code=HTTPStatus.NO_CONTENT, summary='Отозвать токены')
+async def logout_tokens(claims: AccessTokenClaimsDep, request: LogoutRequest | None = None) -> Response:
+    """Отзывает предъявленный access токен и, если передан, всё семейство refresh токена.
+
+    Args:
+        claims: Утверждения access токена из заголовка Authorization.
+        request: Необязательный refresh токен для отзыва.
+
+    Returns:
+        Пустой ответ 204.
+    """
+    logout(
+        claims,
+        request.refresh_token if request is not None else None,
+        AppContainer.token_service(),
+        AppContainer.token_revocation_store(),
+        AppContainer.refresh_token_store(),
+    )
+
+    return Response(status_code=HTTPStatus.NO_CONTENT)
+
+
+@router.get('/me', status_code=HTTPStatus.OK, summary='Профиль владельца access токена')
+async def read_token_user(current_user: CurrentUserOauth2Dep) -> UserResponse:
+    """Возвращает данные пользователя, которому выдан access токен.
+
+    В режиме авторизации по утверждениям токена профиль берётся из токена
+    без обращения к репозиторию; токен, выданный до изменения учётной
+    записи, отклоняется.
+
+    Args:
+        current_user: Пользователь из access токена.
+
+    Returns:
+        Модель пользователя без пароля.
+    """
+    return UserPresenter.to_response(current_user)
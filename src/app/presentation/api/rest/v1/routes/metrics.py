@@ -0,0 +1,31 @@
+"""Маршрут для получения внутренних метрик приложения."""
+
+from dataclasses import asdict
+from http import HTTPStatus
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from src.app.infrastructure.container import AppContainer
+
+router = APIRouter(tags=['system'])
+
+
+@router.get('/metrics', status_code=HTTPStatus.OK, summary='Metrics')
+async def metrics() -> JSONResponse:
+    """Возвращает счётчики внутренних кэшей и пакетных обработчиков приложения.
+
+    Returns:
+        JSON-ответ со статистикой попаданий и промахов по каждому кэшу и
+        размерам пачек и задержкам в очереди по каждому пакетному обработчику.
+    """
+    caches = {name: {**asdict(stats), 'hit_rate': stats.hit_rate} for name, stats in AppContainer.cache_stats().items()}
+    batchers = {
+        name: {
+            **asdict(stats),
+            'mean_batch_size': stats.mean_batch_size,
+            'mean_queue_delay_seconds': stats.mean_queue_delay_seconds,
+        }
+        for name, stats in AppContainer.batcher_stats().items()
+    }
+    return JSONResponse(content={'caches': caches, 'batchers': batchers})
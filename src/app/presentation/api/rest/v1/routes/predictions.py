@@ -1,24 +1,118 @@
 """Маршруты, связанные с предсказаниями модели."""
 
 from http import HTTPStatus
+from typing import cast, Final, TYPE_CHECKING  # noqa: TC003
 
 from fastapi import APIRouter
+from pydantic import TypeAdapter, ValidationError
 
-from src.app.application.services.inference_service import predict_from_features
-from src.app.presentation.schemas.prediction import PredictRequest, PredictResponse
+from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+from src.app.presentation.schemas.prediction import (
+    PredictBatchItem,
+    PredictBatchRequest,
+    PredictBatchResponse,
+    PredictFeatures,
+    PredictRequest,
+    PredictResponse,
+)
+from src.app.presentation.webserver.dependencies import (  # noqa: TC001
+    CurrentClientDep,
+    ModelRegistryDep,
+    PredictionCacheDep,
+    PredictorDep,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 router = APIRouter(tags=['predictions'])
 
+_ROWS_ADAPTER: Final[TypeAdapter[list[PredictFeatures]]] = TypeAdapter(list[PredictFeatures])
+_OUTCOME_ITEMS: Final[dict[PredictionOutcome, PredictBatchItem]] = {
+    outcome: PredictBatchItem(prediction=outcome) for outcome in PredictionOutcome
+}
+
 
-@router.post('predictions', status_code=HTTPStatus.OK, summary='predictions')
-def predict(request: PredictRequest) -> PredictResponse:
+@router.post('/predictions', status_code=HTTPStatus.OK, summary='predictions')
+async def predict(
+    request: PredictRequest,
+    _: CurrentClientDep,
+    registry: ModelRegistryDep,
+    cache: PredictionCacheDep,
+    predictor: PredictorDep,
+) -> PredictResponse:
     """Возвращает предсказание модели на основе входных признаков.
 
+    Доступно по API-ключу в заголовке X-API-Key или по HTTP Basic. Если
+    кэш включён, повторная строка активной версии модели возвращается из
+    него без ожидания пачки. Если объединение запросов включено, строка
+    вычисляется в одной пачке с одновременными запросами других клиентов.
+
     Args:
         request: Входные признаки в виде модели Pydantic.
+        _: Аутентифицированный клиент.
+        registry: Реестр версий модели.
+        cache: Кэш результатов предсказаний (None, если кэш отключён).
+        predictor: Предиктор, объединяющий запросы в пачки (None, если объединение отключено).
 
     Returns:
         Результат предсказания модели.
     """
-    prediction = predict_from_features(request.model_dump())
+    features = request.model_dump()
+    if cache is not None and (prediction := cache.get(features)) is not None:
+        return PredictResponse(prediction=prediction)
+
+    predict_many = registry.predict_many if cache is None else cache.compute_many
+    prediction = predict_many([features])[0] if predictor is None else await predictor.predict(features)
     return PredictResponse(prediction=prediction)
+
+
+@router.post('/predictions:batch', status_code=HTTPStatus.OK, summary='predictions_batch')
+def predict_batch(
+    request: PredictBatchRequest, _: CurrentClientDep, registry: ModelRegistryDep, cache: PredictionCacheDep
+) -> PredictBatchResponse:
+    """Возвращает предсказания для пачки строк признаков в порядке строк.
+
+    Строки проверяются по схеме PredictRequest одним вызовом валидатора для
+    всей пачки; если в пачке есть ошибки, строки перепроверяются по одной,
+    и ошибка строки попадает в её результат, не отклоняя пачку. Корректные
+    строки вычисляются активной моделью за один вызов; если кэш включён,
+    модель получает только строки, которых в нём нет.
+
+    Args:
+        request: Строки входных признаков.
+        _: Аутентифицированный клиент.
+        registry: Реестр версий модели.
+        cache: Кэш результатов предсказаний (None, если кэш отключён).
+
+    Returns:
+        Результаты предсказания по строкам.
+    """
+    try:
+        rows: list[PredictFeatures | PredictBatchItem] = list(_ROWS_ADAPTER.validate_python(request.rows))
+    except ValidationError:
+        rows = [_validate_row(row) for row in request.rows]
+
+    features = [row for row in rows if isinstance(row, dict)]
+    predict_many = registry.predict_many if cache is None else cache.predict_many
+    outcomes = iter(predict_many(cast('list[Mapping[str, int | float | str | None]]', features)))
+
+    return PredictBatchResponse(
+        results=[_OUTCOME_ITEMS[next(outcomes)] if isinstance(row, dict) else row for row in rows]
+    )
+
+
+def _validate_row(row: object) -> PredictFeatures | PredictBatchItem:
+    """Проверяет строку пачки по схеме PredictRequest.
+
+    Args:
+        row: Строка из тела запроса.
+
+    Returns:
+        Признаки строки или результат с ошибками проверки.
+    """
+    try:
+        return cast('PredictFeatures', PredictRequest.model_validate(row).model_dump())
+    except ValidationError as error:
+        details = error.errors(include_url=False, include_context=False, include_input=False)
+        return PredictBatchItem(detail=[dict(item) for item in details])
@@ -2,26 +2,49 @@
 
 from dataclasses import asdict
 from http import HTTPStatus
+from typing import Annotated, TYPE_CHECKING  # noqa: TC003
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request  # noqa: TC002
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
-from src.app.domain.models.user import InternalUser
+from src.app.application.services.user_import_service import create_users, NewUser
+from src.app.domain.models.user import InternalUser, UserQuery
+from src.app.domain.value_objects.role import Role  # noqa: TC001
 from src.app.infrastructure.config import get_settings
 from src.app.infrastructure.presenters.user_presenter import UserPresenter
-from src.app.presentation.schemas.user import UserCreate, UserResponse
+from src.app.presentation.api.constants import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NDJSON_MAX_LINE_BYTES,
+    NDJSON_MEDIA_TYPE,
+    USER_EXPORT_PAGE_SIZE,
+    USER_IMPORT_CHUNK_SIZE,
+    USER_IMPORT_MAX_BUFFERED_LINES,
+)
+from src.app.presentation.api.ndjson import iter_ndjson_lines, NDJSONStreamingResponse
+from src.app.presentation.api.pagination import decode_cursor
+from src.app.presentation.schemas.user import UserCreate, UserImportResult, UserPageResponse, UserResponse
 from src.app.presentation.webserver.dependencies import (  # noqa: TCH001
+    AdminUserDep,
     CurrentUserHTTPBasicDep,
     HasherDep,
     UserRepoDep,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    from src.app.application.ports.security.password_hasher import AsyncPasswordHasher
+    from src.app.domain.repositories.user_repository import AsyncUserRepository
+
 settings = get_settings()
 
 router = APIRouter(tags=['users'])
 
 
-@router.get('users/me', status_code=HTTPStatus.OK, summary='read_current_user')
-def read_current_user(current_user: CurrentUserHTTPBasicDep) -> UserResponse:
+@router.get('/users/me', status_code=HTTPStatus.OK, summary='read_current_user')
+async def read_current_user(current_user: CurrentUserHTTPBasicDep) -> UserResponse:
     """Возвращает данные текущего аутентифицированного пользователя.
 
     Args:
@@ -33,8 +56,69 @@ def read_current_user(current_user: CurrentUserHTTPBasicDep) -> UserResponse:
     return UserPresenter.to_response(current_user)
 
 
-@router.post('users', status_code=HTTPStatus.CREATED, summary='create_user')
-def create_user(
+@router.get('/users', status_code=HTTPStatus.OK, summary='list_users')
+async def list_users(  # noqa: PLR0913
+    _: AdminUserDep,
+    user_repository: UserRepoDep,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[str | None, Query(description='Курсор из ответа предыдущей страницы')] = None,
+    email: str | None = None,
+    role: Role | None = None,
+    min_age: Annotated[int | None, Query(ge=0)] = None,
+    max_age: Annotated[int | None, Query(ge=0)] = None,
+) -> UserPageResponse:
+    """Возвращает страницу пользователей с курсором следующей страницы.
+
+    Страница выбирается по курсору и вторичным индексам репозитория,
+    поэтому стоимость запроса не зависит ни от номера страницы, ни от общего
+    числа пользователей.
+
+    Args:
+        _: Субъект токена с правом ADMIN.
+        user_repository: Репозиторий пользователей.
+        limit: Максимальное количество пользователей на странице.
+        cursor: Курсор, полученный с предыдущей страницей.
+        email: Отбор по email без учета регистра.
+        role: Отбор по роли.
+        min_age: Минимальный возраст включительно.
+        max_age: Максимальный возраст включительно.
+
+    Returns:
+        Страница пользователей.
+    """
+    query = UserQuery(email=email, role=role, min_age=min_age, max_age=max_age)
+    page = await user_repository.list_page(query, limit, decode_cursor(cursor) if cursor is not None else None)
+
+    return UserPresenter.to_page_response(page)
+
+
+@router.get(
+    '/users/export',
+    status_code=HTTPStatus.OK,
+    summary='export_users',
+    response_class=StreamingResponse,
+    responses={HTTPStatus.OK: {'content': {NDJSON_MEDIA_TYPE: {}}, 'model': UserResponse}},
+)
+async def export_users(_: AdminUserDep, user_repository: UserRepoDep) -> StreamingResponse:
+    """Выгружает всех пользователей в формате NDJSON — по одному UserResponse в строке.
+
+    Пользователи читаются из репозитория страницами по курсору, и каждая
+    страница отправляется клиенту отдельной частью ответа, поэтому память
+    воркера не зависит от числа пользователей. Пользователи, добавленные во
+    время выгрузки, попадают в неё, если добавлены после текущей страницы.
+
+    Args:
+        _: Субъект токена с правом ADMIN.
+        user_repository: Репозиторий пользователей.
+
+    Returns:
+        Потоковый ответ со строками пользователей в порядке добавления.
+    """
+    return StreamingResponse(_export_pages(user_repository), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post('/users', status_code=HTTPStatus.CREATED, summary='create_user')
+async def create_user(
     user_data: UserCreate,
     password_hasher: HasherDep,
     user_repository: UserRepoDep,
@@ -56,10 +140,179 @@ def create_user(
         username=user_data.username,
         email=user_data.email,
         age=user_data.age,
-        hashed_password=password_hasher.hash(user_data.password),
+        hashed_password=await password_hasher.hash(user_data.password),
         role=user_data.role,
     )
 
-    user_repository.add(internal_user)
+    await user_repository.add(internal_user)
 
     return UserResponse(**asdict(internal_user))
+
+
+@router.post(
+    '/users:batch',
+    status_code=HTTPStatus.OK,
+    summary='import_users',
+    response_class=NDJSONStreamingResponse,
+    responses={HTTPStatus.OK: {'content': {NDJSON_MEDIA_TYPE: {}}, 'model': UserImportResult}},
+)
+async def import_users(
+    _: AdminUserDep,
+    request: Request,
+    password_hasher: HasherDep,
+    user_repository: UserRepoDep,
+) -> NDJSONStreamingResponse:
+    """Создаёт пользователей из тела запроса в формате NDJSON — по одному UserCreate в строке.
+
+    Тело читается и обрабатывается частями по мере поступления, а результаты
+    отправляются клиенту по мере готовности, поэтому память не зависит от
+    размера файла. Пароли каждой части хешируются параллельно в пуле хешера.
+    Ответ — NDJSON с результатом для каждой непустой строки в порядке строк;
+    ошибка одной строки не прерывает импорт остальных.
+
+    Args:
+        _: Субъект токена с правом ADMIN.
+        request: Входящий запрос.
+        password_hasher: Сервис хеширования паролей.
+        user_repository: Репозиторий пользователей.
+
+    Returns:
+        Потоковый ответ с результатами по строкам.
+    """
+    chunk_size = min(USER_IMPORT_CHUNK_SIZE, settings.password_hasher.max_pending)
+
+    return NDJSONStreamingResponse(_import_results(request.stream(), chunk_size, password_hasher, user_repository))
+
+
+async def _export_pages(user_repository: 'AsyncUserRepository') -> 'AsyncIterator[bytes]':
+    """Обходит репозиторий страницами по курсору.
+
+    Args:
+        user_repository: Репозиторий пользователей.
+
+    Yields:
+        Пользователи очередной страницы в формате NDJSON.
+    """
+    query = UserQuery()
+    cursor = None
+
+    while True:
+        page = await user_repository.list_page(query, USER_EXPORT_PAGE_SIZE, cursor)
+        if page.items:
+            yield UserPresenter.to_ndjson(page.items)
+        if page.next_cursor is None:
+            return
+        cursor = page.next_cursor
+
+
+async def _import_results(
+    body: 'AsyncIterable[bytes]',
+    chunk_size: int,
+    password_hasher: 'AsyncPasswordHasher',
+    user_repository: 'AsyncUserRepository',
+) -> 'AsyncIterator[bytes]':
+    """Разбирает строки тела и создаёт пользователей частями по chunk_size корректных строк.
+
+    Часть отправляется и раньше, если в ней накопилось USER_IMPORT_MAX_BUFFERED_LINES
+    строк, поэтому тело из одних ошибочных строк тоже обрабатывается потоком
+    в ограниченной памяти.
+
+    Args:
+        body: Части тела запроса.
+        chunk_size: Количество пользователей, создаваемых за один вызов create_users.
+        password_hasher: Сервис хеширования паролей.
+        user_repository: Репозиторий пользователей.
+
+    Yields:
+        Строки NDJSON с результатами в порядке строк тела.
+    """
+    rows: list[tuple[int, NewUser | UserImportResult]] = []
+    users: list[NewUser] = []
+
+    async for number, line in iter_ndjson_lines(body, NDJSON_MAX_LINE_BYTES):
+        row = _parse_import_line(number, line)
+        rows.append((number, row))
+
+        if isinstance(row, NewUser):
+            users.append(row)
+
+        if len(users) == chunk_size or len(rows) == USER_IMPORT_MAX_BUFFERED_LINES:
+            yield await _import_chunk(rows, users, password_hasher, user_repository)
+            rows, users = [], []
+
+    if rows:
+        yield await _import_chunk(rows, users, password_hasher, user_repository)
+
+
+def _parse_import_line(number: int, line: bytes | None) -> NewUser | UserImportResult:
+    """Проверяет строку тела по схеме UserCreate.
+
+    Args:
+        number: Номер строки.
+        line: Содержимое строки или None, если строка длиннее допустимого.
+
+    Returns:
+        Данные пользователя или результат с причиной отклонения строки.
+    """
+    if line is None:
+        return UserImportResult(
+            line=number,
+            status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            detail=f'Line exceeds {NDJSON_MAX_LINE_BYTES} bytes',
+        )
+
+    try:
+        user_data = UserCreate.model_validate_json(line)
+    except ValidationError as error:
+        return UserImportResult(
+            line=number,
+            status=HTTPStatus.BAD_REQUEST,
+            detail=[
+                dict(details) for details in error.errors(include_url=False, include_context=False, include_input=False)
+            ],
+        )
+
+    return NewUser(
+        username=user_data.username,
+        email=user_data.email,
+        age=user_data.age,
+        role=user_data.role,
+        password=user_data.password,
+    )
+
+
+async def _import_chunk(
+    rows: list[tuple[int, NewUser | UserImportResult]],
+    users: list[NewUser],
+    password_hasher: 'AsyncPasswordHasher',
+    user_repository: 'AsyncUserRepository',
+) -> bytes:
+    """Создаёт пользователей части и собирает результаты всех её строк.
+
+    Args:
+        rows: Строки части в порядке тела: данные пользователя или готовый результат.
+        users: Корректные строки части в том же порядке.
+        password_hasher: Сервис хеширования паролей.
+        user_repository: Репозиторий пользователей.
+
+    Returns:
+        Результаты строк части в формате NDJSON.
+    """
+    errors = iter(await create_users(users, password_hasher, user_repository) if users else ())
+    results = bytearray()
+
+    for number, row in rows:
+        if isinstance(row, NewUser):
+            error = next(errors)
+            result = UserImportResult(
+                line=number,
+                status=HTTPStatus.CREATED if error is None else error.status_code,
+                username=row.username,
+                detail=None if error is None else error.message,
+            )
+        else:
+            result = row
+        results += result.model_dump_json(exclude_none=True).encode()
+        results += b'\n'
+
+    return bytes(results)
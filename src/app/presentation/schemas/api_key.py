@@ -0,0 +1,27 @@
+"""Схемы Pydantic для управления API-ключами."""
+
+from datetime import datetime  # noqa: TC003
+
+from pydantic import BaseModel, Field
+
+
+class ApiKeyCreate(BaseModel):
+    """Схема запроса на выпуск API-ключа."""
+
+    username: str = Field(description='Пользователь, от имени которого действует ключ')
+    name: str = Field(min_length=1, max_length=64, description='Название ключа, например имя сервиса')
+
+
+class ApiKeyResponse(BaseModel):
+    """Схема ответа API с данными ключа без его значения."""
+
+    key_id: str
+    username: str
+    name: str
+    created_at: datetime
+
+
+class ApiKeyCreated(ApiKeyResponse):
+    """Схема ответа на выпуск ключа. Значение ключа возвращается только один раз."""
+
+    api_key: str
@@ -9,11 +9,27 @@ class Token(BaseModel):
     """Схема возвращаемого токена доступа."""
 
     access_token: str = Field(..., description='JWT токен доступа')
+    refresh_token: str | None = Field(default=None, description='Одноразовый JWT токен для обновления пары токенов')
     token_type: str = Field(default='bearer', description='Тип токена (по умолчанию bearer)')
 
 
+class RefreshTokenRequest(BaseModel):
+    """Схема запроса на обновление пары токенов."""
+
+    refresh_token: str = Field(..., description='Refresh токен, полученный при входе или предыдущем обновлении')
+
+
+class LogoutRequest(BaseModel):
+    """Схема запроса на отзыв токенов."""
+
+    refresh_token: str | None = Field(default=None, description='Refresh токен, семейство которого нужно отозвать')
+
+
 class TokenData(BaseModel):
     """Схема данных, извлекаемых из токена."""
 
     username: str | None = Field(default=None, description='Имя пользователя, полученное из JWT')
     role: Role | None = Field(default=None, description='Роль пользователя, полученная из JWT')
+    email: str | None = Field(default=None, description='Email пользователя, полученный из JWT')
+    age: int | None = Field(default=None, description='Возраст пользователя, полученный из JWT')
+    version: int | None = Field(default=None, description='Версия учётной записи, для которой выдан JWT')
@@ -0,0 +1,27 @@
+"""Схемы Pydantic для управления версиями модели."""
+
+from pydantic import BaseModel, Field
+
+
+class ModelRegistryResponse(BaseModel):
+    """Схема ответа с состоянием реестра версий модели."""
+
+    active_version: str = Field(description='Версия, обслуживающая запросы')
+    resident_versions: list[str] = Field(description='Версии, загруженные в память этого воркера')
+    rollback_versions: list[str] = Field(description='Версии для отката, начиная с ближайшей')
+    available_versions: list[str] = Field(description='Версии в каталоге артефактов')
+    sync_error: str | None = Field(default=None, description='Ошибка последней загрузки опубликованной версии')
+
+    model_config = {
+        'json_schema_extra': {
+            'examples': [
+                {
+                    'active_version': '2026-10-01',
+                    'resident_versions': ['builtin', '2026-09-01', '2026-10-01'],
+                    'rollback_versions': ['2026-09-01', 'builtin'],
+                    'available_versions': ['2026-09-01', '2026-10-01'],
+                    'sync_error': None,
+                },
+            ]
+        }
+    }
@@ -1,8 +1,11 @@
 """Схемы Pydantic для работы с предсказаниями."""
 
-from pydantic import BaseModel
+from typing import Any, NotRequired, TypedDict  # noqa: TC003
+
+from pydantic import BaseModel, Field
 
 from src.app.domain.value_objects.prediction_outcome import PredictionOutcome  # noqa: TCH001
+from src.app.presentation.api.constants import MAX_PREDICTION_BATCH_SIZE
 
 
 class PredictRequest(BaseModel):
@@ -21,6 +24,18 @@ class PredictRequest(BaseModel):
     }
 
 
+class PredictFeatures(TypedDict):
+    """Входные признаки строки пачки в виде словаря; поля и проверки совпадают с PredictRequest.
+
+    Строка проверяется сразу в словарь, который принимает модель, без
+    промежуточного объекта Pydantic и model_dump().
+    """
+
+    age: int
+    income: NotRequired[float | None]
+    occupation: NotRequired[str | None]
+
+
 class PredictResponse(BaseModel):
     """Схема ответа с результатом предсказания."""
 
@@ -33,3 +48,38 @@ class PredictResponse(BaseModel):
             ]
         }
     }
+
+
+class PredictBatchRequest(BaseModel):
+    """Схема пачки строк признаков; каждая строка проверяется по схеме PredictRequest отдельно."""
+
+    rows: list[Any] = Field(min_length=1, max_length=MAX_PREDICTION_BATCH_SIZE)
+
+    model_config = {
+        'json_schema_extra': {
+            'examples': [
+                {'rows': [{'age': 42, 'income': 70000.0}, {'age': 25}]},
+            ]
+        }
+    }
+
+
+class PredictBatchItem(BaseModel):
+    """Результат предсказания для одной строки пачки."""
+
+    prediction: PredictionOutcome | None = None
+    detail: list[dict[str, Any]] | None = Field(default=None, description='Ошибки проверки строки')
+
+
+class PredictBatchResponse(BaseModel):
+    """Схема ответа с результатами в порядке строк запроса."""
+
+    results: list[PredictBatchItem]
+
+    model_config = {
+        'json_schema_extra': {
+            'examples': [
+                {'results': [{'prediction': 'positive'}, {'detail': [{'type': 'missing', 'loc': ['age']}]}]},
+            ]
+        }
+    }
@@ -1,5 +1,7 @@
 """Схемы Pydantic для работы с пользователями через API."""
 
+from typing import Any  # noqa: TC003
+
 from pydantic import BaseModel, EmailStr, Field
 
 from src.app.domain.value_objects.role import Role  # noqa: TC001
@@ -49,3 +51,27 @@ class UserResponse(BaseModel):
             ]
         }
     }
+
+
+class UserRoleUpdate(BaseModel):
+    """Схема смены роли пользователя."""
+
+    role: Role
+
+    model_config = {'json_schema_extra': {'examples': [{'role': 'admin'}]}}
+
+
+class UserPageResponse(BaseModel):
+    """Схема ответа API со страницей пользователей."""
+
+    items: list[UserResponse]
+    next_cursor: str | None = Field(default=None, description='Курсор следующей страницы; отсутствует на последней')
+
+
+class UserImportResult(BaseModel):
+    """Схема результата импорта одной строки NDJSON."""
+
+    line: int = Field(description='Номер строки во входном файле, начиная с единицы')
+    status: int = Field(description='HTTP-код, с которым была бы обработана строка отдельным запросом')
+    username: str | None = None
+    detail: str | list[dict[str, Any]] | None = Field(default=None, description='Причина отклонения строки')
@@ -1,63 +1,155 @@
 """Зависимости FastAPI для повторного использования логики."""
 
-from typing import Annotated, TYPE_CHECKING
-
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBasic, HTTPBasicCredentials, OAuth2PasswordBearer
-
-from src.app.application.ports.security.password_hasher import PasswordHasher
+from http import HTTPStatus
+from typing import Annotated, Any, TYPE_CHECKING
+
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import APIKeyHeader, HTTPBasic, HTTPBasicCredentials, OAuth2PasswordBearer
+from pydantic import ValidationError
+
+from src.app.application.ports.inference.prediction_cache import PredictionCache
+from src.app.application.ports.inference.predictor import AsyncPredictor
+from src.app.application.ports.security.credential_cache import CredentialCache
+from src.app.application.ports.security.login_throttle import LoginThrottle
+from src.app.application.ports.security.password_hasher import AsyncPasswordHasher
+from src.app.application.ports.security.refresh_token_store import RefreshTokenStore
+from src.app.application.ports.security.token_revocation_store import TokenRevocationStore
 from src.app.application.ports.security.token_service import TokenService
-from src.app.application.services.auth_service import authenticate_user, resolve_current_user
+from src.app.application.ports.security.user_version_provider import UserVersionProvider
+from src.app.application.services.api_key_service import authenticate_api_key
+from src.app.application.services.auth_service import (
+    authenticate_user,
+    ensure_token_not_revoked,
+    resolve_current_user,
+    verify_principal_version,
+)
+from src.app.application.services.authorization_service import authorize_claims, ScopePolicy
+from src.app.application.services.model_registry import ModelRegistry
 from src.app.domain.exceptions import InvalidTokenError
-from src.app.domain.models.user import InternalUser, User
-from src.app.domain.repositories.user_repository import UserRepository
-from src.app.domain.value_objects.role import Role
+from src.app.domain.models.token import TokenSubject
+from src.app.domain.models.user import InternalUser, Principal
+from src.app.domain.repositories.api_key_repository import ApiKeyRepository
+from src.app.domain.repositories.user_repository import AsyncUserRepository, UserRepository
+from src.app.domain.value_objects.scope import Scope
 from src.app.infrastructure.config import get_settings, Settings
 from src.app.infrastructure.container import AppContainer
-from src.app.presentation.api.constants import OAUTH2_TOKEN_URL
+from src.app.presentation.api.constants import API_KEY_HEADER_NAME, OAUTH2_TOKEN_URL
 from src.app.presentation.schemas.auth import TokenData
 from src.app.presentation.webserver.exceptions import build_unauthorized_exception
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Awaitable, Callable
 
 
 http_basic_security = HTTPBasic()
+optional_http_basic_security = HTTPBasic(auto_error=False)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=OAUTH2_TOKEN_URL)
+api_key_security = APIKeyHeader(name=API_KEY_HEADER_NAME, auto_error=False)
 
 
-def get_app_settings() -> 'Settings':
+async def get_app_settings() -> 'Settings':
     """Возвращает экземпляр настроек приложения."""
     return get_settings()
 
 
 def get_user_repository() -> 'UserRepository':
-    """Возвращает экземпляр репозитория пользователей."""
+    """Возвращает экземпляр синхронного репозитория пользователей для кода вне обработчиков запросов."""
     return AppContainer.user_repository()
 
 
-def get_password_hasher() -> 'PasswordHasher':
-    """Возвращает экземпляр хешера паролей."""
-    return AppContainer.password_hasher()
+async def get_async_user_repository() -> 'AsyncUserRepository':
+    """Возвращает экземпляр асинхронного репозитория пользователей."""
+    return AppContainer.async_user_repository()
+
+
+async def get_api_key_repository() -> 'ApiKeyRepository':
+    """Возвращает экземпляр репозитория API-ключей."""
+    return AppContainer.api_key_repository()
+
+
+async def get_password_hasher() -> 'AsyncPasswordHasher':
+    """Возвращает экземпляр асинхронного хешера паролей."""
+    return AppContainer.async_password_hasher()
+
+
+async def get_credential_cache() -> 'CredentialCache | None':
+    """Возвращает кэш проверенных учетных данных, если он включён."""
+    return AppContainer.credential_cache()
+
 
+async def get_login_throttle() -> 'LoginThrottle | None':
+    """Возвращает ограничитель попыток входа, если он включён."""
+    return AppContainer.login_throttle()
 
-def get_token_service() -> 'TokenService':
+
+async def get_client_ip(request: Request) -> str | None:
+    """Возвращает IP-адрес клиента, от которого получен запрос."""
+    return request.client.host if request.client is not None else None
+
+
+async def get_token_service() -> 'TokenService':
     """Возвращает экземпляр службы токенов."""
     return AppContainer.token_service()
 
 
+async def get_token_revocation_store() -> 'TokenRevocationStore':
+    """Возвращает список отозванных access токенов."""
+    return AppContainer.token_revocation_store()
+
+
+async def get_refresh_token_store() -> 'RefreshTokenStore':
+    """Возвращает хранилище refresh токенов."""
+    return AppContainer.refresh_token_store()
+
+
+async def get_user_version_provider() -> 'UserVersionProvider | None':
+    """Возвращает источник версий учётных записей, если включена авторизация по утверждениям токена."""
+    return AppContainer.user_version_provider()
+
+
+async def get_model_registry() -> 'ModelRegistry':
+    """Возвращает реестр версий модели."""
+    return AppContainer.model_registry()
+
+
+async def get_prediction_cache() -> 'PredictionCache | None':
+    """Возвращает кэш результатов предсказаний, если он включён."""
+    return AppContainer.prediction_cache()
+
+
+async def get_predictor() -> 'AsyncPredictor | None':
+    """Возвращает предиктор, объединяющий запросы в пачки, если он включён."""
+    return AppContainer.predictor()
+
+
 AppSettingsDep = Annotated[Settings, Depends(get_app_settings)]
 TokenDep = Annotated[str, Depends(oauth2_scheme)]
 CredentialsDep = Annotated[HTTPBasicCredentials, Depends(http_basic_security)]
-UserRepoDep = Annotated[UserRepository, Depends(get_user_repository)]
-HasherDep = Annotated[PasswordHasher, Depends(get_password_hasher)]
+OptionalCredentialsDep = Annotated[HTTPBasicCredentials | None, Depends(optional_http_basic_security)]
+ApiKeyDep = Annotated[str | None, Depends(api_key_security)]
+UserRepoDep = Annotated[AsyncUserRepository, Depends(get_async_user_repository)]
+ApiKeyRepoDep = Annotated[ApiKeyRepository, Depends(get_api_key_repository)]
+HasherDep = Annotated[AsyncPasswordHasher, Depends(get_password_hasher)]
 TokenServiceDep = Annotated[TokenService, Depends(get_token_service)]
-
-
-def get_current_user_http_basic(
+CredentialCacheDep = Annotated[CredentialCache | None, Depends(get_credential_cache)]
+LoginThrottleDep = Annotated[LoginThrottle | None, Depends(get_login_throttle)]
+ClientIpDep = Annotated[str | None, Depends(get_client_ip)]
+UserVersionProviderDep = Annotated[UserVersionProvider | None, Depends(get_user_version_provider)]
+TokenRevocationStoreDep = Annotated[TokenRevocationStore, Depends(get_token_revocation_store)]
+ModelRegistryDep = Annotated[ModelRegistry, Depends(get_model_registry)]
+PredictionCacheDep = Annotated[PredictionCache | None, Depends(get_prediction_cache)]
+PredictorDep = Annotated[AsyncPredictor | None, Depends(get_predictor)]
+RefreshTokenStoreDep = Annotated[RefreshTokenStore, Depends(get_refresh_token_store)]
+
+
+async def get_current_user_http_basic(  # noqa: PLR0913
     credentials: CredentialsDep,
     password_hasher: HasherDep,
     user_repository: UserRepoDep,
+    credential_cache: CredentialCacheDep,
+    login_throttle: LoginThrottleDep,
+    client_ip: ClientIpDep,
+    version_provider: UserVersionProviderDep,
 ) -> 'InternalUser':
     """Зависимость для получения текущего аутентифицированного пользователя.
 
@@ -65,82 +157,197 @@ def get_current_user_http_basic(
         credentials: Учетные данные HTTP Basic.
         password_hasher: Сервиса хеширования паролей.
         user_repository: Репозиторий пользователей.
+        credential_cache: Кэш успешных проверок пароля (None, если отключён).
+        login_throttle: Ограничитель попыток входа (None, если отключён).
+        client_ip: IP-адрес клиента.
+        version_provider: Источник версий учётных записей (None, если режим отключён).
 
     Returns:
         Внутренняя модель пользователя, если аутентификация прошла успешно.
     """
     username, password = credentials.username, credentials.password
-    user = authenticate_user(
-        username=username, password=password, user_repository=user_repository, password_hasher=password_hasher
+    user = await authenticate_user(
+        username=username,
+        password=password,
+        user_repository=user_repository,
+        password_hasher=password_hasher,
+        credential_cache=credential_cache,
+        login_throttle=login_throttle,
+        client_ip=client_ip,
+        version_provider=version_provider,
     )
     return user
 
 
-def get_current_user_oauth2(
+async def get_current_client(  # noqa: PLR0913
+    api_key: ApiKeyDep,
+    credentials: OptionalCredentialsDep,
+    api_key_repository: ApiKeyRepoDep,
+    password_hasher: HasherDep,
+    user_repository: UserRepoDep,
+    credential_cache: CredentialCacheDep,
+    login_throttle: LoginThrottleDep,
+    client_ip: ClientIpDep,
+    version_provider: UserVersionProviderDep,
+) -> 'InternalUser':
+    """Зависимость для эндпоинтов, доступных машинным клиентам.
+
+    API-ключ из заголовка X-API-Key проверяется поиском SHA-256 дайджеста
+    в словаре без вычисления bcrypt. Если ключ не передан, используется HTTP Basic.
+
+    Args:
+        api_key: Значение API-ключа из заголовка.
+        credentials: Учетные данные HTTP Basic, если переданы.
+        api_key_repository: Репозиторий API-ключей.
+        password_hasher: Сервиса хеширования паролей.
+        user_repository: Репозиторий пользователей.
+        credential_cache: Кэш успешных проверок пароля (None, если отключён).
+        login_throttle: Ограничитель попыток входа (None, если отключён).
+        client_ip: IP-адрес клиента.
+        version_provider: Источник версий учётных записей (None, если режим отключён).
+
+    Returns:
+        Владелец ключа или пользователь, прошедший HTTP Basic.
+
+    Raises:
+        HTTPException: Если не передан ни ключ, ни учетные данные.
+    """
+    if api_key:
+        return await authenticate_api_key(api_key, api_key_repository, user_repository)
+
+    if credentials is None:
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail='Not authenticated',
+            headers={'WWW-Authenticate': 'Basic'},
+        )
+
+    return await get_current_user_http_basic(
+        credentials, password_hasher, user_repository, credential_cache, login_throttle, client_ip, version_provider
+    )
+
+
+async def get_access_token_claims(
     token: TokenDep,
     token_service: TokenServiceDep,
-    user_repository: UserRepoDep,
-) -> User:
-    """Получает текущего пользователя из JWT-токена.
+    revocation_store: TokenRevocationStoreDep,
+) -> dict[str, Any]:
+    """Проверяет access токен из заголовка Authorization и возвращает его утверждения.
 
     Args:
         token: JWT-токен из запроса.
         token_service: Сервис для декодирования токена.
-        user_repository: Репозиторий пользователей.
+        revocation_store: Список отозванных токенов.
 
     Returns:
-        Объект пользователя.
+        Утверждения действительного и не отозванного токена.
 
     Raises:
-        HTTPException: Если токен недействителен или пользователь не найден.
+        HTTPException: Если токен недействителен, истёк или отозван.
     """
     try:
-        payload = token_service.decode_access_token(token)
-        token_data = TokenData(**payload)
-        if not token_data.username or not token_data.role:
-            raise build_unauthorized_exception(detail='Invalid authentication token')
+        claims = token_service.decode_access_token(token)
+        ensure_token_not_revoked(claims, revocation_store)
     except InvalidTokenError as error:
         raise HTTPException(status_code=error.status_code, detail=error.message) from error
-    except Exception as error:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Internal authentication error'
-        ) from error
 
-    user: InternalUser = resolve_current_user(token_data.username, user_repository)
-    return user
+    return claims
+
+
+AccessTokenClaimsDep = Annotated[dict[str, Any], Depends(get_access_token_claims)]
+
+
+async def get_current_user_oauth2(
+    claims: AccessTokenClaimsDep,
+    user_repository: UserRepoDep,
+    version_provider: UserVersionProviderDep,
+) -> Principal:
+    """Получает текущего пользователя из JWT-токена.
+
+    Если включена авторизация по утверждениям токена и токен содержит профиль
+    и версию учётной записи, пользователь восстанавливается из токена без
+    обращения к репозиторию; проверяется только актуальность версии.
+
+    Args:
+        claims: Утверждения проверенного access токена.
+        user_repository: Репозиторий пользователей.
+        version_provider: Источник версий учётных записей (None, если режим отключён).
+
+    Returns:
+        Объект пользователя.
+
+    Raises:
+        HTTPException: Если утверждения токена некорректны.
+    """
+    try:
+        token_data = TokenData(
+            username=claims.get('sub'),
+            role=claims.get('role'),
+            email=claims.get('email'),
+            age=claims.get('age'),
+            version=claims.get('ver'),
+        )
+    except ValidationError as error:
+        raise build_unauthorized_exception(detail='Invalid authentication token') from error
+
+    if not token_data.username or not token_data.role:
+        raise build_unauthorized_exception(detail='Invalid authentication token')
+
+    if version_provider is None or token_data.version is None:
+        return await resolve_current_user(token_data.username, user_repository)
+
+    if token_data.email is None or token_data.age is None:
+        raise build_unauthorized_exception(detail='Invalid authentication token')
+
+    principal = Principal(
+        username=token_data.username,
+        email=token_data.email,
+        age=token_data.age,
+        role=token_data.role,
+        version=token_data.version,
+    )
+    return await verify_principal_version(principal, version_provider)
 
 
 CurrentUserHTTPBasicDep = Annotated[InternalUser, Depends(get_current_user_http_basic)]
-CurrentUserOauth2Dep = Annotated[InternalUser, Depends(get_current_user_oauth2)]
+CurrentUserOauth2Dep = Annotated[Principal, Depends(get_current_user_oauth2)]
+CurrentClientDep = Annotated[InternalUser, Depends(get_current_client)]
+
 
+def require_scopes(*scopes: Scope) -> 'Callable[[dict[str, Any], UserVersionProvider | None], Awaitable[TokenSubject]]':
+    """Фабрика зависимости, проверяющей права доступа из access токена.
 
-def require_roles(allowed_roles: 'Iterable[Role]') -> 'Callable[[Annotated[InternalUser, Depends]], InternalUser]':
-    """Фабрика зависимости для проверки принадлежности пользователя к одной из допустимых ролей.
+    Политика компилируется в битовую маску один раз при объявлении маршрута,
+    а проверка в запросе не загружает пользователя из репозитория.
 
     Args:
-        allowed_roles: Список разрешённых ролей.
+        *scopes: Права, которые должны быть выданы токену.
 
     Returns:
-        Зависимость FastAPI, проверяющая роль пользователя.
+        Зависимость FastAPI, возвращающая субъект токена.
     """
+    policy = ScopePolicy.all_of(*scopes)
 
-    def dependency(user: InternalUser) -> InternalUser:
-        """Проверяет, входит ли роль пользователя в список разрешённых.
+    async def dependency(claims: AccessTokenClaimsDep, version_provider: UserVersionProviderDep) -> TokenSubject:
+        """Проверяет, что токен содержит все права политики.
 
         Args:
-            user: Аутентифицированный пользователь.
+            claims: Утверждения проверенного access токена.
+            version_provider: Источник версий учётных записей (None, если режим отключён).
 
         Returns:
-            Объект InternalUser, если роль разрешена.
+            Субъект токена.
 
         Raises:
-            HTTPException: Если у пользователя нет нужных прав.
+            HTTPException: Если утверждения токена некорректны или устарели.
         """
-        if user.role not in allowed_roles:
-            raise build_unauthorized_exception('Недостаточно прав доступа')
-        return user
+        try:
+            return await authorize_claims(claims, policy, version_provider)
+        except InvalidTokenError as error:
+            raise build_unauthorized_exception(detail=error.message) from error
 
     return dependency
 
 
-AdminUserDep = Annotated[InternalUser, Depends(require_roles([Role.ADMIN]))]
+AdminUserDep = Annotated[TokenSubject, Depends(require_scopes(Scope.ADMIN))]
+ApiKeyAdminDep = Annotated[TokenSubject, Depends(require_scopes(Scope.API_KEYS_MANAGE))]
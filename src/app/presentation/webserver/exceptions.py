@@ -31,7 +31,7 @@ async def base_app_error_handler(_: 'Request', exc: Exception) -> JSONResponse:
     """
     if isinstance(exc, BaseAppError):
         logger.warning('application_error', message=exc.message, status_code=exc.status_code)
-        return _internal_error_response(status_code=exc.status_code, content=exc.message)
+        return _internal_error_response(status_code=exc.status_code, content=exc.message, headers=exc.headers)
 
     logger.error('unexpected_exception', exc_info=exc)
     return _internal_error_response(
@@ -77,12 +77,17 @@ def build_unauthorized_exception(detail: str | None = HTTPStatus.UNAUTHORIZED.ph
     )
 
 
-def _internal_error_response(status_code: int, content: 'str | Sequence[dict[str, object]]') -> JSONResponse:
+def _internal_error_response(
+    status_code: int,
+    content: 'str | Sequence[dict[str, object]]',
+    headers: dict[str, str] | None = None,
+) -> JSONResponse:
     """Формирует JSON-ответ с заданным HTTP-статусом и телом ошибки.
 
     Args:
         status_code: HTTP-статус ответа.
         content: Содержимое поля `detail` в теле ответа.
+        headers: Дополнительные HTTP-заголовки ответа.
 
     Returns:
         Объект JSONResponse.
@@ -90,4 +95,5 @@ def _internal_error_response(status_code: int, content: 'str | Sequence[dict[str
     return JSONResponse(
         status_code=status_code,
         content={'detail': content},
+        headers=headers,
     )
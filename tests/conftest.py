@@ -75,3 +75,23 @@ async def test_user_async(async_api_client: AsyncClient) -> tuple[str, str]:
     assert response.status_code == HTTPStatus.CREATED
 
     return username, password
+
+
+@pytest.fixture
+def admin_headers(sync_api_client: TestClient) -> dict[str, str]:
+    """Создаёт администратора и возвращает заголовок с его access токеном."""
+    username = f'admin_{uuid.uuid4().hex[:8]}'
+    password = uuid.uuid4().hex[:12]
+    sync_api_client.post(
+        '/api/v1/users',
+        json={
+            'username': username,
+            'email': f'{username}@example.com',
+            'age': 30,
+            'password': password,
+            'role': 'admin',
+        },
+    )
+    response = sync_api_client.post('/api/v1/auth/token', data={'username': username, 'password': password})
+
+    return {'Authorization': f'Bearer {response.json()["access_token"]}'}
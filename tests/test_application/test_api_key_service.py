@@ -0,0 +1,54 @@
+import pytest
+
+from src.app.application.services.api_key_service import authenticate_api_key, mint_api_key, revoke_api_key
+from src.app.domain.exceptions import ApiKeyNotFoundError, InvalidApiKeyError, UserNotFoundError
+from src.app.domain.models.user import InternalUser
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.in_memory_api_key_repository import InMemoryApiKeyRepository
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import (
+    AsyncInMemoryUserRepository,
+    InMemoryUserRepository,
+)
+
+
+@pytest.fixture
+def user_repository() -> AsyncInMemoryUserRepository:
+    """Репозиторий с одним пользователем."""
+    repository = InMemoryUserRepository()
+    repository.add(
+        InternalUser(username='Batch_Service', email='batch@example.com', age=30, role=Role.USER, hashed_password='h')
+    )
+    return AsyncInMemoryUserRepository(repository)
+
+
+@pytest.mark.unit
+class TestApiKeyService:
+    @staticmethod
+    async def test_mint_api_key__only_digest_stored(user_repository: AsyncInMemoryUserRepository) -> None:
+        """Значение ключа не должно сохраняться в репозитории, а ключ должен аутентифицировать владельца."""
+        api_key_repository = InMemoryApiKeyRepository()
+
+        api_key, plain_key = await mint_api_key('batch_service', 'nightly', api_key_repository, user_repository)
+
+        assert plain_key not in {api_key.digest, api_key.key_id}
+        owner = await authenticate_api_key(plain_key, api_key_repository, user_repository)
+        assert owner.username == 'Batch_Service'
+
+    @staticmethod
+    async def test_mint_api_key__unknown_user(user_repository: AsyncInMemoryUserRepository) -> None:
+        """Ключ нельзя выпустить для несуществующего пользователя."""
+        with pytest.raises(UserNotFoundError):
+            await mint_api_key('ghost', 'nightly', InMemoryApiKeyRepository(), user_repository)
+
+    @staticmethod
+    async def test_revoke_api_key__key_rejected(user_repository: AsyncInMemoryUserRepository) -> None:
+        """Отозванный ключ не должен аутентифицировать, повторный отзыв — возвращать 404."""
+        api_key_repository = InMemoryApiKeyRepository()
+        api_key, plain_key = await mint_api_key('batch_service', 'nightly', api_key_repository, user_repository)
+
+        revoke_api_key(api_key.key_id, api_key_repository)
+
+        with pytest.raises(InvalidApiKeyError):
+            await authenticate_api_key(plain_key, api_key_repository, user_repository)
+        with pytest.raises(ApiKeyNotFoundError):
+            revoke_api_key(api_key.key_id, api_key_repository)
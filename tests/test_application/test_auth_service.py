@@ -0,0 +1,147 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.application.ports.security.password_hasher import AsyncPasswordHasher
+from src.app.application.services.auth_service import (
+    authenticate_user,
+    build_access_token_claims,
+    verify_principal_version,
+)
+from src.app.domain.exceptions import InvalidTokenError
+from src.app.domain.models.user import InternalUser, Principal
+from src.app.domain.value_objects.role import Role
+from src.app.domain.value_objects.scope import scopes_for_role
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import (
+    AsyncInMemoryUserRepository,
+    InMemoryUserRepository,
+)
+from src.app.infrastructure.adapters.security.bcrypt_password_hasher import BcryptPasswordHasher
+from src.app.infrastructure.adapters.security.cached_user_version_provider import CachedUserVersionProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class _InlinePasswordHasher(AsyncPasswordHasher):
+    def __init__(self, rounds: int) -> None:
+        self._hasher = BcryptPasswordHasher(rounds=rounds)
+
+    async def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    async def hash_many(self, passwords: 'Sequence[str]') -> list[str]:
+        return [self._hasher.hash(password) for password in passwords]
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._hasher.verify(plain_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._hasher.needs_rehash(hashed_password)
+
+    def shutdown(self) -> None:
+        pass
+
+
+@pytest.fixture
+def user_repository() -> InMemoryUserRepository:
+    """Репозиторий с одним пользователем."""
+    repository = InMemoryUserRepository()
+    repository.add(
+        InternalUser(username='john_doe', email='john@example.com', age=25, role=Role.USER, hashed_password='hash')
+    )
+    return repository
+
+
+@pytest.mark.unit
+class TestStatelessPrincipal:
+    @staticmethod
+    def test_build_access_token_claims__profile_included_on_demand(user_repository: InMemoryUserRepository) -> None:
+        """Профиль и версия должны попадать в токен только в режиме без обращения к репозиторию."""
+        user = user_repository.get_by_username('john_doe')
+        assert user is not None
+
+        user_scopes = int(scopes_for_role(Role.USER))
+
+        assert build_access_token_claims(user, include_profile=False) == {
+            'sub': 'john_doe',
+            'role': 'user',
+            'scp': user_scopes,
+        }
+        assert build_access_token_claims(user, include_profile=True) == {
+            'sub': 'john_doe',
+            'role': 'user',
+            'scp': user_scopes,
+            'email': 'john@example.com',
+            'age': 25,
+            'ver': 1,
+        }
+
+    @staticmethod
+    async def test_verify_principal_version__cached_per_process(user_repository: InMemoryUserRepository) -> None:
+        """Актуальная версия должна приниматься, а повторная проверка — обслуживаться из кэша."""
+        provider = CachedUserVersionProvider(AsyncInMemoryUserRepository(user_repository), ttl_seconds=60, max_size=10)
+        principal = Principal(username='john_doe', email='john@example.com', age=25, role=Role.USER, version=1)
+
+        assert await verify_principal_version(principal, provider) is principal
+        assert await verify_principal_version(principal, provider) is principal
+        assert provider.stats().hits == 1
+
+    @staticmethod
+    @pytest.mark.parametrize('username,version', [('john_doe', 2), ('deleted_user', 1)])
+    async def test_verify_principal_version__stale_token_rejected(
+        user_repository: InMemoryUserRepository, username: str, version: int
+    ) -> None:
+        """Токен устаревшей версии или удалённого пользователя должен отклоняться."""
+        provider = CachedUserVersionProvider(AsyncInMemoryUserRepository(user_repository), ttl_seconds=60, max_size=10)
+        principal = Principal(username=username, email='x@example.com', age=25, role=Role.USER, version=version)
+
+        with pytest.raises(InvalidTokenError):
+            await verify_principal_version(principal, provider)
+
+
+@pytest.mark.unit
+class TestRehashOnLogin:
+    @staticmethod
+    async def test_authenticate_user__rehashes_outdated_cost() -> None:
+        """Хеш с устаревшей стоимостью должен пересчитываться и сохраняться, отзывая ранее выданные токены."""
+        repository = InMemoryUserRepository()
+        old_hash = BcryptPasswordHasher(rounds=4).hash('qwerty123')
+        repository.add(
+            InternalUser(
+                username='john_doe', email='john@example.com', age=25, role=Role.USER, hashed_password=old_hash
+            )
+        )
+        hasher = _InlinePasswordHasher(rounds=5)
+        async_repository = AsyncInMemoryUserRepository(repository)
+        provider = CachedUserVersionProvider(async_repository, ttl_seconds=60, max_size=10)
+        old_principal = Principal(username='john_doe', email='john@example.com', age=25, role=Role.USER)
+        assert await verify_principal_version(old_principal, provider) is old_principal
+
+        user = await authenticate_user('john_doe', 'qwerty123', hasher, async_repository, version_provider=provider)
+
+        stored = repository.get_by_username('john_doe')
+        assert stored is not None
+        assert stored.hashed_password == user.hashed_password != old_hash
+        assert stored.version == user.version == old_principal.version + 1
+        with pytest.raises(InvalidTokenError):
+            await verify_principal_version(old_principal, provider)
+        assert hasher.needs_rehash(stored.hashed_password) is False
+        assert await hasher.verify('qwerty123', stored.hashed_password)
+
+    @staticmethod
+    async def test_authenticate_user__current_cost_kept() -> None:
+        """Хеш с текущей стоимостью не должен пересчитываться."""
+        repository = InMemoryUserRepository()
+        current_hash = BcryptPasswordHasher(rounds=4).hash('qwerty123')
+        repository.add(
+            InternalUser(
+                username='john_doe', email='john@example.com', age=25, role=Role.USER, hashed_password=current_hash
+            )
+        )
+
+        user = await authenticate_user(
+            'john_doe', 'qwerty123', _InlinePasswordHasher(rounds=4), AsyncInMemoryUserRepository(repository)
+        )
+
+        assert user.hashed_password == current_hash
@@ -0,0 +1,42 @@
+import pytest
+
+from src.app.application.services.authorization_service import authorize_claims, ScopePolicy
+from src.app.domain.exceptions import InsufficientScopeError, InvalidTokenError
+from src.app.domain.value_objects.role import Role
+from src.app.domain.value_objects.scope import Scope, scopes_for_role
+
+
+@pytest.mark.unit
+class TestScopePolicy:
+    @staticmethod
+    def test_all_of__requires_every_scope() -> None:
+        """Политика должна выполняться только при наличии всех требуемых прав."""
+        policy = ScopePolicy.all_of(Scope.ADMIN, Scope.API_KEYS_MANAGE)
+
+        assert policy.is_satisfied_by(int(scopes_for_role(Role.ADMIN)))
+        assert not policy.is_satisfied_by(int(Scope.ADMIN))
+        assert not policy.is_satisfied_by(int(scopes_for_role(Role.USER)))
+
+    @staticmethod
+    async def test_authorize_claims__returns_subject() -> None:
+        """Авторизация должна возвращать субъект токена без обращения к репозиторию."""
+        claims = {'sub': 'john_doe', 'scp': int(scopes_for_role(Role.USER))}
+
+        subject = await authorize_claims(claims, ScopePolicy.all_of(Scope.PREDICTIONS))
+
+        assert subject.username == 'john_doe'
+        assert Scope.PREDICTIONS in subject.scopes
+
+    @staticmethod
+    async def test_authorize_claims__insufficient_scope() -> None:
+        """Токен без нужного права должен отклоняться."""
+        claims = {'sub': 'john_doe', 'scp': int(scopes_for_role(Role.USER))}
+
+        with pytest.raises(InsufficientScopeError):
+            await authorize_claims(claims, ScopePolicy.all_of(Scope.ADMIN))
+
+    @staticmethod
+    async def test_authorize_claims__malformed_claims() -> None:
+        """Токен без субъекта должен считаться недействительным."""
+        with pytest.raises(InvalidTokenError):
+            await authorize_claims({'scp': 1}, ScopePolicy.all_of(Scope.USERS_READ))
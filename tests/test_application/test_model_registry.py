@@ -0,0 +1,162 @@
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from src.app.application.services.inference_service import BUILTIN_MODEL_VERSION, ThresholdModel
+from src.app.application.services.model_registry import ModelRegistry
+from src.app.domain.exceptions import InvalidModelArtifactError, ModelVersionNotFoundError, NoPreviousModelError
+from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+from src.app.infrastructure.adapters.inference.directory_model_store import DirectoryModelStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ROWS: list[dict[str, int | float | str | None]] = [{'age': 25, 'occupation': 'engineer'}, {'age': 35}]
+
+
+def _write_linear(path: 'Path', version: str, bias: float) -> None:
+    artifact = {'kind': 'linear', 'bias': bias, 'weights': {'age': 1.0}, 'categories': {'occupation': {'engineer': 10}}}
+    (path / f'{version}.json').write_bytes(orjson.dumps(artifact))
+
+
+def _registry(path: 'Path', max_resident: int = 2) -> ModelRegistry:
+    return ModelRegistry(fallback=ThresholdModel(), store=DirectoryModelStore(path), max_resident=max_resident)
+
+
+@pytest.mark.unit
+class TestModelRegistry:
+    @staticmethod
+    def test_sync__loads_latest_version(tmp_path: 'Path') -> None:
+        """Без опубликованной версии реестр должен загрузить последнюю версию из каталога."""
+        _write_linear(tmp_path, 'v001', bias=-100)
+        _write_linear(tmp_path, 'v002', bias=-30)
+        registry = _registry(tmp_path)
+
+        registry.sync()
+
+        assert registry.active.version == 'v002'
+        assert registry.predict_many(ROWS) == [PredictionOutcome.POSITIVE, PredictionOutcome.POSITIVE]
+
+    @staticmethod
+    def test_sync__orders_versions_numerically(tmp_path: 'Path') -> None:
+        """Последней должна считаться версия с большим номером, даже если её имя меньше по алфавиту."""
+        for version in ('v9', 'v10', 'v2'):
+            _write_linear(tmp_path, version, bias=-30)
+        registry = _registry(tmp_path)
+
+        registry.sync()
+
+        assert registry.status().available_versions == ['v2', 'v9', 'v10']
+        assert registry.active.version == 'v10'
+
+    @staticmethod
+    def test_activate__followed_by_other_workers(tmp_path: 'Path') -> None:
+        """Версия, активированная одним воркером, должна подхватываться другим при следующей сверке."""
+        _write_linear(tmp_path, 'v001', bias=-100)
+        _write_linear(tmp_path, 'v002', bias=-30)
+        worker, other = _registry(tmp_path), _registry(tmp_path)
+        other.sync()
+
+        worker.activate('v001')
+
+        assert worker.active.version == 'v001'
+        assert other.active.version == 'v002'
+        other.sync()
+        assert other.active.version == 'v001'
+
+    @staticmethod
+    def test_rollback__restores_previous_versions(tmp_path: 'Path') -> None:
+        """Откат должен возвращать версии в обратном порядке активации, а без истории — отклоняться."""
+        _write_linear(tmp_path, 'v001', bias=-100)
+        _write_linear(tmp_path, 'v002', bias=-30)
+        registry = _registry(tmp_path)
+        registry.activate('v001')
+        registry.activate('v002')
+
+        assert registry.rollback() == 'v001'
+        assert registry.rollback() == BUILTIN_MODEL_VERSION
+        assert registry.predict_many(ROWS) == [PredictionOutcome.NEGATIVE, PredictionOutcome.POSITIVE]
+        with pytest.raises(NoPreviousModelError):
+            registry.rollback()
+
+    @staticmethod
+    def test_activate__keeps_limited_versions_resident(tmp_path: 'Path') -> None:
+        """В памяти должно оставаться не больше max_resident загруженных версий, не считая встроенной."""
+        for index in range(1, 4):
+            _write_linear(tmp_path, f'v00{index}', bias=-30)
+        registry = _registry(tmp_path, max_resident=2)
+
+        for index in range(1, 4):
+            registry.activate(f'v00{index}')
+
+        assert registry.status().resident_versions == [BUILTIN_MODEL_VERSION, 'v002', 'v003']
+
+    @staticmethod
+    def test_activate__invalid_version_keeps_active_model(tmp_path: 'Path') -> None:
+        """Версия, которая не загрузилась, не должна становиться активной."""
+        _write_linear(tmp_path, 'v001', bias=-30)
+        (tmp_path / 'broken.json').write_bytes(orjson.dumps({'kind': 'linear', 'weights': {'age': 'heavy'}}))
+        (tmp_path / 'tree.json').write_bytes(orjson.dumps({'kind': 'tree'}))
+        registry = _registry(tmp_path)
+        registry.activate('v001')
+
+        with pytest.raises(InvalidModelArtifactError):
+            registry.activate('broken')
+        with pytest.raises(InvalidModelArtifactError, match='unknown model kind'):
+            registry.activate('tree')
+        with pytest.raises(ModelVersionNotFoundError):
+            registry.activate('../v001')
+
+        assert registry.active.version == 'v001'
+
+    @staticmethod
+    def test_active__not_synced_on_read(tmp_path: 'Path') -> None:
+        """Чтение активной модели не должно обращаться к хранилищу."""
+        _write_linear(tmp_path, 'v001', bias=-30)
+        registry = _registry(tmp_path)
+
+        _write_linear(tmp_path, 'v002', bias=-30)
+
+        assert registry.active.version == BUILTIN_MODEL_VERSION
+        assert registry.predict_many(ROWS) == [PredictionOutcome.NEGATIVE, PredictionOutcome.POSITIVE]
+        assert registry.status().resident_versions == [BUILTIN_MODEL_VERSION]
+
+    @staticmethod
+    def test_sync__error_keeps_serving(tmp_path: 'Path') -> None:
+        """Ошибка загрузки опубликованной версии не должна прерывать предсказания."""
+        _write_linear(tmp_path, 'v001', bias=-30)
+        registry = _registry(tmp_path)
+        registry.sync()
+        (tmp_path / 'ACTIVE').write_text('missing\n', encoding='utf-8')
+
+        with pytest.raises(ModelVersionNotFoundError):
+            registry.sync()
+
+        assert registry.active.version == 'v001'
+        assert registry.status().sync_error == 'Model version "missing" not found'
+
+    @staticmethod
+    def test_activate__publish_failure_keeps_active_model(tmp_path: 'Path', monkeypatch: pytest.MonkeyPatch) -> None:
+        """Если версию не удалось опубликовать, воркер не должен переключаться на неё в одиночку."""
+        _write_linear(tmp_path, 'v001', bias=-100)
+        _write_linear(tmp_path, 'v002', bias=-30)
+        store = DirectoryModelStore(tmp_path)
+        registry = ModelRegistry(fallback=ThresholdModel(), store=store, max_resident=2)
+        registry.activate('v001')
+        registry.activate('v002')
+
+        def write_active(version: str) -> None:
+            raise OSError(f'cannot publish {version}')
+
+        monkeypatch.setattr(store, 'write_active', write_active)
+
+        with pytest.raises(OSError, match='cannot publish v001'):
+            registry.rollback()
+        with pytest.raises(OSError, match='cannot publish v001'):
+            registry.activate('v001')
+
+        status = registry.status()
+        assert status.active_version == 'v002'
+        assert status.rollback_versions == ['v001', BUILTIN_MODEL_VERSION]
+        assert store.read_active() == 'v002'
@@ -0,0 +1,89 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.application.ports.security.password_hasher import AsyncPasswordHasher
+from src.app.application.services.user_import_service import create_users, NewUser
+from src.app.domain.exceptions import (
+    EmailAlreadyExistsError,
+    ServiceOverloadedError,
+    UserAlreadyExistsError,
+)
+from src.app.domain.models.user import InternalUser
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import (
+    AsyncInMemoryUserRepository,
+    InMemoryUserRepository,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class _RecordingPasswordHasher(AsyncPasswordHasher):
+    def __init__(self, overloaded: bool = False) -> None:
+        self.batches: list[list[str]] = []
+        self._overloaded = overloaded
+
+    async def hash(self, password: str) -> str:
+        return f'hashed:{password}'
+
+    async def hash_many(self, passwords: 'Sequence[str]') -> list[str]:
+        if self._overloaded:
+            raise ServiceOverloadedError('Password hasher')
+        self.batches.append(list(passwords))
+        return [f'hashed:{password}' for password in passwords]
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return hashed_password == f'hashed:{plain_password}'
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return not hashed_password.startswith('hashed:')
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _new_user(username: str, email: str | None = None) -> NewUser:
+    return NewUser(
+        username=username, email=email or f'{username}@example.com', age=30, role=Role.USER, password=f'{username}-pw'
+    )
+
+
+@pytest.fixture
+def storage() -> InMemoryUserRepository:
+    """Хранилище с одним существующим пользователем."""
+    storage = InMemoryUserRepository()
+    storage.add(
+        InternalUser(username='Existing', email='existing@example.com', age=40, role=Role.USER, hashed_password='h')
+    )
+    return storage
+
+
+@pytest.mark.unit
+class TestCreateUsers:
+    @staticmethod
+    async def test_create_users__existing_names_not_hashed(storage: InMemoryUserRepository) -> None:
+        """Занятые имена должны отклоняться без хеширования, а остальные пароли — хешироваться одной пачкой."""
+        password_hasher = _RecordingPasswordHasher()
+        users = [_new_user('alice'), _new_user('EXISTING'), _new_user('bob', email='ALICE@example.com')]
+
+        errors = await create_users(users, password_hasher, AsyncInMemoryUserRepository(storage))
+
+        assert [type(error) for error in errors] == [type(None), UserAlreadyExistsError, EmailAlreadyExistsError]
+        assert password_hasher.batches == [['alice-pw', 'bob-pw']]
+        assert storage.get_by_username('alice') == InternalUser(
+            username='alice', email='alice@example.com', age=30, role=Role.USER, hashed_password='hashed:alice-pw'
+        )
+
+    @staticmethod
+    async def test_create_users__overloaded_hasher(storage: InMemoryUserRepository) -> None:
+        """Перегрузка хешера должна отклонять только пользователей, которых нужно было хешировать."""
+        users = [_new_user('alice'), _new_user('existing')]
+
+        errors = await create_users(
+            users, _RecordingPasswordHasher(overloaded=True), AsyncInMemoryUserRepository(storage)
+        )
+
+        assert [type(error) for error in errors] == [ServiceOverloadedError, UserAlreadyExistsError]
+        assert storage.get_by_username('alice') is None
@@ -0,0 +1,42 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.infrastructure.adapters.security.bcrypt_calibration import calibrate_rounds, write_env_value
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+MIN_ROUNDS = 10
+
+
+def _doubling_cost(base_rounds: int, base_seconds: float) -> 'Callable[[int], float]':
+    return lambda rounds: base_seconds * 2 ** (rounds - base_rounds)
+
+
+@pytest.mark.unit
+class TestBcryptCalibration:
+    @staticmethod
+    def test_calibrate_rounds__fits_target() -> None:
+        """Должна выбираться наибольшая стоимость, укладывающаяся в целевое время."""
+        measure = _doubling_cost(base_rounds=MIN_ROUNDS, base_seconds=0.05)
+
+        assert calibrate_rounds(target_seconds=0.25, min_rounds=MIN_ROUNDS, measure=measure) == MIN_ROUNDS + 2
+
+    @staticmethod
+    def test_calibrate_rounds__never_below_minimum() -> None:
+        """На медленном железе должна возвращаться минимальная стоимость."""
+        measure = _doubling_cost(base_rounds=MIN_ROUNDS, base_seconds=1.0)
+
+        assert calibrate_rounds(target_seconds=0.25, min_rounds=MIN_ROUNDS, measure=measure) == MIN_ROUNDS
+
+    @staticmethod
+    def test_write_env_value__replaces_existing(tmp_path: 'Path') -> None:
+        """Существующее значение должно заменяться, остальные строки — сохраняться."""
+        env_file = tmp_path / '.env.local'
+        env_file.write_text('APP_ENV=local\nAPP_PASSWORD_HASHER_BCRYPT_ROUNDS=10\n')
+
+        write_env_value(env_file, 'APP_PASSWORD_HASHER_BCRYPT_ROUNDS', '13')
+
+        assert env_file.read_text() == 'APP_ENV=local\nAPP_PASSWORD_HASHER_BCRYPT_ROUNDS=13\n'
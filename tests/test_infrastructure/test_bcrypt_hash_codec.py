@@ -0,0 +1,34 @@
+import pytest
+
+from src.app.infrastructure.adapters.security.bcrypt_hash_codec import (
+    pack_bcrypt_hash,
+    PACKED_BCRYPT_HASH_SIZE,
+    unpack_bcrypt_hash,
+)
+from src.app.infrastructure.adapters.security.bcrypt_password_hasher import BcryptPasswordHasher
+
+
+@pytest.mark.unit
+class TestBcryptHashCodec:
+    @staticmethod
+    @pytest.mark.parametrize(
+        'hashed_password',
+        [
+            BcryptPasswordHasher(rounds=4).hash('qwerty123'),
+            '$2a$31$' + '.' * 53,
+            '$2y$10$' + '9' * 53,
+        ],
+    )
+    def test_pack__round_trip(hashed_password: str) -> None:
+        """Упакованный хеш должен занимать фиксированный размер и восстанавливаться без потерь."""
+        packed = pack_bcrypt_hash(hashed_password)
+
+        assert packed is not None
+        assert len(packed) == PACKED_BCRYPT_HASH_SIZE
+        assert unpack_bcrypt_hash(packed) == hashed_password
+
+    @staticmethod
+    @pytest.mark.parametrize('hashed_password', ['hash', '$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA', ''])
+    def test_pack__not_bcrypt(hashed_password: str) -> None:
+        """Строки другого формата не должны упаковываться."""
+        assert pack_bcrypt_hash(hashed_password) is None
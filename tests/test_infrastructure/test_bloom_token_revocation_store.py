@@ -0,0 +1,90 @@
+from datetime import datetime, UTC
+
+import pytest
+
+from src.app.infrastructure.adapters.cache.bloom_filter import BloomFilter
+from src.app.infrastructure.adapters.security.bloom_token_revocation_store import BloomTokenRevocationStore
+
+MAX_FALSE_POSITIVES = 300
+
+
+def _make_store(now: list[float], capacity: int = 16) -> BloomTokenRevocationStore:
+    return BloomTokenRevocationStore(
+        capacity=capacity, error_rate=0.01, purge_interval_seconds=10, clock=lambda: now[0]
+    )
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    @staticmethod
+    def test_contains__no_false_negatives() -> None:
+        """Фильтр должен содержать все добавленные элементы."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f'token-{i}' for i in range(1000)]
+
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert len(bloom) == len(items)
+
+    @staticmethod
+    def test_contains__false_positive_rate_within_bound() -> None:
+        """Доля ложноположительных ответов должна быть близка к заданной."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+
+        for i in range(1000):
+            bloom.add(f'token-{i}')
+
+        false_positives = sum(f'other-{i}' in bloom for i in range(10000))
+
+        assert false_positives < MAX_FALSE_POSITIVES
+
+
+@pytest.mark.unit
+class TestBloomTokenRevocationStore:
+    @staticmethod
+    def test_is_revoked__revoked_token() -> None:
+        """Отозванный токен должен считаться отозванным до истечения срока."""
+        now = [1000.0]
+        store = _make_store(now)
+
+        store.revoke('jti-1', datetime.fromtimestamp(1100, UTC))
+
+        assert store.is_revoked('jti-1') is True
+        assert store.is_revoked('jti-2') is False
+
+    @staticmethod
+    def test_revoke__expired_token_ignored() -> None:
+        """Токен с истёкшим сроком не должен попадать в список."""
+        now = [1000.0]
+        store = _make_store(now)
+
+        store.revoke('jti-1', datetime.fromtimestamp(900, UTC))
+
+        assert len(store) == 0
+
+    @staticmethod
+    def test_purge__removes_expired_entries() -> None:
+        """Записи истёкших токенов должны удаляться при очистке."""
+        now = [1000.0]
+        store = _make_store(now)
+        store.revoke('jti-1', datetime.fromtimestamp(1005, UTC))
+        store.revoke('jti-2', datetime.fromtimestamp(2000, UTC))
+
+        now[0] = 1020.0
+
+        assert store.is_revoked('jti-1') is False
+        assert len(store) == 1
+        assert store.is_revoked('jti-2') is True
+
+    @staticmethod
+    def test_revoke__grows_beyond_capacity() -> None:
+        """При переполнении фильтра все отозванные токены должны оставаться отозванными."""
+        now = [1000.0]
+        store = _make_store(now, capacity=4)
+
+        for i in range(20):
+            store.revoke(f'jti-{i}', datetime.fromtimestamp(2000, UTC))
+
+        assert all(store.is_revoked(f'jti-{i}') for i in range(20))
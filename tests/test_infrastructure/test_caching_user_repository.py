@@ -0,0 +1,112 @@
+import pytest
+
+from src.app.domain.models.user import InternalUser
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.caching_user_repository import (
+    AsyncCachingUserRepository,
+    CachingUserRepository,
+    UserLookupCache,
+)
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import (
+    AsyncInMemoryUserRepository,
+    InMemoryUserRepository,
+)
+
+
+class _CountingUserRepository(InMemoryUserRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    def get_by_username(self, username: str) -> InternalUser | None:
+        self.lookups += 1
+        return super().get_by_username(username)
+
+
+def _make_user(age: int = 25) -> InternalUser:
+    return InternalUser(username='John_Doe', email='john@example.com', age=age, role=Role.USER, hashed_password='hash')
+
+
+def _make_cache(now: list[float]) -> UserLookupCache:
+    return UserLookupCache(
+        max_size=10, ttl_seconds=60, negative_max_size=10, negative_ttl_seconds=5, clock=lambda: now[0]
+    )
+
+
+@pytest.mark.unit
+class TestCachingUserRepository:
+    @staticmethod
+    def test_get_by_username__served_from_cache() -> None:
+        """Повторный поиск должен обслуживаться из кэша без учета регистра имени."""
+        storage = _CountingUserRepository()
+        storage.add(_make_user())
+        cache = _make_cache([0.0])
+        repository = CachingUserRepository(storage, cache)
+
+        assert repository.get_by_username('john_doe') == _make_user()
+        assert repository.get_by_username('JOHN_DOE') == _make_user()
+        assert storage.lookups == 1
+        assert cache.stats()[0].hits == 1
+
+    @staticmethod
+    def test_get_by_username__negative_ttl_shorter() -> None:
+        """Отсутствие имени должно кэшироваться на время negative TTL."""
+        now = [0.0]
+        storage = _CountingUserRepository()
+        cache = _make_cache(now)
+        repository = CachingUserRepository(storage, cache)
+
+        assert repository.get_by_username('scanner') is None
+        assert repository.get_by_username('scanner') is None
+        now[0] = 6.0
+        assert repository.get_by_username('scanner') is None
+
+        assert storage.lookups == 2  # noqa: PLR2004
+        assert cache.stats()[1].hits == 1
+
+    @staticmethod
+    def test_writes__invalidate_cache() -> None:
+        """Добавление и обновление должны сбрасывать закэшированные результаты."""
+        repository = CachingUserRepository(InMemoryUserRepository(), _make_cache([0.0]))
+
+        assert repository.get_by_username('john_doe') is None
+        repository.add(_make_user())
+        assert repository.get_by_username('john_doe') == _make_user()
+        repository.update(_make_user(age=30))
+
+        user = repository.get_by_username('john_doe')
+        assert user is not None
+        assert user.age == 30  # noqa: PLR2004
+
+    @staticmethod
+    def test_add_many__invalidates_cache() -> None:
+        """Пачка должна сбрасывать закэшированное отсутствие имён всех своих пользователей."""
+        repository = CachingUserRepository(InMemoryUserRepository(), _make_cache([0.0]))
+
+        assert repository.get_by_username('john_doe') is None
+        assert repository.add_many([_make_user()]) == [None]
+        assert repository.get_by_username('john_doe') == _make_user()
+
+    @staticmethod
+    def test_store__skipped_after_concurrent_write() -> None:
+        """Результат чтения, начатого до записи, не должен попадать в кэш."""
+        cache = _make_cache([0.0])
+        generation = cache.generation()
+
+        cache.invalidate('john_doe')
+        cache.store('john_doe', None, generation)
+
+        assert cache.lookup('john_doe') == (False, None)
+
+    @staticmethod
+    async def test_async__shares_cache_with_sync() -> None:
+        """Запись через синхронный декоратор должна быть видна асинхронному."""
+        storage = InMemoryUserRepository()
+        cache = _make_cache([0.0])
+        sync_repository = CachingUserRepository(storage, cache)
+        async_repository = AsyncCachingUserRepository(AsyncInMemoryUserRepository(storage), cache)
+
+        assert await async_repository.get_by_username('john_doe') is None
+        sync_repository.add(_make_user())
+
+        assert await async_repository.get_by_username('john_doe') == _make_user()
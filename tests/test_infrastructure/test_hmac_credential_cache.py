@@ -0,0 +1,46 @@
+import pytest
+
+from src.app.infrastructure.adapters.security.hmac_credential_cache import HMACCredentialCache
+
+
+@pytest.mark.unit
+class TestHMACCredentialCache:
+    @staticmethod
+    def test_is_verified__after_remember() -> None:
+        """Запомненные учетные данные должны приниматься без учёта регистра имени."""
+        cache = HMACCredentialCache(secret_key='secret', ttl_seconds=60, max_size=10)
+        cache.remember('John_Doe', 'qwerty123', 'hash-1')
+
+        assert cache.is_verified('john_doe', 'qwerty123', 'hash-1')
+        assert not cache.is_verified('john_doe', 'wrong', 'hash-1')
+
+    @staticmethod
+    def test_is_verified__invalidated_by_password_change() -> None:
+        """Смена хеша пароля должна делать запись недействительной."""
+        cache = HMACCredentialCache(secret_key='secret', ttl_seconds=60, max_size=10)
+        cache.remember('john_doe', 'qwerty123', 'hash-1')
+
+        assert not cache.is_verified('john_doe', 'qwerty123', 'hash-2')
+        assert not cache.is_verified('john_doe', 'qwerty123', 'hash-1')
+
+    @staticmethod
+    def test_is_verified__expires_after_ttl() -> None:
+        """Запись должна истекать по TTL."""
+        now = [0.0]
+        cache = HMACCredentialCache(secret_key='secret', ttl_seconds=1, max_size=10, clock=lambda: now[0])
+        cache.remember('john_doe', 'qwerty123', 'hash-1')
+        now[0] = 2.0
+
+        assert not cache.is_verified('john_doe', 'qwerty123', 'hash-1')
+
+    @staticmethod
+    def test_key__does_not_contain_plaintext_password() -> None:
+        """Ключ кэша не должен содержать открытый пароль."""
+        cache = HMACCredentialCache(secret_key='secret', ttl_seconds=60, max_size=10)
+
+        key = cache._make_key('john_doe', 'qwerty123')
+
+        assert b'qwerty123' not in key
+        assert key != HMACCredentialCache(secret_key='other', ttl_seconds=60, max_size=10)._make_key(
+            'john_doe', 'qwerty123'
+        )
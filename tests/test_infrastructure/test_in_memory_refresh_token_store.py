@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+import pytest
+
+from src.app.domain.exceptions import InvalidTokenError
+from src.app.infrastructure.adapters.security.in_memory_refresh_token_store import InMemoryRefreshTokenStore
+
+
+@pytest.mark.unit
+class TestInMemoryRefreshTokenStore:
+    @staticmethod
+    def test_rotate__expired_token_rejected() -> None:
+        """Истёкший токен не должен обмениваться."""
+        now = [1000.0]
+        store = InMemoryRefreshTokenStore(timedelta(seconds=10), sweep_interval_seconds=60, clock=lambda: now[0])
+        grant = store.issue('john_doe')
+        now[0] += 10
+
+        with pytest.raises(InvalidTokenError):
+            store.rotate(grant.token_id, grant.family_id)
+
+    @staticmethod
+    def test_sweep__removes_expired_records() -> None:
+        """Очистка должна удалять истёкшие записи, включая использованные."""
+        now = [1000.0]
+        store = InMemoryRefreshTokenStore(timedelta(seconds=10), sweep_interval_seconds=5, clock=lambda: now[0])
+        grant = store.issue('john_doe')
+        store.rotate(grant.token_id, grant.family_id)
+        now[0] += 10
+
+        store.issue('jane_doe')
+
+        assert len(store) == 1
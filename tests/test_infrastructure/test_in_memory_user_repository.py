@@ -0,0 +1,249 @@
+import dataclasses
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.domain.exceptions import EmailAlreadyExistsError, UserAlreadyExistsError
+from src.app.domain.models.user import InternalUser, UserQuery
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import InMemoryUserRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+USERS_COUNT = 50
+PAGE_SIZE = 7
+THREADS_COUNT = 16
+STRESS_USERS_COUNT = 300
+STRESS_UPDATES_COUNT = 200
+STRESS_SWITCH_INTERVAL = 1e-6
+
+
+def _make_user(index: int, age: int | None = None, role: Role | None = None) -> InternalUser:
+    return InternalUser(
+        username=f'user_{index}',
+        email=f'user_{index}@example.com',
+        age=age if age is not None else 18 + index,
+        role=role if role is not None else (Role.ADMIN if index % 5 == 0 else Role.USER),
+        hashed_password='hash',
+    )
+
+
+@pytest.fixture
+def repository() -> InMemoryUserRepository:
+    """Репозиторий с пользователями разных ролей и возрастов."""
+    repository = InMemoryUserRepository()
+    for index in range(USERS_COUNT):
+        repository.add(_make_user(index))
+    return repository
+
+
+@pytest.fixture
+def frequent_thread_switches() -> 'Iterator[None]':
+    """Заставляет интерпретатор переключать потоки как можно чаще, чтобы гонки проявлялись чаще."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(STRESS_SWITCH_INTERVAL)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _collect(repository: InMemoryUserRepository, query: UserQuery) -> list[str]:
+    usernames: list[str] = []
+    cursor = None
+
+    while True:
+        page = repository.list_page(query, PAGE_SIZE, cursor)
+        usernames.extend(user.username for user in page.items)
+        if page.next_cursor is None:
+            return usernames
+        cursor = page.next_cursor
+
+
+@pytest.mark.unit
+class TestInMemoryUserRepositoryIndexes:
+    @staticmethod
+    @pytest.mark.parametrize(
+        'query',
+        [
+            UserQuery(),
+            UserQuery(role=Role.ADMIN),
+            UserQuery(min_age=30, max_age=41),
+            UserQuery(role=Role.USER, min_age=55),
+            UserQuery(email='USER_7@example.com'),
+        ],
+    )
+    def test_list_page__matches_full_scan(repository: InMemoryUserRepository, query: UserQuery) -> None:
+        """Обход страниц по индексам должен давать тот же результат, что и фильтрация всех пользователей."""
+        expected = [user.username for user in repository.list() if query.matches(user)]
+
+        assert _collect(repository, query) == expected
+
+    @staticmethod
+    def test_list_page__last_page_has_no_cursor(repository: InMemoryUserRepository) -> None:
+        """Страница, исчерпавшая выборку, не должна возвращать курсор."""
+        page = repository.list_page(UserQuery(role=Role.ADMIN), limit=USERS_COUNT // 5)
+
+        assert len(page.items) == USERS_COUNT // 5
+        assert page.next_cursor is None
+
+    @staticmethod
+    def test_update__reindexes_changed_fields(repository: InMemoryUserRepository) -> None:
+        """После обновления пользователь должен находиться по новым роли, возрасту и email."""
+        repository.update(
+            InternalUser(
+                username='user_1', email='renamed@example.com', age=99, role=Role.ADMIN, hashed_password='hash'
+            )
+        )
+
+        assert repository.get_by_email('user_1@example.com') is None
+        assert repository.get_by_email('RENAMED@example.com') is not None
+        assert [user.username for user in repository.list_page(UserQuery(min_age=90), limit=10).items] == ['user_1']
+        assert 'user_1' in _collect(repository, UserQuery(role=Role.ADMIN))
+
+    @staticmethod
+    def test_email__unique(repository: InMemoryUserRepository) -> None:
+        """Email, отличающийся только регистром, должен считаться занятым."""
+        duplicate = InternalUser(
+            username='other', email='USER_3@example.com', age=30, role=Role.USER, hashed_password='hash'
+        )
+
+        with pytest.raises(EmailAlreadyExistsError):
+            repository.add(duplicate)
+        with pytest.raises(EmailAlreadyExistsError):
+            repository.update(
+                InternalUser(
+                    username='user_4', email='user_3@example.com', age=30, role=Role.USER, hashed_password='hash'
+                )
+            )
+
+    @staticmethod
+    def test_add_many__rejects_only_conflicting_users(repository: InMemoryUserRepository) -> None:
+        """Конфликтующие пользователи пачки, в том числе между собой, должны отклоняться, не мешая остальным."""
+        users = [
+            _make_user(USERS_COUNT),
+            _make_user(1),
+            dataclasses.replace(_make_user(USERS_COUNT + 1), email='USER_2@example.com'),
+            dataclasses.replace(_make_user(USERS_COUNT), email='other@example.com'),
+            _make_user(USERS_COUNT + 2),
+        ]
+
+        errors = repository.add_many(users)
+
+        assert [type(error) for error in errors] == [
+            type(None),
+            UserAlreadyExistsError,
+            EmailAlreadyExistsError,
+            UserAlreadyExistsError,
+            type(None),
+        ]
+        assert repository.get_by_username(f'user_{USERS_COUNT + 2}') == _make_user(USERS_COUNT + 2)
+        assert len(repository.list()) == USERS_COUNT + 2
+
+    @staticmethod
+    @pytest.mark.parametrize('hashed_password', ['same', 'longer-hash', ''])
+    def test_update__rewrites_packed_hash(repository: InMemoryUserRepository, hashed_password: str) -> None:
+        """Хеш любой длины должен сохраняться, не затрагивая хеши соседних строк."""
+        user = repository.get_by_username('user_2')
+        assert user is not None
+
+        repository.update(dataclasses.replace(user, hashed_password=hashed_password))
+
+        assert repository.get_by_username('user_2') == dataclasses.replace(user, hashed_password=hashed_password)
+        assert [stored.hashed_password for stored in repository.list()].count('hash') == USERS_COUNT - 1
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures('frequent_thread_switches')
+class TestInMemoryUserRepositoryConcurrency:
+    @staticmethod
+    def test_add__same_usernames_from_many_threads() -> None:
+        """Каждое имя должно добавиться ровно один раз, сколько бы потоков ни занимали его одновременно."""
+        repository = InMemoryUserRepository()
+        barrier = threading.Barrier(THREADS_COUNT)
+
+        def register(thread: int) -> int:
+            barrier.wait()
+            added = 0
+            for offset in range(STRESS_USERS_COUNT):
+                index = (offset + thread * 7) % STRESS_USERS_COUNT
+                user = _make_user(index)
+                username = user.username.upper() if thread % 2 else user.username
+                try:
+                    repository.add(dataclasses.replace(user, username=username, email=f'{thread}.{user.email}'))
+                except UserAlreadyExistsError:
+                    continue
+                added += 1
+            return added
+
+        with ThreadPoolExecutor(THREADS_COUNT) as executor:
+            added = sum(executor.map(register, range(THREADS_COUNT)))
+
+        assert added == STRESS_USERS_COUNT
+        assert len(repository.list()) == STRESS_USERS_COUNT
+        assert all(repository.get_by_username(f'user_{index}') for index in range(STRESS_USERS_COUNT))
+
+    @staticmethod
+    def test_add__same_email_from_many_threads() -> None:
+        """Email должен достаться одному пользователю, даже если имена попадают в разные полосы блокировок."""
+        repository = InMemoryUserRepository()
+        barrier = threading.Barrier(THREADS_COUNT)
+
+        def register(thread: int) -> bool:
+            barrier.wait()
+            try:
+                repository.add(dataclasses.replace(_make_user(thread), email='shared@example.com'))
+            except EmailAlreadyExistsError:
+                return False
+            return True
+
+        with ThreadPoolExecutor(THREADS_COUNT) as executor:
+            added = sum(executor.map(register, range(THREADS_COUNT)))
+
+        assert added == 1
+        assert len(repository.list()) == 1
+
+    @staticmethod
+    def test_get_by_username__never_sees_partial_update(repository: InMemoryUserRepository) -> None:
+        """Чтение во время обновлений и добавлений должно возвращать пользователя целиком из одной версии."""
+        stop = threading.Event()
+
+        def update(index: int) -> None:
+            user = _make_user(index)
+            for version in range(user.version + 1, STRESS_UPDATES_COUNT):
+                repository.update(
+                    dataclasses.replace(
+                        user, email=f'{user.username}.v{version}@example.com', age=version, version=version
+                    )
+                )
+
+        def add_others() -> None:
+            for index in range(USERS_COUNT, USERS_COUNT + STRESS_USERS_COUNT):
+                repository.add(_make_user(index))
+
+        def read(index: int) -> int:
+            inconsistent = 0
+            while not stop.is_set():
+                user = repository.get_by_username(f'USER_{index}')
+                assert user is not None
+                if user.version > 1 and (
+                    user.age != user.version or user.email != f'user_{index}.v{user.version}@example.com'
+                ):
+                    inconsistent += 1
+            return inconsistent
+
+        with ThreadPoolExecutor(THREADS_COUNT) as executor:
+            readers = [executor.submit(read, index % 4) for index in range(THREADS_COUNT // 2)]
+            writers = [executor.submit(update, index) for index in range(4)]
+            writers.append(executor.submit(add_others))
+            for writer in writers:
+                writer.result()
+            stop.set()
+            inconsistent = sum(reader.result() for reader in readers)
+
+        assert inconsistent == 0
+        updated = [repository.get_by_username(f'user_{index}') for index in range(4)]
+        assert [user.version if user else None for user in updated] == [STRESS_UPDATES_COUNT - 1] * 4
+        assert len(repository.list()) == USERS_COUNT + STRESS_USERS_COUNT
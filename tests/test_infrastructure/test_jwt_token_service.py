@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+import pytest
+
+from src.app.domain.exceptions import InvalidTokenError
+from src.app.infrastructure.adapters.security.jwt_token_service import PyJWTTokenService
+
+
+@pytest.mark.unit
+class TestPyJWTTokenService:
+    @staticmethod
+    def test_decode_access_token__served_from_cache() -> None:
+        """Повторное декодирование того же токена должно обслуживаться из кэша."""
+        service = PyJWTTokenService('secret', 'HS256', timedelta(minutes=5), decode_cache_size=10)
+        token = service.create_access_token({'sub': 'john_doe', 'role': 'user'})
+
+        first = service.decode_access_token(token)
+        first['sub'] = 'mutated'
+        second = service.decode_access_token(token)
+        stats = service.cache_stats()
+
+        assert second['sub'] == 'john_doe'
+        assert stats is not None
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    @staticmethod
+    def test_decode_access_token__invalid_token_not_cached() -> None:
+        """Токен с неверной подписью должен отклоняться и не попадать в кэш."""
+        service = PyJWTTokenService('secret', 'HS256', timedelta(minutes=5), decode_cache_size=10)
+        foreign = PyJWTTokenService('other', 'HS256', timedelta(minutes=5)).create_access_token({'sub': 'x'})
+
+        for _ in range(2):
+            with pytest.raises(InvalidTokenError):
+                service.decode_access_token(foreign)
+
+        stats = service.cache_stats()
+
+        assert stats is not None
+        assert stats.size == 0
+
+    @staticmethod
+    def test_cache_stats__disabled_by_default() -> None:
+        """Без размера кэша статистика должна отсутствовать."""
+        service = PyJWTTokenService('secret', 'HS256', timedelta(minutes=5))
+
+        assert service.cache_stats() is None
@@ -0,0 +1,126 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.application.ports.inference.model import PredictionModel
+from src.app.application.ports.inference.model_store import ModelStore
+from src.app.application.services.inference_service import predict_from_feature_rows, ThresholdModel
+from src.app.application.services.model_registry import ModelRegistry
+from src.app.domain.exceptions import ModelVersionNotFoundError
+from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+from src.app.infrastructure.adapters.inference.lru_prediction_cache import canonical_features, LRUPredictionCache
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+TTL_SECONDS = 60.0
+
+
+class _CountingModel(PredictionModel):
+    def __init__(self, version: str) -> None:
+        self._version = version
+        self.rows: list[Mapping[str, int | float | str | None]] = []
+
+    @property
+    def version(self) -> str:
+        return self._version
+
+    def predict_many(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list[PredictionOutcome]:
+        self.rows.extend(rows)
+        return predict_from_feature_rows(rows)
+
+
+class _StubModelStore(ModelStore):
+    def __init__(self, *models: _CountingModel) -> None:
+        self.models = {model.version: model for model in models}
+
+    def list_versions(self) -> list[str]:
+        return sorted(self.models)
+
+    def load(self, version: str) -> PredictionModel:
+        if version not in self.models:
+            raise ModelVersionNotFoundError(version)
+        return self.models[version]
+
+    def read_active(self) -> str | None:
+        return None
+
+    def write_active(self, version: str) -> None:
+        pass
+
+
+def _cache(
+    store: _StubModelStore, now: list[float] | None = None, max_size: int = 10
+) -> tuple[LRUPredictionCache, ModelRegistry]:
+    clock = now or [0.0]
+    registry = ModelRegistry(fallback=ThresholdModel(), store=store, max_resident=2)
+    registry.sync()
+    cache = LRUPredictionCache(registry, max_size=max_size, ttl_seconds=TTL_SECONDS, clock=lambda: clock[0])
+    return cache, registry
+
+
+@pytest.mark.unit
+class TestCanonicalFeatures:
+    @staticmethod
+    def test_canonical_features__equivalent_rows_share_key() -> None:
+        """Порядок признаков, None вместо отсутствующего признака и int вместо float не должны менять ключ."""
+        assert canonical_features({'age': 42, 'income': 70000.0, 'occupation': None}) == canonical_features(
+            {'income': 70000, 'age': 42}
+        )
+        assert canonical_features({'age': 42}) != canonical_features({'age': 42, 'occupation': 'engineer'})
+
+
+@pytest.mark.unit
+class TestLRUPredictionCache:
+    @staticmethod
+    def test_predict_many__repeated_rows_skip_model() -> None:
+        """Модель должна получать только строки, которых нет в кэше, а попадания — учитываться в статистике."""
+        model = _CountingModel('v001')
+        cache, _ = _cache(_StubModelStore(model))
+
+        first = cache.predict_many([{'age': 35}, {'age': 20}])
+        second = cache.predict_many([{'age': 20, 'income': None}, {'age': 35}, {'age': 40}])
+
+        assert first == [PredictionOutcome.POSITIVE, PredictionOutcome.NEGATIVE]
+        assert second == [PredictionOutcome.NEGATIVE, PredictionOutcome.POSITIVE, PredictionOutcome.POSITIVE]
+        assert model.rows[-3:] == [{'age': 35}, {'age': 20}, {'age': 40}]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (2, 3, 3)
+
+    @staticmethod
+    def test_compute_many__stores_without_lookup() -> None:
+        """compute_many должен сохранять прогнозы, не учитывая промахи повторно."""
+        model = _CountingModel('v001')
+        cache, _ = _cache(_StubModelStore(model))
+
+        assert cache.get({'age': 35}) is None
+        assert cache.compute_many([{'age': 35}]) == [PredictionOutcome.POSITIVE]
+
+        assert cache.get({'age': 35}) == PredictionOutcome.POSITIVE
+        assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    @staticmethod
+    def test_get__invalidated_on_model_swap() -> None:
+        """Прогнозы прежней версии модели не должны возвращаться после переключения."""
+        old, new = _CountingModel('v001'), _CountingModel('v002')
+        cache, registry = _cache(_StubModelStore(old, new))
+        registry.activate('v001')
+        cache.predict_many([{'age': 35}])
+
+        registry.activate('v002')
+
+        assert cache.get({'age': 35}) is None
+        assert cache.stats().size == 0
+        cache.predict_many([{'age': 35}])
+        assert new.rows[-1] == {'age': 35}
+
+    @staticmethod
+    def test_get__expires_after_ttl() -> None:
+        """Прогноз должен перестать возвращаться из кэша по истечении TTL."""
+        now = [0.0]
+        cache, _ = _cache(_StubModelStore(_CountingModel('v001')), now)
+        cache.predict_many([{'age': 35}])
+
+        now[0] = TTL_SECONDS
+
+        assert cache.get({'age': 35}) is None
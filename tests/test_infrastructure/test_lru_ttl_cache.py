@@ -0,0 +1,46 @@
+import pytest
+
+from src.app.infrastructure.adapters.cache.lru_ttl_cache import LRUTTLCache
+
+
+@pytest.mark.unit
+class TestLRUTTLCache:
+    @staticmethod
+    def test_get__expired_entry_is_a_miss() -> None:
+        """Запись должна считаться отсутствующей после истечения TTL."""
+        now = [0.0]
+        cache: LRUTTLCache[str, int] = LRUTTLCache(max_size=10, ttl_seconds=5, clock=lambda: now[0])
+        cache.set('key', 1)
+
+        assert cache.get('key') == 1
+
+        now[0] = 5.0
+
+        assert cache.get('key') is None
+        assert len(cache) == 0
+
+    @staticmethod
+    def test_set__evicts_least_recently_used() -> None:
+        """При переполнении должна вытесняться самая давно использованная запись."""
+        cache: LRUTTLCache[str, int] = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3  # noqa: PLR2004
+
+    @staticmethod
+    def test_stats__counts_hits_and_misses() -> None:
+        """Статистика должна учитывать попадания и промахи."""
+        cache: LRUTTLCache[str, int] = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('missing')
+
+        stats = cache.stats()
+
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5  # noqa: PLR2004
@@ -0,0 +1,98 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.application.services.inference_service import predict_from_feature_rows
+from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+from src.app.infrastructure.adapters.inference.micro_batch_predictor import MicroBatchPredictor
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+MAX_WAIT_SECONDS = 0.01
+
+
+class _RecordingModel:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    def __call__(self, rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list[PredictionOutcome]:
+        self.batches.append(len(rows))
+        return predict_from_feature_rows(rows)
+
+
+@pytest.mark.unit
+class TestMicroBatchPredictor:
+    @staticmethod
+    async def test_predict__full_batch_sent_without_waiting() -> None:
+        """Одновременные запросы должны вычисляться одним вызовом модели, как только пачка заполнится."""
+        model = _RecordingModel()
+        predictor = MicroBatchPredictor(model, max_batch_size=4, max_wait_seconds=60)
+
+        outcomes = await asyncio.wait_for(
+            asyncio.gather(*(predictor.predict({'age': age}) for age in (20, 35, 30, 31))), timeout=1
+        )
+
+        assert outcomes == [
+            PredictionOutcome.NEGATIVE,
+            PredictionOutcome.POSITIVE,
+            PredictionOutcome.NEGATIVE,
+            PredictionOutcome.POSITIVE,
+        ]
+        assert model.batches == [4]
+        assert predictor.stats().full_batches == 1
+
+    @staticmethod
+    async def test_predict__partial_batch_sent_after_wait() -> None:
+        """Неполная пачка должна отправляться по истечении времени ожидания."""
+        model = _RecordingModel()
+        predictor = MicroBatchPredictor(model, max_batch_size=64, max_wait_seconds=MAX_WAIT_SECONDS)
+
+        outcomes = await asyncio.gather(predictor.predict({'age': 40}), predictor.predict({'age': 'unknown'}))
+        stats = predictor.stats()
+
+        assert list(outcomes) == [PredictionOutcome.POSITIVE, PredictionOutcome.NEGATIVE]
+        assert model.batches == [2]
+        assert (stats.batches, stats.items, stats.full_batches) == (1, 2, 0)
+        assert stats.mean_batch_size == 2  # noqa: PLR2004
+        assert stats.queue_delay_seconds_max >= MAX_WAIT_SECONDS / 2
+
+    @staticmethod
+    async def test_predict__model_error_reaches_every_caller() -> None:
+        """Ошибка модели должна передаваться всем запросам пачки, не ломая следующие пачки."""
+        calls = 0
+
+        def failing_once(rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list[PredictionOutcome]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError('model failed')
+            return predict_from_feature_rows(rows)
+
+        predictor = MicroBatchPredictor(failing_once, max_batch_size=2, max_wait_seconds=60)
+
+        results = await asyncio.gather(
+            predictor.predict({'age': 40}), predictor.predict({'age': 20}), return_exceptions=True
+        )
+
+        assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+        outcomes = await asyncio.gather(predictor.predict({'age': 40}), predictor.predict({'age': 20}))
+
+        assert list(outcomes) == [PredictionOutcome.POSITIVE, PredictionOutcome.NEGATIVE]
+
+    @staticmethod
+    async def test_predict__wrong_outcome_count_reaches_every_caller() -> None:
+        """Ответ модели с неверным числом прогнозов должен завершать ошибкой все запросы пачки."""
+
+        def truncating(rows: 'Sequence[Mapping[str, int | float | str | None]]') -> list[PredictionOutcome]:
+            return predict_from_feature_rows(rows)[:1]
+
+        predictor = MicroBatchPredictor(truncating, max_batch_size=2, max_wait_seconds=60)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(predictor.predict({'age': 40}), predictor.predict({'age': 20}), return_exceptions=True),
+            timeout=1,
+        )
+
+        assert [type(result) for result in results] == [ValueError, ValueError]
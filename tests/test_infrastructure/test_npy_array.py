@@ -0,0 +1,118 @@
+import mmap
+import struct
+from array import array
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from src.app.domain.exceptions import InvalidModelArtifactError
+from src.app.domain.value_objects.prediction_outcome import PredictionOutcome
+from src.app.infrastructure.adapters.inference.directory_model_store import DirectoryModelStore
+from src.app.infrastructure.adapters.inference.npy_array import InvalidNpyError, map_npy, NPY_MAGIC
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NPY_HEADER_ALIGNMENT = 64
+
+
+def _write_npy(path: 'Path', values: list[float], descr: str = '<f8', shape: str | None = None) -> None:
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': {shape or f'({len(values)},)'}, }}"
+    prefix_length = len(NPY_MAGIC) + 4
+    header += ' ' * (-(prefix_length + len(header) + 1) % NPY_HEADER_ALIGNMENT) + '\n'
+    data = array('d' if descr == '<f8' else 'f', values).tobytes()
+    path.write_bytes(NPY_MAGIC + b'\x01\x00' + struct.pack('<H', len(header)) + header.encode('latin-1') + data)
+
+
+@pytest.mark.unit
+class TestMapNpy:
+    @staticmethod
+    @pytest.mark.parametrize('descr', ['<f8', '<f4'])
+    def test_map_npy__reads_without_copy(tmp_path: 'Path', descr: str) -> None:
+        """Элементы должны читаться прямо из отображения файла в память."""
+        _write_npy(tmp_path / 'weights.npy', [1.5, -2.0, 0.25], descr=descr)
+
+        weights = map_npy(tmp_path / 'weights.npy')
+
+        assert list(weights) == [1.5, -2.0, 0.25]
+        assert weights.readonly
+        assert isinstance(weights.obj, mmap.mmap)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'content',
+        [
+            b'',
+            b'not an npy file',
+            NPY_MAGIC + b'\x09\x00',
+            NPY_MAGIC + b'\x01\x00\x10',
+            NPY_MAGIC + b'\x02\x00\x10\x00',
+        ],
+        ids=['empty', 'garbage', 'unknown_version', 'truncated_v1_header_length', 'truncated_v2_header_length'],
+    )
+    def test_map_npy__invalid_file(tmp_path: 'Path', content: bytes) -> None:
+        """Файлы, не являющиеся .npy, должны отклоняться."""
+        (tmp_path / 'weights.npy').write_bytes(content)
+
+        with pytest.raises(InvalidNpyError):
+            map_npy(tmp_path / 'weights.npy')
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ('descr', 'shape', 'message'),
+        [
+            ('<i8', None, 'dtype'),
+            ('<f8', '(1, 2)', 'one-dimensional'),
+            ('<f8', '(5,)', 'Truncated'),
+            ('<f8', "('a',)", 'length'),
+            ('<f8', '(1.5,)', 'length'),
+            ('<f8', '(True,)', 'length'),
+            ('<f8', '(-1,)', 'length'),
+            ('<f8', '[2]', 'one-dimensional'),
+        ],
+    )
+    def test_map_npy__unsupported_array(tmp_path: 'Path', descr: str, shape: str | None, message: str) -> None:
+        """Массивы неподдерживаемого типа, формы или обрезанные файлы должны отклоняться."""
+        _write_npy(tmp_path / 'weights.npy', [1.0, 2.0], descr=descr, shape=shape)
+
+        with pytest.raises(InvalidNpyError, match=message):
+            map_npy(tmp_path / 'weights.npy')
+
+
+@pytest.mark.unit
+class TestLinearModelWeightsFile:
+    @staticmethod
+    def test_load__weights_from_npy(tmp_path: 'Path') -> None:
+        """Линейная модель должна брать веса признаков из файла .npy рядом с артефактом."""
+        _write_npy(tmp_path / 'v001.npy', [1.0, 0.001])
+        artifact = {'kind': 'linear', 'bias': -30, 'features': ['age', 'income'], 'weights_file': 'v001.npy'}
+        (tmp_path / 'v001.json').write_bytes(orjson.dumps(artifact))
+
+        model = DirectoryModelStore(tmp_path).load('v001')
+
+        assert model.predict_many([{'age': 25}, {'age': 25, 'income': 10_000.0}, {'age': 31}]) == [
+            PredictionOutcome.NEGATIVE,
+            PredictionOutcome.POSITIVE,
+            PredictionOutcome.POSITIVE,
+        ]
+
+    @staticmethod
+    def test_load__weights_do_not_match_features(tmp_path: 'Path') -> None:
+        """Файл весов другой длины, чем список признаков, должен отклоняться при загрузке."""
+        _write_npy(tmp_path / 'v001.npy', [1.0])
+        artifact = {'kind': 'linear', 'features': ['age', 'income'], 'weights_file': 'v001.npy'}
+        (tmp_path / 'v001.json').write_bytes(orjson.dumps(artifact))
+
+        with pytest.raises(InvalidModelArtifactError):
+            DirectoryModelStore(tmp_path).load('v001')
+
+    @staticmethod
+    def test_load__malformed_weights_file(tmp_path: 'Path') -> None:
+        """Повреждённый файл весов должен отклоняться как недопустимый артефакт, а не ронять загрузку."""
+        _write_npy(tmp_path / 'v001.npy', [1.0, 2.0], shape="('a',)")
+        artifact = {'kind': 'linear', 'features': ['age', 'income'], 'weights_file': 'v001.npy'}
+        (tmp_path / 'v001.json').write_bytes(orjson.dumps(artifact))
+
+        with pytest.raises(InvalidModelArtifactError):
+            DirectoryModelStore(tmp_path).load('v001')
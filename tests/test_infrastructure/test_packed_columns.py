@@ -0,0 +1,55 @@
+import pytest
+
+from src.app.infrastructure.adapters.repositories.packed_columns import CaseInsensitiveIndex, PackedStringColumn
+
+VALUES_COUNT = 1000
+
+
+@pytest.mark.unit
+class TestPackedStringColumn:
+    @staticmethod
+    def test_set__shorter_and_longer_values() -> None:
+        """Замена значения любой длины не должна затрагивать соседние строки."""
+        column = PackedStringColumn()
+        for value in ('alpha', 'бета', 'gamma'):
+            column.append(value)
+
+        column.set(1, 'b')
+        column.set(0, 'alpha-longer')
+
+        assert [column.get(row) for row in range(len(column))] == ['alpha-longer', 'b', 'gamma']
+
+
+@pytest.mark.unit
+class TestCaseInsensitiveIndex:
+    @staticmethod
+    def test_find__after_growth() -> None:
+        """Все значения должны находиться без учета регистра после многократного роста таблицы."""
+        column = PackedStringColumn()
+        index = CaseInsensitiveIndex(column)
+        for row in range(VALUES_COUNT):
+            column.append(f'User_{row}')
+            index.insert(row)
+
+        assert len(index) == VALUES_COUNT
+        assert all(index.find(f'user_{row}') == row for row in range(VALUES_COUNT))
+        assert index.find('missing') is None
+
+    @staticmethod
+    def test_remove__reindex_changed_value() -> None:
+        """После смены значения строка должна находиться только по новому значению."""
+        column = PackedStringColumn()
+        index = CaseInsensitiveIndex(column)
+        for row in range(VALUES_COUNT):
+            column.append(f'value_{row}')
+            index.insert(row)
+
+        for row in range(0, VALUES_COUNT, 2):
+            index.remove(row)
+            column.set(row, f'renamed_{row}')
+            index.insert(row)
+
+        assert index.find('value_0') is None
+        assert index.find('RENAMED_0') == 0
+        assert index.find('value_1') == 1
+        assert len(index) == VALUES_COUNT
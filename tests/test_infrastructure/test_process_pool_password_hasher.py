@@ -0,0 +1,108 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.domain.exceptions import ServiceOverloadedError
+from src.app.infrastructure.adapters.security.bcrypt_password_hasher import BcryptPasswordHasher
+from src.app.infrastructure.adapters.security.process_pool_password_hasher import ProcessPoolPasswordHasher
+from src.app.infrastructure.config import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+SLOW_BCRYPT_ROUNDS = 12
+
+
+@pytest.fixture
+def password_hasher() -> 'Iterator[ProcessPoolPasswordHasher]':
+    """Хешер с одним процессом в пуле."""
+    hasher = ProcessPoolPasswordHasher(
+        secret_key=get_settings().app.secret_key.get_secret_value(),
+        pool_size=1,
+        max_pending=4,
+        bcrypt_rounds=4,
+    )
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestProcessPoolPasswordHasher:
+    @staticmethod
+    async def test_hash_and_verify__ok(password_hasher: ProcessPoolPasswordHasher) -> None:
+        """Хеш, вычисленный в пуле, должен проверяться как в пуле, так и синхронным хешером."""
+        hashed = await password_hasher.hash('qwerty123')
+
+        assert await password_hasher.verify('qwerty123', hashed)
+        assert not await password_hasher.verify('wrong_password', hashed)
+        assert BcryptPasswordHasher().verify('qwerty123', hashed)
+        assert password_hasher.pending == 0
+
+    @staticmethod
+    async def test_hash_many__hashes_in_order(password_hasher: ProcessPoolPasswordHasher) -> None:
+        """Хеши пачки должны возвращаться в порядке паролей."""
+        passwords = ['first-password', 'second-password', 'third-password']
+
+        hashes = await password_hasher.hash_many(passwords)
+
+        assert [
+            BcryptPasswordHasher().verify(password, hashed) for password, hashed in zip(passwords, hashes, strict=True)
+        ] == [True] * len(passwords)
+        assert password_hasher.pending == 0
+
+    @staticmethod
+    async def test_hash_many__rejected_whole_when_queue_lacks_room() -> None:
+        """Пачка, не помещающаяся в свободные места очереди, должна отклоняться целиком."""
+        hasher = ProcessPoolPasswordHasher(
+            secret_key='secret', pool_size=1, max_pending=4, bcrypt_rounds=SLOW_BCRYPT_ROUNDS
+        )
+        running = asyncio.create_task(hasher.hash_many(['a-password', 'b-password']))
+        await asyncio.sleep(0)
+
+        try:
+            with pytest.raises(ServiceOverloadedError):
+                await hasher.hash_many(['c-password', 'd-password', 'e-password'])
+            assert hasher.pending == 2  # noqa: PLR2004
+            await running
+        finally:
+            hasher.shutdown()
+
+    @staticmethod
+    async def test_submit__raises_when_queue_is_full() -> None:
+        """При заполненной очереди новые задачи должны отклоняться без хеширования."""
+        hasher = ProcessPoolPasswordHasher(
+            secret_key='secret', pool_size=1, max_pending=1, bcrypt_rounds=SLOW_BCRYPT_ROUNDS
+        )
+        running = asyncio.create_task(hasher.hash('qwerty123'))
+        await asyncio.sleep(0)
+
+        try:
+            with pytest.raises(ServiceOverloadedError):
+                await hasher.hash('qwerty123')
+            await running
+        finally:
+            hasher.shutdown()
+
+    @staticmethod
+    async def test_hash_many__cancelled_slots_held_until_jobs_finish() -> None:
+        """Отмена запроса не должна освобождать места в очереди, пока задачи ещё выполняются в пуле."""
+        hasher = ProcessPoolPasswordHasher(
+            secret_key='secret', pool_size=1, max_pending=3, bcrypt_rounds=SLOW_BCRYPT_ROUNDS
+        )
+        running = asyncio.create_task(hasher.hash_many(['a-password', 'b-password']))
+        await asyncio.sleep(0.1)
+
+        try:
+            running.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await running
+
+            assert hasher.pending == 2  # noqa: PLR2004
+            with pytest.raises(ServiceOverloadedError):
+                await hasher.hash_many(['c-password', 'd-password'])
+            await hasher.hash('e-password')
+            assert hasher.pending == 0
+        finally:
+            hasher.shutdown()
@@ -0,0 +1,313 @@
+import asyncio
+import dataclasses
+import fcntl
+import multiprocessing
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.domain.exceptions import (
+    EmailAlreadyExistsError,
+    UserAlreadyExistsError,
+    UserFieldTooLongError,
+    UserNotFoundError,
+    UserStorageFullError,
+)
+from src.app.domain.models.user import InternalUser, UserQuery
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories import shared_memory_user_repository
+from src.app.infrastructure.adapters.repositories.shared_memory_user_repository import (
+    AsyncSharedMemoryUserRepository,
+    SharedMemoryUserRepository,
+    USERNAME_MAX_BYTES,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+CAPACITY = 32
+PAGE_SIZE = 5
+CHILD_TIMEOUT_SECONDS = 30
+UPDATES_COUNT = 2000
+
+
+def _make_user(index: int) -> InternalUser:
+    return InternalUser(
+        username=f'User_{index}',
+        email=f'user_{index}@example.com',
+        age=18 + index,
+        role=Role.ADMIN if index % 3 == 0 else Role.USER,
+        hashed_password=f'hash-{index}',
+    )
+
+
+def _add_from_other_process(name: str, index: int) -> None:
+    repository = SharedMemoryUserRepository(name=name, capacity=CAPACITY)
+    try:
+        repository.add(_make_user(index))
+    finally:
+        repository.close()
+
+
+def _update_from_other_process(name: str, updates: int) -> None:
+    repository = SharedMemoryUserRepository(name=name, capacity=CAPACITY)
+    try:
+        for version in range(2, updates):
+            repository.update(
+                dataclasses.replace(_make_user(1), email=f'user_1.v{version}@example.com', age=version, version=version)
+            )
+    finally:
+        repository.close()
+
+
+@pytest.fixture
+def name() -> str:
+    """Уникальное имя сегмента для теста."""
+    return f'insight-api-test-{uuid.uuid4().hex[:12]}'
+
+
+@pytest.fixture
+def repository(name: str) -> 'Iterator[SharedMemoryUserRepository]':
+    """Репозиторий в новом сегменте, удаляемом после теста."""
+    repository = SharedMemoryUserRepository(name=name, capacity=CAPACITY)
+    yield repository
+    repository.unlink()
+    repository.close()
+
+
+@pytest.mark.unit
+class TestSharedMemoryUserRepository:
+    @staticmethod
+    def test_add__found_case_insensitively(repository: SharedMemoryUserRepository) -> None:
+        """Добавленный пользователь должен находиться по имени и email без учета регистра."""
+        repository.add(_make_user(1))
+
+        assert repository.get_by_username('USER_1') == _make_user(1)
+        assert repository.get_by_email('User_1@Example.com') == _make_user(1)
+        assert repository.get_by_username('user_2') is None
+
+    @staticmethod
+    def test_add__duplicates_rejected(repository: SharedMemoryUserRepository) -> None:
+        """Имя и email, отличающиеся только регистром, должны считаться занятыми."""
+        repository.add(_make_user(1))
+
+        with pytest.raises(UserAlreadyExistsError):
+            repository.add(dataclasses.replace(_make_user(2), username='USER_1'))
+        with pytest.raises(EmailAlreadyExistsError):
+            repository.add(dataclasses.replace(_make_user(2), email='USER_1@example.com'))
+
+    @staticmethod
+    def test_update__reindexes_email(repository: SharedMemoryUserRepository) -> None:
+        """После смены email пользователь должен находиться только по новому, а старый — освобождаться."""
+        repository.add(_make_user(1))
+        updated = dataclasses.replace(_make_user(1), email='renamed@example.com', age=70, version=2)
+
+        repository.update(dataclasses.replace(updated, username='user_1'))
+        repository.add(_make_user(2))
+        repository.add(dataclasses.replace(_make_user(3), email='user_1@example.com'))
+
+        assert repository.get_by_username('user_1') == updated
+        assert repository.get_by_email('renamed@example.com') == updated
+        assert repository.get_by_email('user_1@example.com') == dataclasses.replace(
+            _make_user(3), email='user_1@example.com'
+        )
+
+    @staticmethod
+    def test_update__missing_user(repository: SharedMemoryUserRepository) -> None:
+        """Обновление несуществующего пользователя должно завершаться ошибкой."""
+        with pytest.raises(UserNotFoundError):
+            repository.update(_make_user(1))
+
+    @staticmethod
+    def test_add__limits(repository: SharedMemoryUserRepository) -> None:
+        """Слишком длинные поля и переполнение ёмкости должны отклоняться без частичной записи."""
+        with pytest.raises(UserFieldTooLongError):
+            repository.add(dataclasses.replace(_make_user(0), username='x' * (USERNAME_MAX_BYTES + 1)))
+
+        for index in range(CAPACITY):
+            repository.add(_make_user(index))
+
+        with pytest.raises(UserStorageFullError):
+            repository.add(_make_user(CAPACITY))
+        assert len(repository.list()) == CAPACITY
+
+    @staticmethod
+    def test_add_many__rejects_only_invalid_users(repository: SharedMemoryUserRepository) -> None:
+        """Слишком длинные, конфликтующие и не поместившиеся пользователи должны отклоняться по отдельности."""
+        repository.add(_make_user(0))
+        users = [
+            _make_user(1),
+            dataclasses.replace(_make_user(2), username='x' * (USERNAME_MAX_BYTES + 1)),
+            dataclasses.replace(_make_user(3), username='USER_1'),
+            *map(_make_user, range(4, CAPACITY + 4)),
+        ]
+
+        errors = repository.add_many(users)
+
+        assert [type(error) for error in errors[:4]] == [
+            type(None),
+            UserFieldTooLongError,
+            UserAlreadyExistsError,
+            type(None),
+        ]
+        assert [type(error) for error in errors[-2:]] == [UserStorageFullError, UserStorageFullError]
+        assert len(repository.list()) == CAPACITY
+        assert repository.get_by_username('user_4') == _make_user(4)
+
+    @staticmethod
+    def test_list_page__matches_full_scan(repository: SharedMemoryUserRepository) -> None:
+        """Обход страниц должен давать пользователей, подходящих под условия, в порядке добавления."""
+        for index in range(CAPACITY):
+            repository.add(_make_user(index))
+        query = UserQuery(role=Role.ADMIN, min_age=25)
+        usernames: list[str] = []
+        cursor = None
+
+        while True:
+            page = repository.list_page(query, PAGE_SIZE, cursor)
+            usernames.extend(user.username for user in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert usernames == [user.username for user in map(_make_user, range(CAPACITY)) if query.matches(user)]
+
+    @staticmethod
+    def test_list_page__decodes_records_outside_lock(
+        repository: SharedMemoryUserRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Выборки должны копировать записи порциями и разбирать их, не удерживая блокировку записи."""
+        for index in range(CAPACITY):
+            repository.add(_make_user(index))
+        decode_record = shared_memory_user_repository._decode_record
+        decoded_under_lock: list[bool] = []
+
+        def decode_record_spy(record: bytes) -> InternalUser:
+            decoded_under_lock.append(repository._thread_lock.locked())
+            return decode_record(record)
+
+        monkeypatch.setattr(shared_memory_user_repository, '_SCAN_CHUNK_ROWS', 3)
+        monkeypatch.setattr(shared_memory_user_repository, '_decode_record', decode_record_spy)
+
+        page = repository.list_page(UserQuery(), PAGE_SIZE, cursor=1)
+
+        assert [user.username for user in page.items] == [f'User_{index}' for index in range(2, 2 + PAGE_SIZE)]
+        assert page.next_cursor == 1 + PAGE_SIZE
+        assert repository.list() == [_make_user(index) for index in range(CAPACITY)]
+        assert decoded_under_lock
+        assert not any(decoded_under_lock)
+
+    @staticmethod
+    def test_attach__shares_users_between_instances(repository: SharedMemoryUserRepository, name: str) -> None:
+        """Пользователи, добавленные через один экземпляр, должны быть видны подключённому к тому же сегменту."""
+        other = SharedMemoryUserRepository(name=name, capacity=CAPACITY)
+        try:
+            other.add(_make_user(1))
+            repository.add(_make_user(2))
+
+            assert repository.get_by_username('user_1') == _make_user(1)
+            assert other.get_by_username('user_2') == _make_user(2)
+            with pytest.raises(UserAlreadyExistsError):
+                repository.add(_make_user(1))
+        finally:
+            other.close()
+
+    @staticmethod
+    @pytest.mark.usefixtures('repository')
+    def test_attach__incompatible_capacity(name: str) -> None:
+        """Подключение к сегменту другой ёмкости должно завершаться ошибкой."""
+        with pytest.raises(ValueError, match='incompatible layout'):
+            SharedMemoryUserRepository(name=name, capacity=CAPACITY * 4)
+
+    @staticmethod
+    def test_get_by_username__recovers_interrupted_write(repository: SharedMemoryUserRepository) -> None:
+        """Чтение не должно зависать, если процесс упал посреди записи и оставил seqlock нечётным."""
+        repository.add(_make_user(1))
+        repository._sequence[0] += 1
+
+        assert repository.get_by_username('user_1') == _make_user(1)
+        assert repository._sequence[0] % 2 == 0
+
+    @staticmethod
+    def test_add_many__marks_each_record(repository: SharedMemoryUserRepository) -> None:
+        """Пакетное добавление должно отмечать в seqlock каждую запись, а не держать его нечётным весь пакет."""
+        sequence = repository._sequence[0]
+
+        repository.add_many([_make_user(index) for index in range(5)])
+
+        assert repository._sequence[0] == sequence + 2 * 5
+
+    @staticmethod
+    async def test_async_get_by_username__waits_for_lock_off_event_loop(
+        repository: SharedMemoryUserRepository, name: str
+    ) -> None:
+        """Ожидание блокировки, занятой другим процессом, не должно останавливать цикл событий."""
+        repository.add(_make_user(1))
+        repository._sequence[0] += 1
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        lock_file = os.open(Path(tempfile.gettempdir()) / f'{name}.lock', os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            ticker = asyncio.create_task(tick())
+            lookup = asyncio.create_task(AsyncSharedMemoryUserRepository(repository).get_by_username('user_1'))
+            await asyncio.sleep(0.05)
+
+            assert not lookup.done()
+            assert ticks > 1
+        finally:
+            os.close(lock_file)
+
+        assert await lookup == _make_user(1)
+        ticker.cancel()
+
+
+@pytest.mark.integration
+class TestSharedMemoryUserRepositoryProcesses:
+    @staticmethod
+    def test_add__visible_across_processes(repository: SharedMemoryUserRepository, name: str) -> None:
+        """Пользователь, добавленный другим процессом, должен быть виден без перезапуска."""
+        context = multiprocessing.get_context('spawn')
+        process = context.Process(target=_add_from_other_process, args=(name, 1))
+
+        process.start()
+        process.join(CHILD_TIMEOUT_SECONDS)
+
+        assert process.exitcode == 0
+        assert repository.get_by_username('user_1') == _make_user(1)
+
+    @staticmethod
+    def test_get_by_username__never_sees_partial_update(repository: SharedMemoryUserRepository, name: str) -> None:
+        """Чтение без блокировок во время обновлений из другого процесса должно возвращать запись одной версии."""
+        repository.add(_make_user(1))
+        process = multiprocessing.get_context('spawn').Process(
+            target=_update_from_other_process, args=(name, UPDATES_COUNT)
+        )
+        inconsistent = 0
+
+        process.start()
+        while process.is_alive():
+            user = repository.get_by_username('user_1')
+            assert user is not None
+            if user.version > 1 and (user.age != user.version or user.email != f'user_1.v{user.version}@example.com'):
+                inconsistent += 1
+        process.join(CHILD_TIMEOUT_SECONDS)
+
+        assert process.exitcode == 0
+        assert inconsistent == 0
+        assert repository.get_by_username('user_1') == dataclasses.replace(
+            _make_user(1),
+            email=f'user_1.v{UPDATES_COUNT - 1}@example.com',
+            age=UPDATES_COUNT - 1,
+            version=UPDATES_COUNT - 1,
+        )
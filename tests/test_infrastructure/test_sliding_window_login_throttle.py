@@ -0,0 +1,86 @@
+import pytest
+
+from src.app.domain.exceptions import TooManyLoginAttemptsError
+from src.app.infrastructure.adapters.security.sliding_window_login_throttle import SlidingWindowLoginThrottle
+
+WINDOW_SECONDS = 60.0
+MAX_ATTEMPTS = 3
+
+
+def _make_throttle(now: list[float], max_keys: int = 100) -> SlidingWindowLoginThrottle:
+    return SlidingWindowLoginThrottle(
+        window_seconds=WINDOW_SECONDS,
+        max_attempts_per_username=MAX_ATTEMPTS,
+        max_attempts_per_ip=MAX_ATTEMPTS * 2,
+        max_keys=max_keys,
+        clock=lambda: now[0],
+    )
+
+
+@pytest.mark.unit
+class TestSlidingWindowLoginThrottle:
+    @staticmethod
+    def test_check__rejects_after_limit() -> None:
+        """После исчерпания лимита попытка должна отклоняться до ухода неудач из скользящего окна."""
+        now = [0.0]
+        throttle = _make_throttle(now)
+
+        for _ in range(MAX_ATTEMPTS):
+            throttle.check('John_Doe', '10.0.0.1')
+            throttle.record_failure('John_Doe', '10.0.0.1')
+
+        with pytest.raises(TooManyLoginAttemptsError) as error:
+            throttle.check('john_doe', '10.0.0.2')
+
+        assert error.value.status_code == 429  # noqa: PLR2004
+        assert error.value.headers['Retry-After'] == '80'
+
+    @staticmethod
+    def test_check__limits_client_ip_across_usernames() -> None:
+        """Перебор разных имён с одного адреса должен ограничиваться лимитом адреса."""
+        now = [0.0]
+        throttle = _make_throttle(now)
+
+        for i in range(MAX_ATTEMPTS * 2):
+            throttle.record_failure(f'user_{i}', '10.0.0.1')
+
+        with pytest.raises(TooManyLoginAttemptsError):
+            throttle.check('another_user', '10.0.0.1')
+
+    @staticmethod
+    def test_check__not_counted_as_attempt() -> None:
+        """Проверка лимита без неудачи не должна расходовать лимит и создавать счётчики."""
+        now = [0.0]
+        throttle = _make_throttle(now)
+
+        for _ in range(MAX_ATTEMPTS * 5):
+            throttle.check('john_doe', '10.0.0.1')
+
+        assert len(throttle) == 0
+
+    @staticmethod
+    def test_check__window_slides() -> None:
+        """Попытки предыдущего окна должны учитываться пропорционально и постепенно истекать."""
+        now = [0.0]
+        throttle = _make_throttle(now)
+
+        for _ in range(MAX_ATTEMPTS):
+            throttle.record_failure('john_doe', None)
+
+        now[0] = WINDOW_SECONDS * 1.1
+        with pytest.raises(TooManyLoginAttemptsError):
+            throttle.check('john_doe', None)
+
+        now[0] = WINDOW_SECONDS * 1.5
+        throttle.check('john_doe', None)
+
+    @staticmethod
+    def test_record_failure__evicts_least_recent_keys() -> None:
+        """Число отслеживаемых ключей не должно превышать заданного предела."""
+        now = [0.0]
+        throttle = _make_throttle(now, max_keys=4)
+
+        for i in range(10):
+            throttle.record_failure(f'user_{i}', None)
+
+        assert len(throttle) == 4  # noqa: PLR2004
@@ -0,0 +1,161 @@
+import dataclasses
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.domain.exceptions import EmailAlreadyExistsError, UserAlreadyExistsError, UserNotFoundError
+from src.app.domain.models.user import InternalUser, UserQuery
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.sqlite_user_repository import (
+    AsyncSQLiteUserRepository,
+    SQLiteUserRepository,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+THREADS = 8
+PAGE_USERS = 10
+PAGE_SIZE = 3
+
+
+def _make_user(username: str = 'John_Doe', hashed_password: str = 'hash', age: int = 25) -> InternalUser:
+    return InternalUser(
+        username=username, email=f'{username}@example.com', age=age, role=Role.ADMIN, hashed_password=hashed_password
+    )
+
+
+@pytest.fixture
+def repository(tmp_path: 'Path') -> 'Iterator[SQLiteUserRepository]':
+    """Репозиторий во временном файле."""
+    repository = SQLiteUserRepository(tmp_path / 'users.sqlite3', busy_timeout_seconds=1.0, statement_cache_size=16)
+    yield repository
+    repository.close()
+
+
+@pytest.mark.unit
+class TestSQLiteUserRepository:
+    @staticmethod
+    def test_get_by_username__case_insensitive(repository: SQLiteUserRepository) -> None:
+        """Пользователь должен находиться по имени без учета регистра."""
+        repository.add(_make_user())
+
+        assert repository.get_by_username('john_doe') == _make_user()
+        assert repository.get_by_username('missing') is None
+
+    @staticmethod
+    def test_add__duplicate_username(repository: SQLiteUserRepository) -> None:
+        """Имя, отличающееся только регистром, должно считаться занятым."""
+        repository.add(_make_user())
+
+        with pytest.raises(UserAlreadyExistsError):
+            repository.add(_make_user('JOHN_DOE'))
+
+    @staticmethod
+    def test_add_many__rejects_only_conflicting_users(repository: SQLiteUserRepository) -> None:
+        """Конфликтующие пользователи пачки, в том числе между собой, должны отклоняться, а остальные — сохраняться."""
+        repository.add(_make_user())
+        users = [
+            _make_user('Alice'),
+            _make_user('JOHN_DOE'),
+            dataclasses.replace(_make_user('Bob'), email='ALICE@example.com'),
+            _make_user('Carol'),
+        ]
+
+        errors = repository.add_many(users)
+
+        assert [type(error) for error in errors] == [
+            type(None),
+            UserAlreadyExistsError,
+            EmailAlreadyExistsError,
+            type(None),
+        ]
+        assert [user.username for user in repository.list()] == ['John_Doe', 'Alice', 'Carol']
+
+    @staticmethod
+    def test_add__duplicate_email(repository: SQLiteUserRepository) -> None:
+        """Email должен быть уникален без учета регистра и находиться по индексу."""
+        repository.add(_make_user())
+
+        with pytest.raises(EmailAlreadyExistsError):
+            repository.add(dataclasses.replace(_make_user('other'), email='JOHN_DOE@example.com'))
+        assert repository.get_by_email('john_doe@EXAMPLE.com') == _make_user()
+
+    @staticmethod
+    def test_list_page__keyset_with_filter(repository: SQLiteUserRepository) -> None:
+        """Страницы должны идти по порядку добавления и содержать только подходящих пользователей."""
+        for index in range(PAGE_USERS):
+            repository.add(_make_user(f'user_{index}', age=20 + index))
+
+        usernames: list[str] = []
+        cursor = None
+        while True:
+            page = repository.list_page(UserQuery(min_age=22, max_age=28), PAGE_SIZE, cursor)
+            usernames.extend(user.username for user in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert usernames == [f'user_{index}' for index in range(2, 9)]
+
+    @staticmethod
+    def test_update__replaces_fields(repository: SQLiteUserRepository) -> None:
+        """Обновление должно сохранять новые данные и отклонять неизвестных пользователей."""
+        repository.add(_make_user())
+
+        repository.update(_make_user(hashed_password='new-hash'))
+
+        stored = repository.get_by_username('john_doe')
+        assert stored is not None
+        assert stored.hashed_password == 'new-hash'
+        with pytest.raises(UserNotFoundError):
+            repository.update(_make_user('ghost'))
+
+    @staticmethod
+    def test_data_survives_reopen(tmp_path: 'Path') -> None:
+        """Данные должны сохраняться после закрытия и повторного открытия базы."""
+        path = tmp_path / 'users.sqlite3'
+        first = SQLiteUserRepository(path, busy_timeout_seconds=1.0, statement_cache_size=16)
+        first.add(_make_user())
+        first.close()
+
+        second = SQLiteUserRepository(path, busy_timeout_seconds=1.0, statement_cache_size=16)
+
+        assert [user.username for user in second.list()] == ['John_Doe']
+        second.close()
+
+    @staticmethod
+    def test_add__concurrent_threads(repository: SQLiteUserRepository) -> None:
+        """Потоки должны работать через собственные соединения без ошибок."""
+        errors: list[Exception] = []
+
+        def worker(index: int) -> None:
+            try:
+                repository.add(_make_user(f'user_{index}'))
+                assert repository.get_by_username(f'USER_{index}') is not None
+            except Exception as error:  # noqa: BLE001
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(index,)) for index in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(repository.list()) == THREADS
+
+    @staticmethod
+    async def test_async_adapter__runs_in_threads(repository: SQLiteUserRepository) -> None:
+        """Асинхронный адаптер должен работать с той же базой из потоков пула."""
+        async_repository = AsyncSQLiteUserRepository(repository)
+
+        await async_repository.add(_make_user())
+        await async_repository.update(_make_user(hashed_password='new-hash'))
+
+        stored = await async_repository.get_by_username('JOHN_DOE')
+        assert stored is not None
+        assert stored.hashed_password == 'new-hash'
+        assert [user.username for user in await async_repository.list()] == ['John_Doe']
@@ -0,0 +1,163 @@
+import dataclasses
+from array import array
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.domain.models.user import InternalUser, UserQuery
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.app.infrastructure.adapters.repositories.snapshot import (
+    CorruptedSnapshotError,
+    open_snapshot,
+    write_snapshot,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+USERS_COUNT = 40
+ROLE_CODES_SECTION = 8
+USERNAME_INDEX_ROWS_SECTION = 15
+BCRYPT_HASH = '$2b$12$R9h/cIPz0gi.URNNX3kh2OPST9/PgBkqquzi.Ss7KIUgO2t0jWMUW'
+
+
+def _make_user(index: int) -> InternalUser:
+    return InternalUser(
+        username=f'User_{index}',
+        email=f'user_{index}@example.com',
+        age=18 + index,
+        role=Role.ADMIN if index % 4 == 0 else Role.USER,
+        hashed_password=BCRYPT_HASH if index % 2 else f'plain-{index}',
+    )
+
+
+@pytest.fixture
+def repository() -> InMemoryUserRepository:
+    """Репозиторий с bcrypt- и прочими хешами и изменёнными после добавления пользователями."""
+    repository = InMemoryUserRepository()
+    for index in range(USERS_COUNT):
+        repository.add(_make_user(index))
+
+    repository.update(dataclasses.replace(_make_user(3), email='renamed-longer@example.com', age=70, role=Role.ADMIN))
+    repository.update(dataclasses.replace(_make_user(4), hashed_password=BCRYPT_HASH, version=2))
+    return repository
+
+
+@pytest.mark.unit
+class TestUserRepositorySnapshot:
+    @staticmethod
+    def test_from_snapshot__round_trip(repository: InMemoryUserRepository, tmp_path: 'Path') -> None:
+        """Восстановленный репозиторий должен возвращать тех же пользователей и находить их по индексам."""
+        path = tmp_path / 'users.snapshot'
+        repository.save_snapshot(path)
+
+        restored = InMemoryUserRepository.from_snapshot(path)
+        query = UserQuery(role=Role.ADMIN, min_age=40)
+
+        assert restored.list() == repository.list()
+        assert restored.get_by_username('user_7') == repository.get_by_username('user_7')
+        assert restored.get_by_email('RENAMED-LONGER@example.com') == repository.get_by_email(
+            'renamed-longer@example.com'
+        )
+        assert restored.list_page(query, USERS_COUNT) == repository.list_page(query, USERS_COUNT)
+
+    @staticmethod
+    def test_from_snapshot__writable(repository: InMemoryUserRepository, tmp_path: 'Path') -> None:
+        """Восстановленный репозиторий должен принимать новых пользователей и изменения."""
+        path = tmp_path / 'users.snapshot'
+        repository.save_snapshot(path)
+
+        restored = InMemoryUserRepository.from_snapshot(path)
+        restored.add(_make_user(USERS_COUNT))
+        restored.update(dataclasses.replace(_make_user(0), hashed_password=BCRYPT_HASH))
+
+        assert restored.get_by_username(f'user_{USERS_COUNT}') == _make_user(USERS_COUNT)
+        assert restored.get_by_username('user_0') == dataclasses.replace(_make_user(0), hashed_password=BCRYPT_HASH)
+
+    @staticmethod
+    def test_from_snapshot__empty_repository(tmp_path: 'Path') -> None:
+        """Снимок пустого репозитория должен восстанавливаться в пустой репозиторий."""
+        path = tmp_path / 'users.snapshot'
+        InMemoryUserRepository().save_snapshot(path)
+
+        assert InMemoryUserRepository.from_snapshot(path).list() == []
+
+    @staticmethod
+    @pytest.mark.parametrize('content_size', [0.5, 0.9])
+    def test_from_snapshot__truncated(
+        repository: InMemoryUserRepository, tmp_path: 'Path', content_size: float
+    ) -> None:
+        """Обрезанный снимок должен отклоняться, а не восстанавливать часть данных."""
+        path = tmp_path / 'users.snapshot'
+        repository.save_snapshot(path)
+        content = path.read_bytes()
+        path.write_bytes(content[: int(len(content) * content_size)])
+
+        with pytest.raises(CorruptedSnapshotError):
+            InMemoryUserRepository.from_snapshot(path)
+
+    @staticmethod
+    def test_from_snapshot__invalid_section_length(repository: InMemoryUserRepository, tmp_path: 'Path') -> None:
+        """Секция, длина которой не кратна размеру элемента, должна отклоняться как повреждение снимка."""
+        path = tmp_path / 'users.snapshot'
+        repository.save_snapshot(path)
+        with open_snapshot(path) as reader:
+            roles = bytes(reader.read_bytes())
+        write_snapshot(path, [roles, b'abc', b'12345'])
+
+        with pytest.raises(CorruptedSnapshotError, match='invalid length'):
+            InMemoryUserRepository.from_snapshot(path)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ('section', 'tamper'),
+        [
+            pytest.param(USERNAME_INDEX_ROWS_SECTION, lambda rows: array('i', [0]) * len(rows), id='no-empty-slot'),
+            pytest.param(
+                USERNAME_INDEX_ROWS_SECTION,
+                lambda rows: array('i', [USERS_COUNT if row >= 0 else row for row in rows]),
+                id='row-out-of-range',
+            ),
+            pytest.param(ROLE_CODES_SECTION, lambda codes: array('B', [len(Role)]) * len(codes), id='role-code'),
+        ],
+    )
+    def test_from_snapshot__tampered_section(
+        repository: InMemoryUserRepository,
+        tmp_path: 'Path',
+        section: int,
+        tamper: 'Callable[[array[int]], array[int]]',
+    ) -> None:
+        """Изменённая в файле секция должна отклоняться при загрузке, а не ломать поиск при обработке запросов."""
+        path = tmp_path / 'users.snapshot'
+        repository.save_snapshot(path)
+        original = bytes(repository.snapshot()[section])
+        values = array('B' if section == ROLE_CODES_SECTION else 'i')
+        values.frombytes(original)
+        content = path.read_bytes()
+        assert content.count(original) == 1
+        path.write_bytes(content.replace(original, tamper(values).tobytes()))
+
+        with pytest.raises(CorruptedSnapshotError, match='checksum'):
+            InMemoryUserRepository.from_snapshot(path)
+
+    @staticmethod
+    def test_from_snapshot__unknown_format(tmp_path: 'Path') -> None:
+        """Файл другого формата должен отклоняться."""
+        path = tmp_path / 'users.snapshot'
+        path.write_bytes(b'not a snapshot')
+
+        with pytest.raises(CorruptedSnapshotError):
+            InMemoryUserRepository.from_snapshot(path)
+
+    @staticmethod
+    def test_save_snapshot__replaces_previous(repository: InMemoryUserRepository, tmp_path: 'Path') -> None:
+        """Повторная запись должна заменять снимок целиком, не оставляя временных файлов."""
+        path = tmp_path / 'users.snapshot'
+        InMemoryUserRepository().save_snapshot(path)
+
+        repository.save_snapshot(path)
+
+        assert InMemoryUserRepository.from_snapshot(path).list() == repository.list()
+        assert [file.name for file in tmp_path.iterdir()] == ['users.snapshot']
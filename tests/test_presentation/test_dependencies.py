@@ -1,8 +1,21 @@
+import dataclasses
+
 import pytest
 
+from src.app.application.services.auth_service import build_access_token_claims
+from src.app.domain.exceptions import InvalidTokenError
+from src.app.domain.models.user import InternalUser, Principal
 from src.app.domain.repositories.user_repository import UserRepository
+from src.app.domain.value_objects.role import Role
+from src.app.infrastructure.adapters.repositories.in_memory_user_repository import (
+    AsyncInMemoryUserRepository,
+    InMemoryUserRepository,
+)
+from src.app.infrastructure.adapters.security.cached_user_version_provider import CachedUserVersionProvider
 from src.app.infrastructure.container import AppContainer
-from src.app.presentation.webserver.dependencies import get_user_repository
+from src.app.presentation.webserver.dependencies import get_current_user_oauth2, get_user_repository
+
+USER = InternalUser(username='john_doe', email='john@example.com', age=25, role=Role.USER, hashed_password='hash')
 
 
 @pytest.mark.unit
@@ -12,3 +25,32 @@ def test_get_user_repository__returns_singleton_instance() -> None:
 
     assert isinstance(user_repository, UserRepository)
     assert user_repository is AppContainer.user_repository()
+
+
+@pytest.mark.unit
+class TestGetCurrentUserOauth2:
+    @staticmethod
+    async def test_stateless_token__authorized_without_repository() -> None:
+        """Токен с профилем и версией должен авторизовываться без поиска пользователя в репозитории."""
+        versions = InMemoryUserRepository()
+        versions.add(USER)
+        provider = CachedUserVersionProvider(AsyncInMemoryUserRepository(versions), ttl_seconds=60, max_size=10)
+        claims = build_access_token_claims(USER, include_profile=True)
+
+        principal = await get_current_user_oauth2(
+            claims, AsyncInMemoryUserRepository(InMemoryUserRepository()), provider
+        )
+
+        assert principal == Principal(username='john_doe', email='john@example.com', age=25, role=Role.USER)
+
+    @staticmethod
+    async def test_stateless_token__rejected_after_version_bump() -> None:
+        """Токен, выданный до изменения учётной записи, должен отклоняться."""
+        versions = InMemoryUserRepository()
+        versions.add(USER)
+        claims = build_access_token_claims(USER, include_profile=True)
+        versions.update(dataclasses.replace(USER, version=USER.version + 1))
+        provider = CachedUserVersionProvider(AsyncInMemoryUserRepository(versions), ttl_seconds=60, max_size=10)
+
+        with pytest.raises(InvalidTokenError):
+            await get_current_user_oauth2(claims, AsyncInMemoryUserRepository(versions), provider)
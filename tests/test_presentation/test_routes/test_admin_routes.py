@@ -0,0 +1,118 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.infrastructure.config import get_settings
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestApiKeyEndpoints:
+    @staticmethod
+    def test_api_key__lifecycle(
+        sync_api_client: 'TestClient', admin_headers: dict[str, str], test_user_sync: tuple[str, str]
+    ) -> None:
+        """Выпущенный ключ должен давать доступ к предсказаниям до момента отзыва."""
+        created = sync_api_client.post(
+            '/api/v1/admin/api-keys', json={'username': test_user_sync[0], 'name': 'batch'}, headers=admin_headers
+        )
+        key_headers = {'X-API-Key': created.json()['api_key']}
+
+        allowed = sync_api_client.post('/api/v1/predictions', json={'age': 40}, headers=key_headers)
+        revoked = sync_api_client.delete(f'/api/v1/admin/api-keys/{created.json()["key_id"]}', headers=admin_headers)
+        denied = sync_api_client.post('/api/v1/predictions', json={'age': 40}, headers=key_headers)
+
+        assert created.status_code == HTTPStatus.CREATED
+        assert allowed.status_code == HTTPStatus.OK
+        assert revoked.status_code == HTTPStatus.NO_CONTENT
+        assert denied.status_code == HTTPStatus.UNAUTHORIZED
+
+    @staticmethod
+    def test_api_key__requires_admin(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """Выпуск ключей должен быть недоступен обычному пользователю."""
+        username, password = test_user_sync
+        token = sync_api_client.post('/api/v1/auth/token', data={'username': username, 'password': password})
+
+        response = sync_api_client.post(
+            '/api/v1/admin/api-keys',
+            json={'username': username, 'name': 'batch'},
+            headers={'Authorization': f'Bearer {token.json()["access_token"]}'},
+        )
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    @staticmethod
+    def test_predictions__requires_credentials(sync_api_client: 'TestClient') -> None:
+        """Предсказания без ключа и учетных данных должны отклоняться."""
+        response = sync_api_client.post('/api/v1/predictions', json={'age': 40})
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestUserRoleEndpoint:
+    @staticmethod
+    def test_update_role__revokes_stateless_tokens(
+        sync_api_client: 'TestClient',
+        admin_headers: dict[str, str],
+        test_user_sync: tuple[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """После смены роли токен, выданный с прежней ролью, должен отклоняться, а новый — принимать новую роль."""
+        monkeypatch.setattr(get_settings().jwt, 'stateless_principal', True)
+        username, password = test_user_sync
+        credentials = {'username': username, 'password': password}
+        old_token = sync_api_client.post('/api/v1/auth/token', data=credentials).json()['access_token']
+        old_headers = {'Authorization': f'Bearer {old_token}'}
+        before = sync_api_client.get('/api/v1/auth/me', headers=old_headers)
+
+        updated = sync_api_client.put(
+            f'/api/v1/admin/users/{username}/role', json={'role': 'admin'}, headers=admin_headers
+        )
+        after = sync_api_client.get('/api/v1/auth/me', headers=old_headers)
+        new_token = sync_api_client.post('/api/v1/auth/token', data=credentials).json()['access_token']
+        renewed = sync_api_client.get('/api/v1/auth/me', headers={'Authorization': f'Bearer {new_token}'})
+
+        assert before.status_code == HTTPStatus.OK
+        assert updated.status_code == HTTPStatus.OK
+        assert updated.json()['role'] == 'admin'
+        assert after.status_code == HTTPStatus.UNAUTHORIZED
+        assert renewed.status_code == HTTPStatus.OK
+        assert renewed.json()['role'] == 'admin'
+
+    @staticmethod
+    def test_update_role__unknown_user(sync_api_client: 'TestClient', admin_headers: dict[str, str]) -> None:
+        """Смена роли несуществующего пользователя должна завершаться 404."""
+        response = sync_api_client.put('/api/v1/admin/users/nobody/role', json={'role': 'admin'}, headers=admin_headers)
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestModelEndpoints:
+    @staticmethod
+    def test_models__builtin_only(sync_api_client: 'TestClient', admin_headers: dict[str, str]) -> None:
+        """Без каталога артефактов должна быть доступна только встроенная модель."""
+        status = sync_api_client.get('/api/v1/admin/models', headers=admin_headers)
+        activated = sync_api_client.post('/api/v1/admin/models/builtin:activate', headers=admin_headers)
+        missing = sync_api_client.post('/api/v1/admin/models/v001:activate', headers=admin_headers)
+        rollback = sync_api_client.post('/api/v1/admin/models:rollback', headers=admin_headers)
+
+        assert status.status_code == HTTPStatus.OK
+        assert status.json()['active_version'] == 'builtin'
+        assert activated.status_code == HTTPStatus.OK
+        assert missing.status_code == HTTPStatus.NOT_FOUND
+        assert rollback.status_code == HTTPStatus.CONFLICT
+
+    @staticmethod
+    def test_models__requires_admin(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """Управление версиями модели должно быть недоступно без права администратора."""
+        response = sync_api_client.post('/api/v1/admin/models:rollback', auth=test_user_sync)
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
@@ -0,0 +1,146 @@
+import asyncio
+import uuid
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.app.infrastructure.config import get_settings
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+    from httpx import AsyncClient
+
+
+def _login(client: 'TestClient', credentials: tuple[str, str]) -> dict[str, str]:
+    username, password = credentials
+    response = client.post('/api/v1/auth/token', data={'username': username, 'password': password})
+    assert response.status_code == HTTPStatus.OK
+    return dict(response.json())
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestRefreshEndpoint:
+    @staticmethod
+    def test_refresh__rotates_tokens(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """Должен выдавать новую пару токенов в обмен на refresh токен."""
+        tokens = _login(sync_api_client, test_user_sync)
+
+        response = sync_api_client.post('/api/v1/auth/refresh', json={'refresh_token': tokens['refresh_token']})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['refresh_token'] != tokens['refresh_token']
+        assert response.json()['token_type'] == 'bearer'
+
+    @staticmethod
+    def test_refresh__reuse_revokes_family(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """Повторное использование refresh токена должно отзывать все токены семейства."""
+        tokens = _login(sync_api_client, test_user_sync)
+        rotated = sync_api_client.post('/api/v1/auth/refresh', json={'refresh_token': tokens['refresh_token']})
+
+        reused = sync_api_client.post('/api/v1/auth/refresh', json={'refresh_token': tokens['refresh_token']})
+        after_reuse = sync_api_client.post(
+            '/api/v1/auth/refresh', json={'refresh_token': rotated.json()['refresh_token']}
+        )
+
+        assert reused.status_code == HTTPStatus.UNAUTHORIZED
+        assert after_reuse.status_code == HTTPStatus.UNAUTHORIZED
+
+    @staticmethod
+    def test_refresh__access_token_rejected(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """Access токен не должен приниматься вместо refresh токена."""
+        tokens = _login(sync_api_client, test_user_sync)
+
+        response = sync_api_client.post('/api/v1/auth/refresh', json={'refresh_token': tokens['access_token']})
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestLogoutEndpoint:
+    @staticmethod
+    def test_logout__revokes_access_and_refresh(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """После выхода access и refresh токены не должны приниматься."""
+        tokens = _login(sync_api_client, test_user_sync)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        response = sync_api_client.post(
+            '/api/v1/auth/logout', json={'refresh_token': tokens['refresh_token']}, headers=headers
+        )
+        me = sync_api_client.get('/api/v1/users/me', headers=headers)
+        refreshed = sync_api_client.post('/api/v1/auth/refresh', json={'refresh_token': tokens['refresh_token']})
+
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert me.status_code == HTTPStatus.UNAUTHORIZED
+        assert refreshed.status_code == HTTPStatus.UNAUTHORIZED
+
+    @staticmethod
+    def test_logout__requires_access_token(sync_api_client: 'TestClient') -> None:
+        """Выход без access токена должен отклоняться."""
+        response = sync_api_client.post('/api/v1/auth/logout')
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestTokenUserEndpoint:
+    @staticmethod
+    def test_me__returns_token_owner(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """Должен возвращать профиль пользователя, которому выдан access токен."""
+        tokens = _login(sync_api_client, test_user_sync)
+
+        response = sync_api_client.get('/api/v1/auth/me', headers={'Authorization': f'Bearer {tokens["access_token"]}'})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            'username': test_user_sync[0],
+            'email': f'{test_user_sync[0]}@example.com',
+            'age': 30,
+            'role': 'user',
+        }
+
+    @staticmethod
+    def test_me__requires_access_token(sync_api_client: 'TestClient') -> None:
+        """Запрос без access токена должен отклоняться."""
+        response = sync_api_client.get('/api/v1/auth/me')
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestLoginThrottle:
+    @staticmethod
+    def test_token__too_many_attempts(sync_api_client: 'TestClient') -> None:
+        """После серии неудачных попыток вход должен отклоняться с 429 и заголовком Retry-After."""
+        username = f'user_{uuid.uuid4().hex[:8]}'
+        credentials = {'username': username, 'password': 'wrong-password'}
+        max_attempts = get_settings().login_throttle.max_attempts_per_username
+
+        for _ in range(max_attempts):
+            response = sync_api_client.post('/api/v1/auth/token', data=credentials)
+            assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+        response = sync_api_client.post('/api/v1/auth/token', data=credentials)
+
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        assert int(response.headers['Retry-After']) > 0
+
+    @staticmethod
+    async def test_http_basic__concurrent_valid_requests_not_throttled(
+        async_api_client: 'AsyncClient', test_user_async: tuple[str, str]
+    ) -> None:
+        """Одновременные запросы с верными учётными данными не должны расходовать лимит попыток входа."""
+        requests = get_settings().login_throttle.max_attempts_per_username * 3
+
+        responses = await asyncio.gather(
+            *(
+                async_api_client.post('/api/v1/predictions', json={'age': 35}, auth=test_user_async)
+                for _ in range(requests)
+            )
+        )
+
+        assert [response.status_code for response in responses] == [HTTPStatus.OK] * requests
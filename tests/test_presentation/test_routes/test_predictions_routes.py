@@ -3,7 +3,12 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from src.app.infrastructure.adapters.inference.lru_prediction_cache import LRUPredictionCache
+from src.app.infrastructure.container import AppContainer
+from src.app.presentation.webserver.dependencies import get_prediction_cache, get_predictor
+
 if TYPE_CHECKING:
+    from fastapi import FastAPI
     from fastapi.testclient import TestClient
 
 
@@ -30,3 +35,70 @@ class TestPredictEndpoint:
 
         assert response.status_code == HTTPStatus.OK
         assert response.json() == {'prediction': expected_prediction}
+
+    @staticmethod
+    def test_predict__counted_in_batcher_metrics(
+        sync_api_client: 'TestClient', test_user_sync: tuple[str, str]
+    ) -> None:
+        """Одиночные предсказания должны проходить через пакетный обработчик и учитываться в метриках."""
+        before = sync_api_client.get('/api/v1/metrics').json()['batchers']['predictions']
+
+        response = sync_api_client.post('/api/v1/predictions', json={'age': 35}, auth=test_user_sync)
+        after = sync_api_client.get('/api/v1/metrics').json()['batchers']['predictions']
+
+        assert response.status_code == HTTPStatus.OK
+        assert after['items'] == before['items'] + 1
+        assert after['batches'] == before['batches'] + 1
+
+    @staticmethod
+    def test_predict__repeated_features_served_from_cache(
+        fastapi_app: 'FastAPI', sync_api_client: 'TestClient', test_user_sync: tuple[str, str]
+    ) -> None:
+        """Повторные признаки, в том числе в другой записи, должны возвращаться из кэша без вызова модели."""
+        cache = LRUPredictionCache(AppContainer.model_registry(), max_size=10, ttl_seconds=60)
+        fastapi_app.dependency_overrides[get_prediction_cache] = lambda: cache
+        fastapi_app.dependency_overrides[get_predictor] = lambda: None
+
+        first = sync_api_client.post('/api/v1/predictions', json={'age': 42, 'income': 7e4}, auth=test_user_sync)
+        second = sync_api_client.post(
+            '/api/v1/predictions', json={'income': 70000, 'age': 42, 'occupation': None}, auth=test_user_sync
+        )
+
+        assert first.json() == second.json() == {'prediction': 'positive'}
+        assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestPredictBatchEndpoint:
+    @staticmethod
+    def test_predict_batch__results_in_row_order(
+        sync_api_client: 'TestClient', test_user_sync: tuple[str, str]
+    ) -> None:
+        """Результаты должны идти в порядке строк, а ошибки строк — не отклонять пачку."""
+        rows = [{'age': 35}, {'income': 1.0}, 'not an object', {'age': 30, 'occupation': 'engineer'}, {'age': 31}]
+
+        response = sync_api_client.post('/api/v1/predictions:batch', json={'rows': rows}, auth=test_user_sync)
+        results = response.json()['results']
+
+        assert response.status_code == HTTPStatus.OK
+        assert [result.get('prediction') for result in results] == ['positive', None, None, 'negative', 'positive']
+        assert results[1]['detail'][0]['loc'] == ['age']
+        assert results[2]['detail'][0]['type'] == 'model_type'
+
+    @staticmethod
+    @pytest.mark.parametrize('rows', [[], None])
+    def test_predict_batch__invalid_batch(
+        sync_api_client: 'TestClient', test_user_sync: tuple[str, str], rows: list[object] | None
+    ) -> None:
+        """Пустая пачка или тело без списка строк должны отклоняться целиком."""
+        response = sync_api_client.post('/api/v1/predictions:batch', json={'rows': rows}, auth=test_user_sync)
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    @staticmethod
+    def test_predict_batch__unauthorized(sync_api_client: 'TestClient') -> None:
+        """Без учётных данных пачка должна отклоняться."""
+        response = sync_api_client.post('/api/v1/predictions:batch', json={'rows': [{'age': 35}]})
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
@@ -1,9 +1,21 @@
+import json
+import uuid
 from http import HTTPStatus
 from typing import TYPE_CHECKING
 
 import pytest
 
+from src.app.infrastructure.container import AppContainer
+from src.app.presentation.api.constants import (
+    NDJSON_MAX_LINE_BYTES,
+    USER_IMPORT_CHUNK_SIZE,
+    USER_IMPORT_MAX_BUFFERED_LINES,
+)
+from src.app.presentation.api.rest.v1.routes.users import _import_results
+
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
     from fastapi.testclient import TestClient
 
 
@@ -116,3 +128,190 @@ class TestCreateUserEndpoint:
         second_response = sync_api_client.post('/users', json=user_data)
         assert second_response.status_code == HTTPStatus.CONFLICT
         assert second_response.json()['detail'] == f'User "{username}" already exists'
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestListUsersEndpoint:
+    @staticmethod
+    def test_list_users__pages_with_cursor(
+        sync_api_client: 'TestClient', admin_headers: dict[str, str], test_user_sync: tuple[str, str]
+    ) -> None:
+        """Администратор должен проходить всех пользователей по курсору без повторов."""
+        usernames: list[str] = []
+        params: dict[str, str | int] = {'limit': 1}
+
+        while True:
+            response = sync_api_client.get('/api/v1/users', params=params, headers=admin_headers)
+            assert response.status_code == HTTPStatus.OK
+            usernames.extend(user['username'] for user in response.json()['items'])
+            if response.json()['next_cursor'] is None:
+                break
+            params['cursor'] = response.json()['next_cursor']
+
+        assert test_user_sync[0] in usernames
+        assert len(usernames) == len(set(usernames))
+
+    @staticmethod
+    def test_list_users__filter_by_email(
+        sync_api_client: 'TestClient', admin_headers: dict[str, str], test_user_sync: tuple[str, str]
+    ) -> None:
+        """Отбор по email должен возвращать только владельца адреса."""
+        email = f'{test_user_sync[0]}@EXAMPLE.com'
+
+        response = sync_api_client.get('/api/v1/users', params={'email': email}, headers=admin_headers)
+
+        assert [user['username'] for user in response.json()['items']] == [test_user_sync[0]]
+
+    @staticmethod
+    @pytest.mark.parametrize('cursor', ['not-a-cursor', 'LTE'])
+    def test_list_users__invalid_cursor(
+        sync_api_client: 'TestClient', admin_headers: dict[str, str], cursor: str
+    ) -> None:
+        """Повреждённый курсор должен отклоняться с кодом 400."""
+        response = sync_api_client.get('/api/v1/users', params={'cursor': cursor}, headers=admin_headers)
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    @staticmethod
+    def test_list_users__requires_admin(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """Обычному пользователю список пользователей недоступен."""
+        token = sync_api_client.post(
+            '/api/v1/auth/token', data={'username': test_user_sync[0], 'password': test_user_sync[1]}
+        ).json()['access_token']
+
+        response = sync_api_client.get('/api/v1/users', headers={'Authorization': f'Bearer {token}'})
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestImportUsersEndpoint:
+    @staticmethod
+    def test_import_users__results_per_line(sync_api_client: 'TestClient', admin_headers: dict[str, str]) -> None:
+        """Каждая непустая строка должна получать свой результат, а ошибки строк — не прерывать импорт."""
+        prefix = f'bulk_{uuid.uuid4().hex[:8]}'
+        rows = [
+            {'username': f'{prefix}_a', 'email': f'{prefix}_a@example.com', 'age': 20, 'password': 'password123'},
+            {'username': f'{prefix}_b', 'email': 'not-an-email', 'age': 20, 'password': 'password123'},
+            {'username': f'{prefix}_A', 'email': f'{prefix}_c@example.com', 'age': 20, 'password': 'password123'},
+        ]
+        body = '\n'.join(
+            [
+                json.dumps(rows[0]),
+                '',
+                json.dumps(rows[1]),
+                'not json',
+                'x' * (NDJSON_MAX_LINE_BYTES + 1),
+                json.dumps(rows[2]),
+            ]
+        )
+
+        response = sync_api_client.post('/api/v1/users:batch', content=body, headers=admin_headers)
+        results = [json.loads(line) for line in response.text.splitlines()]
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['content-type'] == 'application/x-ndjson'
+        assert [(result['line'], result['status']) for result in results] == [
+            (1, HTTPStatus.CREATED),
+            (3, HTTPStatus.BAD_REQUEST),
+            (4, HTTPStatus.BAD_REQUEST),
+            (5, HTTPStatus.REQUEST_ENTITY_TOO_LARGE),
+            (6, HTTPStatus.CONFLICT),
+        ]
+        assert results[0]['username'] == rows[0]['username']
+        assert results[4]['detail'] == f'User "{rows[2]["username"]}" already exists'
+        assert 'password123' not in response.text
+
+    @staticmethod
+    async def test_import_users__invalid_lines_streamed_in_bounded_chunks() -> None:
+        """Результаты ошибочных строк должны отправляться частями, не дожидаясь конца тела."""
+
+        async def endless_invalid_lines() -> 'AsyncGenerator[bytes]':
+            while True:
+                yield b'not json\n' * 100
+
+        body = endless_invalid_lines()
+        results = _import_results(
+            body,
+            USER_IMPORT_CHUNK_SIZE,
+            AppContainer.async_password_hasher(),
+            AppContainer.async_user_repository(),
+        )
+        chunk = await anext(results)
+        await body.aclose()
+
+        lines = [json.loads(line) for line in chunk.splitlines()]
+        assert len(lines) == USER_IMPORT_MAX_BUFFERED_LINES
+        assert {line['status'] for line in lines} == {HTTPStatus.BAD_REQUEST}
+
+    @staticmethod
+    def test_import_users__created_users_can_log_in(
+        sync_api_client: 'TestClient', admin_headers: dict[str, str]
+    ) -> None:
+        """Пользователи из пачки больше части импорта должны создаваться и входить со своими паролями."""
+        usernames = [f'bulk_{uuid.uuid4().hex[:8]}' for _ in range(USER_IMPORT_CHUNK_SIZE + 1)]
+        body = ''.join(
+            json.dumps({'username': name, 'email': f'{name}@example.com', 'age': 30, 'password': f'{name}-secret'})
+            + '\n'
+            for name in usernames
+        )
+
+        response = sync_api_client.post('/api/v1/users:batch', content=body, headers=admin_headers)
+        token_response = sync_api_client.post(
+            '/api/v1/auth/token', data={'username': usernames[-1], 'password': f'{usernames[-1]}-secret'}
+        )
+
+        assert [json.loads(line)['status'] for line in response.text.splitlines()] == [HTTPStatus.CREATED] * len(
+            usernames
+        )
+        assert token_response.status_code == HTTPStatus.OK
+
+    @staticmethod
+    def test_import_users__requires_admin(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """Обычному пользователю импорт недоступен."""
+        token = sync_api_client.post(
+            '/api/v1/auth/token', data={'username': test_user_sync[0], 'password': test_user_sync[1]}
+        ).json()['access_token']
+
+        response = sync_api_client.post(
+            '/api/v1/users:batch', content=b'', headers={'Authorization': f'Bearer {token}'}
+        )
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestExportUsersEndpoint:
+    @staticmethod
+    def test_export_users__streams_every_user_once(
+        sync_api_client: 'TestClient', admin_headers: dict[str, str], test_user_sync: tuple[str, str]
+    ) -> None:
+        """Выгрузка должна содержать каждого пользователя один раз, в полях UserResponse и без хеша пароля."""
+        response = sync_api_client.get('/api/v1/users/export', headers=admin_headers)
+        users = [json.loads(line) for line in response.text.splitlines()]
+        usernames = [user['username'] for user in users]
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['content-type'] == 'application/x-ndjson'
+        assert len(usernames) == len(set(usernames))
+        assert {
+            'username': test_user_sync[0],
+            'email': f'{test_user_sync[0]}@example.com',
+            'age': 30,
+            'role': 'user',
+        } in users
+        assert all(set(user) == {'username', 'email', 'age', 'role'} for user in users)
+
+    @staticmethod
+    def test_export_users__requires_admin(sync_api_client: 'TestClient', test_user_sync: tuple[str, str]) -> None:
+        """Обычному пользователю выгрузка недоступна."""
+        token = sync_api_client.post(
+            '/api/v1/auth/token', data={'username': test_user_sync[0], 'password': test_user_sync[1]}
+        ).json()['access_token']
+
+        response = sync_api_client.get('/api/v1/users/export', headers={'Authorization': f'Bearer {token}'})
+
+        assert response.status_code == HTTPStatus.FORBIDDEN